@@ -122,6 +122,7 @@ class UserProfile:
     linkedin_url: Optional[str] = None
     location: str = ""
     website: Optional[str] = None
+    user_id: Optional[str] = None  # Account id; keys the user's saved answers
     
     # Pre-filled answers for common questions
     work_authorization: str = "Yes"  # Are you authorized to work?
@@ -139,6 +140,7 @@ class Resume:
     raw_text: str
     parsed_data: dict
     tailored_version: Optional[dict] = None
+    digest: Optional[dict] = None  # precomputed at upload, see core.resume_digest
 
 
 class JobPlatformAdapter(ABC):
@@ -148,6 +150,8 @@ class JobPlatformAdapter(ABC):
     """
 
     platform: PlatformType
+    user_id: Optional[str] = None  # Owner of the run; keys per-user session snapshots
+    checkpoint = None  # core.step_checkpoints.ApplyCheckpoint for the current queue item, if any
 
     def __init__(self, browser_manager, session_cookie: Optional[str] = None):
         self.browser_manager = browser_manager
@@ -192,7 +196,8 @@ class JobPlatformAdapter(ABC):
                     self.browser_manager = UnifiedBrowserManager()
                     await self.browser_manager.init()
                 
-                session = await self.browser_manager.create_session(self.platform.value)
+                # Seeded from the user's stored storage-state snapshot, if any.
+                session = await self.browser_manager.create_session(self.platform.value, user_id=self.user_id)
                 self._session = session
                 self._log(f"Using BrowserBase Stagehand ({'local' if force_local else 'cloud'} mode)")
                 
@@ -205,6 +210,11 @@ class JobPlatformAdapter(ABC):
     async def close(self):
         """Close the platform session."""
         if self._session:
+            if self.user_id and hasattr(self.browser_manager, 'save_storage_state'):
+                try:
+                    await self.browser_manager.save_storage_state(self._session, self.user_id)
+                except Exception as e:
+                    self._log(f"Storage-state refresh failed: {e}")
             # Check if it's a Stagehand session
             if hasattr(self._session, 'close'):
                 await self._session.close()
@@ -0,0 +1,235 @@
+"""
+Board Fetcher - shared, bounded-concurrency fetcher for public job-board APIs.
+
+Greenhouse and Lever expose one JSON board per company. Searching a list of
+companies used to fetch them one by one with a fixed sleep in between; this
+fetcher fetches many boards at once while staying polite to each host:
+
+- One pooled ``aiohttp`` session shared by every adapter instance
+- A global concurrency cap plus, per host, a concurrency cap and a minimum
+  spacing between request starts (``BOARD_FETCH_PER_HOST_RPS``)
+- ``429``/``503`` responses back off (honouring ``Retry-After``) and pause
+  the whole host, not just the one request
+- Boards are yielded as they arrive, so callers filter each one while the
+  rest are still in flight
+- Conditional requests (``If-None-Match`` / ``If-Modified-Since``) for
+  incremental sync (see ``adapters.board_sync``)
+
+Example:
+    from adapters.board_fetcher import get_board_fetcher
+
+    async for company, board in get_board_fetcher().stream(companies, board_url):
+        ...  # board is the decoded JSON, or None if the board is missing
+"""
+
+import os
+import time
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional, Tuple, TypeVar
+from urllib.parse import urlparse
+
+import aiohttp
+
+from ai.llm_client import close_stale_session, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+USER_AGENT = "Mozilla/5.0 (compatible; JobBot/1.0)"
+
+
+@dataclass
+class BoardFetcherConfig:
+    max_concurrency: int = int(os.getenv("BOARD_FETCH_CONCURRENCY", "32"))
+    per_host_concurrency: int = int(os.getenv("BOARD_FETCH_PER_HOST", "8"))
+    # Minimum spacing between request starts to one host (0 disables).
+    per_host_rps: float = float(os.getenv("BOARD_FETCH_PER_HOST_RPS", "10"))
+    timeout_seconds: float = float(os.getenv("BOARD_FETCH_TIMEOUT_SECONDS", "10"))
+    max_retries: int = int(os.getenv("BOARD_FETCH_MAX_RETRIES", "2"))
+    max_retry_after: float = 30.0
+
+
+@dataclass
+class BoardResponse:
+    """A fetched board, a 304 for an unchanged one, or a 404 for a board that no longer exists."""
+    data: Any = None
+    not_modified: bool = False
+    not_found: bool = False
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class HostLimiter:
+    """Concurrency cap and request spacing for one host."""
+
+    def __init__(self, concurrency: int, rps: float):
+        self.semaphore = asyncio.Semaphore(max(1, concurrency))
+        self.interval = 1.0 / rps if rps > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait_turn(self):
+        """Reserve the next start slot and sleep until it comes up."""
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def pause(self, seconds: float):
+        """Hold back every request to this host for ``seconds``."""
+        self._next_start = max(self._next_start, time.monotonic() + seconds)
+
+
+class BoardFetcher:
+    """Fetches JSON boards concurrently with per-host politeness limits."""
+
+    def __init__(self, config: Optional[BoardFetcherConfig] = None):
+        self.config = config or BoardFetcherConfig()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._global: Optional[asyncio.Semaphore] = None
+        self._hosts: Dict[str, HostLimiter] = {}
+        self._stats = {
+            "requests": 0, "ok": 0, "not_modified": 0, "not_found": 0, "errors": 0, "retries": 0, "throttled": 0,
+        }
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, recreating it (and the limiters) on a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            await close_stale_session(self._session, self._loop, tag="BoardFetcher")
+            self._session = None
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_concurrency,
+                limit_per_host=self.config.per_host_concurrency,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(connector=connector, headers={"User-Agent": USER_AGENT})
+            self._loop = loop
+            self._global = asyncio.Semaphore(max(1, self.config.max_concurrency))
+            self._hosts = {}
+        return self._session
+
+    def _host(self, url: str) -> HostLimiter:
+        host = urlparse(url).netloc
+        if host not in self._hosts:
+            self._hosts[host] = HostLimiter(self.config.per_host_concurrency, self.config.per_host_rps)
+        return self._hosts[host]
+
+    async def fetch_json(self, url: str) -> Optional[Any]:
+        """GET ``url`` and decode JSON; None when the board is missing or keeps failing."""
+        resp = await self.fetch(url)
+        return resp.data if resp is not None else None
+
+    async def fetch(
+        self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None
+    ) -> Optional[BoardResponse]:
+        """
+        GET ``url``, conditionally when ``etag``/``last_modified`` are given.
+        Returns the decoded board (200), a ``not_modified`` response (304) or a
+        ``not_found`` response (404); None when the board keeps failing.
+        """
+        session = await self._get_session()
+        limiter = self._host(url)
+        timeout = aiohttp.ClientTimeout(total=self.config.timeout_seconds)
+        attempts = max(1, self.config.max_retries + 1)
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        async with self._global, limiter.semaphore:
+            for attempt in range(attempts):
+                await limiter.wait_turn()
+                self._stats["requests"] += 1
+                if attempt:
+                    self._stats["retries"] += 1
+                delay = None
+                try:
+                    async with session.get(url, headers=headers or None, timeout=timeout) as resp:
+                        if resp.status in (200, 304):
+                            not_modified = resp.status == 304
+                            self._stats["not_modified" if not_modified else "ok"] += 1
+                            return BoardResponse(
+                                data=None if not_modified else await resp.json(content_type=None),
+                                not_modified=not_modified,
+                                etag=resp.headers.get("ETag") or etag,
+                                last_modified=resp.headers.get("Last-Modified") or last_modified,
+                            )
+                        if resp.status == 404:
+                            self._stats["not_found"] += 1
+                            return BoardResponse(not_found=True)
+                        if resp.status not in RETRYABLE_STATUSES:
+                            self._stats["errors"] += 1
+                            return None
+                        if resp.status == 429:
+                            self._stats["throttled"] += 1
+                        retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                        if retry_after is not None:
+                            delay = min(retry_after, self.config.max_retry_after)
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                    logger.debug(f"[BoardFetcher] {url} attempt {attempt + 1} failed: {e}")
+
+                if attempt < attempts - 1:
+                    limiter.pause(delay if delay is not None else 0.5 * (2 ** attempt))
+
+        self._stats["errors"] += 1
+        return None
+
+    async def stream(
+        self, items: Iterable[T], url_for: Callable[[T], str]
+    ) -> AsyncIterator[Tuple[T, Optional[Any]]]:
+        """Fetch ``url_for(item)`` for every item, yielding ``(item, data)`` as each completes."""
+
+        async def fetch(item: T) -> Tuple[T, Optional[Any]]:
+            try:
+                return item, await self.fetch_json(url_for(item))
+            except Exception as e:
+                logger.warning(f"[BoardFetcher] Error fetching {item}: {e}")
+                return item, None
+
+        tasks = [asyncio.create_task(fetch(item)) for item in items]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self._stats, "hosts": len(self._hosts)}
+
+    async def close(self):
+        """Close the pooled session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+
+# Singleton
+_board_fetcher: Optional[BoardFetcher] = None
+
+
+def get_board_fetcher() -> BoardFetcher:
+    """Get singleton BoardFetcher instance."""
+    global _board_fetcher
+    if _board_fetcher is None:
+        _board_fetcher = BoardFetcher()
+    return _board_fetcher
+
+
+async def close_board_fetcher():
+    """Close the shared fetcher (called from the app lifespan on shutdown)."""
+    global _board_fetcher
+    if _board_fetcher is not None:
+        await _board_fetcher.close()
+        _board_fetcher = None
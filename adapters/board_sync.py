@@ -0,0 +1,316 @@
+"""
+Incremental Board Sync
+
+Keeps a local copy of Greenhouse and Lever company boards so repeat searches
+don't re-download every board:
+
+- Per board, the ETag / Last-Modified of the last download; the next sync
+  sends ``If-None-Match`` / ``If-Modified-Since`` and a ``304`` costs a few
+  hundred bytes instead of the whole board
+- Boards checked within ``BOARD_SYNC_MIN_INTERVAL_SECONDS`` aren't requested
+  at all
+- A changed board is diffed by posting ID into the job store (added,
+  updated, removed); a board that fails to download keeps its last snapshot,
+  while one that returns ``404`` (company left the ATS) has its postings
+  dropped
+
+Searches read postings from the store after syncing. Requests go through the
+shared ``BoardFetcher`` (per-host politeness, pooled session).
+
+Example:
+    from adapters.board_sync import get_board_sync
+
+    boards = await get_board_sync().board_jobs("greenhouse", companies, board_url)
+    for company, postings in boards.items():
+        ...  # raw board JSON per posting
+"""
+
+import json
+import time
+import asyncio
+import hashlib
+import sqlite3
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from api.config import config
+from .board_fetcher import BoardFetcher, get_board_fetcher
+
+logger = logging.getLogger(__name__)
+
+
+def _greenhouse_postings(data: Any) -> List[Dict]:
+    return list((data or {}).get("jobs") or []) if isinstance(data, dict) else []
+
+
+def _lever_postings(data: Any) -> List[Dict]:
+    return list(data) if isinstance(data, list) else []
+
+
+# ATS -> function extracting the posting list from a board response.
+BOARD_POSTINGS: Dict[str, Callable[[Any], List[Dict]]] = {
+    "greenhouse": _greenhouse_postings,
+    "lever": _lever_postings,
+}
+
+
+def board_key(ats: str, company: str) -> str:
+    return f"{ats}:{company}"
+
+
+def _content_hash(posting: Dict) -> str:
+    return hashlib.sha1(json.dumps(posting, sort_keys=True, default=str).encode()).hexdigest()
+
+
+@dataclass
+class BoardDiff:
+    """Outcome of syncing one board."""
+    board: str
+    status: str  # changed | not_modified | fresh | not_found | error
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    total: int = 0
+
+
+class JobStore:
+    """SQLite store of board postings and their sync validators."""
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = Path(db_path or config.BOARD_SYNC_DB)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _init_db(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS board_state (
+                    board_key TEXT PRIMARY KEY,
+                    url TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    checked_at REAL,
+                    changed_at REAL,
+                    job_count INTEGER DEFAULT 0
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS board_jobs (
+                    board_key TEXT NOT NULL,
+                    job_id TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    first_seen REAL,
+                    last_changed REAL,
+                    PRIMARY KEY (board_key, job_id)
+                )
+            """)
+            conn.commit()
+
+    def get_state(self, key: str) -> Optional[Dict[str, Any]]:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("SELECT * FROM board_state WHERE board_key = ?", (key,)).fetchone()
+        return dict(row) if row else None
+
+    def mark_checked(self, key: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Record a check that found nothing new (304)."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """UPDATE board_state SET checked_at = ?,
+                       etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified)
+                   WHERE board_key = ?""",
+                (time.time(), etag, last_modified, key),
+            )
+            conn.commit()
+
+    def clear_board(self, key: str, url: str) -> int:
+        """Drop a board that no longer exists; returns the number of postings removed."""
+        with sqlite3.connect(self.db_path) as conn:
+            removed = conn.execute("DELETE FROM board_jobs WHERE board_key = ?", (key,)).rowcount
+            conn.execute(
+                """INSERT INTO board_state (board_key, url, etag, last_modified, checked_at, changed_at, job_count)
+                   VALUES (?, ?, NULL, NULL, ?, ?, 0)
+                   ON CONFLICT(board_key) DO UPDATE SET
+                       url = excluded.url, etag = NULL, last_modified = NULL,
+                       checked_at = excluded.checked_at, job_count = 0,
+                       changed_at = CASE WHEN ? THEN excluded.changed_at ELSE board_state.changed_at END""",
+                (key, url, time.time(), time.time(), int(removed > 0)),
+            )
+            conn.commit()
+        return removed
+
+    def apply_snapshot(
+        self, key: str, url: str, postings: List[Dict],
+        etag: Optional[str] = None, last_modified: Optional[str] = None,
+    ) -> BoardDiff:
+        """Diff a full board download against the stored postings by ID."""
+        now = time.time()
+        incoming = {}
+        for posting in postings:
+            if isinstance(posting, dict) and posting.get("id") not in (None, ""):
+                incoming[str(posting["id"])] = posting
+
+        diff = BoardDiff(board=key, status="changed", total=len(incoming))
+        with sqlite3.connect(self.db_path) as conn:
+            stored = dict(conn.execute(
+                "SELECT job_id, content_hash FROM board_jobs WHERE board_key = ?", (key,)
+            ).fetchall())
+            for job_id, posting in incoming.items():
+                digest = _content_hash(posting)
+                if job_id not in stored:
+                    diff.added += 1
+                    conn.execute(
+                        """INSERT INTO board_jobs (board_key, job_id, content_hash, data, first_seen, last_changed)
+                           VALUES (?, ?, ?, ?, ?, ?)""",
+                        (key, job_id, digest, json.dumps(posting, default=str), now, now),
+                    )
+                elif stored[job_id] != digest:
+                    diff.updated += 1
+                    conn.execute(
+                        """UPDATE board_jobs SET content_hash = ?, data = ?, last_changed = ?
+                           WHERE board_key = ? AND job_id = ?""",
+                        (digest, json.dumps(posting, default=str), now, key, job_id),
+                    )
+            removed = [job_id for job_id in stored if job_id not in incoming]
+            diff.removed = len(removed)
+            conn.executemany(
+                "DELETE FROM board_jobs WHERE board_key = ? AND job_id = ?", [(key, j) for j in removed]
+            )
+            changed = diff.added or diff.updated or diff.removed
+            conn.execute(
+                """INSERT INTO board_state (board_key, url, etag, last_modified, checked_at, changed_at, job_count)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(board_key) DO UPDATE SET
+                       url = excluded.url, etag = excluded.etag, last_modified = excluded.last_modified,
+                       checked_at = excluded.checked_at, job_count = excluded.job_count,
+                       changed_at = CASE WHEN ? THEN excluded.changed_at ELSE board_state.changed_at END""",
+                (key, url, etag, last_modified, now, now, len(incoming), int(bool(changed))),
+            )
+            conn.commit()
+        return diff
+
+    def postings(self, keys: Iterable[str]) -> Dict[str, List[Dict]]:
+        """Stored postings per board key, in first-seen order."""
+        keys = list(keys)
+        result: Dict[str, List[Dict]] = {key: [] for key in keys}
+        if not keys:
+            return result
+        with sqlite3.connect(self.db_path) as conn:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = conn.execute(
+                    f"""SELECT board_key, data FROM board_jobs
+                        WHERE board_key IN ({','.join('?' * len(chunk))})
+                        ORDER BY first_seen, rowid""",
+                    chunk,
+                ).fetchall()
+                for key, data in rows:
+                    result[key].append(json.loads(data))
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        with sqlite3.connect(self.db_path) as conn:
+            boards, jobs = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(job_count), 0) FROM board_state"
+            ).fetchone()
+        return {"boards": boards, "jobs": jobs}
+
+
+class BoardSync:
+    """Conditional, diffing sync of company boards into the job store."""
+
+    def __init__(
+        self,
+        store: Optional[JobStore] = None,
+        fetcher: Optional[BoardFetcher] = None,
+        min_interval: Optional[float] = None,
+    ):
+        self.store = store or JobStore()
+        self._fetcher = fetcher
+        self.min_interval = config.BOARD_SYNC_MIN_INTERVAL_SECONDS if min_interval is None else min_interval
+        self.stats = {"changed": 0, "not_modified": 0, "fresh": 0, "not_found": 0, "error": 0}
+
+    @property
+    def fetcher(self) -> BoardFetcher:
+        return self._fetcher or get_board_fetcher()
+
+    async def sync_board(self, ats: str, company: str, url: str) -> BoardDiff:
+        key = board_key(ats, company)
+        # Store calls (sqlite, hashing whole boards) run in threads so hundreds of boards don't stall the loop.
+        state = await asyncio.to_thread(self.store.get_state, key)
+        if state and state["checked_at"] and time.time() - state["checked_at"] < self.min_interval:
+            return self._count(BoardDiff(board=key, status="fresh", total=state["job_count"]))
+
+        # Validators only apply to the same URL (Lever is fetched with and without ?mode=json).
+        same_url = bool(state) and state["url"] == url
+        resp = await self.fetcher.fetch(
+            url,
+            etag=state["etag"] if same_url else None,
+            last_modified=state["last_modified"] if same_url else None,
+        )
+        if resp is None:
+            return self._count(BoardDiff(board=key, status="error", total=(state or {}).get("job_count") or 0))
+        if resp.not_found:
+            removed = await asyncio.to_thread(self.store.clear_board, key, url)
+            if removed:
+                logger.info(f"[BoardSync] {key} is gone (404); dropped {removed} postings")
+            return self._count(BoardDiff(board=key, status="not_found", removed=removed))
+        if resp.not_modified:
+            await asyncio.to_thread(self.store.mark_checked, key, resp.etag, resp.last_modified)
+            return self._count(BoardDiff(board=key, status="not_modified", total=state["job_count"]))
+
+        diff = await asyncio.to_thread(
+            self.store.apply_snapshot,
+            key, url, BOARD_POSTINGS[ats](resp.data), etag=resp.etag, last_modified=resp.last_modified,
+        )
+        if state and not (diff.added or diff.updated or diff.removed):
+            diff.status = "not_modified"  # downloaded, but nothing changed (server without validators)
+        return self._count(diff)
+
+    def _count(self, diff: BoardDiff) -> BoardDiff:
+        self.stats[diff.status] += 1
+        return diff
+
+    async def sync(self, ats: str, companies: Iterable[str], url_for: Callable[[str], str]) -> Dict[str, BoardDiff]:
+        """Sync every company's board concurrently (bounded by the fetcher)."""
+        companies = list(dict.fromkeys(companies))
+
+        async def one(company: str) -> BoardDiff:
+            try:
+                return await self.sync_board(ats, company, url_for(company))
+            except Exception as e:
+                logger.warning(f"[BoardSync] {ats}/{company} failed: {e}")
+                return self._count(BoardDiff(board=board_key(ats, company), status="error"))
+
+        diffs = await asyncio.gather(*[one(c) for c in companies])
+        result = dict(zip(companies, diffs))
+        summary = {status: sum(1 for d in diffs if d.status == status) for status in self.stats}
+        logger.info(f"[BoardSync] {ats}: {len(companies)} boards {summary}")
+        return result
+
+    async def board_jobs(
+        self, ats: str, companies: Iterable[str], url_for: Callable[[str], str]
+    ) -> Dict[str, List[Dict]]:
+        """Sync, then return the stored postings per company."""
+        companies = list(dict.fromkeys(companies))
+        await self.sync(ats, companies, url_for)
+        stored = await asyncio.to_thread(self.store.postings, [board_key(ats, c) for c in companies])
+        return {c: stored[board_key(ats, c)] for c in companies}
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, **self.store.get_stats()}
+
+
+# Singleton
+_board_sync: Optional[BoardSync] = None
+
+
+def get_board_sync() -> BoardSync:
+    """Get singleton BoardSync instance."""
+    global _board_sync
+    if _board_sync is None:
+        _board_sync = BoardSync()
+    return _board_sync
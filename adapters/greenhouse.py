@@ -5,14 +5,20 @@ Direct JSON endpoints, no browser needed.
 
 import aiohttp
 import asyncio
+import logging
 from typing import List, Optional
 from datetime import datetime
 from pathlib import Path
 
+from core.resume_digest import resume_snippet
+from monitoring.apply_spans import mark_phase
 from .base import (
     JobPlatformAdapter, PlatformType, JobPosting, ApplicationResult,
     ApplicationStatus, SearchConfig, UserProfile, Resume
 )
+from .board_fetcher import get_board_fetcher
+
+logger = logging.getLogger(__name__)
 
 
 # Import dynamic company discovery
@@ -50,6 +56,7 @@ class GreenhouseAdapter(JobPlatformAdapter):
     
     platform = PlatformType.GREENHOUSE
     tier = "api"  # Easy tier
+    API_BASE = "https://boards-api.greenhouse.io/v1/boards"
     
     def __init__(
         self,
@@ -91,61 +98,60 @@ class GreenhouseAdapter(JobPlatformAdapter):
             await self._session.close()
             self._session = None
     
+    def _board_url(self, company: str) -> str:
+        return f"{self.API_BASE}/{company}/jobs"
+    
     async def search_jobs(self, criteria: SearchConfig) -> List[JobPosting]:
-        """Search Greenhouse job boards across multiple companies."""
-        session = await self._get_session()
-        all_jobs = []
+        """Search Greenhouse job boards across multiple companies (fetched concurrently)."""
+        companies = list(dict.fromkeys(self.companies))
+        order = {company: i for i, company in enumerate(companies)}
+        matched = []
         
-        query_lower = " ".join(criteria.roles).lower()
-        location_lower = " ".join(criteria.locations).lower() if criteria.locations else ""
-        
-        for company in self.companies:
+        # Boards are filtered as they arrive; output keeps the configured company order.
+        async for company, data in get_board_fetcher().stream(companies, self._board_url):
+            if not data:
+                continue
+            # One malformed board must not sink the whole multi-company search.
             try:
-                url = f"https://boards-api.greenhouse.io/v1/boards/{company}/jobs"
-                
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                    if resp.status != 200:
-                        continue
-                    
-                    data = await resp.json()
-                    jobs = data.get("jobs", [])
-                    
-                    for job in jobs:
-                        title = job.get("title", "").lower()
-                        location = job.get("location", {}).get("name", "").lower()
-                        
-                        # Filter by role keywords
-                        if not any(kw.lower() in title for kw in criteria.roles):
-                            continue
-                        
-                        # Filter by location if specified
-                        if criteria.locations and location_lower:
-                            if not any(loc.lower() in location or "remote" in location 
-                                      for loc in criteria.locations):
-                                continue
-                        
-                        all_jobs.append(JobPosting(
-                            id=f"gh_{company}_{job['id']}",
-                            platform=self.platform,
-                            title=job.get("title", ""),
-                            company=company.replace("-", " ").title(),
-                            location=job.get("location", {}).get("name", ""),
-                            url=job.get("absolute_url", f"https://boards.greenhouse.io/{company}/jobs/{job['id']}"),
-                            description=job.get("content", ""),
-                            easy_apply=True,  # Greenhouse has easy apply
-                            remote="remote" in location
-                        ))
-                
-                # Small delay between companies
-                await asyncio.sleep(0.2)
-                
+                matched.append((order[company], self._filter_board(company, data, criteria)))
             except Exception as e:
-                print(f"[Greenhouse] Error fetching {company}: {e}")
-                continue
+                logger.warning(f"[Greenhouse] Skipping board {company}: {type(e).__name__}: {e}")
         
-        print(f"[Greenhouse] Found {len(all_jobs)} jobs across {len(self.companies)} companies")
+        all_jobs = [job for _, jobs in sorted(matched, key=lambda m: m[0]) for job in jobs]
+        print(f"[Greenhouse] Found {len(all_jobs)} jobs across {len(companies)} companies")
         return all_jobs
     
+    def _filter_board(self, company: str, data: dict, criteria: SearchConfig) -> List[JobPosting]:
+        """Postings on one company's board that match the role and location filters."""
+        location_lower = " ".join(criteria.locations).lower() if criteria.locations else ""
+        jobs = []
+        for job in data.get("jobs", []):
+            title = job.get("title", "").lower()
+            location = (job.get("location") or {}).get("name", "").lower()
+            
+            # Filter by role keywords
+            if not any(kw.lower() in title for kw in criteria.roles):
+                continue
+            
+            # Filter by location if specified
+            if criteria.locations and location_lower:
+                if not any(loc.lower() in location or "remote" in location 
+                          for loc in criteria.locations):
+                    continue
+            
+            jobs.append(JobPosting(
+                id=f"gh_{company}_{job['id']}",
+                platform=self.platform,
+                title=job.get("title", ""),
+                company=company.replace("-", " ").title(),
+                location=(job.get("location") or {}).get("name", ""),
+                url=job.get("absolute_url", f"https://boards.greenhouse.io/{company}/jobs/{job['id']}"),
+                description=job.get("content", ""),
+                easy_apply=True,  # Greenhouse has easy apply
+                remote="remote" in location
+            ))
+        return jobs
+    
     async def get_job_details(self, job_url: str) -> JobPosting:
         """Get full job details from Greenhouse."""
         session = await self._get_session()
@@ -176,6 +182,44 @@ class GreenhouseAdapter(JobPlatformAdapter):
                 remote="remote" in data.get("location", {}).get("name", "").lower()
             )
     
+    # Fields the adapter fills from the profile/resume rather than by answering.
+    STANDARD_FIELDS = {
+        "first_name", "last_name", "email", "phone", "resume", "resume_text",
+        "cover_letter", "cover_letter_text", "location", "linkedin_profile",
+    }
+
+    async def get_application_questions(self, job_url: str) -> List[dict]:
+        """
+        Custom screening questions from the public job board API, in the
+        shape FormIntelligence.answer_questions takes.
+        """
+        session = await self._get_session()
+        parts = job_url.rstrip("/").split("/")
+        job_id = parts[-1]
+        company = parts[-3] if len(parts) >= 3 else "unknown"
+        url = f"https://boards-api.greenhouse.io/v1/boards/{company}/jobs/{job_id}?questions=true"
+
+        async with session.get(url) as resp:
+            if resp.status != 200:
+                return []
+            data = await resp.json()
+
+        questions = []
+        for q in data.get("questions") or []:
+            fields = q.get("fields") or []
+            field = fields[0] if fields else {}
+            field_type = field.get("type", "")
+            if field.get("name") in self.STANDARD_FIELDS or field_type == "input_file":
+                continue
+            options = [v.get("label", "") for v in field.get("values") or [] if v.get("label")]
+            questions.append({
+                "question": q.get("label", ""),
+                "type": "select" if options else "text",
+                "options": options or None,
+                "required": bool(q.get("required")),
+            })
+        return [q for q in questions if q["question"]]
+    
     async def apply_to_job(
         self,
         job: JobPosting,
@@ -250,6 +294,7 @@ class GreenhouseAdapter(JobPlatformAdapter):
         async def fill_additional_fields() -> dict:
             """
             Best-effort fill for additional required fields (screening/EEO/etc).
+            Scans the form first, then answers all questions in one batch.
             Returns dict: {filled: int, missing_required: [question,...]}.
             """
             try:
@@ -260,6 +305,7 @@ class GreenhouseAdapter(JobPlatformAdapter):
                 fi = None
 
             profile_ctx = {
+                "user_id": getattr(profile, "user_id", None),
                 "first_name": getattr(profile, "first_name", ""),
                 "last_name": getattr(profile, "last_name", ""),
                 "email": getattr(profile, "email", ""),
@@ -270,12 +316,13 @@ class GreenhouseAdapter(JobPlatformAdapter):
                 "years_experience": getattr(profile, "years_experience", None),
                 "custom_answers": getattr(profile, "custom_answers", {}) or {},
             }
-            resume_text = getattr(resume, "raw_text", "") or ""
+            resume_text = resume_snippet(resume, "questions") if resume else ""
             job_desc = getattr(job, "description", "") or ""
 
             filled = 0
             missing_required: list[str] = []
             processed_radio_names: set[str] = set()
+            questions: list[dict] = []  # answered together after the scan
 
             controls = page.locator("form input, form select, form textarea")
             try:
@@ -412,19 +459,62 @@ class GreenhouseAdapter(JobPlatformAdapter):
                                 missing_required.append(qtxt)
                             continue
 
-                        if fi:
-                            ans = await fi.answer_question(
-                                question=qtxt,
-                                question_type="radio",
-                                options=opt_labels,
-                                profile=profile_ctx,
-                                resume_text=resume_text,
-                                job_description=job_desc,
-                                context={"company": getattr(job, "company", ""), "title": getattr(job, "title", "")},
-                            )
-                        else:
-                            ans = opt_labels[0]
+                        questions.append({
+                            "kind": "radio", "el": el, "name": name, "opts": opts, "required": required,
+                            "question": qtxt, "type": "radio", "options": opt_labels,
+                        })
+                        continue
+                    except Exception:
+                        if required:
+                            missing_required.append(question or "required_radio")
+                        continue
+
+                # Select
+                if tag == "select":
+                    try:
+                        options_text = [t.strip() for t in await el.locator("option").all_inner_texts() if t.strip()]
+                    except Exception:
+                        options_text = []
+                    if not options_text:
+                        if required:
+                            missing_required.append(question or "required_select")
+                        continue
+                    questions.append({
+                        "kind": "select", "el": el, "required": required,
+                        "question": question or "Select an option", "type": "select", "options": options_text,
+                    })
+                    continue
+
+                # Text / textarea
+                if tag in {"input", "textarea"}:
+                    qtype = "text"
+                    if tag == "input" and itype in {"email", "tel"}:
+                        qtype = "text"
+
+                    questions.append({
+                        "kind": "text", "el": el, "required": required,
+                        "question": question or "Answer", "type": qtype, "options": None,
+                    })
+                    continue
+
+            # Answer every collected question with one batched LLM call.
+            if questions and fi:
+                answers = await fi.answer_questions(
+                    [{"question": q["question"], "type": q["type"], "options": q["options"]} for q in questions],
+                    profile=profile_ctx,
+                    resume_text=resume_text,
+                    job_description=job_desc,
+                    context={"company": getattr(job, "company", ""), "title": getattr(job, "title", "")},
+                )
+            else:
+                answers = [q["options"][0] if q["options"] else "Not specified" for q in questions]
 
+            for q, ans in zip(questions, answers):
+                el = q["el"]
+                if q["kind"] == "radio":
+                    try:
+                        opts = q["opts"]
+                        name = q["name"]
                         # Click matching option
                         clicked = False
                         for o in opts:
@@ -449,34 +539,12 @@ class GreenhouseAdapter(JobPlatformAdapter):
                             else:
                                 await el.click()
                             filled += 1
-                        continue
                     except Exception:
-                        if required:
-                            missing_required.append(question or "required_radio")
-                        continue
+                        if q["required"]:
+                            missing_required.append(q["question"] or "required_radio")
+                    continue
 
-                # Select
-                if tag == "select":
-                    try:
-                        options_text = [t.strip() for t in await el.locator("option").all_inner_texts() if t.strip()]
-                    except Exception:
-                        options_text = []
-                    if not options_text:
-                        if required:
-                            missing_required.append(question or "required_select")
-                        continue
-                    if fi:
-                        ans = await fi.answer_question(
-                            question=question or "Select an option",
-                            question_type="select",
-                            options=options_text,
-                            profile=profile_ctx,
-                            resume_text=resume_text,
-                            job_description=job_desc,
-                            context={"company": getattr(job, "company", ""), "title": getattr(job, "title", "")},
-                        )
-                    else:
-                        ans = options_text[0]
+                if q["kind"] == "select":
                     try:
                         await el.select_option(label=str(ans))
                     except Exception:
@@ -487,40 +555,22 @@ class GreenhouseAdapter(JobPlatformAdapter):
                     filled += 1
                     continue
 
-                # Text / textarea
-                if tag in {"input", "textarea"}:
-                    qtype = "text"
-                    if tag == "input" and itype in {"email", "tel"}:
-                        qtype = "text"
-
-                    if fi:
-                        ans = await fi.answer_question(
-                            question=question or "Answer",
-                            question_type=qtype,
-                            options=None,
-                            profile=profile_ctx,
-                            resume_text=resume_text,
-                            job_description=job_desc,
-                            context={"company": getattr(job, "company", ""), "title": getattr(job, "title", "")},
-                        )
-                    else:
-                        ans = "Not specified"
-
-                    try:
-                        await el.fill(str(ans))
-                        filled += 1
-                    except Exception:
-                        if required:
-                            missing_required.append(question or "required_text")
-                    continue
+                try:
+                    await el.fill(str(ans))
+                    filled += 1
+                except Exception:
+                    if q["required"]:
+                        missing_required.append(q["question"] or "required_text")
 
             return {"filled": filled, "missing_required": missing_required}
 
         screenshot_path = None
         try:
+            mark_phase("navigation")
             await page.goto(job.url, wait_until="domcontentloaded", timeout=60000)
             await self.browser_manager.human_like_delay(2, 4)
 
+            mark_phase("field_discovery")
             # Some Greenhouse postings require clicking "Apply" to reveal the form.
             for sel in [
                 'a:has-text("Apply")',
@@ -538,6 +588,7 @@ class GreenhouseAdapter(JobPlatformAdapter):
                     continue
 
             # Core fields
+            mark_phase("form_fill")
             await try_fill(
                 [
                     "input#first_name",
@@ -572,6 +623,7 @@ class GreenhouseAdapter(JobPlatformAdapter):
             )
 
             # Resume upload
+            mark_phase("upload")
             await try_upload(
                 [
                     "input#resume",
@@ -582,6 +634,7 @@ class GreenhouseAdapter(JobPlatformAdapter):
             )
 
             # Optional cover letter (some forms accept text)
+            mark_phase("form_fill")
             if cover_letter:
                 await try_fill(
                     [
@@ -603,6 +656,7 @@ class GreenhouseAdapter(JobPlatformAdapter):
                     external_url=job.url,
                 )
 
+            mark_phase("captcha")
             if await detect_captcha():
                 screenshot_path = f"/tmp/greenhouse_captcha_{job.id}.png"
                 await page.screenshot(path=screenshot_path, full_page=True)
@@ -624,6 +678,7 @@ class GreenhouseAdapter(JobPlatformAdapter):
                 )
 
             # Submit
+            mark_phase("submit")
             submitted = False
             for sel in [
                 "button[type='submit']",
@@ -652,6 +707,7 @@ class GreenhouseAdapter(JobPlatformAdapter):
                 )
 
             # Verify submission (best-effort)
+            mark_phase("verify")
             content = (await page.content()).lower()
             if "thank you" in content or "application submitted" in content:
                 return ApplicationResult(
@@ -10,6 +10,8 @@ from typing import Dict, Optional, List
 from dataclasses import dataclass
 import logging
 
+from monitoring.apply_spans import mark_phase
+
 logger = logging.getLogger(__name__)
 
 
@@ -125,9 +127,11 @@ class GenericATSHandler:
         
         try:
             # Wait for page to load
+            mark_phase("navigation")
             await asyncio.sleep(3)
             
             # Detect if this looks like an application form
+            mark_phase("field_discovery")
             has_form = await self._detect_application_form(page)
             if not has_form:
                 return ApplicationResult(
@@ -138,6 +142,7 @@ class GenericATSHandler:
             logger.info("[GenericATS] Application form detected")
             
             # Fill form fields
+            mark_phase("form_fill")
             fields_filled = await self._fill_form_fields(page, profile)
             
             if not fields_filled:
@@ -147,13 +152,16 @@ class GenericATSHandler:
                 )
             
             # Upload resume
+            mark_phase("upload")
             resume_uploaded = await self._upload_resume(page, resume_path)
             
             # Submit form
+            mark_phase("submit")
             submitted = await self._submit_form(page)
             
             if submitted:
                 # Check for success
+                mark_phase("verify")
                 success = await self._check_success(page)
                 if success:
                     self.stats['successful'] += 1
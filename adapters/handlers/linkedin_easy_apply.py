@@ -10,14 +10,28 @@ Success Rate: ~75% (varies by company)
 """
 
 import asyncio
-from typing import Dict, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import logging
 from urllib.parse import urlparse
 
+from monitoring.apply_spans import mark_phase
+
 logger = logging.getLogger(__name__)
 
 
+async def current_step_name(page) -> Optional[str]:
+    """Heading of the current Easy Apply step (e.g. 'Contact info'), if visible."""
+    try:
+        heading = page.locator('.jobs-easy-apply-modal h3, .jobs-easy-apply-content h3').first
+        if await heading.count() > 0:
+            text = (await heading.inner_text() or '').strip()
+            return text[:80] or None
+    except Exception:
+        pass
+    return None
+
+
 @dataclass
 class ApplicationResult:
     """Result of an application attempt."""
@@ -294,7 +308,8 @@ class LinkedInEasyApplyHandler:
         self,
         page,
         profile: Dict[str, str],
-        resume_path: str
+        resume_path: str,
+        checkpoint=None,
     ) -> ApplicationResult:
         """
         Apply to a LinkedIn job.
@@ -303,6 +318,7 @@ class LinkedInEasyApplyHandler:
             page: Playwright page (already on LinkedIn job page)
             profile: Dict with first_name, last_name, email, phone
             resume_path: Path to resume file
+            checkpoint: Optional ApplyCheckpoint; a retry reuses its answers
             
         Returns:
             ApplicationResult
@@ -313,6 +329,7 @@ class LinkedInEasyApplyHandler:
             logger.info(f"[LinkedIn] Starting application to {page.url[:60]}...")
             
             # Wait for page to fully load
+            mark_phase("navigation")
             await asyncio.sleep(2)
             
             # Check if login required
@@ -353,7 +370,7 @@ class LinkedInEasyApplyHandler:
             
             if apply_type == 'easy_apply':
                 logger.info("[LinkedIn] Starting Easy Apply flow...")
-                return await self._apply_easy_apply(page, profile, resume_path)
+                return await self._apply_easy_apply(page, profile, resume_path, checkpoint)
             
             elif apply_type == 'external':
                 logger.info("[LinkedIn] Starting External Apply flow...")
@@ -514,7 +531,8 @@ class LinkedInEasyApplyHandler:
         self,
         page,
         profile: Dict[str, str],
-        resume_path: str
+        resume_path: str,
+        checkpoint=None,
     ) -> ApplicationResult:
         """Complete LinkedIn Easy Apply flow with full modal handling."""
         try:
@@ -528,6 +546,7 @@ class LinkedInEasyApplyHandler:
                 )
             
             # Check for CAPTCHA
+            mark_phase("captcha")
             captcha_detected = await self._check_for_captcha(page)
             if captcha_detected:
                 self.stats['captcha_hits'] += 1
@@ -537,6 +556,7 @@ class LinkedInEasyApplyHandler:
                 )
             
             # Step 1: Click Apply button
+            mark_phase("field_discovery")
             logger.info("[LinkedIn] Step 1: Clicking Easy Apply button...")
             apply_clicked = False
             for selector in self.APPLY_BUTTON_SELECTORS:
@@ -632,6 +652,7 @@ class LinkedInEasyApplyHandler:
                     logger.debug(f"[LinkedIn] JS click error: {e}")
             
             # Step 2: Fill/Verify Contact Info
+            mark_phase("form_fill")
             logger.info("[LinkedIn] Step 2: Filling contact information...")
             await self._fill_contact_info_detailed(page, profile)
             
@@ -666,10 +687,11 @@ class LinkedInEasyApplyHandler:
             except Exception as e:
                 logger.debug(f"[LinkedIn] Button debug error: {e}")
             
-            step_result = await self._progress_through_steps(page, resume_path)
+            step_result = await self._progress_through_steps(page, resume_path, checkpoint, profile)
             
             if step_result.success:
                 # Verify the application was actually submitted
+                mark_phase("verify")
                 logger.info("[LinkedIn] Verifying application submission...")
                 await asyncio.sleep(2)
                 
@@ -733,18 +755,33 @@ class LinkedInEasyApplyHandler:
                     logger.debug(f"[LinkedIn] Could not fill {field_name}: {e}")
                     continue
     
-    async def _progress_through_steps(self, page, resume_path: str) -> ApplicationResult:
-        """Progress through LinkedIn Easy Apply multi-step modal."""
+    async def _progress_through_steps(
+        self, page, resume_path: str, checkpoint=None, profile: Optional[Dict] = None
+    ) -> ApplicationResult:
+        """
+        Progress through LinkedIn Easy Apply multi-step modal.
+        
+        With a checkpoint, completed steps and answers are recorded as we go;
+        on a retry, stored answers are reused and the resume step selects the
+        copy LinkedIn already holds instead of uploading again.
+        """
         max_steps = 10
         current_step = 0
         screenshot_on_failure = True
         
+        if checkpoint and checkpoint.resumed:
+            logger.info(
+                f"[LinkedIn] Resuming from checkpoint (last step: {checkpoint.last_step}, "
+                f"{len(checkpoint.answers)} stored answers)"
+            )
+        
         while current_step < max_steps:
             current_step += 1
             logger.info(f"[LinkedIn] Processing step {current_step}/{max_steps}...")
             
             try:
                 await asyncio.sleep(2)
+                step_name = await current_step_name(page) or f"step_{current_step}"
                 
                 # Check for success
                 if await self._check_success(page):
@@ -755,18 +792,25 @@ class LinkedInEasyApplyHandler:
                     )
                 
                 # Handle Resume Upload
-                resume_uploaded = await self._handle_resume_step(page, resume_path)
+                mark_phase("upload")
+                resume_uploaded = await self._handle_resume_step(
+                    page, resume_path, prefer_existing=bool(checkpoint and checkpoint.is_done("resume"))
+                )
                 if resume_uploaded:
                     logger.info("[LinkedIn] ✅ Resume handled")
+                    if checkpoint:
+                        await checkpoint.mark_done("resume")
                     await asyncio.sleep(1)
                 
                 # Answer Additional Questions
-                questions_answered = await self._handle_additional_questions(page)
+                mark_phase("form_fill")
+                questions_answered = await self._handle_additional_questions(page, checkpoint, profile)
                 if questions_answered:
                     logger.info("[LinkedIn] ✅ Questions answered")
                     await asyncio.sleep(1)
                 
                 # Check for final Submit button
+                mark_phase("submit")
                 submit_clicked = False
                 for submit_selector in self.EASY_APPLY_MODAL['submit_button']:
                     try:
@@ -800,6 +844,7 @@ class LinkedInEasyApplyHandler:
                         return ApplicationResult(success=True)
                 
                 # Check for Review/Next buttons
+                mark_phase("navigation")
                 review_clicked = False
                 for review_selector in self.EASY_APPLY_MODAL['review_button']:
                     try:
@@ -815,6 +860,8 @@ class LinkedInEasyApplyHandler:
                         continue
                 
                 if review_clicked:
+                    if checkpoint:
+                        await checkpoint.mark_done(step_name)
                     continue
                 
                 next_clicked = False
@@ -835,6 +882,8 @@ class LinkedInEasyApplyHandler:
                         continue
                 
                 if next_clicked:
+                    if checkpoint:
+                        await checkpoint.mark_done(step_name)
                     continue
                 
                 # Check if done
@@ -870,9 +919,27 @@ class LinkedInEasyApplyHandler:
             error=f"Could not complete after {max_steps} steps"
         )
     
-    async def _handle_resume_step(self, page, resume_path: str) -> bool:
+    async def _select_existing_resume(self, page) -> bool:
+        """Pick a resume LinkedIn already holds instead of uploading."""
+        select_btn = page.locator('button:has-text("Select resume")').first
+        if await select_btn.count() > 0 and await select_btn.is_visible():
+            await select_btn.click()
+            await asyncio.sleep(1)
+            first_resume = page.locator('.artdeco-list__item').first
+            if await first_resume.count() > 0:
+                await first_resume.click()
+                await asyncio.sleep(1)
+            logger.info("[LinkedIn] Existing resume selected")
+            return True
+        return False
+    
+    async def _handle_resume_step(self, page, resume_path: str, prefer_existing: bool = False) -> bool:
         """Handle resume upload step specifically."""
         try:
+            # A previous attempt already uploaded it; reuse LinkedIn's copy.
+            if prefer_existing and await self._select_existing_resume(page):
+                return True
+            
             upload_input = page.locator('input[type="file"]').first
             if await upload_input.count() > 0 and await upload_input.is_visible():
                 await upload_input.set_input_files(resume_path)
@@ -880,15 +947,7 @@ class LinkedInEasyApplyHandler:
                 logger.info("[LinkedIn] Resume uploaded")
                 return True
             
-            select_btn = page.locator('button:has-text("Select resume")').first
-            if await select_btn.count() > 0 and await select_btn.is_visible():
-                await select_btn.click()
-                await asyncio.sleep(1)
-                first_resume = page.locator('.artdeco-list__item').first
-                if await first_resume.count() > 0:
-                    await first_resume.click()
-                    await asyncio.sleep(1)
-                logger.info("[LinkedIn] Existing resume selected")
+            if await self._select_existing_resume(page):
                 return True
                 
         except Exception as e:
@@ -896,9 +955,17 @@ class LinkedInEasyApplyHandler:
         
         return False
     
-    async def _handle_additional_questions(self, page) -> bool:
-        """Handle additional screening questions."""
+    async def _handle_additional_questions(self, page, checkpoint=None, profile: Optional[Dict] = None) -> bool:
+        """
+        Handle additional screening questions.
+        
+        Answers stored in the checkpoint by an earlier attempt are applied
+        first, then the authorization/sponsorship rules. Whatever is left is
+        answered with one batched FormIntelligence call for the whole step.
+        New answers are recorded so a retry doesn't re-derive them.
+        """
         answered = False
+        pending = []  # questions the checkpoint and rules couldn't answer
         
         try:
             selects = await page.locator('select').all()
@@ -906,19 +973,40 @@ class LinkedInEasyApplyHandler:
                 try:
                     select_id = await select.get_attribute('id') or ''
                     options = await select.locator('option').all()
+                    option_texts = [(await option.inner_text()).strip() for option in options[1:]]
                     
-                    for option in options[1:]:
-                        text = await option.inner_text()
+                    stored = checkpoint.get_answer(select_id) if checkpoint and select_id else None
+                    matched_text = None
+                    for text in option_texts:
                         text_lower = text.lower()
                         
-                        if 'sponsor' in select_id.lower() and 'no' in text_lower:
-                            await select.select_option(label=text)
-                            answered = True
-                            break
+                        if stored is not None:
+                            matched = text == stored
+                        elif 'sponsor' in select_id.lower() and 'no' in text_lower:
+                            matched = True
                         elif ('authorized' in select_id.lower() or 'legally' in select_id.lower()) and 'yes' in text_lower:
-                            await select.select_option(label=text)
-                            answered = True
+                            matched = True
+                        else:
+                            matched = False
+                        
+                        if matched:
+                            matched_text = text
                             break
+                    
+                    if matched_text is None:
+                        if option_texts and not (await select.input_value() or '').strip():
+                            label = page.locator(f'label[for="{select_id}"]').first if select_id else None
+                            question = (await label.inner_text()).strip() if label and await label.count() > 0 else select_id
+                            pending.append({
+                                'kind': 'select', 'el': select, 'key': select_id, 'question': question or select_id,
+                                'type': 'select', 'options': option_texts,
+                            })
+                        continue
+                    
+                    await select.select_option(label=matched_text)
+                    answered = True
+                    if checkpoint and select_id:
+                        await checkpoint.set_answer(select_id, matched_text)
                 except:
                     continue
             
@@ -929,31 +1017,90 @@ class LinkedInEasyApplyHandler:
                     if await legend.count() > 0:
                         question = await legend.inner_text()
                         question_lower = question.lower()
+                        stored = checkpoint.get_answer(question) if checkpoint else None
                         
+                        choices = []
                         radios = await group.locator('input[type="radio"]').all()
                         for radio in radios:
                             radio_id = await radio.get_attribute('id')
                             label = page.locator(f'label[for="{radio_id}"]').first
                             if await label.count() > 0:
                                 label_text = await label.inner_text()
-                                label_lower = label_text.lower()
-                                
-                                if 'authorized' in question_lower and 'yes' in label_lower:
-                                    await radio.click()
-                                    answered = True
-                                    break
-                                elif 'sponsor' in question_lower and 'no' in label_lower:
-                                    await radio.click()
-                                    answered = True
-                                    break
+                                choices.append((radio, label_text.strip()))
+                        
+                        matched_radio = None
+                        for radio, label_text in choices:
+                            label_lower = label_text.lower()
+                            
+                            if stored is not None:
+                                matched = label_text == stored
+                            elif 'authorized' in question_lower and 'yes' in label_lower:
+                                matched = True
+                            elif 'sponsor' in question_lower and 'no' in label_lower:
+                                matched = True
+                            else:
+                                matched = False
+                            
+                            if matched:
+                                matched_radio = (radio, label_text)
+                                break
+                        
+                        if matched_radio is None:
+                            if choices and not any([await radio.is_checked() for radio, _ in choices]):
+                                pending.append({
+                                    'kind': 'radio', 'choices': choices, 'key': question, 'question': question.strip(),
+                                    'type': 'radio', 'options': [text for _, text in choices],
+                                })
+                            continue
+                        
+                        await matched_radio[0].click()
+                        answered = True
+                        if checkpoint:
+                            await checkpoint.set_answer(question, matched_radio[1])
                 except:
                     continue
+            
+            if pending and await self._answer_pending_questions(pending, checkpoint, profile):
+                answered = True
                     
         except Exception as e:
             logger.debug(f"[LinkedIn] Questions handling error: {e}")
         
         return answered
     
+    async def _answer_pending_questions(self, pending: List[Dict], checkpoint=None, profile: Optional[Dict] = None) -> bool:
+        """Answer the remaining questions on a step with one batched AI call."""
+        try:
+            from ai.form_intelligence import get_form_intelligence
+            
+            answers = await get_form_intelligence().answer_questions(
+                [{'question': q['question'], 'type': q['type'], 'options': q['options']} for q in pending],
+                profile=profile,
+            )
+        except Exception as e:
+            logger.debug(f"[LinkedIn] Batch question answering unavailable: {e}")
+            return False
+        
+        answered = False
+        for q, answer in zip(pending, answers):
+            try:
+                if q['kind'] == 'select':
+                    await q['el'].select_option(label=answer)
+                else:
+                    radio = next((r for r, text in q['choices'] if text == answer), None)
+                    if radio is None:
+                        continue
+                    await radio.click()
+                answered = True
+                if checkpoint and q['key']:
+                    await checkpoint.set_answer(q['key'], answer)
+            except Exception:
+                continue
+        
+        if answered:
+            logger.info(f"[LinkedIn] Answered {len(pending)} screening questions in one batch")
+        return answered
+    
     async def _check_success(self, page) -> bool:
         """Check if application was successfully submitted."""
         for selector in self.SUCCESS_SELECTORS:
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Browserless HTTP Form Submitter
+
+Many hosted application pages (Lever and similar) are plain HTML multipart
+forms with no JavaScript challenge. For those we can fetch the form, fill it
+from the profile using the same ``FieldMappings`` selectors the browser path
+uses, and post it directly with aiohttp, which is much cheaper than driving
+a browser.
+
+The submitter never tries to get past a CAPTCHA: if one is detected, or the
+form depends on JavaScript, or a required field can't be filled, it returns
+a result with ``should_fallback`` set and the caller uses the browser path.
+
+Example:
+    from adapters.http_submitter import HTTPFormSubmitter
+
+    submitter = HTTPFormSubmitter(platform="lever")
+    result = await submitter.submit(apply_url, profile, resume, cover_letter)
+    if result.should_fallback:
+        ...  # drive the browser instead
+"""
+
+import re
+import asyncio
+import logging
+import mimetypes
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+import aiohttp
+
+from adapters.job_boards.field_mappings import FieldMappings
+
+logger = logging.getLogger(__name__)
+
+
+CAPTCHA_MARKERS = (
+    "g-recaptcha", "recaptcha/api", "hcaptcha", "h-captcha",
+    "cf-turnstile", "challenges.cloudflare.com", "data-sitekey", "arkoselabs", "funcaptcha",
+)
+
+CONFIRMATION_MARKERS = (
+    "thank you", "thanks for applying", "application submitted",
+    "application received", "application has been received", "we've received your application",
+)
+
+SKIP_INPUT_TYPES = {"submit", "button", "image", "reset"}
+
+_ATTR_CLAUSE = r'\[(?:[^\]"\']|"[^"]*"|\'[^\']*\')+\]'
+_SELECTOR_RE = re.compile(r'^([a-zA-Z]+)?((?:[#.][\w-]+)*)((?:' + _ATTR_CLAUSE + r')*)$')
+_ATTR_RE = re.compile(
+    r'\[\s*([\w:-]+)\s*(?:([*^$]?=)\s*(?:"([^"]*)"|\'([^\']*)\'|([^\]\s]*))\s*(i)?\s*)?\]'
+)
+
+
+def selector_matches(selector: str, tag: str, attrs: Dict[str, str]) -> bool:
+    """
+    Match a simple CSS selector against a parsed element.
+
+    Supports ``tag``, ``#id``, ``.class`` and attribute clauses
+    (``[a]``, ``[a=v]``, ``[a*=v]``, ``[a^=v]``, ``[a$=v]``, optional ``i``).
+    Combinators and pseudo-classes never match.
+    """
+    m = _SELECTOR_RE.match(selector.strip())
+    if not m:
+        return False
+    sel_tag, id_class, attr_part = m.groups()
+    if sel_tag and sel_tag.lower() != tag:
+        return False
+
+    for token in re.findall(r'[#.][\w-]+', id_class or ''):
+        if token[0] == '#' and attrs.get('id') != token[1:]:
+            return False
+        if token[0] == '.' and token[1:] not in (attrs.get('class') or '').split():
+            return False
+
+    for name, op, dq, sq, bare, flag in _ATTR_RE.findall(attr_part or ''):
+        expected = dq or sq or bare
+        if name not in attrs:
+            return False
+        if not op:
+            continue
+        actual = attrs.get(name) or ''
+        if flag:
+            actual, expected = actual.lower(), expected.lower()
+        if op == '=' and actual != expected:
+            return False
+        if op == '*=' and expected not in actual:
+            return False
+        if op == '^=' and not actual.startswith(expected):
+            return False
+        if op == '$=' and not actual.endswith(expected):
+            return False
+    return True
+
+
+@dataclass
+class FormField:
+    """A single control inside a parsed HTML form."""
+    tag: str
+    attrs: Dict[str, str]
+    options: List[str] = field(default_factory=list)
+    text: str = ""
+
+    @property
+    def name(self) -> str:
+        return self.attrs.get('name', '')
+
+    @property
+    def type(self) -> str:
+        return (self.attrs.get('type') or ('text' if self.tag == 'input' else self.tag)).lower()
+
+    @property
+    def required(self) -> bool:
+        return 'required' in self.attrs or self.attrs.get('aria-required') == 'true'
+
+
+@dataclass
+class ParsedForm:
+    """An HTML form and its controls."""
+    attrs: Dict[str, str]
+    fields: List[FormField] = field(default_factory=list)
+
+    @property
+    def action(self) -> str:
+        return self.attrs.get('action', '')
+
+    @property
+    def method(self) -> str:
+        return (self.attrs.get('method') or 'get').lower()
+
+
+class _FormParser(HTMLParser):
+    """Collects forms, their controls and page-level JS/CAPTCHA signals."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.forms: List[ParsedForm] = []
+        self.noscript_text = ""
+        self._form: Optional[ParsedForm] = None
+        self._select: Optional[FormField] = None
+        self._textarea: Optional[FormField] = None
+        self._in_noscript = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {k: (v if v is not None else '') for k, v in attrs}
+        if tag == 'form':
+            self._form = ParsedForm(attrs=attrs)
+            self.forms.append(self._form)
+        elif tag == 'noscript':
+            self._in_noscript = True
+        elif self._form is not None and tag in ('input', 'select', 'textarea', 'button'):
+            control = FormField(tag=tag, attrs=attrs)
+            self._form.fields.append(control)
+            if tag == 'select':
+                self._select = control
+            elif tag == 'textarea':
+                self._textarea = control
+        elif tag == 'option' and self._select is not None:
+            self._select.options.append(attrs.get('value', ''))
+
+    def handle_endtag(self, tag):
+        if tag == 'form':
+            self._form = None
+        elif tag == 'select':
+            self._select = None
+        elif tag == 'textarea':
+            self._textarea = None
+        elif tag == 'noscript':
+            self._in_noscript = False
+
+    def handle_data(self, data):
+        if self._textarea is not None:
+            self._textarea.text += data
+        if self._in_noscript:
+            self.noscript_text += data
+
+
+@dataclass
+class HTTPSubmitResult:
+    """Outcome of an HTTP submission attempt."""
+    status: str  # submitted | unconfirmed | fallback
+    message: str = ""
+    fields_filled: List[str] = field(default_factory=list)
+    final_url: Optional[str] = None
+
+    @property
+    def should_fallback(self) -> bool:
+        """True when nothing was posted and the browser path should run."""
+        return self.status == "fallback"
+
+    @property
+    def submitted(self) -> bool:
+        return self.status == "submitted"
+
+
+class HTTPFormSubmitter:
+    """
+    Fill and post a plain-HTML application form without a browser.
+
+    Field selectors come from ``FieldMappings`` for the given platform, so the
+    HTTP path and the browser path agree on which input is which.
+    """
+
+    def __init__(self, platform: str = "lever", timeout: float = 30.0,
+                 session: Optional[aiohttp.ClientSession] = None):
+        self.platform = platform
+        self.timeout = timeout
+        self._session = session
+        self.stats = {'submitted': 0, 'unconfirmed': 0, 'fallback': 0}
+
+    def _profile_values(self, profile, cover_letter: Optional[str]) -> Dict[str, str]:
+        first = getattr(profile, 'first_name', '') or ''
+        last = getattr(profile, 'last_name', '') or ''
+        return {
+            'full_name': f"{first} {last}".strip(),
+            'first_name': first,
+            'last_name': last,
+            'email': getattr(profile, 'email', '') or '',
+            'phone': getattr(profile, 'phone', '') or '',
+            'location': getattr(profile, 'location', '') or '',
+            'linkedin': getattr(profile, 'linkedin_url', '') or '',
+            'portfolio': getattr(profile, 'website', '') or '',
+            'cover_letter': cover_letter or '',
+        }
+
+    @staticmethod
+    def detect_blockers(page_html: str, parser: _FormParser) -> Optional[str]:
+        """Return a reason the page needs a real browser, or None."""
+        lowered = page_html.lower()
+        for marker in CAPTCHA_MARKERS:
+            if marker in lowered:
+                return f"captcha detected ({marker})"
+        if not parser.forms:
+            if 'javascript' in parser.noscript_text.lower():
+                return "javascript required"
+            return "no HTML form found"
+        return None
+
+    def _pick_form(self, forms: List[ParsedForm]) -> ParsedForm:
+        """Prefer the form with a file input, then the one with the most controls."""
+        return max(forms, key=lambda f: (any(c.type == 'file' for c in f.fields), len(f.fields)))
+
+    def map_fields(
+        self,
+        form: ParsedForm,
+        values: Dict[str, str],
+        answers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Dict[str, str], Optional[FormField], List[str], List[str]]:
+        """
+        Map profile values onto form controls.
+
+        Returns (data, resume_field, filled_field_types, missing_required_names).
+        """
+        data: Dict[str, str] = {}
+        assigned = set()
+        filled: List[str] = []
+        resume_field = None
+
+        for control in form.fields:
+            if not control.name or control.type in SKIP_INPUT_TYPES or control.tag == 'button':
+                continue
+            if control.type in ('checkbox', 'radio'):
+                if 'checked' in control.attrs:
+                    data.setdefault(control.name, control.attrs.get('value', 'on'))
+                continue
+            if control.type == 'file':
+                continue
+            default = control.text if control.tag == 'textarea' else control.attrs.get('value', '')
+            if control.tag == 'select' and not default and control.options:
+                default = control.options[0]
+            if default:
+                data[control.name] = default
+
+        for field_type in FieldMappings.MAPPINGS.get(self.platform.lower(), {}):
+            if field_type == 'submit':
+                continue
+            selectors = FieldMappings.get_selectors(self.platform, field_type)
+            for control in form.fields:
+                if id(control) in assigned or not control.name:
+                    continue
+                if not any(selector_matches(s, control.tag, control.attrs) for s in selectors):
+                    continue
+                if field_type == 'resume':
+                    if control.type == 'file':
+                        resume_field = control
+                        assigned.add(id(control))
+                        filled.append(field_type)
+                    break
+                value = values.get(field_type)
+                if value:
+                    data[control.name] = value
+                    assigned.add(id(control))
+                    filled.append(field_type)
+                break
+
+        for name, value in (answers or {}).items():
+            if value not in (None, ''):
+                data[name] = str(value)
+
+        missing = []
+        for control in form.fields:
+            if not control.required or not control.name:
+                continue
+            if control.type == 'file':
+                if control is not resume_field:
+                    missing.append(control.name)
+            elif not data.get(control.name):
+                missing.append(control.name)
+
+        return data, resume_field, filled, missing
+
+    def _fallback(self, message: str) -> HTTPSubmitResult:
+        self.stats['fallback'] += 1
+        logger.info(f"[HTTPSubmit] Falling back to browser: {message}")
+        return HTTPSubmitResult(status="fallback", message=message)
+
+    async def submit(
+        self,
+        url: str,
+        profile,
+        resume,
+        cover_letter: Optional[str] = None,
+        answers: Optional[Dict[str, str]] = None,
+    ) -> HTTPSubmitResult:
+        """
+        Fetch the form at ``url``, fill it and post it.
+
+        Args:
+            url: Application form URL
+            profile: UserProfile (first_name, last_name, email, ...)
+            resume: Resume with ``file_path``
+            cover_letter: Optional cover letter text
+            answers: Optional explicit values keyed by form field name
+        """
+        resume_path = Path(getattr(resume, 'file_path', '') or '')
+        if not resume_path.is_file():
+            return self._fallback("resume file not available")
+
+        posted = False
+        own_session = self._session is None
+        session = self._session or aiohttp.ClientSession(
+            headers={"User-Agent": "Mozilla/5.0 (compatible; JobBot/1.0)"},
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        try:
+            async with session.get(url) as resp:
+                if resp.status != 200:
+                    return self._fallback(f"form fetch returned HTTP {resp.status}")
+                page_html = await resp.text(errors='ignore')
+                form_url = str(resp.url)
+
+            parser = _FormParser()
+            parser.feed(page_html)
+            blocker = self.detect_blockers(page_html, parser)
+            if blocker:
+                return self._fallback(blocker)
+
+            form = self._pick_form(parser.forms)
+            action = form.action.strip()
+            if action.lower().startswith('javascript:') or form.method != 'post':
+                return self._fallback("form is not a plain POST form")
+
+            data, resume_field, filled, missing = self.map_fields(
+                form, self._profile_values(profile, cover_letter), answers
+            )
+            if resume_field is None:
+                return self._fallback("resume upload field not found")
+            if missing:
+                return self._fallback(f"required fields not mapped: {', '.join(missing[:5])}")
+
+            posted = True
+            payload = aiohttp.FormData()
+            for name, value in data.items():
+                payload.add_field(name, value)
+            content_type = mimetypes.guess_type(resume_path.name)[0] or 'application/octet-stream'
+            with open(resume_path, 'rb') as fh:
+                payload.add_field(resume_field.name, fh, filename=resume_path.name, content_type=content_type)
+                async with session.post(urljoin(form_url, action or form_url), data=payload) as resp:
+                    body = (await resp.text(errors='ignore')).lower()
+                    final_url = str(resp.url)
+                    status = resp.status
+
+            if status >= 400:
+                return self._fallback(f"form post returned HTTP {status}")
+            if any(marker in body for marker in CAPTCHA_MARKERS) and not any(
+                marker in body for marker in CONFIRMATION_MARKERS
+            ):
+                return self._fallback("captcha challenge after submit")
+
+            if any(marker in body for marker in CONFIRMATION_MARKERS):
+                self.stats['submitted'] += 1
+                logger.info(f"[HTTPSubmit] Submitted {url} ({len(filled)} fields)")
+                return HTTPSubmitResult(
+                    status="submitted",
+                    message="Application submitted via HTTP",
+                    fields_filled=filled,
+                    final_url=final_url,
+                )
+
+            # Something was posted; never resubmit through the browser.
+            self.stats['unconfirmed'] += 1
+            return HTTPSubmitResult(
+                status="unconfirmed",
+                message="Form posted, but confirmation not detected. Please verify.",
+                fields_filled=filled,
+                final_url=final_url,
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            if posted:
+                # The post may have reached the server; a browser retry could double-apply.
+                self.stats['unconfirmed'] += 1
+                return HTTPSubmitResult(status="unconfirmed", message=f"Form post interrupted: {e}")
+            return self._fallback(f"request failed: {e}")
+        finally:
+            if own_session:
+                await session.close()
@@ -9,13 +9,16 @@ import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, List, Optional, Any
 import asyncio
 import aiohttp
 import ssl
 from urllib.parse import urljoin, urlparse
 import logging
 
+from core.job_dedupe import get_job_dedupe
+from core.job_index import index_jobs_async
+
 logger = logging.getLogger(__name__)
 
 
@@ -130,35 +133,28 @@ class BaseJobBoardScraper(ABC):
 
 
 class DeduplicationEngine:
-    """Cross-board job deduplication."""
+    """Cross-board job deduplication (canonical URLs + near-duplicates, see core.job_dedupe)."""
     
-    def __init__(self):
-        self.seen_keys: Set[str] = set()
-        self.duplicate_count = 0
+    def __init__(self, user_id: Optional[str] = None):
+        self.session = get_job_dedupe().session(user_id)
         
     def is_duplicate(self, job: JobPosting) -> bool:
-        """Check if job is a duplicate."""
-        key = job.generate_key()
-        if key in self.seen_keys:
-            self.duplicate_count += 1
-            return True
-        self.seen_keys.add(key)
-        return False
+        """Check if job is a duplicate of one already seen (or applied to)."""
+        return self.session.is_duplicate(job)
         
     def filter_unique(self, jobs: List[JobPosting]) -> List[JobPosting]:
         """Filter to unique jobs only."""
-        unique = []
-        for job in jobs:
-            if not self.is_duplicate(job):
-                unique.append(job)
-        return unique
+        return self.session.filter_unique(jobs)
         
     def get_stats(self) -> Dict[str, int]:
         """Get deduplication statistics."""
+        stats = self.session.stats
         return {
-            'unique_jobs': len(self.seen_keys),
-            'duplicates_filtered': self.duplicate_count,
-            'total_seen': len(self.seen_keys) + self.duplicate_count
+            'unique_jobs': stats['unique'],
+            'duplicates_filtered': self.session.duplicates,
+            'near_duplicates': stats['near_duplicate'],
+            'already_applied': stats['applied'],
+            'total_seen': stats['unique'] + self.session.duplicates
         }
 
 
@@ -287,8 +283,11 @@ class UnifiedJobPipeline:
             logger.info(f"{scraper.name}: Found {len(result)} jobs")
             all_jobs.extend(result)
             
+        # Keep everything scraped searchable locally
+        await index_jobs_async(all_jobs)
+        
         # Deduplicate
-        unique_jobs = self.dedup_engine.filter_unique(all_jobs)
+        unique_jobs = await asyncio.to_thread(self.dedup_engine.filter_unique, all_jobs)
         
         # Enrich with ATS detection
         for job in unique_jobs:
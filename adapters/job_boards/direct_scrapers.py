@@ -21,6 +21,8 @@ import logging
 import json
 import ssl
 
+from ..board_sync import get_board_sync
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,65 +68,49 @@ class GreenhouseDirectScraper:
         'vercel', 'linear', 'webflow', 'figma', 'loom',
     ]
     
-    async def scrape_company(self, company: str, keywords: List[str]) -> List[DirectJobPosting]:
-        """Scrape jobs from a single company's Greenhouse board."""
+    @staticmethod
+    def _board_url(company: str) -> str:
+        return f"https://boards.greenhouse.io/{company}/jobs.json"
+    
+    def _matching(self, company: str, postings: List[Dict], keywords: List[str]) -> List[DirectJobPosting]:
         jobs = []
-        url = f"https://boards.greenhouse.io/{company}/jobs.json"
-        
-        try:
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+        for job_data in postings:
+            title = job_data.get('title', '').lower()
             
-            async with aiohttp.ClientSession(
-                connector=aiohttp.TCPConnector(ssl=ssl_context)
-            ) as session:
-                async with session.get(url, timeout=10) as response:
-                    if response.status != 200:
-                        return jobs
-                    
-                    data = await response.json()
-                    
-                    for job_data in data.get('jobs', []):
-                        title = job_data.get('title', '').lower()
-                        
-                        # Filter by keywords
-                        if not any(kw.lower() in title for kw in keywords):
-                            continue
-                        
-                        job = DirectJobPosting(
-                            id=f"gh_{company}_{job_data.get('id')}",
-                            title=job_data.get('title', ''),
-                            company=company.title(),
-                            location=job_data.get('location', {}).get('name', 'Remote'),
-                            url=job_data.get('absolute_url', ''),
-                            description=job_data.get('content', '')[:500],
-                            ats_type='greenhouse',
-                            company_url=f"https://boards.greenhouse.io/{company}",
-                        )
-                        jobs.append(job)
-                        
+            # Filter by keywords
+            if not any(kw.lower() in title for kw in keywords):
+                continue
+            
+            jobs.append(DirectJobPosting(
+                id=f"gh_{company}_{job_data.get('id')}",
+                title=job_data.get('title', ''),
+                company=company.title(),
+                location=(job_data.get('location') or {}).get('name', 'Remote'),
+                url=job_data.get('absolute_url', ''),
+                description=(job_data.get('content') or '')[:500],
+                ats_type='greenhouse',
+                company_url=f"https://boards.greenhouse.io/{company}",
+            ))
+        return jobs
+    
+    async def scrape_company(self, company: str, keywords: List[str]) -> List[DirectJobPosting]:
+        """Scrape jobs from a single company's Greenhouse board (incrementally synced)."""
+        try:
+            boards = await get_board_sync().board_jobs('greenhouse', [company], self._board_url)
+            return self._matching(company, boards[company], keywords)
         except Exception as e:
             logger.debug(f"[GreenhouseDirect] {company} failed: {e}")
-        
-        return jobs
+            return []
     
     async def search(self, keywords: List[str], max_jobs: int = 100) -> List[DirectJobPosting]:
         """Search across all Greenhouse companies."""
         logger.info(f"[GreenhouseDirect] Searching {len(self.COMPANIES)} companies...")
         
+        # Unchanged boards cost a 304 (or nothing, if checked recently).
+        boards = await get_board_sync().board_jobs('greenhouse', self.COMPANIES, self._board_url)
         all_jobs = []
-        tasks = []
-        
-        for company in self.COMPANIES:
-            task = self.scrape_company(company, keywords)
-            tasks.append(task)
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        for result in results:
-            if isinstance(result, list):
-                all_jobs.extend(result)
+        for company, postings in boards.items():
+            all_jobs.extend(self._matching(company, postings, keywords))
         
         logger.info(f"[GreenhouseDirect] Found {len(all_jobs)} jobs")
         return all_jobs[:max_jobs]
@@ -141,59 +127,47 @@ class LeverDirectScraper:
         'twilio', 'segment', 'auth0', 'github',
     ]
     
-    async def scrape_company(self, company: str, keywords: List[str]) -> List[DirectJobPosting]:
-        """Scrape jobs from a Lever company."""
+    @staticmethod
+    def _board_url(company: str) -> str:
+        return f"https://api.lever.co/v0/postings/{company}?mode=json"
+    
+    def _matching(self, company: str, postings: List[Dict], keywords: List[str]) -> List[DirectJobPosting]:
         jobs = []
-        url = f"https://api.lever.co/v0/postings/{company}?mode=json"
-        
-        try:
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+        for posting in postings:
+            title = posting.get('text', '').lower()
             
-            async with aiohttp.ClientSession(
-                connector=aiohttp.TCPConnector(ssl=ssl_context)
-            ) as session:
-                async with session.get(url, timeout=10) as response:
-                    if response.status != 200:
-                        return jobs
-                    
-                    postings = await response.json()
-                    
-                    for posting in postings:
-                        title = posting.get('text', '').lower()
-                        
-                        if not any(kw.lower() in title for kw in keywords):
-                            continue
-                        
-                        job = DirectJobPosting(
-                            id=f"lever_{company}_{posting.get('id')}",
-                            title=posting.get('text', ''),
-                            company=company.title(),
-                            location=posting.get('categories', {}).get('location', 'Remote'),
-                            url=posting.get('applyUrl', ''),
-                            description=posting.get('description', '')[:500],
-                            ats_type='lever',
-                            company_url=f"https://jobs.lever.co/{company}",
-                        )
-                        jobs.append(job)
-                        
+            if not any(kw.lower() in title for kw in keywords):
+                continue
+            
+            jobs.append(DirectJobPosting(
+                id=f"lever_{company}_{posting.get('id')}",
+                title=posting.get('text', ''),
+                company=company.title(),
+                location=(posting.get('categories') or {}).get('location', 'Remote'),
+                url=posting.get('applyUrl', ''),
+                description=(posting.get('description') or '')[:500],
+                ats_type='lever',
+                company_url=f"https://jobs.lever.co/{company}",
+            ))
+        return jobs
+    
+    async def scrape_company(self, company: str, keywords: List[str]) -> List[DirectJobPosting]:
+        """Scrape jobs from a Lever company (incrementally synced)."""
+        try:
+            boards = await get_board_sync().board_jobs('lever', [company], self._board_url)
+            return self._matching(company, boards[company], keywords)
         except Exception as e:
             logger.debug(f"[LeverDirect] {company} failed: {e}")
-        
-        return jobs
+            return []
     
     async def search(self, keywords: List[str], max_jobs: int = 100) -> List[DirectJobPosting]:
         """Search across Lever companies."""
         logger.info(f"[LeverDirect] Searching {len(self.COMPANIES)} companies...")
         
+        boards = await get_board_sync().board_jobs('lever', self.COMPANIES, self._board_url)
         all_jobs = []
-        tasks = [self.scrape_company(c, keywords) for c in self.COMPANIES]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        for result in results:
-            if isinstance(result, list):
-                all_jobs.extend(result)
+        for company, postings in boards.items():
+            all_jobs.extend(self._matching(company, postings, keywords))
         
         logger.info(f"[LeverDirect] Found {len(all_jobs)} jobs")
         return all_jobs[:max_jobs]
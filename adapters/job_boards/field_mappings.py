@@ -18,6 +18,7 @@ class FieldMappings:
     
     # Standard form field types
     FIELD_TYPES = [
+        'full_name',
         'first_name',
         'last_name',
         'email',
@@ -90,6 +91,10 @@ class FieldMappings:
         
         # ===== LEVER =====
         'lever': {
+            'full_name': [
+                'input[name="name"]',
+                'input#name',
+            ],
             'first_name': [
                 'input[name="name[first]"]',
                 'input[placeholder*="First" i]',
@@ -116,6 +121,10 @@ class FieldMappings:
             'cover_letter': [
                 'input[name="coverLetter"]',
                 'textarea[name="coverLetter"]',
+                'textarea[name="comments"]',
+            ],
+            'location': [
+                'input[name="location"]',
             ],
             'linkedin': [
                 'input[name="urls[LinkedIn]"]',
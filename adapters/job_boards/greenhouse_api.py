@@ -14,6 +14,7 @@ from urllib.parse import urljoin
 import logging
 
 from . import BaseJobBoardScraper, JobPosting, SearchCriteria
+from ..board_sync import get_board_sync
 
 logger = logging.getLogger(__name__)
 
@@ -55,22 +56,22 @@ class GreenhouseAPIScraper(BaseJobBoardScraper):
             return 'greenhouse'
         return None
         
-    async def _fetch_company_jobs(self, company: str) -> List[JobPosting]:
-        """Fetch jobs for a single Greenhouse company."""
-        url = f"{self.API_BASE}/{company}/jobs.json"
+    def _board_url(self, company: str) -> str:
+        return f"{self.API_BASE}/{company}/jobs.json"
+        
+    def _parse_jobs(self, postings: List[Dict], company: str) -> List[JobPosting]:
+        jobs = []
+        for job_data in postings:
+            job = self._parse_job(job_data, company)
+            if job:
+                jobs.append(job)
+        return jobs
         
+    async def _fetch_company_jobs(self, company: str) -> List[JobPosting]:
+        """Fetch jobs for a single Greenhouse company (incrementally synced)."""
         try:
-            import aiohttp
-            data = await self.fetch_json(url, timeout=aiohttp.ClientTimeout(total=10))
-            
-            jobs = []
-            for job_data in data.get('jobs', []):
-                job = self._parse_job(job_data, company)
-                if job:
-                    jobs.append(job)
-                    
-            return jobs
-            
+            boards = await get_board_sync().board_jobs("greenhouse", [company], self._board_url)
+            return self._parse_jobs(boards[company], company)
         except Exception as e:
             logger.warning(f"Failed to fetch jobs for {company}: {e}")
             return []
@@ -155,26 +156,13 @@ class GreenhouseAPIScraper(BaseJobBoardScraper):
         """Search Greenhouse across configured companies."""
         all_jobs = []
         
-        # Search companies concurrently (with limit)
-        semaphore = asyncio.Semaphore(10)  # Limit concurrent requests
-        
-        async def fetch_with_limit(company: str):
-            async with semaphore:
-                jobs = await self._fetch_company_jobs(company)
-                await asyncio.sleep(0.5)  # Be polite
-                return jobs
-                
-        tasks = [fetch_with_limit(company) for company in self.companies]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Boards are synced incrementally (conditional requests) and read from the job store.
+        boards = await get_board_sync().board_jobs("greenhouse", self.companies, self._board_url)
         
-        for company, result in zip(self.companies, results):
-            if isinstance(result, Exception):
-                logger.error(f"Greenhouse fetch failed for {company}: {result}")
-                continue
-                
+        query_lower = criteria.query.lower()
+        for company, postings in boards.items():
             # Filter by query
-            query_lower = criteria.query.lower()
-            for job in result:
+            for job in self._parse_jobs(postings, company):
                 if query_lower in job.title.lower() or query_lower in job.description.lower():
                     # Additional filters
                     if criteria.remote_only and not job.remote:
@@ -2,15 +2,18 @@
 """
 JobSpy Scraper - Parallel job scraping with jobspy library.
 
-Supports parallel searches across multiple queries and locations.
+Supports parallel searches across multiple queries and locations. Scrapes
+run in the shared JobSpy process pool (adapters/jobspy_pool.py), so they
+never block the event loop.
 """
 
 import asyncio
+from datetime import datetime
 from typing import List, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor
 import logging
 
 from ..job_boards import BaseJobBoardScraper, SearchCriteria, JobPosting
+from ..jobspy_pool import get_jobspy_pool, jobspy_available
 
 logger = logging.getLogger(__name__)
 
@@ -43,14 +46,9 @@ class JobSpyScraper(BaseJobBoardScraper):
         
         self.name = "jobspy"
         
-        try:
-            from jobspy import scrape_jobs
-            self.scrape_jobs = scrape_jobs
-            self.available = True
-        except ImportError:
+        self.available = jobspy_available()
+        if not self.available:
             logger.warning("jobspy not available")
-            self.available = False
-            self.scrape_jobs = None
     
     def get_default_headers(self) -> Dict[str, str]:
         """Return default headers."""
@@ -58,8 +56,8 @@ class JobSpyScraper(BaseJobBoardScraper):
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
     
-    async def search(self, criteria: SearchCriteria) -> List[JobPosting]:
-        """Search for jobs using jobspy."""
+    async def search(self, criteria: SearchCriteria, timeout: Optional[float] = None) -> List[JobPosting]:
+        """Search for jobs using jobspy (``timeout`` defaults to the pool's)."""
         if not self.available:
             logger.error("jobspy not available")
             return []
@@ -67,12 +65,11 @@ class JobSpyScraper(BaseJobBoardScraper):
         jobs = []
         
         try:
-            # Use jobspy to scrape
-            import pandas as pd
-            
             logger.info(f"[JobSpy] Searching: '{criteria.query}' in '{criteria.location}'")
             
-            jobs_df = self.scrape_jobs(
+            # Runs in the JobSpy process pool; rows come back as compact records.
+            records = await get_jobspy_pool().scrape(
+                timeout=timeout,
                 site_name=self.sites,
                 search_term=criteria.query,
                 location=criteria.location,
@@ -80,19 +77,15 @@ class JobSpyScraper(BaseJobBoardScraper):
                 hours_old=criteria.posted_within_days * 24,
             )
             
-            if jobs_df is None or jobs_df.empty:
+            if not records:
                 logger.info(f"[JobSpy] No jobs found")
                 return []
             
             # Convert to JobPosting objects
-            for _, row in jobs_df.iterrows():
-                try:
-                    job = self._convert_to_jobposting(row)
-                    if job:
-                        jobs.append(job)
-                except Exception as e:
-                    logger.debug(f"[JobSpy] Failed to convert job: {e}")
-                    continue
+            for record in records:
+                job = self._convert_to_jobposting(record)
+                if job:
+                    jobs.append(job)
             
             logger.info(f"[JobSpy] Found {len(jobs)} jobs")
             
@@ -101,12 +94,10 @@ class JobSpyScraper(BaseJobBoardScraper):
         
         return jobs
     
-    def _convert_to_jobposting(self, row) -> Optional[JobPosting]:
-        """Convert jobspy row to JobPosting."""
+    def _convert_to_jobposting(self, record: Dict) -> Optional[JobPosting]:
+        """Convert a compact JobSpy record to JobPosting."""
         try:
-            from datetime import datetime
-            
-            job_url = str(row.get('job_url', ''))
+            job_url = str(record.get('job_url') or '')
             if not job_url or 'http' not in job_url:
                 return None
             
@@ -115,25 +106,26 @@ class JobSpyScraper(BaseJobBoardScraper):
             
             # Parse date
             date_posted = None
-            if 'date_posted' in row and pd.notna(row['date_posted']):
+            if record.get('date_posted'):
                 try:
-                    date_posted = pd.to_datetime(row['date_posted'])
-                except:
+                    date_posted = datetime.fromisoformat(record['date_posted'])
+                except (TypeError, ValueError):
                     pass
             
+            location = str(record.get('location') or '').strip()
             return JobPosting(
                 id=f"{platform}_{abs(hash(job_url)) % 10000000}",
-                title=str(row.get('title', '')).strip(),
-                company=str(row.get('company', '')).strip(),
-                location=str(row.get('location', '')).strip(),
-                description=str(row.get('description', ''))[:500],
+                title=str(record.get('title') or '').strip(),
+                company=str(record.get('company') or '').strip(),
+                location=location,
+                description=str(record.get('description') or '')[:500],
                 url=job_url,
                 source="jobspy",
                 posted_date=date_posted,
-                employment_type=str(row.get('job_type', '')) if pd.notna(row.get('job_type')) else None,
-                remote='remote' in str(row.get('location', '')).lower(),
-                easy_apply=row.get('easy_apply', False) if 'easy_apply' in row else False,
-                raw_data=row.to_dict(),
+                employment_type=record.get('job_type'),
+                remote='remote' in location.lower(),
+                easy_apply=bool(record.get('easy_apply')),
+                raw_data=record,
             )
         except Exception as e:
             logger.debug(f"[JobSpy] Conversion error: {e}")
@@ -189,40 +181,32 @@ class JobSpyScraper(BaseJobBoardScraper):
         
         logger.info(f"[JobSpy] Starting {len(search_configs)} parallel searches")
         
-        # Execute in parallel
+        # Execute in parallel (bounded; each search runs in the JobSpy process pool)
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+        
+        async def run(criteria: SearchCriteria) -> List[JobPosting]:
+            async with semaphore:
+                return await self.search(criteria, timeout=per_search_timeout)
+        
+        results = await asyncio.gather(*[run(c) for c in search_configs], return_exceptions=True)
+        
         all_jobs = []
         seen_urls = set()
-        
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all searches
-            futures = [
-                executor.submit(self._search_sync, criteria)
-                for criteria in search_configs
-            ]
+        for i, jobs in enumerate(results):
+            if isinstance(jobs, Exception):
+                logger.warning(f"[JobSpy] Search failed or timed out: {jobs}")
+                continue
+            logger.info(f"[JobSpy] Search {i+1}/{len(search_configs)}: {len(jobs)} jobs")
             
-            # Collect results as they complete
-            for i, future in enumerate(futures):
-                try:
-                    jobs = future.result(timeout=per_search_timeout)
-                    logger.info(f"[JobSpy] Search {i+1}/{len(search_configs)}: {len(jobs)} jobs")
-                    
-                    # Deduplicate
-                    for job in jobs:
-                        if job.url not in seen_urls:
-                            seen_urls.add(job.url)
-                            all_jobs.append(job)
-                    
-                except Exception as e:
-                    logger.warning(f"[JobSpy] Search failed or timed out: {e}")
+            # Deduplicate
+            for job in jobs:
+                if job.url not in seen_urls:
+                    seen_urls.add(job.url)
+                    all_jobs.append(job)
         
         logger.info(f"[JobSpy] Total unique jobs: {len(all_jobs)}")
         return all_jobs
     
-    def _search_sync(self, criteria: SearchCriteria) -> List[JobPosting]:
-        """Synchronous search for thread pool."""
-        import asyncio
-        return asyncio.run(self.search(criteria))
-    
     async def search_in_batches(
         self,
         queries: List[str],
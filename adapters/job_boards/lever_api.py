@@ -12,6 +12,7 @@ from typing import Dict, List, Optional
 import logging
 
 from . import BaseJobBoardScraper, JobPosting, SearchCriteria
+from ..board_sync import get_board_sync
 
 logger = logging.getLogger(__name__)
 
@@ -54,22 +55,22 @@ class LeverAPIScraper(BaseJobBoardScraper):
             return 'lever'
         return None
         
-    async def _fetch_company_jobs(self, company: str) -> List[JobPosting]:
-        """Fetch jobs for a single Lever company."""
-        url = f"{self.API_BASE}/{company}"
+    def _board_url(self, company: str) -> str:
+        return f"{self.API_BASE}/{company}"
+        
+    def _parse_jobs(self, postings: List[Dict], company: str) -> List[JobPosting]:
+        jobs = []
+        for job_data in postings:
+            job = self._parse_job(job_data, company)
+            if job:
+                jobs.append(job)
+        return jobs
         
+    async def _fetch_company_jobs(self, company: str) -> List[JobPosting]:
+        """Fetch jobs for a single Lever company (incrementally synced)."""
         try:
-            import aiohttp
-            data = await self.fetch_json(url, timeout=aiohttp.ClientTimeout(total=10))
-            
-            jobs = []
-            for job_data in data:
-                job = self._parse_job(job_data, company)
-                if job:
-                    jobs.append(job)
-                    
-            return jobs
-            
+            boards = await get_board_sync().board_jobs("lever", [company], self._board_url)
+            return self._parse_jobs(boards[company], company)
         except Exception as e:
             logger.warning(f"Failed to fetch Lever jobs for {company}: {e}")
             return []
@@ -156,26 +157,13 @@ class LeverAPIScraper(BaseJobBoardScraper):
         """Search Lever across configured companies."""
         all_jobs = []
         
-        # Search companies concurrently
-        semaphore = asyncio.Semaphore(10)
-        
-        async def fetch_with_limit(company: str):
-            async with semaphore:
-                jobs = await self._fetch_company_jobs(company)
-                await asyncio.sleep(0.5)
-                return jobs
-                
-        tasks = [fetch_with_limit(company) for company in self.companies]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Boards are synced incrementally (conditional requests) and read from the job store.
+        boards = await get_board_sync().board_jobs("lever", self.companies, self._board_url)
         
-        for company, result in zip(self.companies, results):
-            if isinstance(result, Exception):
-                logger.error(f"Lever fetch failed for {company}: {result}")
-                continue
-                
+        query_lower = criteria.query.lower()
+        for company, postings in boards.items():
             # Filter by query
-            query_lower = criteria.query.lower()
-            for job in result:
+            for job in self._parse_jobs(postings, company):
                 if query_lower in job.title.lower() or query_lower in job.description.lower():
                     if criteria.remote_only and not job.remote:
                         continue
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Job Detail Resolvers - HTTP fast path for job-detail extraction.
+
+Most ATS boards expose job details through a public JSON API, and most other
+career pages embed a schema.org ``JobPosting`` block as JSON-LD. Resolving
+details over plain HTTP avoids opening a browser and making an LLM
+``extract`` call just to read a title, company and description.
+
+Resolvers are registered by URL pattern and tried in registration order;
+the JSON-LD resolver is the generic last resort. ``resolve_job_details``
+returns None when nothing matched so callers can fall back to the browser.
+
+Example:
+    from adapters.job_details import resolve_job_details
+
+    job = await resolve_job_details(url)
+    if job is None:
+        job = await browser_extract(url)
+"""
+
+import re
+import json
+import html
+import logging
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import urlparse
+
+import aiohttp
+
+from core.models import JobPosting, PlatformType, detect_platform_from_url
+
+logger = logging.getLogger(__name__)
+
+
+ResolverFunc = Callable[[aiohttp.ClientSession, str, "re.Match"], Awaitable[Optional[JobPosting]]]
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; JobBot/1.0)',
+    'Accept': 'application/json, text/html;q=0.9, */*;q=0.8',
+}
+
+_JSONLD_RE = re.compile(
+    r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def html_to_text(content: str) -> str:
+    """Convert (possibly entity-escaped) HTML to plain text."""
+    if not content:
+        return ""
+    content = html.unescape(content)
+    content = re.sub(r'<(br|/p|/li|/h\d|/div)[^>]*>', '\n', content, flags=re.IGNORECASE)
+    content = re.sub(r'<[^>]+>', ' ', content)
+    content = html.unescape(content)
+    content = re.sub(r'[ \t\r\f\v]+', ' ', content)
+    content = re.sub(r'\n\s*\n+', '\n\n', content)
+    return content.strip()
+
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+class JobDetailResolverRegistry:
+    """Ordered registry of (URL pattern -> HTTP resolver) pairs."""
+
+    def __init__(self, timeout: float = 10.0):
+        self.timeout = timeout
+        self._resolvers: List[Tuple[str, Pattern, ResolverFunc]] = []
+        self.stats: Dict[str, int] = {'resolved': 0, 'missed': 0, 'errors': 0}
+
+    def register(self, name: str, pattern: str):
+        """Decorator registering a resolver for URLs matching ``pattern``."""
+        compiled = re.compile(pattern, re.IGNORECASE)
+
+        def decorator(func: ResolverFunc) -> ResolverFunc:
+            self._resolvers.append((name, compiled, func))
+            return func
+
+        return decorator
+
+    def matching(self, url: str) -> List[Tuple[str, "re.Match", ResolverFunc]]:
+        """Resolvers whose pattern matches the URL, in registration order."""
+        out = []
+        for name, pattern, func in self._resolvers:
+            match = pattern.search(url)
+            if match:
+                out.append((name, match, func))
+        return out
+
+    async def resolve(
+        self,
+        url: str,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> Optional[JobPosting]:
+        """Try each matching resolver until one returns a posting."""
+        candidates = self.matching(url)
+        if not candidates:
+            self.stats['missed'] += 1
+            return None
+
+        own_session = session is None
+        if own_session:
+            session = aiohttp.ClientSession(
+                headers=DEFAULT_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+
+        try:
+            for name, match, func in candidates:
+                try:
+                    job = await func(session, url, match)
+                except Exception as e:
+                    self.stats['errors'] += 1
+                    logger.debug(f"[JobDetails] {name} resolver failed for {url}: {e}")
+                    continue
+                if job and job.title:
+                    job.raw_data.setdefault('resolver', name)
+                    self.stats['resolved'] += 1
+                    logger.info(f"[JobDetails] Resolved via {name}: {job.title} at {job.company}")
+                    return job
+        finally:
+            if own_session:
+                await session.close()
+
+        self.stats['missed'] += 1
+        return None
+
+
+registry = JobDetailResolverRegistry()
+
+
+async def _get_json(session: aiohttp.ClientSession, url: str):
+    async with session.get(url, headers={'Accept': 'application/json'}) as resp:
+        if resp.status != 200:
+            return None
+        return await resp.json(content_type=None)
+
+
+# ==================== ATS API resolvers ====================
+
+@registry.register("greenhouse", r"greenhouse\.io/(?:embed/job_app\?for=)?([\w-]+)/jobs/(\d+)")
+async def _resolve_greenhouse(session, url, match) -> Optional[JobPosting]:
+    board, job_id = match.group(1), match.group(2)
+    data = await _get_json(session, f"https://boards-api.greenhouse.io/v1/boards/{board}/jobs/{job_id}")
+    if not data:
+        return None
+    location = (data.get('location') or {}).get('name', '')
+    return JobPosting(
+        id=f"gh_{board}_{job_id}",
+        platform=PlatformType.GREENHOUSE,
+        title=data.get('title', ''),
+        company=board.replace('-', ' ').title(),
+        location=location,
+        url=data.get('absolute_url') or url,
+        description=html_to_text(data.get('content', '')),
+        posted_date=_parse_date(data.get('updated_at')),
+        easy_apply=True,
+        remote='remote' in location.lower(),
+        raw_data=data,
+    )
+
+
+@registry.register("lever", r"jobs\.lever\.co/([\w.-]+)/([0-9a-f-]{36})")
+async def _resolve_lever(session, url, match) -> Optional[JobPosting]:
+    company, job_id = match.group(1), match.group(2)
+    data = await _get_json(session, f"https://api.lever.co/v0/postings/{company}/{job_id}")
+    if not data or not isinstance(data, dict):
+        return None
+    categories = data.get('categories') or {}
+    location = categories.get('location', '') or ''
+    description = data.get('descriptionPlain') or html_to_text(data.get('description', ''))
+    for section in data.get('lists') or []:
+        description += f"\n\n{section.get('text', '')}\n{html_to_text(section.get('content', ''))}"
+    return JobPosting(
+        id=f"lever_{job_id}",
+        platform=PlatformType.LEVER,
+        title=data.get('text', ''),
+        company=company.replace('-', ' ').title(),
+        location=location,
+        url=data.get('hostedUrl') or url,
+        description=description.strip(),
+        easy_apply=True,
+        remote='remote' in location.lower() or data.get('workplaceType') == 'remote',
+        raw_data=data,
+    )
+
+
+@registry.register("ashby", r"jobs\.ashbyhq\.com/([\w.%-]+)/([0-9a-f-]{36})")
+async def _resolve_ashby(session, url, match) -> Optional[JobPosting]:
+    org, job_id = match.group(1), match.group(2)
+    data = await _get_json(session, f"https://api.ashbyhq.com/posting-api/job-board/{org}")
+    if not data:
+        return None
+    posting = next((j for j in data.get('jobs', []) if j.get('id') == job_id), None)
+    if not posting:
+        return None
+    location = posting.get('location', '') or ''
+    return JobPosting(
+        id=f"ashby_{job_id}",
+        platform=PlatformType.ASHBY,
+        title=posting.get('title', ''),
+        company=org.replace('-', ' ').title(),
+        location=location,
+        url=posting.get('jobUrl') or url,
+        description=posting.get('descriptionPlain') or html_to_text(posting.get('descriptionHtml', '')),
+        posted_date=_parse_date(posting.get('publishedAt')),
+        easy_apply=True,
+        remote=bool(posting.get('isRemote')) or 'remote' in location.lower(),
+        raw_data=posting,
+    )
+
+
+@registry.register("smartrecruiters", r"(?:jobs|careers)\.smartrecruiters\.com/([\w.-]+)/(\d+)")
+async def _resolve_smartrecruiters(session, url, match) -> Optional[JobPosting]:
+    company, job_id = match.group(1), match.group(2)
+    data = await _get_json(session, f"https://api.smartrecruiters.com/v1/companies/{company}/postings/{job_id}")
+    if not data:
+        return None
+    loc = data.get('location') or {}
+    location = ", ".join(filter(None, [loc.get('city'), loc.get('region'), loc.get('country')]))
+    sections = (data.get('jobAd') or {}).get('sections') or {}
+    description = "\n\n".join(
+        html_to_text((sections.get(key) or {}).get('text', ''))
+        for key in ('companyDescription', 'jobDescription', 'qualifications', 'additionalInformation')
+        if (sections.get(key) or {}).get('text')
+    )
+    return JobPosting(
+        id=f"sr_{job_id}",
+        platform=PlatformType.SMARTRECRUITERS,
+        title=data.get('name', ''),
+        company=(data.get('company') or {}).get('name') or company,
+        location=location or ("Remote" if loc.get('remote') else ""),
+        url=data.get('applyUrl') or url,
+        description=description,
+        posted_date=_parse_date(data.get('releasedDate')),
+        easy_apply=True,
+        remote=bool(loc.get('remote')) or 'remote' in location.lower(),
+        raw_data=data,
+    )
+
+
+# ==================== Generic schema.org JSON-LD ====================
+
+def _iter_jsonld_nodes(data):
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_jsonld_nodes(item)
+    elif isinstance(data, dict):
+        yield data
+        if '@graph' in data:
+            yield from _iter_jsonld_nodes(data['@graph'])
+
+
+def _is_job_posting(node: dict) -> bool:
+    node_type = node.get('@type')
+    types = node_type if isinstance(node_type, list) else [node_type]
+    return 'JobPosting' in types
+
+
+def extract_jsonld_job_posting(page_html: str) -> Optional[dict]:
+    """Return the first schema.org JobPosting object embedded in a page."""
+    for raw in _JSONLD_RE.findall(page_html or ""):
+        raw = raw.strip()
+        if raw.startswith('<!--'):
+            raw = raw[4:].rsplit('-->', 1)[0]
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError:
+            try:
+                data = json.loads(re.sub(r'[\x00-\x1f]', ' ', raw))
+            except json.JSONDecodeError:
+                continue
+        for node in _iter_jsonld_nodes(data):
+            if _is_job_posting(node):
+                return node
+    return None
+
+
+def _jsonld_location(node: dict) -> str:
+    locations = node.get('jobLocation') or []
+    if isinstance(locations, dict):
+        locations = [locations]
+    parts = []
+    for loc in locations:
+        address = (loc or {}).get('address') or {}
+        if isinstance(address, str):
+            parts.append(address)
+            continue
+        text = ", ".join(filter(None, [
+            address.get('addressLocality'),
+            address.get('addressRegion'),
+            address.get('addressCountry') if isinstance(address.get('addressCountry'), str)
+            else (address.get('addressCountry') or {}).get('name'),
+        ]))
+        if text:
+            parts.append(text)
+    return "; ".join(parts)
+
+
+def _jsonld_salary(node: dict) -> Optional[str]:
+    salary = node.get('baseSalary') or {}
+    if not isinstance(salary, dict):
+        return str(salary) if salary else None
+    value = salary.get('value') or {}
+    currency = salary.get('currency', '')
+    if isinstance(value, dict):
+        low, high = value.get('minValue'), value.get('maxValue')
+        unit = value.get('unitText', '')
+        if low or high:
+            span = f"{low}-{high}" if low and high else str(low or high)
+            return " ".join(filter(None, [currency, span, unit.lower() if unit else None]))
+        if value.get('value'):
+            return " ".join(filter(None, [currency, str(value['value'])]))
+    elif value:
+        return " ".join(filter(None, [currency, str(value)]))
+    return None
+
+
+def job_posting_from_jsonld(node: dict, url: str) -> JobPosting:
+    """Map a schema.org JobPosting object onto our JobPosting model."""
+    org = node.get('hiringOrganization') or {}
+    company = org.get('name', '') if isinstance(org, dict) else str(org)
+    location = _jsonld_location(node)
+    location_type = str(node.get('jobLocationType', '')).upper()
+    platform = detect_platform_from_url(url)
+    if platform == PlatformType.UNKNOWN:
+        platform = PlatformType.COMPANY_WEBSITE
+
+    identifier = node.get('identifier')
+    if isinstance(identifier, dict):
+        identifier = identifier.get('value')
+    job_id = str(identifier or hash(url) % 10000000)
+
+    return JobPosting(
+        id=f"{platform.value}_{job_id}",
+        platform=platform,
+        title=html.unescape(node.get('title', '') or ''),
+        company=html.unescape(company or urlparse(url).netloc),
+        location=location or ("Remote" if location_type == 'TELECOMMUTE' else ""),
+        url=node.get('url') or url,
+        description=html_to_text(node.get('description', '')),
+        salary_range=_jsonld_salary(node),
+        posted_date=_parse_date(node.get('datePosted')),
+        requirements=html_to_text(node.get('qualifications', '')) or None,
+        remote=location_type == 'TELECOMMUTE' or 'remote' in location.lower(),
+        raw_data=node,
+    )
+
+
+@registry.register("jsonld", r"^https?://")
+async def _resolve_jsonld(session, url, match) -> Optional[JobPosting]:
+    async with session.get(url, headers={'Accept': 'text/html'}) as resp:
+        if resp.status != 200:
+            return None
+        page_html = await resp.text(errors='ignore')
+    node = extract_jsonld_job_posting(page_html)
+    if not node:
+        return None
+    return job_posting_from_jsonld(node, url)
+
+
+async def resolve_job_details(
+    url: str,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> Optional[JobPosting]:
+    """Resolve job details over HTTP; None means fall back to the browser."""
+    return await registry.resolve(url, session=session)
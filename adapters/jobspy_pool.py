@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+JobSpy Process Pool
+
+``jobspy.scrape_jobs`` is synchronous: network I/O plus pandas DataFrame
+building. Called from a coroutine it blocks the event loop (and with it the
+queue worker and every other request) for the whole scrape. This pool runs
+scrapes in separate worker processes instead:
+
+- Bounded workers (``JOBSPY_POOL_WORKERS``), spawned once and reused; each
+  worker is replaced after ``JOBSPY_TASKS_PER_WORKER`` scrapes to cap pandas
+  memory growth
+- Per-scrape timeout (``JOBSPY_TIMEOUT_SECONDS``); a scrape that times out or
+  whose caller is cancelled is killed by recycling the pool, and scrapes that
+  were sharing it are resubmitted once
+- Results come back as compact records: plain dicts with a fixed set of JSON
+  friendly fields (no DataFrames, NaN or Timestamps cross the process boundary)
+
+Example:
+    from adapters.jobspy_pool import get_jobspy_pool
+
+    records = await get_jobspy_pool().scrape(site_name=["indeed"], search_term="python developer")
+    for record in records:
+        print(record["title"], record["job_url"])
+"""
+
+import os
+import sys
+import asyncio
+import logging
+import importlib.util
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Vendored checkout used when the package isn't installed.
+VENDORED_JOBSPY = Path(__file__).parent.parent / "src" / "python-jobspy"
+
+# Fields kept from each JobSpy row.
+RECORD_FIELDS = (
+    "site", "job_url", "job_url_direct", "title", "company", "location", "description",
+    "date_posted", "job_type", "is_remote", "easy_apply",
+    "min_amount", "max_amount", "currency", "interval",
+)
+
+
+class JobSpyError(RuntimeError):
+    """A JobSpy scrape that could not be completed."""
+
+
+class JobSpyTimeout(JobSpyError):
+    """A JobSpy scrape that exceeded its timeout and was killed."""
+
+
+def jobspy_available() -> bool:
+    """True if jobspy is importable (installed or vendored)."""
+    return importlib.util.find_spec("jobspy") is not None or VENDORED_JOBSPY.exists()
+
+
+@dataclass
+class JobSpyPoolConfig:
+    max_workers: int = int(os.getenv("JOBSPY_POOL_WORKERS", "2"))
+    timeout_seconds: float = float(os.getenv("JOBSPY_TIMEOUT_SECONDS", "90"))
+    tasks_per_worker: int = int(os.getenv("JOBSPY_TASKS_PER_WORKER", "20"))
+    description_chars: int = int(os.getenv("JOBSPY_DESCRIPTION_CHARS", "2000"))
+
+
+def _is_missing(value: Any) -> bool:
+    if value is None:
+        return True
+    try:
+        return bool(value != value)  # NaN / NaT
+    except (TypeError, ValueError):
+        return True  # pd.NA refuses truth testing
+
+
+def _plain(value: Any) -> Any:
+    """Convert a pandas/numpy cell to a JSON-friendly Python value."""
+    if _is_missing(value):
+        return None
+    if isinstance(value, (str, bool, int, float)):
+        return value
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        try:
+            return _plain(value.item())
+        except (TypeError, ValueError):
+            pass
+    if hasattr(value, "value") and isinstance(value.value, str):  # enums (job_type, site)
+        return value.value
+    return str(value)
+
+
+def compact_records(rows: Iterable[Dict[str, Any]], description_chars: int = 2000) -> List[Dict[str, Any]]:
+    """Reduce JobSpy rows to plain dicts with ``RECORD_FIELDS`` (rows without a URL are dropped)."""
+    records = []
+    for row in rows:
+        record = {name: _plain(row.get(name)) for name in RECORD_FIELDS}
+        if not record["job_url"]:
+            continue
+        if record["description"]:
+            record["description"] = str(record["description"])[:description_chars]
+        records.append(record)
+    return records
+
+
+def _scrape_worker(kwargs: Dict[str, Any], description_chars: int) -> List[Dict[str, Any]]:
+    """Runs in a pool process: scrape and return compact records."""
+    try:
+        from jobspy import scrape_jobs  # type: ignore
+    except ImportError:
+        if str(VENDORED_JOBSPY) not in sys.path:
+            sys.path.append(str(VENDORED_JOBSPY))
+        from jobspy import scrape_jobs  # type: ignore
+
+    jobs_df = scrape_jobs(**kwargs)
+    if jobs_df is None or getattr(jobs_df, "empty", False):
+        return []
+    return compact_records(jobs_df.to_dict("records"), description_chars)
+
+
+class JobSpyPool:
+    """Runs JobSpy scrapes in a managed process pool."""
+
+    def __init__(self, config: Optional[JobSpyPoolConfig] = None):
+        self.config = config or JobSpyPoolConfig()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._stats = {
+            "submitted": 0, "completed": 0, "records": 0,
+            "timeouts": 0, "cancelled": 0, "errors": 0, "recycled": 0, "resubmitted": 0,
+        }
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Spawned (not forked) workers don't inherit the event loop's threads and locks.
+            self._executor = ProcessPoolExecutor(
+                max_workers=max(1, self.config.max_workers),
+                mp_context=multiprocessing.get_context("spawn"),
+                max_tasks_per_child=max(1, self.config.tasks_per_worker),
+            )
+        return self._executor
+
+    def _recycle(self, executor: ProcessPoolExecutor):
+        """Kill the pool's workers (stopping any running scrape) and start fresh on next use."""
+        if self._executor is executor:
+            self._executor = None
+        self._stats["recycled"] += 1
+        for process in list((getattr(executor, "_processes", None) or {}).values()):
+            try:
+                process.terminate()
+            except Exception:
+                pass
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def scrape(self, timeout: Optional[float] = None, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Run ``jobspy.scrape_jobs(**kwargs)`` in the pool and return compact records.
+
+        Raises ``JobSpyTimeout`` after ``timeout`` seconds (default from config)
+        and ``JobSpyError`` if JobSpy is missing or the scrape fails.
+        """
+        if not jobspy_available():
+            raise JobSpyError("JobSpy not available: install python-jobspy")
+        timeout = self.config.timeout_seconds if timeout is None else timeout
+        self._stats["submitted"] += 1
+
+        for attempt in range(2):
+            executor = self._get_executor()
+            future = executor.submit(_scrape_worker, kwargs, self.config.description_chars)
+            try:
+                records = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+            except asyncio.TimeoutError:
+                self._stats["timeouts"] += 1
+                self._abandon(executor, future)
+                raise JobSpyTimeout(f"JobSpy scrape timed out after {timeout:.0f}s")
+            except asyncio.CancelledError:
+                self._stats["cancelled"] += 1
+                self._abandon(executor, future)
+                raise
+            except BrokenProcessPool:
+                # Another scrape's timeout recycled the pool under us; run once more on a fresh one.
+                if self._executor is executor:
+                    self._executor = None
+                if attempt == 0:
+                    self._stats["resubmitted"] += 1
+                    continue
+                self._stats["errors"] += 1
+                raise JobSpyError("JobSpy worker pool broke")
+            except Exception as e:
+                self._stats["errors"] += 1
+                raise JobSpyError(f"JobSpy scrape failed: {e}") from e
+
+            self._stats["completed"] += 1
+            self._stats["records"] += len(records)
+            return records
+        raise JobSpyError("JobSpy worker pool broke")  # pragma: no cover
+
+    def _abandon(self, executor: ProcessPoolExecutor, future):
+        # A queued scrape is simply cancelled; a running one can only be stopped by killing its worker.
+        if not future.cancel():
+            logger.warning("[JobSpy] Killing running scrape (timeout or cancellation); recycling pool")
+            self._recycle(executor)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self._stats, "workers": self.config.max_workers, "running": self._executor is not None}
+
+    def shutdown(self):
+        """Stop the worker processes (pending scrapes are cancelled)."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Singleton
+_jobspy_pool: Optional[JobSpyPool] = None
+
+
+def get_jobspy_pool() -> JobSpyPool:
+    """Get singleton JobSpyPool instance."""
+    global _jobspy_pool
+    if _jobspy_pool is None:
+        _jobspy_pool = JobSpyPool()
+    return _jobspy_pool
+
+
+def shutdown_jobspy_pool():
+    """Stop the shared pool (called from the app lifespan on shutdown)."""
+    global _jobspy_pool
+    if _jobspy_pool is not None:
+        _jobspy_pool.shutdown()
+        _jobspy_pool = None
@@ -5,6 +5,7 @@ Public JSON API, no browser needed.
 
 import aiohttp
 import asyncio
+import logging
 from typing import List, Optional
 from datetime import datetime
 from pathlib import Path
@@ -13,6 +14,12 @@ from .base import (
     JobPlatformAdapter, PlatformType, JobPosting, ApplicationResult,
     ApplicationStatus, SearchConfig, UserProfile, Resume
 )
+from .board_fetcher import get_board_fetcher
+from .http_submitter import HTTPFormSubmitter
+from core.resume_digest import resume_snippet
+from monitoring.apply_spans import mark_phase
+
+logger = logging.getLogger(__name__)
 
 
 # Popular companies using Lever
@@ -32,11 +39,17 @@ class LeverAdapter(JobPlatformAdapter):
     
     platform = PlatformType.LEVER
     tier = "api"
+    API_BASE = "https://api.lever.co/v0/postings"
     
-    def __init__(self, browser_manager=None, companies: List[str] = None, session_cookie: str = None):
+    def __init__(self, browser_manager=None, companies: List[str] = None, session_cookie: str = None,
+                 http_submit: Optional[bool] = None):
         super().__init__(browser_manager)
         self.companies = companies or DEFAULT_LEVER_COMPANIES
         self._session = None
+        if http_submit is None:
+            from api.config import config
+            http_submit = config.HTTP_SUBMIT_ENABLED
+        self.http_submit = http_submit
     
     async def _get_session(self):
         if not self._session:
@@ -50,56 +63,58 @@ class LeverAdapter(JobPlatformAdapter):
             await self._session.close()
             self._session = None
     
+    def _board_url(self, company: str) -> str:
+        return f"{self.API_BASE}/{company}?mode=json"
+    
     async def search_jobs(self, criteria: SearchConfig) -> List[JobPosting]:
-        """Search Lever job boards across multiple companies."""
-        session = await self._get_session()
-        all_jobs = []
+        """Search Lever job boards across multiple companies (fetched concurrently)."""
+        companies = list(dict.fromkeys(self.companies))
+        order = {company: i for i, company in enumerate(companies)}
+        matched = []
         
-        for company in self.companies:
+        # Boards are filtered as they arrive; output keeps the configured company order.
+        async for company, data in get_board_fetcher().stream(companies, self._board_url):
+            if not isinstance(data, list):
+                continue
             try:
-                url = f"https://api.lever.co/v0/postings/{company}?mode=json"
-                
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                    if resp.status != 200:
-                        continue
-                    
-                    jobs = await resp.json()
-                    
-                    for job in jobs:
-                        title = job.get("text", "").lower()
-                        location = job.get("categories", {}).get("location", "").lower()
-                        
-                        # Filter by role keywords
-                        if not any(kw.lower() in title for kw in criteria.roles):
-                            continue
-                        
-                        # Filter by location if specified
-                        if criteria.locations:
-                            if not any(loc.lower() in location or "remote" in location 
-                                      for loc in criteria.locations):
-                                continue
-                        
-                        all_jobs.append(JobPosting(
-                            id=f"lever_{job['id']}",
-                            platform=self.platform,
-                            title=job.get("text", ""),
-                            company=company.replace("-", " ").title(),
-                            location=job.get("categories", {}).get("location", ""),
-                            url=job.get("hostedUrl", job.get("applyUrl", "")),
-                            description=job.get("descriptionPlain", ""),
-                            easy_apply=True,
-                            remote="remote" in location
-                        ))
-                
-                await asyncio.sleep(0.2)
-                
+                matched.append((order[company], self._filter_board(company, data, criteria)))
             except Exception as e:
-                print(f"[Lever] Error fetching {company}: {e}")
-                continue
+                logger.warning(f"[Lever] Skipping board {company}: {type(e).__name__}: {e}")
         
-        print(f"[Lever] Found {len(all_jobs)} jobs across {len(self.companies)} companies")
+        all_jobs = [job for _, jobs in sorted(matched, key=lambda m: m[0]) for job in jobs]
+        print(f"[Lever] Found {len(all_jobs)} jobs across {len(companies)} companies")
         return all_jobs
     
+    def _filter_board(self, company: str, postings: list, criteria: SearchConfig) -> List[JobPosting]:
+        """Postings on one company's board that match the role and location filters."""
+        jobs = []
+        for job in postings:
+            title = job.get("text", "").lower()
+            location = (job.get("categories") or {}).get("location", "").lower()
+            
+            # Filter by role keywords
+            if not any(kw.lower() in title for kw in criteria.roles):
+                continue
+            
+            # Filter by location if specified
+            if criteria.locations:
+                if not any(loc.lower() in location or "remote" in location 
+                          for loc in criteria.locations):
+                    continue
+            
+            jobs.append(JobPosting(
+                id=f"lever_{job['id']}",
+                platform=self.platform,
+                title=job.get("text", ""),
+                company=company.replace("-", " ").title(),
+                location=(job.get("categories") or {}).get("location", ""),
+                url=job.get("hostedUrl", job.get("applyUrl", "")),
+                description=job.get("descriptionPlain", ""),
+                easy_apply=True,
+                remote="remote" in location
+            ))
+        return jobs
+    
     async def get_job_details(self, job_url: str) -> JobPosting:
         """Get full job details from Lever."""
         session = await self._get_session()
@@ -144,7 +159,14 @@ class LeverAdapter(JobPlatformAdapter):
         - Fill core fields + resume upload.
         - If CAPTCHA is present, do not attempt to bypass; return PENDING_REVIEW.
         - If auto_submit is False, stop at review with a screenshot.
+        - With http_submit enabled, plain-HTML forms are posted without a
+          browser; CAPTCHA/JS pages fall back to the browser path.
         """
+        if auto_submit and self.http_submit:
+            http_result = await self._apply_via_http(job, resume, profile, cover_letter)
+            if http_result is not None:
+                return http_result
+
         if not self.browser_manager:
             return ApplicationResult(
                 status=ApplicationStatus.EXTERNAL_APPLICATION,
@@ -212,6 +234,7 @@ class LeverAdapter(JobPlatformAdapter):
                 fi = None
 
             profile_ctx = {
+                "user_id": getattr(profile, "user_id", None),
                 "first_name": getattr(profile, "first_name", ""),
                 "last_name": getattr(profile, "last_name", ""),
                 "email": getattr(profile, "email", ""),
@@ -222,7 +245,7 @@ class LeverAdapter(JobPlatformAdapter):
                 "years_experience": getattr(profile, "years_experience", None),
                 "custom_answers": getattr(profile, "custom_answers", {}) or {},
             }
-            resume_text = getattr(resume, "raw_text", "") or ""
+            resume_text = resume_snippet(resume, "questions") if resume else ""
             job_desc = getattr(job, "description", "") or ""
 
             filled = 0
@@ -441,9 +464,11 @@ class LeverAdapter(JobPlatformAdapter):
 
         screenshot_path = None
         try:
+            mark_phase("navigation")
             await page.goto(job.url, wait_until="domcontentloaded", timeout=60000)
             await self.browser_manager.human_like_delay(2, 4)
 
+            mark_phase("field_discovery")
             # Lever often hides the form behind an "Apply" CTA.
             for sel in [
                 'a:has-text("Apply")',
@@ -459,6 +484,7 @@ class LeverAdapter(JobPlatformAdapter):
                 except Exception:
                     continue
 
+            mark_phase("form_fill")
             full_name = f"{profile.first_name} {profile.last_name}".strip()
             await try_fill(
                 [
@@ -485,6 +511,7 @@ class LeverAdapter(JobPlatformAdapter):
                 profile.phone,
             )
 
+            mark_phase("upload")
             await try_upload(
                 [
                     "input[name='resume']",
@@ -494,6 +521,7 @@ class LeverAdapter(JobPlatformAdapter):
                 resume.file_path,
             )
 
+            mark_phase("form_fill")
             if cover_letter:
                 await try_fill(
                     [
@@ -515,6 +543,7 @@ class LeverAdapter(JobPlatformAdapter):
                     external_url=job.url,
                 )
 
+            mark_phase("captcha")
             if await detect_captcha():
                 screenshot_path = f"/tmp/lever_captcha_{job.id}.png"
                 await page.screenshot(path=screenshot_path, full_page=True)
@@ -536,6 +565,7 @@ class LeverAdapter(JobPlatformAdapter):
                 )
 
             # Submit
+            mark_phase("submit")
             submitted = False
             for sel in [
                 "button[type='submit']",
@@ -564,6 +594,7 @@ class LeverAdapter(JobPlatformAdapter):
                     external_url=job.url,
                 )
 
+            mark_phase("verify")
             content = (await page.content()).lower()
             if "thank you" in content or "application submitted" in content:
                 return ApplicationResult(
@@ -599,6 +630,39 @@ class LeverAdapter(JobPlatformAdapter):
             except Exception:
                 pass
 
+    async def _apply_via_http(
+        self,
+        job: JobPosting,
+        resume: Resume,
+        profile: UserProfile,
+        cover_letter: Optional[str] = None,
+    ) -> Optional[ApplicationResult]:
+        """Try the browserless submitter; None means use the browser."""
+        apply_url = job.url.rstrip("/")
+        if "jobs.lever.co" in apply_url and not apply_url.endswith("/apply"):
+            apply_url = f"{apply_url}/apply"
+
+        mark_phase("http_submit")
+        result = await HTTPFormSubmitter(platform=self.platform.value).submit(
+            apply_url, profile, resume, cover_letter
+        )
+        if result.should_fallback:
+            print(f"[Lever] HTTP submit skipped ({result.message}); using browser")
+            return None
+
+        if result.submitted:
+            return ApplicationResult(
+                status=ApplicationStatus.SUBMITTED,
+                message=result.message,
+                external_url=result.final_url,
+                submitted_at=datetime.now(),
+            )
+        return ApplicationResult(
+            status=ApplicationStatus.PENDING_REVIEW,
+            message=result.message,
+            external_url=job.url,
+        )
+
 
 async def test_lever():
     """Test Lever adapter."""
@@ -16,6 +16,7 @@ WARNING: This performs REAL application submissions. Use test accounts only.
 
 import aiohttp
 import asyncio
+import logging
 import random
 import json
 import re
@@ -28,6 +29,10 @@ from .base import (
     JobPlatformAdapter, PlatformType, JobPosting, ApplicationResult,
     ApplicationStatus, SearchConfig, UserProfile, Resume
 )
+from .handlers.linkedin_easy_apply import current_step_name
+from core.resume_digest import resume_snippet
+from core.storage_state import get_storage_state_store, is_logged_out_url
+from monitoring.apply_spans import mark_phase
 
 # Import AI service for question answering
 try:
@@ -37,6 +42,8 @@ except ImportError:
     AI_AVAILABLE = False
     KimiResumeOptimizer = None
 
+logger = logging.getLogger(__name__)
+
 
 class LinkedInAdapter(JobPlatformAdapter):
     """
@@ -242,16 +249,7 @@ class LinkedInAdapter(JobPlatformAdapter):
         page = session.page
         
         try:
-            # Set cookie if available
-            if self.session_cookie:
-                await page.context.add_cookies([{
-                    "name": "li_at",
-                    "value": str(self.session_cookie),
-                    "domain": ".linkedin.com",
-                    "path": "/"
-                }])
-            else:
-                logger.warning("[LinkedIn] No session cookie provided - authentication may fail")
+            await self._seed_auth_state(page)
             
             await page.goto(job_url, wait_until="domcontentloaded")
             await self._human_delay()
@@ -309,6 +307,7 @@ class LinkedInAdapter(JobPlatformAdapter):
             )
             
         finally:
+            await self._refresh_auth_state(page)
             await self.browser_manager.close_session(session.session_id)
     
     async def _get_element_text(self, page, selectors: List[str]) -> Optional[str]:
@@ -373,18 +372,10 @@ class LinkedInAdapter(JobPlatformAdapter):
         step_number = 0
         
         try:
-            # Set cookie if available
-            if self.session_cookie:
-                await page.context.add_cookies([{
-                    "name": "li_at",
-                    "value": str(self.session_cookie),
-                    "domain": ".linkedin.com",
-                    "path": "/"
-                }])
-            else:
-                logger.warning("[LinkedIn] No session cookie provided - authentication may fail")
+            await self._seed_auth_state(page)
             
             # Navigate to job
+            mark_phase("navigation")
             print(f"[LinkedIn] Navigating to {job.url}")
             await page.goto(job.url, wait_until="networkidle")
             await self._human_delay()
@@ -395,6 +386,7 @@ class LinkedInAdapter(JobPlatformAdapter):
             screenshots.append(screenshot_path)
             
             # Click Easy Apply button
+            mark_phase("field_discovery")
             easy_apply_btn = page.locator(".jobs-apply-button--top-card, button:has-text('Easy Apply')").first
             if await easy_apply_btn.count() == 0:
                 return ApplicationResult(
@@ -417,10 +409,18 @@ class LinkedInAdapter(JobPlatformAdapter):
                 "questions_answered": [],
                 "steps_completed": 0
             }
+            checkpoint = self.checkpoint
+            if checkpoint and checkpoint.resumed:
+                print(
+                    f"[LinkedIn] Resuming from checkpoint (last step: {checkpoint.last_step}, "
+                    f"{len(checkpoint.answers)} stored answers)"
+                )
             
             for step in range(max_steps):
+                mark_phase("field_discovery")
                 print(f"[LinkedIn] Processing step {step + 1}")
                 await asyncio.sleep(1)
+                step_name = await current_step_name(page) or f"step_{step + 1}"
                 
                 # Capture screenshot of current step
                 step_number += 1
@@ -455,15 +455,21 @@ class LinkedInAdapter(JobPlatformAdapter):
                     )
                 
                 # Fill contact info
+                mark_phase("form_fill")
                 fields_filled = await self._fill_contact_info(page, profile)
                 form_data["fields_filled"].extend(fields_filled)
                 
-                # Handle resume upload
-                if resume.file_path and Path(resume.file_path).exists():
-                    await self._upload_resume(page, resume.file_path)
+                # Handle resume upload (LinkedIn keeps the copy an earlier attempt uploaded)
+                if checkpoint and checkpoint.is_done("resume"):
+                    form_data["fields_filled"].append("resume")
+                elif resume.file_path and Path(resume.file_path).exists():
+                    mark_phase("upload")
+                    if await self._upload_resume(page, resume.file_path) and checkpoint:
+                        await checkpoint.mark_done("resume")
                     form_data["fields_filled"].append("resume")
                 
                 # Handle cover letter if provided
+                mark_phase("form_fill")
                 if cover_letter:
                     await self._fill_cover_letter(page, cover_letter)
                     form_data["fields_filled"].append("cover_letter")
@@ -491,11 +497,13 @@ class LinkedInAdapter(JobPlatformAdapter):
                         )
                     
                     # Click final submit
+                    mark_phase("submit")
                     print("[LinkedIn] Submitting application...")
                     submit_success = await self._click_final_submit(page)
                     
                     if submit_success:
                         await asyncio.sleep(3)
+                        mark_phase("verify")
                         
                         # Check for success
                         if await self._is_application_submitted(page):
@@ -521,6 +529,7 @@ class LinkedInAdapter(JobPlatformAdapter):
                         )
                 
                 # Click Next/Continue to proceed
+                mark_phase("navigation")
                 next_clicked = await self._click_next(page)
                 if not next_clicked:
                     # No next button - might be done or stuck
@@ -537,6 +546,8 @@ class LinkedInAdapter(JobPlatformAdapter):
                         )
                     break
                 
+                if checkpoint:
+                    await checkpoint.mark_done(step_name)
                 await self._human_delay()
                 form_data["steps_completed"] = step + 1
             
@@ -563,8 +574,46 @@ class LinkedInAdapter(JobPlatformAdapter):
             )
             
         finally:
+            await self._refresh_auth_state(page)
             await self.browser_manager.close_session(session.session_id)
     
+    async def _seed_auth_state(self, page) -> bool:
+        """
+        Seed the browser context with authenticated state.
+        
+        Prefers the user's stored storage-state snapshot (cookies + localStorage)
+        and falls back to the bare li_at cookie when there is none.
+        """
+        store = get_storage_state_store()
+        state = store.load(self.user_id, self.platform.value) if self.user_id else None
+        if state and await store.apply_to_context(page.context, state):
+            print("[LinkedIn] Seeded session from storage-state snapshot")
+            return True
+        
+        if self.session_cookie:
+            await page.context.add_cookies([{
+                "name": "li_at",
+                "value": str(self.session_cookie),
+                "domain": ".linkedin.com",
+                "path": "/"
+            }])
+        else:
+            logger.warning("[LinkedIn] No session cookie provided - authentication may fail")
+        return False
+    
+    async def _refresh_auth_state(self, page):
+        """Refresh the stored snapshot after a run that stayed authenticated."""
+        if not self.user_id:
+            return
+        try:
+            store = get_storage_state_store()
+            if is_logged_out_url(page.url):
+                store.invalidate(self.user_id, self.platform.value)
+            else:
+                await store.capture_and_save(page.context, self.user_id, self.platform.value)
+        except Exception as e:
+            logger.warning(f"[LinkedIn] Storage-state refresh failed: {e}")
+    
     async def _capture_step_screenshot(self, page, job_id: str, step: int, label: str) -> str:
         """Capture screenshot of current step."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -685,16 +734,18 @@ class LinkedInAdapter(JobPlatformAdapter):
         
         return fields_filled
     
-    async def _upload_resume(self, page, file_path: str):
-        """Upload resume file."""
+    async def _upload_resume(self, page, file_path: str) -> bool:
+        """Upload resume file; True if a file input took it."""
         try:
             file_input = page.locator('input[type="file"]').first
             if await file_input.count() > 0:
                 await file_input.set_input_files(file_path)
                 print(f"[LinkedIn] Resume uploaded: {file_path}")
                 await asyncio.sleep(2)  # Wait for upload
+                return True
         except Exception as e:
             print(f"[LinkedIn] Resume upload failed: {e}")
+        return False
     
     async def _fill_cover_letter(self, page, cover_letter: str):
         """Fill cover letter textarea."""
@@ -714,7 +765,7 @@ class LinkedInAdapter(JobPlatformAdapter):
             print(f"[LinkedIn] Cover letter fill failed: {e}")
     
     async def _answer_custom_questions(self, page, resume: Resume, profile: UserProfile) -> List[Dict]:
-        """Answer custom application questions using AI."""
+        """Answer custom application questions using AI (one batched call per step)."""
         questions_answered = []
         
         if not self.ai_service:
@@ -730,6 +781,8 @@ class LinkedInAdapter(JobPlatformAdapter):
                 ".artdeco-dropdown"
             ]
             
+            # Collect unanswered text questions first, then answer them together.
+            pending = []
             for selector in question_selectors:
                 questions = await page.locator(selector).all()
                 
@@ -743,38 +796,80 @@ class LinkedInAdapter(JobPlatformAdapter):
                         
                         # Check if already answered
                         input_el = question_el.locator("input, textarea, select").first
-                        current_value = await input_el.input_value() if await input_el.count() > 0 else ""
+                        if await input_el.count() == 0:
+                            continue
+                        current_value = await input_el.input_value()
                         
                         if current_value:
                             continue  # Already filled
                         
                         # Get input type
-                        input_type = await input_el.get_attribute("type") if await input_el.count() > 0 else "text"
-                        
-                        # Answer with AI
-                        answer = await self.ai_service.answer_application_question(
-                            question=label,
-                            resume_context=resume.raw_text[:2000],
-                            existing_answers=profile.custom_answers
-                        )
-                        
-                        # Fill the answer
-                        if input_type in ["text", "email", "tel", "number"]:
-                            await input_el.fill(answer)
-                        elif input_type == "textarea":
-                            await input_el.fill(answer)
-                        
-                        questions_answered.append({
-                            "question": label,
-                            "answer": answer
-                        })
+                        tag = await input_el.evaluate("e => e.tagName.toLowerCase()")
+                        input_type = "textarea" if tag == "textarea" else (await input_el.get_attribute("type") or "text")
+                        if input_type not in ["text", "email", "tel", "number", "textarea"]:
+                            continue
+                        if any(label == q["question"] for q in pending):
+                            continue  # Same container matched by two selectors
                         
-                        await asyncio.sleep(0.5)
+                        pending.append({"question": label, "input": input_el})
                         
                     except Exception as e:
-                        print(f"[LinkedIn] Failed to answer question: {e}")
+                        print(f"[LinkedIn] Failed to read question: {e}")
                         continue
             
+            if not pending:
+                return questions_answered
+            
+            # A retried queue item reuses the answers its earlier attempt produced.
+            checkpoint = self.checkpoint
+            stored = {}
+            if checkpoint:
+                for q in pending:
+                    answer = checkpoint.get_answer(q["question"])
+                    if answer is not None:
+                        stored[q["question"]] = answer
+            to_ask = [q for q in pending if q["question"] not in stored]
+            
+            from ai.form_intelligence import get_form_intelligence
+            
+            generated = await get_form_intelligence().answer_questions(
+                [{"question": q["question"], "type": "text"} for q in to_ask],
+                profile={
+                    "user_id": getattr(profile, "user_id", None),
+                    "first_name": profile.first_name,
+                    "last_name": profile.last_name,
+                    "email": profile.email,
+                    "phone": profile.phone,
+                    "years_experience": profile.years_experience,
+                    "work_authorization": profile.work_authorization,
+                    "sponsorship_required": profile.sponsorship_required,
+                    "custom_answers": profile.custom_answers,
+                },
+                resume_text=resume_snippet(resume, "questions"),
+            ) if to_ask else []
+            answers = {**stored, **{q["question"]: a for q, a in zip(to_ask, generated)}}
+            
+            for q in pending:
+                answer = answers.get(q["question"])
+                if answer is None:
+                    continue
+                try:
+                    # Fill the answer
+                    await q["input"].fill(answer)
+                    if checkpoint:
+                        await checkpoint.set_answer(q["question"], answer)
+                    
+                    questions_answered.append({
+                        "question": q["question"],
+                        "answer": answer
+                    })
+                    
+                    await asyncio.sleep(0.5)
+                    
+                except Exception as e:
+                    print(f"[LinkedIn] Failed to answer question: {e}")
+                    continue
+            
         except Exception as e:
             print(f"[LinkedIn] Question answering error: {e}")
         
@@ -30,6 +30,7 @@ from core import (
     UnifiedAIService,
     detect_platform_from_url,
 )
+from adapters.job_details import resolve_job_details
 
 logger = logging.getLogger(__name__)
 
@@ -90,7 +91,10 @@ class UnifiedPlatformAdapter(JobPlatformAdapter):
     
     async def get_job_details(self, job_url: str) -> JobPosting:
         """
-        Extract job details from any job posting URL using Stagehand.
+        Extract job details from any job posting URL.
+        
+        Tries the HTTP resolvers (ATS APIs, schema.org JSON-LD) first and
+        only opens a browser for Stagehand extraction when those fail.
         
         Args:
             job_url: URL of the job posting
@@ -98,6 +102,15 @@ class UnifiedPlatformAdapter(JobPlatformAdapter):
         Returns:
             JobPosting with extracted details
         """
+        try:
+            job = await resolve_job_details(job_url)
+        except Exception as e:
+            logger.debug(f"HTTP detail resolution failed for {job_url}: {e}")
+            job = None
+        if job:
+            self._log(f"Extracted job via HTTP: {job.title} at {job.company}")
+            return job
+        
         await self._ensure_session()
         
         logger.info(f"Extracting job details from: {job_url}")
@@ -13,6 +13,7 @@ from .base import (
     JobPlatformAdapter, PlatformType, JobPosting, ApplicationResult,
     ApplicationStatus, SearchConfig, UserProfile, Resume
 )
+from monitoring.apply_spans import mark_phase
 
 
 class WorkdayAdapter(JobPlatformAdapter):
@@ -31,6 +32,9 @@ class WorkdayAdapter(JobPlatformAdapter):
     
     platform = PlatformType.WORKDAY
     
+    # Wizard steps Workday keeps as a draft, so a retry can advance past them.
+    RESUMABLE_STEPS = {"source", "my_information", "my_experience", "resume", "voluntary_disclosures"}
+    
     async def search_jobs(self, criteria: SearchConfig) -> List[JobPosting]:
         """
         Workday doesn't have central search.
@@ -102,6 +106,7 @@ class WorkdayAdapter(JobPlatformAdapter):
         session = await self.get_session()
         page = session.page
         
+        mark_phase("navigation")
         await page.goto(job.url, wait_until="networkidle", timeout=60000)
         await self.browser_manager.human_like_delay(3, 5)
         
@@ -130,14 +135,24 @@ class WorkdayAdapter(JobPlatformAdapter):
         # Process application wizard steps
         max_steps = 15  # Workday can have many steps
         current_step = 0
+        checkpoint = self.checkpoint
         
         while current_step < max_steps:
             await self.browser_manager.human_like_delay(1, 2)
             
             # Detect current step
+            mark_phase("field_discovery")
             step_type = await self._detect_step_type(page)
             print(f"   Workday step {current_step + 1}: {step_type}")
             
+            # Retry: skip refilling steps a previous attempt completed, if the draft kept them.
+            if checkpoint and step_type in self.RESUMABLE_STEPS and checkpoint.is_done(step_type):
+                if await self._advance_without_refill(page):
+                    print(f"   Workday step {step_type} restored from checkpoint")
+                    current_step += 1
+                    continue
+            
+            mark_phase("upload" if step_type == "resume" else "form_fill")
             if step_type == "source":
                 # "How did you hear about us" - skip or select
                 await self._handle_source_step(page)
@@ -165,6 +180,7 @@ class WorkdayAdapter(JobPlatformAdapter):
                     )
                 
                 # Submit
+                mark_phase("submit")
                 submit_btn = page.locator('[data-automation-id="bottom-navigation-next-button"]:has-text("Submit")').first
                 if await submit_btn.count() > 0:
                     await submit_btn.click()
@@ -183,10 +199,13 @@ class WorkdayAdapter(JobPlatformAdapter):
                 )
             
             # Try to advance to next step
+            mark_phase("navigation")
             next_btn = page.locator('[data-automation-id="bottom-navigation-next-button"]').first
             if await next_btn.count() > 0 and await next_btn.is_enabled():
                 await next_btn.click()
                 await self.browser_manager.human_like_delay(2, 4)
+                if checkpoint and step_type in self.RESUMABLE_STEPS and not await self._has_form_error(page):
+                    await checkpoint.mark_done(step_type)
             else:
                 # Check for errors
                 error = page.locator('[data-automation-id="errorMessage"], .error-message').first
@@ -205,6 +224,20 @@ class WorkdayAdapter(JobPlatformAdapter):
             message="Max steps exceeded or navigation failed"
         )
     
+    async def _has_form_error(self, page) -> bool:
+        """Check whether the current step shows a validation error."""
+        error = page.locator('[data-automation-id="errorMessage"], .error-message').first
+        return await error.count() > 0
+    
+    async def _advance_without_refill(self, page) -> bool:
+        """Click Next on a step restored from a draft; False if it still needs filling."""
+        next_btn = page.locator('[data-automation-id="bottom-navigation-next-button"]').first
+        if await next_btn.count() == 0 or not await next_btn.is_enabled():
+            return False
+        await next_btn.click()
+        await self.browser_manager.human_like_delay(1, 2)
+        return not await self._has_form_error(page)
+    
     async def _detect_step_type(self, page) -> str:
         """Detect what type of Workday wizard step we're on."""
         content = (await page.content()).lower()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Form Structure Cache
+
+Selector suggestions from ``SelectorAI.analyze_form`` keyed by the form's
+structural fingerprint (see ``ai.form_skeleton``). Companies that share an
+ATS template share one entry, so only the first of them pays for the LLM
+call.
+
+Because the fingerprint ignores generated ids, a hit is re-checked against
+the current page: every selector that matched the page it was learned on
+must still match one element (an alternative is promoted if the primary no
+longer does). Fields that fail the check are dropped from the hit and
+reported as stale, so the caller can re-ask for just those fields and store
+the merged result; the rest of the entry stays usable.
+
+The store is synchronous SQLite; async callers go through asyncio.to_thread.
+
+Example:
+    from ai.cache.form_structure_cache import get_form_structure_cache
+
+    cache = get_form_structure_cache()
+    selectors, stale = await asyncio.to_thread(cache.lookup, skeleton)
+    if selectors is None or stale:
+        selectors = {**(selectors or {}), **await analyze(..., fields=stale)}
+        await asyncio.to_thread(cache.put, skeleton, selectors, page_url)
+"""
+
+import json
+import time
+import sqlite3
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from api.config import config
+from ai.form_skeleton import FormSkeleton
+
+logger = logging.getLogger(__name__)
+
+# Bump when the analyze_form prompt changes in a way that changes its output.
+PROMPT_VERSION = 1
+
+
+class FormStructureCache:
+    """SQLite-backed selector suggestions per form fingerprint."""
+
+    def __init__(self, db_path: Optional[str] = None, ttl_days: Optional[int] = None):
+        self.db_path = Path(db_path or config.FORM_STRUCTURE_CACHE_DB)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_days = config.FORM_STRUCTURE_CACHE_TTL_DAYS if ttl_days is None else ttl_days
+        self.stats = {'hits': 0, 'misses': 0, 'stale': 0, 'stored': 0}
+        self._init_db()
+
+    def _init_db(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS form_structures (
+                    fingerprint TEXT PRIMARY KEY,
+                    prompt_version INTEGER NOT NULL,
+                    suggestions TEXT NOT NULL,
+                    verified TEXT NOT NULL,
+                    source_url TEXT,
+                    hits INTEGER DEFAULT 0,
+                    created_at REAL,
+                    last_hit_at REAL
+                )
+            """)
+            conn.commit()
+
+    def lookup(self, skeleton: FormSkeleton) -> Tuple[Optional[Dict[str, Dict[str, Any]]], List[str]]:
+        """
+        Cached suggestions valid for this page, plus the fields that went stale.
+
+        Returns (None, []) on a miss. Stale fields are verified fields none of
+        whose selectors match this page any more; they are left out of the
+        suggestions.
+        """
+        fingerprint = skeleton.fingerprint()
+        if not fingerprint:
+            return None, []
+
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT suggestions, verified, created_at FROM form_structures "
+                "WHERE fingerprint = ? AND prompt_version = ?",
+                (fingerprint, PROMPT_VERSION),
+            ).fetchone()
+            if row is None or (self.ttl_days and row[2] < time.time() - self.ttl_days * 86400):
+                self.stats['misses'] += 1
+                return None, []
+
+            suggestions, stale = _revalidate(json.loads(row[0]), set(json.loads(row[1])), skeleton)
+            if stale:
+                self.stats['stale'] += 1
+                logger.debug(f"[FormStructureCache] Stale selectors for {fingerprint}: {', '.join(stale)}")
+
+            conn.execute(
+                "UPDATE form_structures SET hits = hits + 1, last_hit_at = ? WHERE fingerprint = ?",
+                (time.time(), fingerprint),
+            )
+            conn.commit()
+
+        if not stale:
+            self.stats['hits'] += 1
+        return suggestions, stale
+
+    def put(self, skeleton: FormSkeleton, suggestions: Dict[str, Dict[str, Any]], source_url: str = ""):
+        """Store suggestions for the page's form structure."""
+        fingerprint = skeleton.fingerprint()
+        if not fingerprint or not suggestions:
+            return
+        # Fields whose selector matched this page get re-checked on later hits.
+        verified = [
+            name for name, data in suggestions.items()
+            if any(skeleton.matches(s) for s in _candidates(data))
+        ]
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """INSERT OR REPLACE INTO form_structures
+                   (fingerprint, prompt_version, suggestions, verified, source_url, hits, created_at)
+                   VALUES (?, ?, ?, ?, ?, 0, ?)""",
+                (fingerprint, PROMPT_VERSION, json.dumps(suggestions), json.dumps(verified),
+                 source_url, time.time()),
+            )
+            conn.commit()
+        self.stats['stored'] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with sqlite3.connect(self.db_path) as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM form_structures").fetchone()[0]
+        lookups = self.stats['hits'] + self.stats['misses'] + self.stats['stale']
+        return {
+            **self.stats,
+            'entries': entries,
+            'hit_rate': f"{(self.stats['hits'] / lookups * 100) if lookups else 0:.1f}%",
+        }
+
+
+def _candidates(data: Dict[str, Any]) -> list:
+    return [s for s in [data.get("selector")] + list(data.get("alternatives") or []) if s]
+
+
+def _revalidate(
+    suggestions: Dict[str, Dict[str, Any]], verified: set, skeleton: FormSkeleton
+) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+    """Promote the first selector that still matches; verified fields with none are stale."""
+    result, stale = {}, []
+    for name, data in suggestions.items():
+        if name not in verified:
+            result[name] = data
+            continue
+        candidates = _candidates(data)
+        match = next((s for s in candidates if skeleton.matches(s)), None)
+        if match is None:
+            stale.append(name)
+            continue
+        result[name] = {
+            **data,
+            "selector": match,
+            "alternatives": [s for s in candidates if s != match],
+        }
+    return result, stale
+
+
+_form_structure_cache: Optional[FormStructureCache] = None
+
+
+def get_form_structure_cache() -> FormStructureCache:
+    """Get singleton FormStructureCache instance."""
+    global _form_structure_cache
+    if _form_structure_cache is None:
+        _form_structure_cache = FormStructureCache()
+    return _form_structure_cache
@@ -9,14 +9,19 @@ import hashlib
 import json
 import re
 import time
-from typing import Optional, Dict, Any, List
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
-from datetime import datetime
 import sqlite3
 import asyncio
 from pathlib import Path
 import logging
 
+from api.config import config
+from ai.cache.single_flight import SingleFlight, get_llm_single_flight
+from ai.cache.semantic_cache import SemanticCache, scope_key
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,19 +35,87 @@ class CacheEntry:
     ttl_days: int
     access_count: int = 0
     last_accessed: Optional[float] = None
+    expires_at: Optional[float] = None
+
+    def expired(self, now: Optional[float] = None) -> bool:
+        return self.expires_at is not None and (now or time.time()) >= self.expires_at
+
+
+class LRUTTLCache:
+    """
+    Bounded in-memory tier: least-recently-used eviction plus per-entry TTL.
+    
+    Only touched from the event loop thread, so no locking is needed.
+    """
+    
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expired():
+            del self._entries[key]
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+    
+    def set(self, entry: CacheEntry):
+        self._entries[entry.key] = entry
+        self._entries.move_to_end(entry.key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def discard_older_than(self, cutoff: float):
+        for key in [k for k, e in self._entries.items() if e.created_at < cutoff]:
+            del self._entries[key]
+    
+    def clear(self):
+        self._entries.clear()
+    
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+    
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 class CachedKimiService:
     """
     Kimi service with intelligent caching.
     
+    Exact-match entries live in two tiers: a bounded LRU/TTL memory cache in
+    front of SQLite. SQLite work runs in a worker thread so hits and misses
+    never block the event loop.
+    Access statistics are buffered and written in batches, and the database
+    is pruned to ``max_db_entries`` (least recently used first).
+    
+    Tailoring and cover letters that miss the exact tiers fall back to a
+    near-duplicate lookup (``SemanticCache``) over the job text, so lightly
+    reworded postings of the same role reuse a prior result.
+    
     Caching strategies:
     - parse_resume: 30 days (resume doesn't change often)
     - tailor_resume: 7 days (job-specific)
     - generate_cover_letter: 7 days (company-specific)
     """
     
-    def __init__(self, api_key: str, db_path: str = "data/ai_cache.db"):
+    def __init__(
+        self,
+        api_key: str,
+        db_path: str = "data/ai_cache.db",
+        max_memory_entries: int = 1000,
+        max_db_entries: int = 20000,
+        stats_flush_size: int = 100,
+        stats_flush_interval: float = 30.0,
+        similarity_threshold: Optional[float] = None,
+    ):
         from ai.kimi_service import KimiResumeOptimizer
         
         self.service = KimiResumeOptimizer(api_key)
@@ -50,14 +123,41 @@ class CachedKimiService:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
         self.cache_hits = 0
+        self.memory_hits = 0
         self.cache_misses = 0
-        self.memory_cache: Dict[str, CacheEntry] = {}
+        self.memory_cache = LRUTTLCache(max_entries=max_memory_entries)
+        self.max_db_entries = max_db_entries
+        self.db_evictions = 0
+        
+        # Buffered access stats: key -> [count delta, last accessed]
+        self.stats_flush_size = stats_flush_size
+        self.stats_flush_interval = stats_flush_interval
+        self._pending_access: Dict[str, List[float]] = {}
+        self._last_flush = time.time()
+        self._db_lock = threading.Lock()  # serializes writers; WAL readers run freely
+        self._local = threading.local()
+        self._writes_since_prune = 0
+        # Concurrent lookups of the same key share one DB read
+        self._reads = SingleFlight()
         
         self._init_db()
+        self.semantic_cache = SemanticCache(
+            str(self.db_path),
+            threshold=config.AI_CACHE_SIMILARITY_THRESHOLD if similarity_threshold is None else similarity_threshold,
+        )
         
+    def _connect(self) -> sqlite3.Connection:
+        """Per-thread connection, reused across calls from the same worker thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            self._local.conn = conn
+        return conn
+    
     def _init_db(self):
         """Initialize cache database."""
         with sqlite3.connect(self.db_path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS ai_cache (
                     key TEXT PRIMARY KEY,
@@ -75,81 +175,159 @@ class CachedKimiService:
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_ai_cache_created ON ai_cache(created_at)
             """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_ai_cache_last_accessed ON ai_cache(last_accessed)
+            """)
             conn.commit()
     
+    # ==================== Storage (worker thread) ====================
+    
+    def _db_get(self, key: str) -> Optional[Tuple[str, int, float]]:
+        """Return (response json, ttl_days, seconds left) for a live row."""
+        return self._connect().execute(
+            """SELECT response, ttl_days,
+                      (julianday(created_at) + ttl_days - julianday('now')) * 86400
+               FROM ai_cache
+               WHERE key = ? AND created_at > datetime('now', '-' || ttl_days || ' days')""",
+            (key,)
+        ).fetchone()
+    
+    def _db_set(self, key: str, response_json: str, method: str, ttl_days: int) -> int:
+        """Upsert a row and, every so often, prune to ``max_db_entries``. Returns rows evicted."""
+        with self._db_lock, self._connect() as conn:
+            conn.execute(
+                """INSERT OR REPLACE INTO ai_cache 
+                   (key, response, method, created_at, ttl_days, access_count, last_accessed)
+                   VALUES (?, ?, ?, datetime('now'), ?, 0, datetime('now'))""",
+                (key, response_json, method, ttl_days)
+            )
+            evicted = 0
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= max(1, self.max_db_entries // 100):
+                self._writes_since_prune = 0
+                evicted = self._prune(conn)
+            conn.commit()
+            return evicted
+    
+    def _prune(self, conn: sqlite3.Connection) -> int:
+        """Delete expired rows, then least-recently-used rows beyond the size cap."""
+        evicted = conn.execute(
+            "DELETE FROM ai_cache WHERE created_at <= datetime('now', '-' || ttl_days || ' days')"
+        ).rowcount
+        (count,) = conn.execute("SELECT COUNT(*) FROM ai_cache").fetchone()
+        overflow = count - self.max_db_entries
+        if overflow > 0:
+            evicted += conn.execute(
+                """DELETE FROM ai_cache WHERE key IN (
+                       SELECT key FROM ai_cache
+                       ORDER BY COALESCE(last_accessed, created_at) ASC
+                       LIMIT ?
+                   )""",
+                (overflow,)
+            ).rowcount
+        return evicted
+    
+    def _db_flush_access(self, updates: List[Tuple[int, str, str]]):
+        with self._db_lock, self._connect() as conn:
+            conn.executemany(
+                """UPDATE ai_cache
+                   SET access_count = access_count + ?, last_accessed = datetime(?, 'unixepoch')
+                   WHERE key = ?""",
+                updates
+            )
+            conn.commit()
+    
+    def _db_clear(self, older_than_days: int) -> int:
+        with self._db_lock, self._connect() as conn:
+            deleted = conn.execute(
+                "DELETE FROM ai_cache WHERE created_at < datetime('now', ?)",
+                (f"-{int(older_than_days)} days",)
+            ).rowcount
+            conn.commit()
+            return deleted
+    
+    # ==================== Cache tiers ====================
+    
+    def _record_access(self, key: str):
+        pending = self._pending_access.setdefault(key, [0, 0.0])
+        pending[0] += 1
+        pending[1] = time.time()
+    
+    async def _maybe_flush_access(self):
+        if (len(self._pending_access) >= self.stats_flush_size
+                or time.time() - self._last_flush >= self.stats_flush_interval):
+            await self.flush()
+    
+    async def flush(self):
+        """Write buffered access statistics in one batch."""
+        if not self._pending_access:
+            self._last_flush = time.time()
+            return
+        pending, self._pending_access = self._pending_access, {}
+        self._last_flush = time.time()
+        updates = [(int(count), last, key) for key, (count, last) in pending.items()]
+        try:
+            await asyncio.to_thread(self._db_flush_access, updates)
+        except Exception as e:
+            logger.warning(f"[AI Cache] Failed to flush access stats: {e}")
+    
     async def _get_cache(self, key: str) -> Optional[Any]:
         """Get cached response."""
         # Check memory cache first
-        if key in self.memory_cache:
-            entry = self.memory_cache[key]
+        entry = self.memory_cache.get(key)
+        if entry is not None:
             entry.access_count += 1
             entry.last_accessed = time.time()
             self.cache_hits += 1
+            self.memory_hits += 1
+            self._record_access(key)
+            await self._maybe_flush_access()
             logger.debug(f"[AI Cache] Memory hit for {key[:16]}")
             return entry.response
         
-        # Check database
+        # Check database (off the event loop)
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                row = conn.execute(
-                    """SELECT response, ttl_days, access_count FROM ai_cache 
-                       WHERE key = ? AND created_at > datetime('now', '-' || ttl_days || ' days')""",
-                    (key,)
-                ).fetchone()
-                
-                if row:
-                    response = json.loads(row[0])
-                    ttl_days = row[1]
-                    access_count = row[2] + 1
-                    
-                    # Update memory cache
-                    self.memory_cache[key] = CacheEntry(
-                        key=key,
-                        response=response,
-                        method="",
-                        created_at=time.time(),
-                        ttl_days=ttl_days,
-                        access_count=access_count,
-                        last_accessed=time.time()
-                    )
-                    
-                    # Update access count in DB
-                    conn.execute(
-                        "UPDATE ai_cache SET access_count = ?, last_accessed = datetime('now') WHERE key = ?",
-                        (access_count, key)
-                    )
-                    conn.commit()
-                    
-                    self.cache_hits += 1
-                    logger.debug(f"[AI Cache] DB hit for {key[:16]}")
-                    return response
+            row = await self._reads.do(key, lambda: asyncio.to_thread(self._db_get, key))
         except Exception as e:
             logger.warning(f"[AI Cache] DB error: {e}")
+            return None
         
-        return None
+        if not row:
+            return None
+        
+        response = json.loads(row[0])
+        now = time.time()
+        ttl_days, remaining = row[1], max(0.0, row[2] or 0.0)
+        self.memory_cache.set(CacheEntry(
+            key=key,
+            response=response,
+            method="",
+            created_at=now + remaining - ttl_days * 86400,
+            ttl_days=ttl_days,
+            access_count=1,
+            last_accessed=now,
+            expires_at=now + remaining,
+        ))
+        self.cache_hits += 1
+        self._record_access(key)
+        await self._maybe_flush_access()
+        logger.debug(f"[AI Cache] DB hit for {key[:16]}")
+        return response
     
     async def _set_cache(self, key: str, response: Any, ttl_days: int = 7, method: str = ""):
         """Cache response."""
+        now = time.time()
+        self.memory_cache.set(CacheEntry(
+            key=key,
+            response=response,
+            method=method,
+            created_at=now,
+            ttl_days=ttl_days,
+            expires_at=now + ttl_days * 86400,
+        ))
         try:
-            # Update memory cache
-            self.memory_cache[key] = CacheEntry(
-                key=key,
-                response=response,
-                method=method,
-                created_at=time.time(),
-                ttl_days=ttl_days
-            )
-            
-            # Update database
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """INSERT OR REPLACE INTO ai_cache 
-                       (key, response, method, created_at, ttl_days, access_count)
-                       VALUES (?, ?, ?, datetime('now'), ?, 0)""",
-                    (key, json.dumps(response), method, ttl_days)
-                )
-                conn.commit()
-                
+            evicted = await asyncio.to_thread(self._db_set, key, json.dumps(response), method, ttl_days)
+            self.db_evictions += evicted
             logger.debug(f"[AI Cache] Stored {key[:16]} (TTL: {ttl_days} days)")
         except Exception as e:
             logger.warning(f"[AI Cache] Failed to store: {e}")
@@ -159,18 +337,6 @@ class CachedKimiService:
         content = f"{method}:{str(args)}:{str(kwargs)}"
         return hashlib.sha256(content.encode()).hexdigest()[:32]
     
-    def _extract_requirements(self, job_description: str) -> str:
-        """Extract key requirements for cache key."""
-        patterns = [
-            r'(?:requirements|qualifications|what you.ll need|must have).*?(?=\n\n|preferred|benefits|$)',
-            r'(?:responsibilities|what you.ll do).*?(?=\n\n|requirements|$)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, job_description, re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(0)[:500]
-        return job_description[:500]
-    
     def _extract_relevant_sections(self, job_description: str) -> str:
         """Extract only relevant sections to reduce tokens."""
         sections = []
@@ -208,7 +374,7 @@ class CachedKimiService:
         key = self._make_key("parse_resume", resume_text[:1000])
         
         cached = await self._get_cache(key)
-        if cached:
+        if cached is not None:
             return cached
         
         result = await self.service.parse_resume(resume_text)
@@ -223,19 +389,27 @@ class CachedKimiService:
         style: str = "professional"
     ) -> Dict:
         """Tailor resume with caching."""
-        # Extract key job requirements for cache key
-        jd_summary = self._extract_requirements(job_description)
-        key = self._make_key("tailor_resume", resume_text[:500], jd_summary, style)
+        key = self._make_key("tailor_resume", resume_text, job_description, style)
         
         cached = await self._get_cache(key)
-        if cached:
+        if cached is not None:
             return cached
         
+        # Near-duplicate posting for the same resume and style
+        scope = scope_key(resume_text, style)
+        near = await self.semantic_cache.lookup("tailor_resume", scope, job_description)
+        if near is not None:
+            result = near[0]
+            await self._set_cache(key, result, ttl_days=7, method="tailor_resume")
+            self.cache_hits += 1
+            return result
+        
         # Optimize token usage - send only relevant sections
         optimized_jd = self._extract_relevant_sections(job_description)
         
         result = await self.service.tailor_resume(resume_text, optimized_jd, style)
         await self._set_cache(key, result, ttl_days=7, method="tailor_resume")
+        await self.semantic_cache.store("tailor_resume", scope, job_description, result, ttl_days=7)
         self.cache_misses += 1
         return result
     
@@ -248,14 +422,23 @@ class CachedKimiService:
         tone: str = "professional"
     ) -> str:
         """Generate cover letter with caching."""
-        # Cache by company + normalized title
         normalized_title = self._normalize_title(job_title)
-        key = self._make_key("cover_letter", company, normalized_title, tone)
+        key = self._make_key("cover_letter", summary, company.strip().lower(), normalized_title, requirements, tone)
         
         cached = await self._get_cache(key)
-        if cached:
+        if cached is not None:
             return cached.get('letter', cached) if isinstance(cached, dict) else cached
         
+        # Near-duplicate posting of the same role at the same company, for the same candidate and tone
+        scope = scope_key(summary, company.strip().lower(), normalized_title, tone)
+        role_text = f"{normalized_title}\n{requirements}"
+        near = await self.semantic_cache.lookup("generate_cover_letter", scope, role_text)
+        if near is not None:
+            letter = near[0].get('letter', '')
+            await self._set_cache(key, {'letter': letter}, ttl_days=7, method="generate_cover_letter")
+            self.cache_hits += 1
+            return letter
+        
         # Optimize - truncate requirements
         optimized_reqs = requirements[:1500] if len(requirements) > 1500 else requirements
         
@@ -263,6 +446,7 @@ class CachedKimiService:
             summary, job_title, company, optimized_reqs, tone
         )
         await self._set_cache(key, {'letter': result}, ttl_days=7, method="generate_cover_letter")
+        await self.semantic_cache.store("generate_cover_letter", scope, role_text, {'letter': result}, ttl_days=7)
         self.cache_misses += 1
         return result
     
@@ -271,7 +455,7 @@ class CachedKimiService:
         key = self._make_key("suggest_job_titles", resume_text[:1000], count)
         
         cached = await self._get_cache(key)
-        if cached:
+        if cached is not None:
             return cached
         
         result = await self.service.suggest_job_titles(resume_text, count)
@@ -286,29 +470,38 @@ class CachedKimiService:
         total = self.cache_hits + self.cache_misses
         hit_rate = (self.cache_hits / total * 100) if total > 0 else 0
         
-        # Calculate memory usage
-        memory_entries = len(self.memory_cache)
+        # Concurrent identical misses coalesced into one upstream request
+        single_flight = get_llm_single_flight().get_stats()
         
         return {
             'hits': self.cache_hits,
+            'memory_hits': self.memory_hits,
             'misses': self.cache_misses,
             'total': total,
             'hit_rate': f"{hit_rate:.1f}%",
-            'memory_entries': memory_entries,
-            'estimated_cost_saved': f"${(self.cache_hits * 0.01):.2f}",  # ~$0.01 per call
+            'memory_entries': len(self.memory_cache),
+            'memory_max_entries': self.memory_cache.max_entries,
+            'memory_evictions': self.memory_cache.evictions,
+            'db_evictions': self.db_evictions,
+            'pending_access_updates': len(self._pending_access),
+            'semantic': self.semantic_cache.get_stats(),
+            'coalesced': single_flight['coalesced'],
+            'coalesce_rate': single_flight['coalesce_rate'],
+            'single_flight': single_flight,
+            'estimated_cost_saved': f"${((self.cache_hits + single_flight['coalesced']) * 0.01):.2f}",  # ~$0.01 per call
         }
     
-    async def clear_cache(self, older_than_days: int = 30):
-        """Clear old cache entries."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                "DELETE FROM ai_cache WHERE created_at < datetime('now', '-? days')",
-                (older_than_days,)
-            )
-            conn.commit()
-        
-        self.memory_cache.clear()
-        logger.info(f"[AI Cache] Cleared entries older than {older_than_days} days")
+    async def clear_cache(self, older_than_days: int = 30) -> int:
+        """Clear entries older than ``older_than_days`` from both tiers."""
+        await self.flush()
+        deleted = await asyncio.to_thread(self._db_clear, older_than_days)
+        self.memory_cache.discard_older_than(time.time() - older_than_days * 86400)
+        logger.info(f"[AI Cache] Cleared {deleted} entries older than {older_than_days} days")
+        return deleted
+    
+    async def close(self):
+        """Flush buffered access statistics."""
+        await self.flush()
 
 
 # Convenience function for creating cached service
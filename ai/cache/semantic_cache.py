@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Semantic Cache
+
+Second cache tier behind the exact-match AI cache. Lightly reworded postings
+of the same role (reordered bullets, a changed benefits paragraph, different
+boilerplate) hash differently and miss the exact tier, but their MinHash
+signatures are close. This tier returns a prior result when the estimated
+Jaccard similarity of the job text is above a threshold.
+
+Everything is computed locally (no embeddings API). Comparisons are limited
+to a ``scope``, the inputs that must match exactly for reuse to be safe:
+the resume and style for tailoring, the candidate summary, company and tone
+for cover letters.
+
+Example:
+    from ai.cache.semantic_cache import SemanticCache
+
+    cache = SemanticCache("data/ai_cache.db", threshold=0.8)
+    hit = await cache.lookup("tailor_resume", scope, job_description)
+    if hit:
+        response, similarity = hit
+"""
+
+import re
+import json
+import time
+import struct
+import random
+import sqlite3
+import asyncio
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+NUM_PERM = 64
+SHINGLE_SIZE = 2
+
+_MASK64 = (1 << 64) - 1
+# Fixed seed: signatures must stay comparable across processes and restarts.
+_PERM_MASKS = [random.Random(1337 + i).getrandbits(64) for i in range(NUM_PERM)]
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+_SIGNATURE_FORMAT = f"<{NUM_PERM}Q"
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set:
+    """Word n-gram shingles of lowercased alphanumeric tokens."""
+    tokens = _TOKEN_RE.findall((text or "").lower())
+    if len(tokens) < size:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "little")
+
+
+def minhash_signature(text: str) -> Tuple[int, ...]:
+    """MinHash signature using one base hash per shingle XOR-ed with per-slot masks."""
+    hashes = [_hash64(s) for s in shingles(text)]
+    if not hashes:
+        return tuple([_MASK64] * NUM_PERM)
+    return tuple(min(h ^ mask for h in hashes) for mask in _PERM_MASKS)
+
+
+def estimate_similarity(a: Sequence[int], b: Sequence[int]) -> float:
+    """Estimated Jaccard similarity: fraction of matching signature slots."""
+    if not a or len(a) != len(b):
+        return 0.0
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+def scope_key(*parts: Any) -> str:
+    """Hash the inputs that must match exactly for a near-duplicate to be reusable."""
+    content = "\x1f".join(str(p) for p in parts)
+    return hashlib.sha256(content.encode()).hexdigest()[:32]
+
+
+def _pack(signature: Sequence[int]) -> bytes:
+    return struct.pack(_SIGNATURE_FORMAT, *signature)
+
+
+def _unpack(blob: bytes) -> Tuple[int, ...]:
+    return struct.unpack(_SIGNATURE_FORMAT, blob)
+
+
+class SemanticCache:
+    """SQLite-backed near-duplicate lookup by MinHash signature within a scope."""
+
+    def __init__(self, db_path: str, threshold: float = 0.8, max_candidates: int = 500):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+        self.max_candidates = max_candidates
+        self.hits = 0
+        self.misses = 0
+        self._similarity_total = 0.0
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _init_db(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ai_semantic_cache (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    method TEXT NOT NULL,
+                    scope TEXT NOT NULL,
+                    signature BLOB NOT NULL,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_ai_semantic_scope
+                ON ai_semantic_cache(method, scope, created_at)
+            """)
+            conn.commit()
+
+    def _db_candidates(self, method: str, scope: str) -> List[Tuple[bytes, str]]:
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute(
+                """SELECT signature, response FROM ai_semantic_cache
+                   WHERE method = ? AND scope = ? AND expires_at > ?
+                   ORDER BY created_at DESC LIMIT ?""",
+                (method, scope, time.time(), self.max_candidates),
+            ).fetchall()
+
+    def _db_store(self, method: str, scope: str, signature: bytes, response_json: str, ttl_days: int):
+        now = time.time()
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "DELETE FROM ai_semantic_cache WHERE expires_at <= ?", (now,)
+            )
+            conn.execute(
+                """INSERT INTO ai_semantic_cache (method, scope, signature, response, created_at, expires_at)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (method, scope, signature, response_json, now, now + ttl_days * 86400),
+            )
+            conn.commit()
+
+    async def lookup(self, method: str, scope: str, text: str) -> Optional[Tuple[Any, float]]:
+        """Best prior result for a near-duplicate of ``text`` in ``scope`` as (response, similarity)."""
+        signature = minhash_signature(text)
+        try:
+            rows = await asyncio.to_thread(self._db_candidates, method, scope)
+        except Exception as e:
+            logger.warning(f"[Semantic Cache] DB error: {e}")
+            return None
+
+        best: Optional[Tuple[str, float]] = None
+        for blob, response_json in rows:
+            similarity = estimate_similarity(signature, _unpack(blob))
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (response_json, similarity)
+
+        if best is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._similarity_total += best[1]
+        logger.debug(f"[Semantic Cache] {method} near-duplicate hit (similarity {best[1]:.2f})")
+        return json.loads(best[0]), best[1]
+
+    async def store(self, method: str, scope: str, text: str, response: Any, ttl_days: int = 7):
+        try:
+            await asyncio.to_thread(
+                self._db_store, method, scope, _pack(minhash_signature(text)), json.dumps(response), ttl_days
+            )
+        except Exception as e:
+            logger.warning(f"[Semantic Cache] Failed to store: {e}")
+
+    def get_stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': f"{(self.hits / total * 100) if total else 0:.1f}%",
+            'threshold': self.threshold,
+            'avg_hit_similarity': round(self._similarity_total / self.hits, 3) if self.hits else None,
+        }
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Single-Flight Request Coalescing
+
+When several queue slots ask the LLM the same thing at the same moment (the
+same screening question, a cover letter for the same posting), only the
+first caller goes upstream; the others await its result. Unlike the response
+cache this needs no completed entry, so it helps exactly when the cache
+cannot: while the first request is still in flight.
+
+Keys are a hash of the normalized request (model, messages with whitespace
+collapsed, sampling parameters, plus whatever else callers pass; the Kimi
+service adds the governor lane and user, since the shared call runs in the
+first caller's context).
+
+Example:
+    from ai.cache.single_flight import get_llm_single_flight, request_key
+
+    key = request_key(model, messages, temperature=0.1, max_tokens=200)
+    data = await get_llm_single_flight().do(key, lambda: call_upstream())
+"""
+
+import re
+import json
+import asyncio
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_text(text: str) -> str:
+    return re.sub(r'\s+', ' ', text or '').strip()
+
+
+def _normalize_content(content: Any) -> Any:
+    if isinstance(content, str):
+        return _normalize_text(content)
+    if isinstance(content, list):  # multimodal parts
+        return [
+            {**part, 'text': _normalize_text(part.get('text', ''))} if isinstance(part, dict) and 'text' in part else part
+            for part in content
+        ]
+    return content
+
+
+def request_key(model: str, messages: List[Dict[str, Any]], **params) -> str:
+    """Stable hash of a chat request; whitespace-only prompt differences share a key."""
+    normalized = {
+        'model': model,
+        'messages': [
+            {'role': m.get('role'), 'content': _normalize_content(m.get('content'))}
+            for m in messages
+        ],
+        'params': params,
+    }
+    payload = json.dumps(normalized, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one execution."""
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``fn`` for ``key`` unless an identical call is already running,
+        in which case await that call's result (or exception).
+        """
+        self.calls += 1
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+
+        if task is not None and not task.done() and task.get_loop() is loop:
+            self.coalesced += 1
+            logger.debug(f"[SingleFlight] Coalesced {key[:12]}")
+        else:
+            self.executions += 1
+            task = loop.create_task(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._forget(k, t))
+
+        # Shield so one caller being cancelled doesn't cancel the shared call.
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved; callers already got it
+
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    def get_stats(self) -> Dict[str, Any]:
+        rate = (self.coalesced / self.calls * 100) if self.calls else 0
+        return {
+            'calls': self.calls,
+            'upstream_calls': self.executions,
+            'coalesced': self.coalesced,
+            'coalesce_rate': f"{rate:.1f}%",
+            'in_flight': self.in_flight(),
+        }
+
+
+# Singleton shared by every LLM caller
+_llm_single_flight: Optional[SingleFlight] = None
+
+
+def get_llm_single_flight() -> SingleFlight:
+    """Get singleton SingleFlight instance for LLM requests."""
+    global _llm_single_flight
+    if _llm_single_flight is None:
+        _llm_single_flight = SingleFlight()
+    return _llm_single_flight
@@ -12,15 +12,33 @@ import asyncio
 from typing import Dict, List, Optional, Any
 import logging
 
+from .llm_governor import LANE_INTERACTIVE, caller_lane, llm_context
+
 logger = logging.getLogger(__name__)
 
 
+PROMPT_PREAMBLE = [
+    "You are helping someone fill out a job application.",
+    "Be truthful and accurate. Do not invent experience, skills, companies, dates, degrees, or credentials.",
+    "Use only the provided applicant profile and resume context. If unknown, say 'Not specified'.",
+]
+
+PROMPT_INSTRUCTIONS = [
+    "1. Keep answers concise (1-2 sentences for text, exact option for select/radio).",
+    "2. If the form asks for demographics (race/gender/veteran/disability), choose 'Prefer not to answer' when available.",
+    "3. For salary questions: respond 'Negotiable' unless a specific number is explicitly provided in the profile.",
+    "4. For authorization/sponsorship: use the profile fields. If missing, say 'Not specified'.",
+]
+
+
 class FormIntelligence:
     """AI-powered form filling intelligence."""
     
     def __init__(self):
         self.kimi_service = None
-        self.cache = {}  # Simple cache for repeated questions
+        self.answer_bank = None
+        self.cache: Dict[str, Dict[str, str]] = {}  # user key -> in-process cache in front of the answer bank
+        self.stats = {'questions': 0, 'rules': 0, 'remembered': 0, 'llm': 0, 'fallback': 0}
     
     def _get_kimi(self):
         """Lazy load Kimi service."""
@@ -32,6 +50,87 @@ class FormIntelligence:
                 logger.warning(f"[FormIntelligence] Could not load Kimi: {e}")
         return self.kimi_service
     
+    def _get_answer_bank(self):
+        """Lazy load the persistent answer bank."""
+        if self.answer_bank is None:
+            try:
+                from core.answer_bank import get_answer_bank
+                self.answer_bank = get_answer_bank()
+            except Exception as e:
+                logger.warning(f"[FormIntelligence] Answer bank unavailable: {e}")
+                self.answer_bank = False
+        return self.answer_bank or None
+    
+    @staticmethod
+    def _user_key(profile: Optional[Dict]) -> Optional[str]:
+        """
+        Owner of the answers: the account id (what ``/profile/answers`` uses).
+        Profiles without an account, e.g. CLI campaign runs, fall back to the email.
+        """
+        if not profile:
+            return None
+        user = profile.get("user_id") or (profile.get("email") or "").strip().lower()
+        return str(user) if user else None
+    
+    @staticmethod
+    def _cache_key(question: str, options: Optional[List[str]]) -> str:
+        return f"{question}_{hash(str(options))}"
+    
+    def forget(self, user_key: str):
+        """Drop a user's cached answers (after they edit or delete answers in the bank)."""
+        self.cache.pop(str(user_key), None)
+    
+    async def _recall(self, question: str, options: Optional[List[str]], profile: Optional[Dict]) -> Optional[str]:
+        """Previously generated (or user-overridden) answer for this profile."""
+        user_key = self._user_key(profile)
+        cached = self.cache.get(user_key or '', {})
+        cache_key = self._cache_key(question, options)
+        if cache_key in cached:
+            return cached[cache_key]
+        
+        bank = self._get_answer_bank() if user_key else None
+        if bank:
+            try:
+                answer = await asyncio.to_thread(bank.lookup, user_key, question, options)
+            except Exception as e:
+                logger.debug(f"[FormIntelligence] Answer bank lookup failed: {e}")
+                answer = None
+            if answer is not None:
+                self.cache.setdefault(user_key, {})[cache_key] = answer
+                return answer
+        return None
+    
+    async def _remember(self, question: str, options: Optional[List[str]], profile: Optional[Dict], answer: str):
+        user_key = self._user_key(profile)
+        self.cache.setdefault(user_key or '', {})[self._cache_key(question, options)] = answer
+        
+        bank = self._get_answer_bank() if user_key else None
+        if bank:
+            try:
+                await asyncio.to_thread(bank.store, user_key, question, options, answer)
+            except Exception as e:
+                logger.debug(f"[FormIntelligence] Answer bank store failed: {e}")
+    
+    async def _known_answer(
+        self,
+        question: str,
+        question_type: str,
+        options: Optional[List[str]],
+        profile: Optional[Dict],
+    ) -> Optional[str]:
+        """Answer without the model: the user's stored answers, then the rule classifier."""
+        known = await self._recall(question, options, profile)
+        if known is not None:
+            self.stats['remembered'] += 1
+            return known
+        
+        from .question_classifier import get_question_classifier
+        resolved = get_question_classifier().resolve(question, question_type, options, profile)
+        if resolved is not None:
+            self.stats['rules'] += 1
+            return resolved.answer
+        return None
+    
     async def answer_question(
         self,
         question: str,
@@ -56,13 +155,29 @@ class FormIntelligence:
         Returns:
             Generated answer
         """
-        # Check cache
-        cache_key = f"{question}_{hash(str(options))}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        self.stats['questions'] += 1
+        known = await self._known_answer(question, question_type, options, profile)
+        if known is not None:
+            return known
         
+        return await self._ask_model(
+            question, question_type, options, profile, resume_text, job_description, context
+        )
+    
+    async def _ask_model(
+        self,
+        question: str,
+        question_type: str,
+        options: Optional[List[str]],
+        profile: Optional[Dict],
+        resume_text: Optional[str],
+        job_description: Optional[str],
+        context: Optional[Dict],
+    ) -> str:
+        """Single-question LLM answer, falling back to canned answers."""
         kimi = self._get_kimi()
         if not kimi:
+            self.stats['fallback'] += 1
             return self._fallback_answer(question, question_type, options)
         
         try:
@@ -73,21 +188,146 @@ class FormIntelligence:
             )
             
             # Get AI response
-            response = await kimi.generate_text(prompt, max_tokens=200)
+            with llm_context(lane=caller_lane(LANE_INTERACTIVE), call_site="question_answer"):
+                response = await kimi.generate_text(prompt, max_tokens=200)
             answer = response.strip()
             
             # Validate and clean answer
             answer = self._validate_answer(answer, question_type, options)
             
             # Cache result
-            self.cache[cache_key] = answer
+            await self._remember(question, options, profile, answer)
+            self.stats['llm'] += 1
             
             return answer
             
         except Exception as e:
             logger.warning(f"[FormIntelligence] AI answer failed: {e}")
+            self.stats['fallback'] += 1
             return self._fallback_answer(question, question_type, options)
     
+    async def answer_questions(
+        self,
+        questions: List[Dict[str, Any]],
+        profile: Dict = None,
+        resume_text: str = None,
+        job_description: str = None,
+        context: Dict = None
+    ) -> List[str]:
+        """
+        Answer every question on a form step with one LLM call.
+        
+        Args:
+            questions: Dicts with 'question', 'type' and optional 'options'
+            profile, resume_text, job_description, context: As for answer_question
+            
+        Returns:
+            Answers in the same order as ``questions``. Answers missing from the
+            batch output, or not matching an offered option, are re-asked one
+            question at a time.
+        """
+        answers: List[Optional[str]] = [None] * len(questions)
+        pending: List[int] = []
+        self.stats['questions'] += len(questions)
+        knowns = await asyncio.gather(*[
+            self._known_answer(q['question'], q.get('type', 'text'), q.get('options'), profile)
+            for q in questions
+        ])
+        for i, known in enumerate(knowns):
+            if known is not None:
+                answers[i] = known
+            else:
+                pending.append(i)
+        
+        kimi = self._get_kimi() if len(pending) > 1 else None
+        if kimi:
+            from .kimi_service import _safe_json_loads
+            
+            batch = [questions[i] for i in pending]
+            try:
+                prompt = self._build_batch_prompt(batch, profile, resume_text, job_description, context)
+                with llm_context(lane=caller_lane(LANE_INTERACTIVE), call_site="question_answer"):
+                    response = await kimi.generate_text(prompt, max_tokens=min(2000, 120 * len(batch) + 200))
+                parsed = _safe_json_loads(response)
+            except Exception as e:
+                logger.warning(f"[FormIntelligence] Batch answer failed: {e}")
+                parsed = None
+            
+            if isinstance(parsed, dict):
+                still_pending = []
+                for n, i in enumerate(pending, start=1):
+                    q = questions[i]
+                    raw = parsed.get(str(n))
+                    if not self._is_valid_answer(raw, q.get('type', 'text'), q.get('options')):
+                        still_pending.append(i)
+                        continue
+                    answer = self._validate_answer(str(raw), q.get('type', 'text'), q.get('options'))
+                    await self._remember(q['question'], q.get('options'), profile, answer)
+                    self.stats['llm'] += 1
+                    answers[i] = answer
+                if still_pending:
+                    logger.info(f"[FormIntelligence] {len(still_pending)}/{len(pending)} batch answers invalid, asking individually")
+                pending = still_pending
+        
+        # Per-question fallback (also the path for a single question)
+        if pending:
+            results = await asyncio.gather(*[
+                self._ask_model(
+                    questions[i]['question'], questions[i].get('type', 'text'), questions[i].get('options'),
+                    profile, resume_text, job_description, context,
+                )
+                for i in pending
+            ])
+            for i, answer in zip(pending, results):
+                answers[i] = answer
+        
+        return answers
+    
+    def _build_batch_prompt(
+        self,
+        questions: List[Dict[str, Any]],
+        profile: Dict,
+        resume_text: str,
+        job_description: str,
+        context: Dict
+    ) -> str:
+        """Build one prompt asking for a JSON map of numbered answers."""
+        prompt_parts = list(PROMPT_PREAMBLE) + ["", "Questions:"]
+        for n, q in enumerate(questions, start=1):
+            line = f"{n}. [{q.get('type', 'text')}] {q['question']}"
+            if q.get('options'):
+                line += f" (Options: {' | '.join(q['options'])})"
+            prompt_parts.append(line)
+        
+        prompt_parts.extend(self._context_lines(profile, resume_text, job_description, context))
+        prompt_parts.append("")
+        prompt_parts.append("Instructions:")
+        prompt_parts.extend(PROMPT_INSTRUCTIONS)
+        prompt_parts.append("5. For select/radio questions, answer with one of the listed options exactly.")
+        prompt_parts.append("")
+        prompt_parts.append('Respond with only a JSON object mapping each question number to its answer, e.g. {"1": "Yes", "2": "..."}.')
+        
+        return "\n".join(prompt_parts)
+    
+    def _is_valid_answer(self, answer: Any, question_type: str, options: List[str]) -> bool:
+        """Whether a batch answer can be used as-is (otherwise the question is re-asked)."""
+        if answer is None or isinstance(answer, (dict, list)):
+            return False
+        text = str(answer).strip()
+        if not text:
+            return False
+        if question_type in ['select', 'radio'] and options:
+            return self._match_option(text, options) is not None
+        return True
+    
+    def _match_option(self, answer: str, options: List[str]) -> Optional[str]:
+        """Option matching (or contained in) the answer text, if any."""
+        answer_lower = answer.lower()
+        for option in options:
+            if option.lower() in answer_lower or answer_lower in option.lower():
+                return option
+        return None
+    
     def _build_prompt(
         self,
         question: str,
@@ -100,10 +340,7 @@ class FormIntelligence:
     ) -> str:
         """Build AI prompt for question answering."""
         
-        prompt_parts = [
-            "You are helping someone fill out a job application.",
-            "Be truthful and accurate. Do not invent experience, skills, companies, dates, degrees, or credentials.",
-            "Use only the provided applicant profile and resume context. If unknown, say 'Not specified'.",
+        prompt_parts = list(PROMPT_PREAMBLE) + [
             "",
             f"Question: {question}",
             f"Question Type: {question_type}",
@@ -112,6 +349,26 @@ class FormIntelligence:
         if options:
             prompt_parts.append(f"Available Options: {', '.join(options)}")
         
+        prompt_parts.extend(self._context_lines(profile, resume_text, job_description, context))
+        
+        prompt_parts.append(f"")
+        prompt_parts.append(f"Instructions:")
+        prompt_parts.extend(PROMPT_INSTRUCTIONS)
+        prompt_parts.append(f"")
+        prompt_parts.append(f"Answer:")
+        
+        return "\n".join(prompt_parts)
+    
+    def _context_lines(
+        self,
+        profile: Dict,
+        resume_text: str,
+        job_description: str,
+        context: Dict
+    ) -> List[str]:
+        """Applicant, resume and job context shared by single and batch prompts."""
+        prompt_parts = []
+        
         if profile:
             prompt_parts.append("")
             prompt_parts.append("Applicant Profile:")
@@ -143,16 +400,7 @@ class FormIntelligence:
             prompt_parts.append(f"")
             prompt_parts.append(f"Additional Context: {context}")
         
-        prompt_parts.append(f"")
-        prompt_parts.append(f"Instructions:")
-        prompt_parts.append(f"1. Keep answers concise (1-2 sentences for text, exact option for select/radio).")
-        prompt_parts.append(f"2. If the form asks for demographics (race/gender/veteran/disability), choose 'Prefer not to answer' when available.")
-        prompt_parts.append(f"3. For salary questions: respond 'Negotiable' unless a specific number is explicitly provided in the profile.")
-        prompt_parts.append(f"4. For authorization/sponsorship: use the profile fields. If missing, say 'Not specified'.")
-        prompt_parts.append(f"")
-        prompt_parts.append(f"Answer:")
-        
-        return "\n".join(prompt_parts)
+        return prompt_parts
     
     def _validate_answer(
         self,
@@ -166,10 +414,9 @@ class FormIntelligence:
         
         if question_type in ['select', 'radio'] and options:
             # Find closest matching option
-            answer_lower = answer.lower()
-            for option in options:
-                if option.lower() in answer_lower or answer_lower in option.lower():
-                    return option
+            matched = self._match_option(answer, options)
+            if matched is not None:
+                return matched
             # Default to first non-placeholder option
             cleaned = [o for o in options if (o or "").strip()]
             non_placeholder = [
@@ -240,6 +487,19 @@ class FormIntelligence:
         
         return 'N/A'
     
+    def get_stats(self) -> Dict[str, Any]:
+        """How questions were answered, including the share that never reached the model."""
+        from .question_classifier import get_question_classifier
+        
+        total = self.stats['questions']
+        skipped = self.stats['rules'] + self.stats['remembered']
+        return {
+            **self.stats,
+            'skipped_model': skipped,
+            'skipped_model_rate': f"{(skipped / total * 100) if total else 0:.1f}%",
+            'classifier': get_question_classifier().get_stats(),
+        }
+    
     async def analyze_form_structure(
         self,
         html_content: str,
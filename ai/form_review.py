@@ -259,8 +259,9 @@ Provide a concise, professional answer (2-3 sentences max).
     
     async def _call_ai(self, prompt: str) -> dict:
         """Call AI API."""
-        import aiohttp
         import os
+        from ai.llm_client import get_llm_client
+        from ai.llm_governor import LANE_INTERACTIVE
         
         api_key = self.api_key or os.getenv("MOONSHOT_API_KEY")
         if not api_key:
@@ -268,11 +269,6 @@ Provide a concise, professional answer (2-3 sentences max).
         
         url = "https://api.moonshot.cn/v1/chat/completions"
         
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        
         payload = {
             "model": self.model,
             "messages": [
@@ -282,20 +278,20 @@ Provide a concise, professional answer (2-3 sentences max).
             "temperature": 0.3
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload) as resp:
-                data = await resp.json()
-                content = data["choices"][0]["message"]["content"]
-                
-                # Try to parse as JSON
-                try:
-                    if "```json" in content:
-                        content = content.split("```json")[1].split("```")[0]
-                    elif "```" in content:
-                        content = content.split("```")[1].split("```")[0]
-                    return json.loads(content.strip())
-                except:
-                    return {"answer": content.strip()}
+        data = await get_llm_client().chat_completion(
+            url, api_key, payload, lane=LANE_INTERACTIVE, call_site="form_review"
+        )
+        content = data["choices"][0]["message"]["content"]
+        
+        # Try to parse as JSON
+        try:
+            if "```json" in content:
+                content = content.split("```json")[1].split("```")[0]
+            elif "```" in content:
+                content = content.split("```")[1].split("```")[0]
+            return json.loads(content.strip())
+        except:
+            return {"answer": content.strip()}
 
 
 class ReviewModeManager:
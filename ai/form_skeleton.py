@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Form Skeleton
+
+Extracts the form-relevant nodes of an application page (controls, labels,
+buttons, Workday ``data-automation-id`` elements, confirmation/error
+containers) and derives two things from them:
+
+- a structural fingerprint: a hash of the canonicalized skeleton with
+  generated ids and numeric indexes stripped, so every company on the same
+  Greenhouse/Lever/Workday template hashes alike
+- reduced HTML: just those nodes, which is what the LLM needs to suggest
+  selectors, at a fraction of the raw page's tokens
+
+Example:
+    from ai.form_skeleton import FormSkeleton
+
+    skeleton = FormSkeleton.parse(page_html)
+    key = skeleton.fingerprint()
+    prompt_html = skeleton.reduced_html(max_chars=20000)
+"""
+
+import re
+import hashlib
+from dataclasses import dataclass, field
+from html import escape
+from html.parser import HTMLParser
+from typing import Dict, List, Optional
+
+CONTROL_TAGS = {"input", "select", "textarea", "button"}
+SKIP_INPUT_TYPES = {"hidden"}
+
+# Attributes kept in the reduced HTML (the ones selectors are built from).
+KEPT_ATTRS = (
+    "type", "name", "id", "for", "class", "placeholder", "aria-label", "role",
+    "data-automation-id", "data-qa", "data-testid", "autocomplete", "accept", "required",
+)
+# Attributes that define the template's structure (fingerprint input).
+STRUCTURAL_ATTRS = ("type", "name", "id", "for", "role", "data-automation-id", "data-qa", "autocomplete")
+
+_STATUS_RE = re.compile(r"success|confirm|thank|error", re.I)
+_ROLE_CONTROLS = {"button", "textbox", "combobox", "listbox", "checkbox", "radio"}
+# Generated ids: uuids/hex runs and numeric indexes (question_1234, answers[3]).
+_DYNAMIC_RE = re.compile(r"[0-9a-f]{8}(?:-?[0-9a-f]{4}){3}-?[0-9a-f]{12}|[0-9a-f]*\d[0-9a-f]{5,}|\d+", re.I)
+
+MAX_TEXT = 80
+MAX_REPEAT_BLOCK = 4
+
+
+def canonical_value(value: str) -> str:
+    """Lowercase an attribute value and replace generated parts with '#'."""
+    return _DYNAMIC_RE.sub("#", (value or "").strip().lower())
+
+
+@dataclass
+class SkeletonNode:
+    """One form-relevant element."""
+    tag: str
+    attrs: Dict[str, str]
+    text: str = ""
+
+    def canonical(self) -> str:
+        parts = [self.tag]
+        for name in STRUCTURAL_ATTRS:
+            if self.attrs.get(name):
+                parts.append(f"{name}={canonical_value(self.attrs[name])}")
+        if "required" in self.attrs:
+            parts.append("required")
+        return " ".join(parts)
+
+    def to_html(self) -> str:
+        attrs = "".join(
+            f' {name}="{escape(self.attrs[name])}"' if self.attrs[name] else f" {name}"
+            for name in KEPT_ATTRS
+            if name in self.attrs
+        )
+        if self.tag == "input":
+            return f"<input{attrs}>"
+        return f"<{self.tag}{attrs}>{escape(self.text)}</{self.tag}>"
+
+
+class _SkeletonParser(HTMLParser):
+    """Collects form-relevant elements in document order."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.nodes: List[SkeletonNode] = []
+        self._open: List[SkeletonNode] = []  # text-bearing nodes awaiting their end tag
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("script", "style", "svg"):
+            self._skip_depth += 1
+            return
+        if self._skip_depth:
+            return
+        attrs = {k: (v if v is not None else "") for k, v in attrs}
+        if tag == "input" and attrs.get("type", "").lower() in SKIP_INPUT_TYPES:
+            return
+
+        keep = (
+            tag in CONTROL_TAGS
+            or tag in ("form", "label", "legend", "fieldset")
+            or "data-automation-id" in attrs
+            or attrs.get("role", "").lower() in _ROLE_CONTROLS
+            or bool(_STATUS_RE.search(attrs.get("id", "") + " " + attrs.get("class", "")))
+        )
+        # Section headings give the model context, but only inside a form.
+        if tag in ("h1", "h2", "h3") and any(n.tag == "form" for n in self._open):
+            keep = True
+        if not keep:
+            return
+
+        node = SkeletonNode(tag=tag, attrs=attrs)
+        self.nodes.append(node)
+        if tag == "button" or tag not in CONTROL_TAGS:
+            self._open.append(node)
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style", "svg"):
+            self._skip_depth = max(0, self._skip_depth - 1)
+            return
+        for i in range(len(self._open) - 1, -1, -1):
+            if self._open[i].tag == tag:
+                del self._open[i:]
+                break
+
+    def handle_data(self, data):
+        if self._skip_depth or not self._open:
+            return
+        node = self._open[-1]
+        if node.tag == "form" or len(node.text) >= MAX_TEXT:
+            return
+        text = " ".join(data.split())
+        if text:
+            node.text = (f"{node.text} {text}" if node.text else text)[:MAX_TEXT]
+
+
+@dataclass
+class FormSkeleton:
+    """Form-relevant nodes of a page, in document order."""
+    nodes: List[SkeletonNode] = field(default_factory=list)
+
+    @classmethod
+    def parse(cls, html: str) -> "FormSkeleton":
+        parser = _SkeletonParser()
+        try:
+            parser.feed(html or "")
+            parser.close()
+        except Exception:
+            pass  # keep whatever was parsed before the bad markup
+        return cls(nodes=parser.nodes)
+
+    @property
+    def has_controls(self) -> bool:
+        return any(n.tag in CONTROL_TAGS or "data-automation-id" in n.attrs for n in self.nodes)
+
+    def canonical_lines(self) -> List[str]:
+        """
+        Canonical skeleton. Back-to-back repeats of a short block (e.g. a
+        label + input per custom question) collapse to one copy, so the
+        number of same-shaped questions doesn't change the fingerprint.
+        """
+        lines: List[str] = []
+        for node in self.nodes:
+            lines.append(node.canonical())
+            for size in range(1, MAX_REPEAT_BLOCK + 1):
+                if len(lines) >= 2 * size and lines[-size:] == lines[-2 * size:-size]:
+                    del lines[-size:]
+                    break
+        return lines
+
+    def fingerprint(self) -> Optional[str]:
+        """Structural hash of the form, or None when the page has no form controls."""
+        if not self.has_controls:
+            return None
+        return hashlib.sha256("\n".join(self.canonical_lines()).encode()).hexdigest()[:32]
+
+    def reduced_html(self, max_chars: int = 20000) -> str:
+        """The skeleton as compact HTML, one element per line."""
+        out, size = [], 0
+        for node in self.nodes:
+            line = node.to_html()
+            if size + len(line) + 1 > max_chars:
+                break
+            out.append(line)
+            size += len(line) + 1
+        return "\n".join(out)
+
+    def matches(self, selector: str) -> bool:
+        """True if a simple CSS selector matches one of the skeleton's elements."""
+        from adapters.http_submitter import selector_matches
+
+        return any(selector_matches(selector, n.tag, n.attrs) for n in self.nodes)
@@ -9,13 +9,15 @@ OpenAI-compatible chat completions API.
 import os
 import re
 import json
-import asyncio
 import logging
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 
-import aiohttp
+from ai.llm_client import LLMRequestError, get_llm_client
+from ai.cache.single_flight import get_llm_single_flight, request_key
+from ai.llm_governor import current_lane, current_user
+from monitoring.apply_spans import apply_span
 
 logger = logging.getLogger(__name__)
 
@@ -119,36 +121,46 @@ class KimiResumeOptimizer:
         messages: List[Dict[str, str]],
         temperature: float = 0.1,
         max_tokens: int = 2000,
+        call_site: Optional[str] = None,
     ) -> _ChatCompletionResponse:
-        """Call Moonshot chat completions API."""
+        """Call Moonshot chat completions API (``call_site`` tags the usage ledger)."""
         if not self.api_key:
             raise RuntimeError("MOONSHOT_API_KEY not configured")
 
-        last_error = None
-        for attempt in range(self.max_retries):
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        # Identical requests already in flight (same question, same posting) share one call.
+        # The shared call runs in the leader's context, so only callers in the same lane and
+        # user join it: an interactive request never waits behind background admission, and
+        # quota and usage stay with the user who asked.
+        key = request_key(
+            self.model, messages, temperature=temperature, max_tokens=max_tokens,
+            lane=current_lane(), user=current_user(),
+        )
+
+        # Counts toward the active application's LLM phase (no-op outside an apply).
+        with apply_span("llm_answer"):
             try:
-                timeout = aiohttp.ClientTimeout(total=self.timeout)
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    async with session.post(
+                data = await get_llm_single_flight().do(
+                    key,
+                    lambda: get_llm_client().chat_completion(
                         f"{self.base_url}/chat/completions",
-                        headers={"Authorization": f"Bearer {self.api_key}"},
-                        json={
-                            "model": self.model,
-                            "messages": messages,
-                            "temperature": temperature,
-                            "max_tokens": max_tokens,
-                        },
-                    ) as resp:
-                        data = await resp.json()
-                        content = data["choices"][0]["message"]["content"]
-                        return _ChatCompletionResponse(
-                            choices=[_Choice(message=_ChoiceMessage(content=content))]
-                        )
-            except Exception as e:
-                last_error = e
-                await asyncio.sleep(1 + attempt)
-
-        raise RuntimeError(f"Moonshot request failed: {last_error}")
+                        self.api_key,
+                        payload,
+                        timeout=self.timeout,
+                        max_retries=self.max_retries,
+                        call_site=call_site,
+                    ),
+                )
+                content = data["choices"][0]["message"]["content"]
+            except (LLMRequestError, KeyError, IndexError, TypeError) as e:
+                raise RuntimeError(f"Moonshot request failed: {e}") from e
+
+        return _ChatCompletionResponse(choices=[_Choice(message=_ChoiceMessage(content=content))])
 
     async def parse_resume(self, resume_text: str) -> Dict[str, Any]:
         """Parse resume text into structured data."""
@@ -206,7 +218,7 @@ class KimiResumeOptimizer:
         ]
 
         try:
-            response = await self._chat_completion(messages, max_tokens=2000)
+            response = await self._chat_completion(messages, max_tokens=2000, call_site="resume_parse")
             data = _safe_json_loads(response.choices[0].message.content) or {}
         except Exception as e:
             logger.warning(f"[Kimi] parse_resume failed: {e}")
@@ -246,6 +258,7 @@ class KimiResumeOptimizer:
             messages,
             temperature=temperature,
             max_tokens=max_tokens,
+            call_site="generate_text",
         )
         return response.choices[0].message.content.strip()
 
@@ -262,7 +275,7 @@ class KimiResumeOptimizer:
             {"role": "user", "content": prompt},
         ]
         try:
-            response = await self._chat_completion(messages, max_tokens=300)
+            response = await self._chat_completion(messages, max_tokens=300, call_site="resume_summary")
             return response.choices[0].message.content.strip()
         except Exception:
             # Fallback: first 2-3 lines
@@ -306,7 +319,7 @@ class KimiResumeOptimizer:
         ]
 
         try:
-            response = await self._chat_completion(messages, max_tokens=1200)
+            response = await self._chat_completion(messages, max_tokens=1200, call_site="tailoring")
             data = _safe_json_loads(response.choices[0].message.content) or {}
         except Exception as e:
             logger.warning(f"[Kimi] tailor_resume failed: {e}")
@@ -342,7 +355,7 @@ class KimiResumeOptimizer:
             {"role": "user", "content": prompt},
         ]
         try:
-            response = await self._chat_completion(messages, max_tokens=1200)
+            response = await self._chat_completion(messages, max_tokens=1200, call_site="cover_letter")
             return response.choices[0].message.content.strip()
         except Exception as e:
             logger.warning(f"[Kimi] generate_cover_letter failed: {e}")
@@ -379,7 +392,7 @@ class KimiResumeOptimizer:
             {"role": "user", "content": prompt},
         ]
         try:
-            response = await self._chat_completion(messages, max_tokens=300)
+            response = await self._chat_completion(messages, max_tokens=300, call_site="question_answer")
             return response.choices[0].message.content.strip()
         except Exception as e:
             logger.warning(f"[Kimi] answer_application_question failed: {e}")
@@ -399,7 +412,7 @@ class KimiResumeOptimizer:
             {"role": "user", "content": prompt},
         ]
         try:
-            response = await self._chat_completion(messages, max_tokens=800)
+            response = await self._chat_completion(messages, max_tokens=800, call_site="job_title_suggestions")
             data = _safe_json_loads(response.choices[0].message.content)
             if isinstance(data, list):
                 return data[:count]
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Shared LLM HTTP Client
+
+One long-lived, pooled ``aiohttp`` session for every Moonshot/Kimi call.
+Connections are kept alive between requests (no TCP/TLS setup per call),
+capped overall and per host, and retried with a policy that honours
+``429``/``Retry-After``. Request latency is tracked for monitoring. Chat
+completions are admitted by the ``LLMGovernor`` (concurrency, RPM/TPM and
+per-user budgets, priority lanes) before they are sent, and their tokens,
+latency and cost are recorded in the LLM usage ledger. With
+``LLM_BACKEND=record|replay`` requests go through the offline record/replay
+backend (``ai.llm_replay``) instead of, or as well as, the network.
+
+The FastAPI lifespan closes the client on shutdown; standalone scripts call
+``close_llm_client()`` themselves.
+
+Example:
+    from ai.llm_client import get_llm_client
+
+    data = await get_llm_client().chat_completion(
+        "https://api.moonshot.ai/v1/chat/completions",
+        api_key,
+        {"model": "moonshot-v1-8k", "messages": messages},
+    )
+"""
+
+import time
+import random
+import asyncio
+import logging
+from collections import deque
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+
+from api.config import config
+from monitoring.apply_spans import percentile
+from monitoring.llm_usage import get_llm_usage_ledger
+from ai.llm_governor import current_tags, estimate_tokens, get_llm_governor
+from ai.llm_replay import ReplayMissError, get_llm_replay_backend
+
+logger = logging.getLogger(__name__)
+
+
+# Upstream statuses worth retrying; anything else in 4xx fails immediately.
+RETRYABLE_STATUSES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class LLMRequestError(RuntimeError):
+    """An LLM request that failed after the retry policy gave up."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+async def close_stale_session(
+    session: Optional[aiohttp.ClientSession],
+    loop: Optional[asyncio.AbstractEventLoop],
+    tag: str = "LLMClient",
+) -> None:
+    """Close a pooled session from an earlier event loop instead of leaking its connector."""
+    if session is None or session.closed:
+        return
+    try:
+        if loop is not None and loop.is_running():
+            # Still serving another thread; close it there.
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            await session.close()
+    except Exception as e:
+        logger.debug(f"[{tag}] Closing stale session failed: {e}")
+
+
+class LLMClient:
+    """Pooled HTTP client with retry policy and latency metrics."""
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        limit_per_host: Optional[int] = None,
+        keepalive_seconds: Optional[float] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        retry_delay: Optional[float] = None,
+        max_retry_after: Optional[float] = None,
+    ):
+        self.limit = limit or config.LLM_POOL_LIMIT
+        self.limit_per_host = limit_per_host or config.LLM_POOL_LIMIT_PER_HOST
+        self.keepalive_seconds = keepalive_seconds or config.LLM_KEEPALIVE_SECONDS
+        self.timeout = timeout or config.AI_TIMEOUT_SECONDS
+        self.max_retries = config.AI_MAX_RETRIES if max_retries is None else max_retries
+        self.retry_delay = config.AI_RETRY_DELAY_SECONDS if retry_delay is None else retry_delay
+        self.max_retry_after = max_retry_after or config.LLM_MAX_RETRY_AFTER_SECONDS
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._latencies: Deque[float] = deque(maxlen=1000)
+        self._stats = {
+            'requests': 0,
+            'succeeded': 0,
+            'failed': 0,
+            'retries': 0,
+            'rate_limited': 0,
+            'sessions_created': 0,
+        }
+        self._per_host: Dict[str, int] = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on first use (or on a new event loop)."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            await close_stale_session(self._session, self._loop)
+            self._session = None
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_seconds,
+                ttl_dns_cache=300,
+                ssl=None if config.LLM_VERIFY_SSL else False,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._loop = loop
+            self._stats['sessions_created'] += 1
+        return self._session
+
+    def _backoff(self, attempt: int) -> float:
+        return self.retry_delay * (2 ** attempt) + random.uniform(0, self.retry_delay / 2 or 0.05)
+
+    async def post_json(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """POST ``payload`` as JSON and return the decoded response, retrying transient failures."""
+        session = await self._get_session()
+        attempts = max(1, self.max_retries if max_retries is None else max_retries)
+        request_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+        host = urlparse(url).netloc
+        last_error: Optional[str] = None
+        last_status: Optional[int] = None
+
+        self._stats['requests'] += 1
+        self._per_host[host] = self._per_host.get(host, 0) + 1
+
+        for attempt in range(attempts):
+            if attempt:
+                self._stats['retries'] += 1
+            delay = None
+            start = time.perf_counter()
+            try:
+                async with session.post(url, json=payload, headers=headers, timeout=request_timeout) as resp:
+                    if resp.status == 200:
+                        data = await resp.json(content_type=None)
+                        self._latencies.append((time.perf_counter() - start) * 1000)
+                        self._stats['succeeded'] += 1
+                        return data
+
+                    body = await resp.text()
+                    last_status = resp.status
+                    last_error = f"HTTP {resp.status}: {body[:200]}"
+                    if resp.status not in RETRYABLE_STATUSES:
+                        break
+                    retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                    if retry_after is not None:
+                        delay = min(retry_after, self.max_retry_after)
+                    if resp.status == 429:
+                        self._stats['rate_limited'] += 1
+                        get_llm_governor().pause(delay if delay is not None else self._backoff(attempt))
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                last_error = f"{type(e).__name__}: {e}"
+
+            if attempt < attempts - 1:
+                delay = self._backoff(attempt) if delay is None else delay
+                logger.debug(f"[LLMClient] {host} attempt {attempt + 1} failed ({last_error}); retry in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+        self._stats['failed'] += 1
+        raise LLMRequestError(last_error or "request failed", status=last_status)
+
+    async def chat_completion(
+        self,
+        url: str,
+        api_key: str,
+        payload: Dict[str, Any],
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        lane: Optional[str] = None,
+        call_site: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        POST an OpenAI-compatible chat completion request once the governor
+        admits it. ``lane`` overrides the lane set with ``llm_context``.
+
+        Every call is written to the LLM usage ledger. ``call_site`` names
+        the caller unless an enclosing ``llm_context(call_site=...)`` already
+        has (e.g. question answering going through ``generate_text``).
+        """
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
+        governor = get_llm_governor()
+        estimate = estimate_tokens(payload)
+        ticket = await governor.acquire(estimate, lane=lane)
+        usage = None
+        status = None
+        ok = False
+        start = time.perf_counter()
+        try:
+            data = await self._send(url, payload, headers, timeout, max_retries)
+            usage = data.get("usage") if isinstance(data, dict) else None
+            ok = True
+            return data
+        except LLMRequestError as e:
+            status = e.status
+            raise
+        finally:
+            governor.release(ticket, usage)
+            await self._record_usage(
+                payload, ticket.lane, call_site, usage, estimate,
+                (time.perf_counter() - start) * 1000, ok, status,
+            )
+
+    async def _send(self, url, payload, headers, timeout, max_retries) -> Dict[str, Any]:
+        """Send upstream, or through the record/replay backend when ``LLM_BACKEND`` selects one."""
+        backend = get_llm_replay_backend()
+        if backend is None:
+            return await self.post_json(url, payload, headers=headers, timeout=timeout, max_retries=max_retries)
+        try:
+            return await backend.complete(
+                payload,
+                lambda: self.post_json(url, payload, headers=headers, timeout=timeout, max_retries=max_retries),
+            )
+        except ReplayMissError as e:
+            raise LLMRequestError(str(e)) from e
+
+    async def _record_usage(self, payload, lane, call_site, usage, estimate, latency_ms, ok, status):
+        """Write the call to the usage ledger off the event loop (never fails the request)."""
+        try:
+            tags = current_tags()
+            backend = get_llm_replay_backend()
+            row = dict(
+                call_site=tags["call_site"] or call_site or "other",
+                model=payload.get("model"),
+                latency_ms=latency_ms,
+                usage=usage,
+                estimated_tokens=estimate,
+                ok=ok,
+                status=status,
+                lane=lane,
+                user_id=tags["user_id"],
+                campaign_id=tags["campaign_id"],
+                application_id=tags["application_id"],
+                backend=backend.mode if backend else "live",
+            )
+            await asyncio.to_thread(lambda: get_llm_usage_ledger().record(**row))
+        except Exception as e:
+            logger.debug(f"[LLMClient] Usage ledger write failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Request counters and latency percentiles (successful requests only)."""
+        latencies = list(self._latencies)
+        return {
+            **self._stats,
+            'per_host': dict(self._per_host),
+            'latency_ms': {
+                'p50': round(percentile(latencies, 50), 2),
+                'p95': round(percentile(latencies, 95), 2),
+                'avg': round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+                'samples': len(latencies),
+            },
+            'pool': {'limit': self.limit, 'limit_per_host': self.limit_per_host},
+        }
+
+    async def close(self):
+        """Close the pooled session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+
+# Singleton
+_llm_client: Optional[LLMClient] = None
+
+
+def get_llm_client() -> LLMClient:
+    """Get singleton LLMClient instance."""
+    global _llm_client
+    if _llm_client is None:
+        _llm_client = LLMClient()
+    return _llm_client
+
+
+async def close_llm_client():
+    """Close the shared client (called from the app lifespan on shutdown)."""
+    global _llm_client
+    if _llm_client is not None:
+        await _llm_client.close()
+        _llm_client = None
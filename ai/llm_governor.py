@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+LLM Concurrency Governor
+
+Central admission control for every LLM request that goes through the
+shared ``LLMClient``. Requests wait for a slot under four limits:
+
+- concurrent requests (``LLM_MAX_CONCURRENCY``)
+- requests per minute (``LLM_REQUESTS_PER_MINUTE``)
+- tokens per minute (``LLM_TOKENS_PER_MINUTE``), estimated from the prompt
+  and ``max_tokens`` then corrected from the response's ``usage``
+- tokens per minute per user (``LLM_USER_TOKENS_PER_MINUTE``)
+
+Waiting requests are served by lane: ``interactive`` (answering questions in
+a live browser session) before ``campaign`` (tailoring, cover letters) before
+``suggestions``. Background lanes may only use ``LLM_BACKGROUND_SHARE`` of
+each budget, which keeps headroom for interactive calls during bursts. A 429
+from upstream pauses admission for its Retry-After.
+
+Callers tag work with ``llm_context``; untagged requests run in the
+``campaign`` lane.
+
+Example:
+    from ai.llm_governor import llm_context, LANE_INTERACTIVE
+
+    with llm_context(lane=LANE_INTERACTIVE, user_id=user_id):
+        answer = await form_intelligence.answer_question(...)
+"""
+
+import time
+import heapq
+import asyncio
+import logging
+import itertools
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from api.config import config
+
+logger = logging.getLogger(__name__)
+
+
+LANE_INTERACTIVE = "interactive"
+LANE_CAMPAIGN = "campaign"
+LANE_SUGGESTIONS = "suggestions"
+
+LANES = (LANE_INTERACTIVE, LANE_CAMPAIGN, LANE_SUGGESTIONS)
+_LANE_RANK = {lane: rank for rank, lane in enumerate(LANES)}
+
+WINDOW_SECONDS = 60.0
+
+_lane_var: ContextVar[Optional[str]] = ContextVar("llm_lane", default=None)
+_user_var: ContextVar[Optional[str]] = ContextVar("llm_user", default=None)
+# Accounting tags (see monitoring.llm_usage); they don't affect admission.
+_call_site_var: ContextVar[Optional[str]] = ContextVar("llm_call_site", default=None)
+_campaign_var: ContextVar[Optional[str]] = ContextVar("llm_campaign", default=None)
+_application_var: ContextVar[Optional[str]] = ContextVar("llm_application", default=None)
+
+
+@contextmanager
+def llm_context(
+    lane: Optional[str] = None,
+    user_id: Optional[str] = None,
+    call_site: Optional[str] = None,
+    campaign_id: Optional[str] = None,
+    application_id: Optional[str] = None,
+):
+    """
+    Tag LLM requests made inside the block with a lane and/or user, plus the
+    call site, campaign and application they are accounted to.
+    """
+    tokens = []
+    if lane is not None:
+        if lane not in _LANE_RANK:
+            raise ValueError(f"Unknown LLM lane: {lane}")
+        tokens.append((_lane_var, _lane_var.set(lane)))
+    for var, value in (
+        (_user_var, user_id),
+        (_call_site_var, call_site),
+        (_campaign_var, campaign_id),
+        (_application_var, application_id),
+    ):
+        if value is not None:
+            tokens.append((var, var.set(str(value))))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+def current_lane() -> str:
+    return _lane_var.get() or LANE_CAMPAIGN
+
+
+def caller_lane(default: str) -> str:
+    """The lane an enclosing ``llm_context`` set, else ``default``."""
+    return _lane_var.get() or default
+
+
+def current_user() -> Optional[str]:
+    return _user_var.get()
+
+
+def current_tags() -> Dict[str, Optional[str]]:
+    """Accounting tags of the current context."""
+    return {
+        "call_site": _call_site_var.get(),
+        "user_id": _user_var.get(),
+        "campaign_id": _campaign_var.get(),
+        "application_id": _application_var.get(),
+    }
+
+
+def estimate_tokens(payload: Dict[str, Any]) -> int:
+    """Rough token cost of a chat request: ~4 characters per prompt token plus the completion cap."""
+    chars = 0
+    for message in payload.get("messages") or []:
+        content = message.get("content")
+        if isinstance(content, str):
+            chars += len(content)
+        elif isinstance(content, list):
+            for part in content:
+                if isinstance(part, dict) and part.get("type") == "text":
+                    chars += len(part.get("text") or "")
+                else:
+                    chars += 1000  # images: flat allowance
+    return chars // 4 + int(payload.get("max_tokens") or 1024)
+
+
+@dataclass
+class Ticket:
+    """An admitted request; pass back to ``release``."""
+    lane: str
+    user_id: Optional[str]
+    tokens: int
+    admitted_at: float
+    entries: list = field(default_factory=list, repr=False)  # window entries to correct on release
+
+
+class _Window:
+    """Sliding one-minute window of (timestamp, amount) entries."""
+
+    def __init__(self):
+        self.entries: Deque[list] = deque()
+        self.total = 0
+
+    def _trim(self, now: float):
+        while self.entries and now - self.entries[0][0] >= WINDOW_SECONDS:
+            self.total -= self.entries.popleft()[1]
+
+    def used(self, now: float) -> int:
+        self._trim(now)
+        return self.total
+
+    def add(self, now: float, amount: int) -> list:
+        entry = [now, amount]
+        self.entries.append(entry)
+        self.total += amount
+        return entry
+
+    def adjust(self, entry: list, amount: int):
+        """Correct an entry still in the window (e.g. estimate -> actual usage)."""
+        if any(e is entry for e in self.entries):
+            self.total += amount - entry[1]
+            entry[1] = amount
+
+    def free_at(self, now: float, needed: int, limit: int) -> float:
+        """Seconds until ``needed`` more fits under ``limit``."""
+        excess = self.used(now) + needed - limit
+        for ts, amount in self.entries:
+            excess -= amount
+            if excess <= 0:
+                return max(0.0, ts + WINDOW_SECONDS - now)
+        return WINDOW_SECONDS
+
+
+class LLMGovernor:
+    """Priority-lane admission control under concurrency, RPM, TPM and per-user budgets."""
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        user_tokens_per_minute: Optional[int] = None,
+        background_share: Optional[float] = None,
+    ):
+        pick = lambda value, default: default if value is None else value
+        self.max_concurrency = pick(max_concurrency, config.LLM_MAX_CONCURRENCY)
+        self.requests_per_minute = pick(requests_per_minute, config.LLM_REQUESTS_PER_MINUTE)
+        self.tokens_per_minute = pick(tokens_per_minute, config.LLM_TOKENS_PER_MINUTE)
+        self.user_tokens_per_minute = pick(user_tokens_per_minute, config.LLM_USER_TOKENS_PER_MINUTE)
+        self.background_share = pick(background_share, config.LLM_BACKGROUND_SHARE)
+
+        self._in_flight = 0
+        self._requests = _Window()
+        self._tokens = _Window()
+        self._user_tokens: Dict[str, _Window] = {}
+        self._paused_until = 0.0
+        self._waiters: List[Tuple[int, int, asyncio.Future, str, Optional[str], int]] = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        self._lane_stats = {
+            lane: {'admitted': 0, 'queued': 0, 'wait_ms_total': 0.0, 'max_wait_ms': 0.0}
+            for lane in LANES
+        }
+        self._stats = {'rate_limit_pauses': 0, 'tokens_estimated': 0, 'tokens_actual': 0}
+
+    # --- admission -------------------------------------------------------
+
+    def _limit(self, limit: int, lane: str) -> float:
+        if lane == LANE_INTERACTIVE:
+            return limit
+        return max(1, limit * self.background_share)
+
+    def _blocked_for(self, lane: str, user_id: Optional[str], tokens: int, now: float) -> Optional[float]:
+        """None if the request fits now, else seconds until it might (0 = wait for a release)."""
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self.max_concurrency and self._in_flight >= self._limit(self.max_concurrency, lane):
+            return 0.0
+        if self.requests_per_minute:
+            limit = self._limit(self.requests_per_minute, lane)
+            if self._requests.used(now) + 1 > limit:
+                return self._requests.free_at(now, 1, limit)
+        if self.tokens_per_minute:
+            limit = self._limit(self.tokens_per_minute, lane)
+            # A single request larger than the budget is admitted into an empty window.
+            if self._tokens.used(now) and self._tokens.used(now) + tokens > limit:
+                return self._tokens.free_at(now, tokens, limit)
+        if self.user_tokens_per_minute and user_id:
+            window = self._user_tokens.get(user_id)
+            if window and window.used(now) and window.used(now) + tokens > self.user_tokens_per_minute:
+                return window.free_at(now, tokens, self.user_tokens_per_minute)
+        return None
+
+    def _admit(self, lane: str, user_id: Optional[str], tokens: int, now: float) -> Ticket:
+        self._in_flight += 1
+        self._requests.add(now, 1)
+        ticket = Ticket(lane=lane, user_id=user_id, tokens=tokens, admitted_at=now)
+        ticket.entries.append(self._tokens.add(now, tokens))
+        if user_id:
+            window = self._user_tokens.setdefault(user_id, _Window())
+            ticket.entries.append(window.add(now, tokens))
+        self._lane_stats[lane]['admitted'] += 1
+        self._stats['tokens_estimated'] += tokens
+        return ticket
+
+    async def acquire(self, tokens: int, lane: Optional[str] = None, user_id: Optional[str] = None) -> Ticket:
+        """Wait for a slot in ``lane`` (default: the current ``llm_context``)."""
+        lane = lane or current_lane()
+        user_id = user_id if user_id is not None else current_user()
+        now = time.monotonic()
+
+        # Fast path: nothing of equal or higher priority is waiting and it fits.
+        if not any(w[0] <= _LANE_RANK[lane] and not w[2].done() for w in self._waiters):
+            if self._blocked_for(lane, user_id, tokens, now) is None:
+                return self._admit(lane, user_id, tokens, now)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        heapq.heappush(self._waiters, (_LANE_RANK[lane], next(self._seq), future, lane, user_id, tokens))
+        self._lane_stats[lane]['queued'] += 1
+        self._dispatch()
+        try:
+            ticket = await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(future.result())
+            raise
+
+        waited = (time.monotonic() - now) * 1000
+        stats = self._lane_stats[lane]
+        stats['wait_ms_total'] += waited
+        stats['max_wait_ms'] = max(stats['max_wait_ms'], waited)
+        return ticket
+
+    def _dispatch(self):
+        """Admit waiters in priority order; a waiter blocked by a shared budget holds back lower lanes."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        loop = asyncio.get_running_loop()
+
+        now = time.monotonic()
+        next_check: Optional[float] = None
+        held: List[tuple] = []
+        while self._waiters:
+            waiter = heapq.heappop(self._waiters)
+            rank, _, future, lane, user_id, tokens = waiter
+            if future.done() or future.get_loop() is not loop:
+                continue  # cancelled, or left behind by a closed event loop
+            blocked = self._blocked_for(lane, user_id, tokens, now)
+            if blocked is None:
+                future.set_result(self._admit(lane, user_id, tokens, now))
+                continue
+            held.append(waiter)
+            if blocked > 0:
+                next_check = blocked if next_check is None else min(next_check, blocked)
+            user_limited = (
+                self.user_tokens_per_minute and user_id
+                and self._blocked_for(lane, None, tokens, now) is None
+            )
+            if not user_limited:
+                break  # shared budget exhausted: don't let lower lanes overtake
+        for waiter in held:
+            heapq.heappush(self._waiters, waiter)
+
+        if next_check is not None and self._waiters:
+            self._timer = loop.call_later(next_check + 0.001, self._dispatch)
+
+    def release(self, ticket: Ticket, usage: Optional[Dict[str, Any]] = None):
+        """Return a slot; ``usage`` (the response's usage block) corrects the token estimate."""
+        self._in_flight = max(0, self._in_flight - 1)
+        actual = (usage or {}).get("total_tokens")
+        if isinstance(actual, int) and actual >= 0:
+            self._stats['tokens_actual'] += actual
+            self._tokens.adjust(ticket.entries[0], actual)
+            if ticket.user_id and len(ticket.entries) > 1:
+                self._user_tokens[ticket.user_id].adjust(ticket.entries[1], actual)
+        try:
+            self._dispatch()
+        except RuntimeError:
+            pass  # no running loop (shutdown)
+
+    def pause(self, seconds: float):
+        """Hold all admissions after an upstream 429."""
+        until = time.monotonic() + seconds
+        if until > self._paused_until:
+            self._paused_until = until
+            self._stats['rate_limit_pauses'] += 1
+            logger.info(f"[LLMGovernor] Upstream rate limit; pausing admissions for {seconds:.1f}s")
+
+    # --- reporting -------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        queued = {lane: 0 for lane in LANES}
+        for _, _, future, lane, _, _ in self._waiters:
+            if not future.done():
+                queued[lane] += 1
+        return {
+            **self._stats,
+            'in_flight': self._in_flight,
+            'requests_last_minute': self._requests.used(now),
+            'tokens_last_minute': self._tokens.used(now),
+            'limits': {
+                'max_concurrency': self.max_concurrency,
+                'requests_per_minute': self.requests_per_minute,
+                'tokens_per_minute': self.tokens_per_minute,
+                'user_tokens_per_minute': self.user_tokens_per_minute,
+                'background_share': self.background_share,
+            },
+            'lanes': {
+                lane: {
+                    'admitted': s['admitted'],
+                    'waiting': queued[lane],
+                    'avg_wait_ms': round(s['wait_ms_total'] / s['queued'], 2) if s['queued'] else 0.0,
+                    'max_wait_ms': round(s['max_wait_ms'], 2),
+                }
+                for lane, s in self._lane_stats.items()
+            },
+            'users_last_minute': {
+                user: window.used(now) for user, window in self._user_tokens.items() if window.used(now)
+            },
+        }
+
+
+# Singleton
+_llm_governor: Optional[LLMGovernor] = None
+
+
+def get_llm_governor() -> LLMGovernor:
+    """Get singleton LLMGovernor instance."""
+    global _llm_governor
+    if _llm_governor is None:
+        _llm_governor = LLMGovernor()
+    return _llm_governor
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+LLM Record/Replay Backend
+
+An offline stand-in for Moonshot/OpenAI so the apply pipeline, campaign
+runners and the queue worker can be benchmarked deterministically without
+network access. Selected with ``LLM_BACKEND``:
+
+- ``live``   (default) every call goes upstream
+- ``record`` calls go upstream and each request/response pair is appended
+             to the cassette at ``LLM_REPLAY_PATH`` (JSONL)
+- ``replay`` calls are served from the cassette after a synthetic delay;
+             nothing leaves the machine
+
+Pairs are keyed by the normalized prompt (model plus messages with
+whitespace collapsed, see ``ai.cache.single_flight.request_key``). A key
+recorded several times replays its responses in rotation.
+
+``LLM_REPLAY_LATENCY`` sets the delay distribution in milliseconds:
+``none``, ``fixed:MS``, ``uniform:LO,HI``, ``normal:MEAN,STD``,
+``lognormal:MEDIAN,SIGMA`` or ``recorded[:SCALE]`` (the latency measured
+while recording). ``LLM_REPLAY_SEED`` makes the delays reproducible.
+On a cache miss, ``LLM_REPLAY_MISS=error`` fails the call and ``synthetic``
+answers with a stub (``{}`` when the prompt asks for JSON).
+
+The backend sits inside ``LLMClient.chat_completion``, so replayed calls
+still pass the governor and land in the usage ledger. Callers that check
+for an API key still need one set (any value works in replay mode).
+
+Example:
+    LLM_BACKEND=record LLM_REPLAY_PATH=./data/apply.jsonl python scripts/...
+    LLM_BACKEND=replay LLM_REPLAY_LATENCY=lognormal:900,0.4 MOONSHOT_API_KEY=x pytest -m performance
+"""
+
+import copy
+import json
+import math
+import time
+import random
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from api.config import config
+from ai.cache.single_flight import request_key
+
+logger = logging.getLogger(__name__)
+
+
+BACKEND_MODES = ("live", "record", "replay")
+MISS_POLICIES = ("error", "synthetic")
+
+
+class ReplayMissError(LookupError):
+    """A replayed request that was never recorded."""
+
+
+class LatencyModel:
+    """Synthetic delay distribution parsed from ``LLM_REPLAY_LATENCY``."""
+
+    KINDS = ("none", "fixed", "uniform", "normal", "lognormal", "recorded")
+
+    def __init__(self, spec: str = "recorded", seed: Optional[int] = None):
+        kind, _, args = (spec or "none").strip().lower().partition(":")
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution '{kind}' (expected one of {', '.join(self.KINDS)})")
+        try:
+            params = [float(p) for p in args.split(",") if p.strip()]
+        except ValueError:
+            raise ValueError(f"Invalid latency parameters in '{spec}'")
+        required = {"none": 0, "fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "recorded": 0}[kind]
+        if len(params) < required:
+            raise ValueError(f"Latency '{kind}' needs {required} parameter(s), got '{spec}'")
+        self.kind = kind
+        self.params = params
+        self.spec = spec
+        self._rng = random.Random(seed)
+
+    def sample_ms(self, recorded_ms: Optional[float] = None) -> float:
+        p = self.params
+        if self.kind == "fixed":
+            value = p[0]
+        elif self.kind == "uniform":
+            value = self._rng.uniform(p[0], p[1])
+        elif self.kind == "normal":
+            value = self._rng.gauss(p[0], p[1])
+        elif self.kind == "lognormal":
+            value = self._rng.lognormvariate(math.log(max(p[0], 1e-6)), p[1])
+        elif self.kind == "recorded":
+            value = (recorded_ms or 0.0) * (p[0] if p else 1.0)
+        else:
+            value = 0.0
+        return max(0.0, value)
+
+
+def _prompt_text(payload: Dict[str, Any]) -> str:
+    parts = []
+    for message in payload.get("messages") or []:
+        content = message.get("content")
+        if isinstance(content, list):
+            content = " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+        parts.append(str(content or ""))
+    return "\n".join(parts)
+
+
+def synthetic_response(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """A well-formed stub completion for prompts missing from the cassette."""
+    prompt = _prompt_text(payload)
+    content = "{}" if "json" in prompt.lower() else "Synthetic replay response."
+    prompt_tokens = max(1, len(prompt) // 4)
+    completion_tokens = max(1, len(content) // 4)
+    return {
+        "id": "replay-synthetic",
+        "object": "chat.completion",
+        "model": payload.get("model"),
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+class LLMReplayBackend:
+    """Records chat completions to a JSONL cassette, or serves them back."""
+
+    def __init__(
+        self,
+        mode: str = "replay",
+        path: Optional[str] = None,
+        latency: Optional[LatencyModel] = None,
+        on_miss: str = "error",
+    ):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"LLMReplayBackend mode must be 'record' or 'replay', got '{mode}'")
+        if on_miss not in MISS_POLICIES:
+            raise ValueError(f"on_miss must be one of {', '.join(MISS_POLICIES)}")
+        self.mode = mode
+        self.path = Path(path or config.LLM_REPLAY_PATH)
+        self.latency = latency or LatencyModel("none")
+        self.on_miss = on_miss
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._cursor: Dict[str, int] = {}
+        self._stats = {"hits": 0, "misses": 0, "synthetic": 0, "recorded": 0}
+        self._load()
+
+    @staticmethod
+    def key(payload: Dict[str, Any]) -> str:
+        return request_key(payload.get("model") or "", payload.get("messages") or [])
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        loaded = 0
+        with open(self.path, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    self._entries.setdefault(entry["key"], []).append(entry)
+                    loaded += 1
+                except (ValueError, KeyError) as e:
+                    logger.warning(f"[LLMReplay] Skipping bad cassette line {line_no}: {e}")
+        logger.info(f"[LLMReplay] Loaded {loaded} recorded calls ({len(self._entries)} prompts) from {self.path}")
+
+    async def complete(
+        self, payload: Dict[str, Any], send: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Serve ``payload`` from the cassette (replay) or via ``send`` (record)."""
+        if self.mode == "record":
+            return await self._record(payload, send)
+        return await self._replay(payload)
+
+    async def _record(self, payload, send) -> Dict[str, Any]:
+        start = time.perf_counter()
+        data = await send()
+        entry = {
+            "key": self.key(payload),
+            "model": payload.get("model"),
+            "prompt": _prompt_text(payload)[:200],
+            "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+            "response": data,
+            "recorded_at": time.time(),
+        }
+        self._entries.setdefault(entry["key"], []).append(entry)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._stats["recorded"] += 1
+        return data
+
+    async def _replay(self, payload) -> Dict[str, Any]:
+        key = self.key(payload)
+        entries = self._entries.get(key)
+        if entries:
+            index = self._cursor.get(key, 0)
+            self._cursor[key] = index + 1
+            entry = entries[index % len(entries)]
+            self._stats["hits"] += 1
+            await self._sleep(entry.get("latency_ms"))
+            return copy.deepcopy(entry["response"])
+
+        self._stats["misses"] += 1
+        if self.on_miss == "synthetic":
+            self._stats["synthetic"] += 1
+            await self._sleep(None)
+            return synthetic_response(payload)
+        raise ReplayMissError(f"No recorded response for prompt {key[:12]} ({_prompt_text(payload)[:80]!r})")
+
+    async def _sleep(self, recorded_ms: Optional[float]):
+        delay_ms = self.latency.sample_ms(recorded_ms)
+        if delay_ms:
+            await asyncio.sleep(delay_ms / 1000)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "mode": self.mode,
+            "path": str(self.path),
+            "prompts": len(self._entries),
+            "latency": self.latency.spec,
+            "on_miss": self.on_miss,
+        }
+
+
+# Singleton
+_llm_replay_backend: Optional[LLMReplayBackend] = None
+
+
+def get_llm_replay_backend() -> Optional[LLMReplayBackend]:
+    """The configured record/replay backend, or None for live calls."""
+    global _llm_replay_backend
+    mode = (config.LLM_BACKEND or "live").lower()
+    if mode == "live":
+        return None
+    if mode not in BACKEND_MODES:
+        raise ValueError(f"LLM_BACKEND must be one of {', '.join(BACKEND_MODES)}, got '{mode}'")
+    if _llm_replay_backend is None:
+        _llm_replay_backend = LLMReplayBackend(
+            mode=mode,
+            path=config.LLM_REPLAY_PATH,
+            latency=LatencyModel(config.LLM_REPLAY_LATENCY, seed=config.LLM_REPLAY_SEED),
+            on_miss=config.LLM_REPLAY_MISS,
+        )
+    return _llm_replay_backend
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Deterministic Screening-Question Classifier
+
+Most screening questions are one of a handful of kinds (work authorization,
+sponsorship, relocation, years of experience, EEO, salary, start date). This
+tier recognizes those with patterns and answers them straight from the
+profile and its ``custom_answers``, without a model call. A question is only
+resolved when the answer is unambiguous: the data is present and, for
+select/radio questions, maps onto exactly one offered option. Everything else
+falls through to the LLM.
+
+Example:
+    from ai.question_classifier import get_question_classifier
+
+    resolved = get_question_classifier().resolve(question, "radio", ["Yes", "No"], profile)
+    if resolved:
+        answer = resolved.answer
+"""
+
+import re
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Resolution:
+    """A rule-derived answer."""
+    category: str
+    answer: str
+    source: str  # 'custom_answers', 'profile' or 'policy'
+
+
+def _yes_no(value: Any) -> Optional[str]:
+    """'Yes'/'No' for booleans and yes/no-leading strings, else None."""
+    if isinstance(value, bool):
+        return "Yes" if value else "No"
+    text = str(value or "").strip().lower()
+    if re.match(r"^(yes|y|true)\b", text):
+        return "Yes"
+    if re.match(r"^(no|n|false)\b", text):
+        return "No"
+    return None
+
+
+def _invert(value: Optional[str]) -> Optional[str]:
+    return {"Yes": "No", "No": "Yes"}.get(value or "")
+
+
+def _is_placeholder(option: str) -> bool:
+    text = option.strip().lower()
+    return not text or any(tok in text for tok in ("select", "choose", "--"))
+
+
+def choose_option(answer: str, options: Sequence[str]) -> Optional[str]:
+    """
+    Map an answer onto exactly one offered option.
+
+    Tries an exact (case-insensitive) match, then yes/no polarity. Returns
+    None when nothing or more than one option fits.
+    """
+    candidates = [o for o in options if not _is_placeholder(o)]
+    wanted = answer.strip().lower()
+    for option in candidates:
+        if option.strip().lower() == wanted:
+            return option
+
+    polarity = _yes_no(answer)
+    if polarity:
+        matches = [o for o in candidates if _yes_no(o) == polarity]
+        if len(matches) == 1:
+            return matches[0]
+    return None
+
+
+def _decline_option(options: Sequence[str]) -> Optional[str]:
+    for option in options:
+        text = option.lower()
+        if any(tok in text for tok in ("prefer not", "decline", "do not wish", "don't wish", "choose not")):
+            return option
+    return None
+
+
+def _years_option(years: float, options: Sequence[str]) -> Optional[str]:
+    """Pick the range option ('0-2', '3-5 years', '10+') containing ``years``."""
+    for option in options:
+        text = option.lower().replace("–", "-")
+        nums = [float(n) for n in re.findall(r"\d+(?:\.\d+)?", text)]
+        if not nums:
+            continue
+        if len(nums) >= 2 and nums[0] <= years <= nums[1]:
+            return option
+        if len(nums) == 1:
+            if ("+" in text or "more" in text or "over" in text) and years >= nums[0]:
+                return option
+            if ("less" in text or "under" in text or "<" in text) and years < nums[0]:
+                return option
+            if years == nums[0]:
+                return option
+    return None
+
+
+# (category, question pattern, custom_answers keys, profile field)
+_CATEGORY_PATTERNS: List[Tuple[str, re.Pattern, Tuple[str, ...], Optional[str]]] = [
+    ("sponsorship", re.compile(r"sponsor|visa status|h-?1b"),
+     ("sponsorship", "sponsorship_required", "require_sponsorship"), "sponsorship_required"),
+    ("work_authorization", re.compile(r"(legally )?(authori[sz]ed|eligible|permitted) to work|work authori[sz]ation|right to work"),
+     ("authorized_to_work", "work_authorization", "authorization"), "work_authorization"),
+    ("eeo", re.compile(r"\b(gender|race|ethnicity|hispanic|latino|veteran|disability|disabled|sexual orientation|pronouns)\b"),
+     ("eeo",), None),
+    ("relocation", re.compile(r"relocat"),
+     ("willing_to_relocate", "relocation", "relocate"), "willing_to_relocate"),
+    ("years_experience", re.compile(r"^(how many )?(total )?years of (professional |relevant |total |work )?experience( do you have)?$"),
+     ("years_experience",), "years_experience"),
+    ("salary", re.compile(r"salary|compensation|pay (expectation|requirement)|desired pay"),
+     ("salary_expectations", "salary", "desired_salary"), "salary_expectation"),
+    ("start_date", re.compile(r"start date|when can you start|earliest.*start|notice period|available to start"),
+     ("start_date", "notice_period", "availability"), "start_date"),
+]
+
+
+class QuestionClassifier:
+    """Pattern-based classification and profile-derived answers."""
+
+    def __init__(self):
+        self.stats: Dict[str, int] = {'seen': 0, 'resolved': 0}
+        self.by_category: Dict[str, int] = {}
+        self._resolvers: Dict[str, Callable[[str, str, Sequence[str], Dict], Optional[Tuple[str, str]]]] = {
+            "sponsorship": self._resolve_yes_no,
+            "work_authorization": self._resolve_yes_no,
+            "relocation": self._resolve_yes_no,
+            "eeo": self._resolve_eeo,
+            "years_experience": self._resolve_years,
+            "salary": self._resolve_text,
+            "start_date": self._resolve_text,
+        }
+
+    @staticmethod
+    def _normalize(question: str) -> str:
+        text = re.sub(r"\s+", " ", (question or "").strip().lower())
+        return text.rstrip(" *:?").strip()
+
+    def classify(self, question: str) -> Optional[str]:
+        """Category of a question, or None if it isn't exactly one known kind."""
+        text = self._normalize(question)
+        matches = [category for category, pattern, _, _ in _CATEGORY_PATTERNS if pattern.search(text)]
+        # Compound questions ("authorized ... and will you need sponsorship?") go to the LLM.
+        return matches[0] if len(matches) == 1 else None
+
+    def resolve(
+        self,
+        question: str,
+        question_type: str,
+        options: Optional[Sequence[str]],
+        profile: Optional[Dict],
+    ) -> Optional[Resolution]:
+        """Answer a question from the profile when it's a known kind and the data is there."""
+        self.stats['seen'] += 1
+        category = self.classify(question)
+        if category is None:
+            return None
+
+        _, _, custom_keys, field = next(c for c in _CATEGORY_PATTERNS if c[0] == category)
+        profile = profile or {}
+        custom = profile.get("custom_answers") or {}
+        value, source = None, None
+        for key in custom_keys:
+            if custom.get(key) not in (None, ""):
+                value, source = custom[key], "custom_answers"
+                break
+        if value is None and field and profile.get(field) not in (None, ""):
+            value, source = profile[field], "profile"
+
+        resolved = self._resolvers[category](category, question_type, options or [], {
+            "value": value, "source": source, "question": self._normalize(question),
+        })
+        if resolved is None:
+            return None
+
+        answer, source = resolved
+        self.stats['resolved'] += 1
+        self.by_category[category] = self.by_category.get(category, 0) + 1
+        logger.debug(f"[QuestionClassifier] {category} answered from {source}: '{question[:60]}'")
+        return Resolution(category=category, answer=answer, source=source)
+
+    def _resolve_yes_no(self, category, question_type, options, data):
+        value = _yes_no(data["value"])
+        if value is None:
+            return None
+        negated = category == "sponsorship" and re.search(r"\bwithout\b|\bnot (need|require)", data["question"])
+        if negated:
+            value = _invert(value)
+        if question_type in ("select", "radio") and options:
+            option = choose_option(value, options)
+            return (option, data["source"]) if option else None
+        if question_type in ("select", "radio", "checkbox"):
+            return None
+        keep_wording = data["source"] == "custom_answers" and not negated
+        return (str(data["value"]) if keep_wording else value, data["source"])
+
+    def _resolve_eeo(self, category, question_type, options, data):
+        if data["value"] is not None:
+            return None  # a stated EEO preference needs per-question handling
+        if options:
+            option = _decline_option(options)
+            return (option, "policy") if option else None
+        return ("Prefer not to answer", "policy") if question_type == "text" else None
+
+    def _resolve_years(self, category, question_type, options, data):
+        try:
+            years = float(data["value"])
+        except (TypeError, ValueError):
+            return None
+        if options:
+            option = _years_option(years, [o for o in options if not _is_placeholder(o)])
+            return (option, data["source"]) if option else None
+        return (str(int(years)) if years.is_integer() else str(years), data["source"])
+
+    def _resolve_text(self, category, question_type, options, data):
+        if data["value"] is None:
+            return None
+        if options:
+            option = choose_option(str(data["value"]), options)
+            return (option, data["source"]) if option else None
+        return (str(data["value"]), data["source"])
+
+    def get_stats(self) -> Dict[str, Any]:
+        seen = self.stats['seen']
+        return {
+            **self.stats,
+            'resolve_rate': f"{(self.stats['resolved'] / seen * 100) if seen else 0:.1f}%",
+            'by_category': dict(self.by_category),
+        }
+
+
+# Singleton
+_question_classifier: Optional[QuestionClassifier] = None
+
+
+def get_question_classifier() -> QuestionClassifier:
+    """Get singleton QuestionClassifier instance."""
+    global _question_classifier
+    if _question_classifier is None:
+        _question_classifier = QuestionClassifier()
+    return _question_classifier
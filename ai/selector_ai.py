@@ -4,8 +4,14 @@ AI-Powered Form Selector Detection
 Uses Moonshot AI to analyze job application forms and suggest field selectors.
 This is especially useful for Workday and other complex ATS systems where
 selectors vary between companies.
+
+Suggestions are cached per form structure (ai.cache.form_structure_cache), so
+companies on the same ATS template skip the LLM call, and only the form's
+relevant nodes (ai.form_skeleton) are sent on a miss. When some cached
+selectors no longer match, only those fields are asked for again.
 """
 
+import asyncio
 import json
 import logging
 from typing import Dict, List, Optional
@@ -13,6 +19,8 @@ from dataclasses import dataclass
 
 import os
 
+from ai.form_skeleton import FormSkeleton
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,6 +46,7 @@ class SelectorAI:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv("MOONSHOT_API_KEY")
         self.model = "moonshot-v1-8k"
+        self._cache = None
         
     async def analyze_form(self, page_html: str, page_url: str) -> Dict[str, SelectorSuggestion]:
         """
@@ -50,9 +59,21 @@ class SelectorAI:
         Returns:
             Dictionary mapping field names to selector suggestions
         """
-        # Truncate HTML if too long
+        # Forms built from the same ATS template share a structural fingerprint;
+        # reuse the selectors learned on any of them instead of asking again.
+        skeleton = FormSkeleton.parse(page_html)
+        cache = self._get_cache()
+        cached, stale = await asyncio.to_thread(cache.lookup, skeleton) if cache else (None, [])
+        if cached is not None and not stale:
+            logger.debug(f"Selector cache hit for {page_url}")
+            return self._to_suggestions(cached)
+        
+        # Send only the form-relevant nodes (raw HTML if none were found)
         max_html = 50000
-        if len(page_html) > max_html:
+        reduced = skeleton.reduced_html(max_chars=max_html)
+        if reduced and skeleton.has_controls:
+            page_html = reduced
+        elif len(page_html) > max_html:
             page_html = page_html[:max_html] + "..."
         
         prompt = f"""Analyze this job application form and suggest CSS selectors for each field.
@@ -64,15 +85,7 @@ HTML:
 {page_html}
 ```
 
-Identify selectors for these fields:
-1. First name input
-2. Last name input  
-3. Email input
-4. Phone input
-5. Resume upload file input
-6. Apply/Submit button
-7. Next/Continue button (for multi-step forms)
-8. Success confirmation message (after submission)
+{self._fields_request(stale)}
 
 For each field, provide:
 - Primary selector (most specific)
@@ -80,6 +93,8 @@ For each field, provide:
 - Confidence score (0-1)
 - Brief reasoning
 
+Prefer stable attributes (name, type, for, data-automation-id) over generated ids.
+
 Respond in JSON format:
 {{
     "first_name": {{
@@ -96,22 +111,60 @@ Respond in JSON format:
             # Call Moonshot API
             result = await self._call_api(prompt)
             
-            # Parse suggestions
-            suggestions = {}
-            for field_name, data in result.items():
-                suggestions[field_name] = SelectorSuggestion(
-                    field_name=field_name,
-                    selector=data.get("selector", ""),
-                    confidence=data.get("confidence", 0.5),
-                    alternatives=data.get("alternatives", []),
-                    reasoning=data.get("reasoning", "")
-                )
-            
-            return suggestions
+            result = {k: v for k, v in result.items() if isinstance(v, dict)}
+            if stale:
+                # Keep the cached fields that still match; take only the re-asked ones.
+                result = {**cached, **{k: v for k, v in result.items() if k in stale}}
+            if cache and result:
+                await asyncio.to_thread(cache.put, skeleton, result, page_url)
+            return self._to_suggestions(result)
             
         except Exception as e:
             logger.error(f"AI selector analysis failed: {e}")
-            return {}
+            return self._to_suggestions(cached) if cached else {}
+    
+    @staticmethod
+    def _fields_request(stale: List[str]) -> str:
+        """Field list for the prompt: everything on a miss, just the stale fields on a partial hit."""
+        if stale:
+            return (
+                "Identify selectors for only these fields (use these exact keys): "
+                + ", ".join(stale)
+            )
+        return """Identify selectors for these fields:
+1. First name input
+2. Last name input  
+3. Email input
+4. Phone input
+5. Resume upload file input
+6. Apply/Submit button
+7. Next/Continue button (for multi-step forms)
+8. Success confirmation message (after submission)"""
+    
+    @staticmethod
+    def _to_suggestions(result: Dict[str, dict]) -> Dict[str, SelectorSuggestion]:
+        """Parse suggestions from the model's (or the cache's) JSON."""
+        suggestions = {}
+        for field_name, data in result.items():
+            suggestions[field_name] = SelectorSuggestion(
+                field_name=field_name,
+                selector=data.get("selector", ""),
+                confidence=data.get("confidence", 0.5),
+                alternatives=data.get("alternatives", []),
+                reasoning=data.get("reasoning", "")
+            )
+        return suggestions
+    
+    def _get_cache(self):
+        """Lazy form structure cache; analysis still works without it."""
+        if self._cache is None:
+            try:
+                from ai.cache.form_structure_cache import get_form_structure_cache
+                self._cache = get_form_structure_cache()
+            except Exception as e:
+                logger.warning(f"Form structure cache unavailable: {e}")
+                self._cache = False
+        return self._cache or None
     
     async def suggest_field_mapping(
         self,
@@ -197,15 +250,11 @@ Extract the actual selectors used in this form. Return JSON:
     
     async def _call_api(self, prompt: str) -> dict:
         """Call Moonshot API."""
-        import aiohttp
+        from ai.llm_client import get_llm_client
+        from ai.llm_governor import LANE_INTERACTIVE
         
         url = "https://api.moonshot.cn/v1/chat/completions"
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
         payload = {
             "model": self.model,
             "messages": [
@@ -215,22 +264,18 @@ Extract the actual selectors used in this form. Return JSON:
             "temperature": 0.1
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload) as resp:
-                if resp.status != 200:
-                    text = await resp.text()
-                    raise Exception(f"API error {resp.status}: {text}")
-                
-                data = await resp.json()
-                content = data["choices"][0]["message"]["content"]
-                
-                # Extract JSON from markdown code block if present
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0]
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0]
-                
-                return json.loads(content.strip())
+        data = await get_llm_client().chat_completion(
+            url, self.api_key, payload, lane=LANE_INTERACTIVE, call_site="selector_ai"
+        )
+        content = data["choices"][0]["message"]["content"]
+        
+        # Extract JSON from markdown code block if present
+        if "```json" in content:
+            content = content.split("```json")[1].split("```")[0]
+        elif "```" in content:
+            content = content.split("```")[1].split("```")[0]
+        
+        return json.loads(content.strip())
 
 
 class SelectorLearningDB:
@@ -314,5 +359,4 @@ async def test_selector_ai():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(test_selector_ai())
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Vision Frames - compact screenshots for vision-model calls.
+
+Turns a Playwright page into the smallest image that still shows the form:
+1. Crop to the bounding box of the page's form controls (padded)
+2. Downsample to ``VISION_MAX_WIDTH`` pixels wide
+3. Encode as JPEG at ``VISION_JPEG_QUALITY``
+
+Each frame carries a perceptual hash (64-bit difference hash). Agents keep
+the last analyzed frame and skip the model call when the new frame is within
+``VISION_HASH_DISTANCE`` bits of it.
+
+Downsampling and perceptual hashing use Pillow when it is installed. Without
+it, frames are still cropped and JPEG-encoded by the browser, and the hash
+falls back to an exact digest (only byte-identical frames are skipped).
+
+Example:
+    from ai.vision_frames import capture_frame, frame_changed
+
+    frame = await capture_frame(page)
+    if frame_changed(last_frame, frame):
+        payload_url = frame.data_url()
+"""
+
+import io
+import os
+import base64
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+# Union of form-control boxes in page coordinates, or null when there is no form.
+_FORM_REGION_JS = """
+() => {
+    const els = document.querySelectorAll(
+        'form, input:not([type=hidden]), select, textarea, button, [role=button], [data-automation-id]'
+    );
+    let x1 = Infinity, y1 = Infinity, x2 = -Infinity, y2 = -Infinity;
+    for (const el of els) {
+        const r = el.getBoundingClientRect();
+        if (r.width < 2 || r.height < 2) continue;
+        x1 = Math.min(x1, r.left + window.scrollX);
+        y1 = Math.min(y1, r.top + window.scrollY);
+        x2 = Math.max(x2, r.right + window.scrollX);
+        y2 = Math.max(y2, r.bottom + window.scrollY);
+    }
+    if (x1 === Infinity) return null;
+    return {
+        x: x1, y: y1, width: x2 - x1, height: y2 - y1,
+        pageWidth: document.documentElement.scrollWidth,
+        pageHeight: document.documentElement.scrollHeight,
+    };
+}
+"""
+
+
+@dataclass
+class VisionFrameConfig:
+    max_width: int = int(os.getenv("VISION_MAX_WIDTH", "1024"))
+    max_height: int = int(os.getenv("VISION_MAX_HEIGHT", "4096"))
+    jpeg_quality: int = int(os.getenv("VISION_JPEG_QUALITY", "70"))
+    # Frames whose hashes differ by at most this many bits count as unchanged.
+    hash_distance: int = int(os.getenv("VISION_HASH_DISTANCE", "4"))
+    padding: int = 24
+
+
+@dataclass
+class VisionFrame:
+    """An encoded screenshot ready to send to a vision model."""
+    data: bytes
+    mime: str = "image/jpeg"
+    width: Optional[int] = None
+    height: Optional[int] = None
+    phash: Union[int, str, None] = None
+    raw_size: int = 0
+    cropped: bool = False
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    def data_url(self) -> str:
+        return f"data:{self.mime};base64,{base64.b64encode(self.data).decode('ascii')}"
+
+
+@dataclass
+class VisionStats:
+    """Vision-call counters for one application."""
+    calls: int = 0
+    skipped_unchanged: int = 0
+    bytes_sent: int = 0
+    payload_sizes: list = field(default_factory=list)
+
+    def record_call(self, frame: VisionFrame):
+        self.calls += 1
+        self.bytes_sent += frame.size
+        self.payload_sizes.append(frame.size)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "skipped_unchanged": self.skipped_unchanged,
+            "bytes_sent": self.bytes_sent,
+            "payload_sizes": list(self.payload_sizes),
+        }
+
+
+def difference_hash(image: "Image.Image", size: int = 8) -> int:
+    """64-bit difference hash: compares adjacent pixels of a 9x8 grayscale thumbnail."""
+    small = image.convert("L").resize((size + 1, size), Image.BILINEAR)
+    pixels = list(small.getdata())
+    bits = 0
+    for row in range(size):
+        for col in range(size):
+            left = pixels[row * (size + 1) + col]
+            right = pixels[row * (size + 1) + col + 1]
+            bits = (bits << 1) | (1 if left > right else 0)
+    return bits
+
+
+def frame_changed(
+    previous: Optional[VisionFrame], current: VisionFrame, max_distance: Optional[int] = None
+) -> bool:
+    """True unless ``current`` is perceptually the same as ``previous``."""
+    if previous is None or previous.phash is None or current.phash is None:
+        return True
+    if isinstance(previous.phash, int) and isinstance(current.phash, int):
+        limit = VisionFrameConfig().hash_distance if max_distance is None else max_distance
+        return bin(previous.phash ^ current.phash).count("1") > limit
+    return previous.phash != current.phash
+
+
+def encode_frame(raw: bytes, config: VisionFrameConfig, cropped: bool = False) -> VisionFrame:
+    """Downsample, JPEG-encode and hash a screenshot (pass-through without Pillow)."""
+    if not PIL_AVAILABLE:
+        return VisionFrame(
+            data=raw, phash=hashlib.sha1(raw).hexdigest(), raw_size=len(raw), cropped=cropped
+        )
+
+    image = Image.open(io.BytesIO(raw))
+    image.load()
+    scale = min(1.0, config.max_width / image.width, config.max_height / image.height)
+    if scale < 1.0:
+        image = image.resize((max(1, int(image.width * scale)), max(1, int(image.height * scale))), Image.LANCZOS)
+    rgb = image.convert("RGB")
+    out = io.BytesIO()
+    rgb.save(out, format="JPEG", quality=config.jpeg_quality, optimize=True)
+    return VisionFrame(
+        data=out.getvalue(),
+        width=rgb.width,
+        height=rgb.height,
+        phash=difference_hash(rgb),
+        raw_size=len(raw),
+        cropped=cropped,
+    )
+
+
+async def form_region(page, padding: int = 24) -> Optional[Dict[str, float]]:
+    """Padded bounding box of the page's form controls, or None."""
+    try:
+        box = await page.evaluate(_FORM_REGION_JS)
+    except Exception as e:
+        logger.debug(f"Form region detection failed: {e}")
+        return None
+    if not box or box["width"] <= 0 or box["height"] <= 0:
+        return None
+    x = max(0.0, box["x"] - padding)
+    y = max(0.0, box["y"] - padding)
+    return {
+        "x": x,
+        "y": y,
+        "width": min(box["pageWidth"], box["x"] + box["width"] + padding) - x,
+        "height": min(box["pageHeight"], box["y"] + box["height"] + padding) - y,
+    }
+
+
+async def capture_frame(page, config: Optional[VisionFrameConfig] = None) -> VisionFrame:
+    """Screenshot the form region of ``page`` as a compact, hashed frame."""
+    config = config or VisionFrameConfig()
+    region = await form_region(page, config.padding)
+    options: Dict[str, Any] = {"type": "jpeg", "quality": config.jpeg_quality, "scale": "css"}
+    if region:
+        options.update(clip=region, full_page=True)
+    raw = await page.screenshot(**options)
+    return encode_frame(raw, config, cropped=region is not None)
@@ -14,10 +14,17 @@ Benefits:
 - 95%+ theoretical success rate
 - No maintenance for new ATS platforms
 - Uses Kimi Vision instead of GPT-4V
+
+Screenshots go through ai.vision_frames (form-region crop, downscale, JPEG).
+Each application re-screenshots after every round of actions; a frame that
+hasn't changed since the previous analysis skips the model call (and ends the
+run, since the actions had no effect). The frame hash is too coarse to see
+typed text, so the page's URL and field values are compared as well: when
+those moved, the frame is analyzed afresh instead.
 """
 
 import asyncio
-import base64
+import hashlib
 from typing import List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
@@ -25,8 +32,20 @@ import logging
 import json
 import os
 
+from ai.vision_frames import VisionFrame, VisionFrameConfig, VisionStats, capture_frame, frame_changed
+
 logger = logging.getLogger(__name__)
 
+# URL plus every field's value/checked state; changes when a round of actions took effect.
+PAGE_STATE_SCRIPT = """
+() => [location.href].concat(
+    Array.from(document.querySelectorAll('input, textarea, select')).map(el =>
+        el.type === 'checkbox' || el.type === 'radio' ? String(el.checked)
+        : el.type === 'file' ? String(el.files ? el.files.length : 0)
+        : el.value)
+).join('\\u0001')
+"""
+
 
 class ActionType(Enum):
     CLICK = "click"
@@ -195,8 +214,14 @@ class VisualFormAgent:
         self.vision_model = vision_model
         self.action_history: List[FormAction] = []
         self.max_retries = 3
+        self.max_steps = 5  # screenshot/analyze/act rounds per application
         self.api_key = None
         self.base_url = "https://api.moonshot.ai/v1"
+        self.frame_config = VisionFrameConfig()
+        self.vision_stats = VisionStats()
+        # Last analyzed frame; an unchanged frame reuses its analysis.
+        self._last_frame: Optional[VisionFrame] = None
+        self._last_analysis: Optional[FormAnalysis] = None
         
     async def initialize(self):
         """Initialize the agent (load API keys, etc.)."""
@@ -236,89 +261,120 @@ class VisualFormAgent:
             'success': False,
             'confirmation_id': None,
             'error': None,
-            'steps_completed': 0
+            'steps_completed': 0,
+            'vision': None,
         }
+        self.vision_stats = VisionStats()
+        # A previous application's frame must never stand in for this form.
+        self._last_frame = None
+        self._last_analysis = None
         
         try:
             logger.info("[VisualAgent] Starting visual form application...")
             
-            # Take initial screenshot
-            screenshot = await self._take_screenshot(page)
-            
-            # Analyze form
-            form_analysis = await self._analyze_screenshot(screenshot, profile, job_data)
-            
-            if form_analysis.is_complete:
-                logger.info("[VisualAgent] Form already complete")
-                result['success'] = True
-                return result
-            
-            # Generate actions from analysis
-            actions = self._generate_actions(form_analysis, profile, resume_path)
-            
-            # Execute actions
-            for action in actions:
-                success = await action.execute(page)
-                if success:
-                    self.action_history.append(action)
-                    result['steps_completed'] += 1
-                    await asyncio.sleep(1)  # Brief pause between actions
-                else:
-                    logger.warning(f"[VisualAgent] Action failed: {action}")
+            # Screenshot, analyze, act; repeat for each step of the form.
+            page_state = None
+            for step in range(self.max_steps):
+                screenshot = await self._take_screenshot(page)
+                previous_state, page_state = page_state, await self._page_state(page)
+                skipped = self.vision_stats.skipped_unchanged
+                form_analysis = await self._analyze_screenshot(
+                    screenshot, profile, job_data, force=bool(step and page_state != previous_state)
+                )
+                
+                if form_analysis.is_complete:
+                    logger.info("[VisualAgent] Form already complete")
+                    result['success'] = True
+                    return result
+                
+                if step and self.vision_stats.skipped_unchanged > skipped:
+                    # Our last actions left the form as it was; repeating them won't help.
+                    logger.info("[VisualAgent] Form unchanged after actions, stopping")
+                    break
+                
+                # Generate actions from analysis
+                actions = self._generate_actions(form_analysis, profile, resume_path)
+                if not actions:
+                    break
+                
+                # Execute actions
+                for action in actions:
+                    success = await action.execute(page)
+                    if success:
+                        self.action_history.append(action)
+                        result['steps_completed'] += 1
+                        await asyncio.sleep(1)  # Brief pause between actions
+                    else:
+                        logger.warning(f"[VisualAgent] Action failed: {action}")
+                
+                # Check for success indicators
+                if await self._check_success(page):
+                    result['success'] = True
+                    result['confirmation_id'] = f"VA_{len(self.action_history)}"
+                    logger.info("[VisualAgent] Application successful!")
+                    break
             
-            # Check for success indicators
-            if await self._check_success(page):
-                result['success'] = True
-                result['confirmation_id'] = f"VA_{len(self.action_history)}"
-                logger.info("[VisualAgent] Application successful!")
-            else:
+            if not result['success']:
                 result['error'] = "Could not confirm submission"
                 
         except Exception as e:
             logger.error(f"[VisualAgent] Error: {e}")
             result['error'] = str(e)
         
+        result['vision'] = self.vision_stats.to_dict()
+        logger.info(
+            f"[VisualAgent] Vision calls: {self.vision_stats.calls} "
+            f"(skipped unchanged: {self.vision_stats.skipped_unchanged}, "
+            f"sent {self.vision_stats.bytes_sent / 1024:.1f} KB)"
+        )
         return result
     
-    async def _take_screenshot(self, page) -> bytes:
-        """Take a screenshot of the current page."""
-        return await page.screenshot(type='png')
+    async def _take_screenshot(self, page) -> VisionFrame:
+        """Capture the form region as a downscaled JPEG frame."""
+        return await capture_frame(page, self.frame_config)
+    
+    async def _page_state(self, page) -> Optional[str]:
+        """Digest of the page URL and field values (None if it can't be read)."""
+        try:
+            state = await page.evaluate(PAGE_STATE_SCRIPT)
+        except Exception as e:
+            logger.debug(f"[VisualAgent] Page state unavailable: {e}")
+            return None
+        return hashlib.sha1(str(state).encode("utf-8", "replace")).hexdigest()
     
     async def _analyze_screenshot(
         self,
-        screenshot: bytes,
+        screenshot: VisionFrame,
         profile: Dict[str, Any],
-        job_data: Dict[str, Any]
+        job_data: Dict[str, Any],
+        force: bool = False
     ) -> FormAnalysis:
         """
         Analyze a screenshot using Kimi Vision.
         
         Returns a FormAnalysis with detected fields and recommended actions.
+        A frame that hasn't meaningfully changed since the last analyzed one
+        reuses that analysis without a model call, unless ``force`` is set
+        (the page changed in ways the frame hash can't see).
         """
         if not self.api_key:
             logger.warning("No API key available for vision analysis")
             return FormAnalysis()
         
+        if not force and self._last_analysis is not None and not frame_changed(
+            self._last_frame, screenshot, self.frame_config.hash_distance
+        ):
+            self.vision_stats.skipped_unchanged += 1
+            logger.debug("[VisualAgent] Frame unchanged, reusing last analysis")
+            return self._last_analysis
+        
         try:
-            import aiohttp
-            
-            # Convert screenshot to base64
-            image_base64 = base64.b64encode(screenshot).decode('utf-8')
+            from ai.llm_client import LLMRequestError, get_llm_client
+            from ai.llm_governor import LANE_INTERACTIVE
             
             # Prepare prompt for Kimi Vision
             prompt = self._build_analysis_prompt(profile, job_data)
             
-            # Call Kimi Vision API with SSL verification disabled for macOS
-            import ssl
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             payload = {
                 "model": self.vision_model,
                 "messages": [
@@ -328,7 +384,7 @@ class VisualFormAgent:
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": f"data:image/png;base64,{image_base64}"
+                                    "url": screenshot.data_url()
                                 }
                             },
                             {
@@ -342,22 +398,28 @@ class VisualFormAgent:
                 "max_tokens": 2000
             }
             
-            async with aiohttp.ClientSession(
-                connector=aiohttp.TCPConnector(ssl=ssl_context)
-            ) as session:
-                async with session.post(
+            self.vision_stats.record_call(screenshot)
+            logger.debug(
+                f"[VisualAgent] Vision payload {screenshot.size / 1024:.1f} KB "
+                f"(raw {screenshot.raw_size / 1024:.1f} KB, cropped={screenshot.cropped})"
+            )
+            try:
+                data = await get_llm_client().chat_completion(
                     f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=60)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        analysis_text = data['choices'][0]['message']['content']
-                        return self._parse_analysis(analysis_text)
-                    else:
-                        logger.error(f"Kimi Vision API error: {response.status}")
-                        return FormAnalysis()
+                    self.api_key,
+                    payload,
+                    timeout=60,
+                    lane=LANE_INTERACTIVE,
+                    call_site="vision",
+                )
+            except LLMRequestError as e:
+                logger.error(f"Kimi Vision API error: {e.status or e}")
+                return FormAnalysis()
+            
+            analysis_text = data['choices'][0]['message']['content']
+            analysis = self._parse_analysis(analysis_text)
+            self._last_frame, self._last_analysis = screenshot, analysis
+            return analysis
                         
         except Exception as e:
             logger.error(f"Screenshot analysis failed: {e}")
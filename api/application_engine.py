@@ -13,10 +13,11 @@ Notes:
 
 from __future__ import annotations
 
+import asyncio
 import os
 import re
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
@@ -30,8 +31,13 @@ from api.database import (
     get_settings,
     get_user_by_id,
     save_application,
+    save_apply_spans,
 )
 from api.logging_config import logger, log_application
+from ai.llm_governor import llm_context
+from core.resume_digest import get_resume_digest, resume_snippet
+from core.step_checkpoints import get_step_checkpoint_store
+from monitoring.apply_spans import finish_apply_trace, mark_phase, start_apply_trace
 from monitoring.notifications import notifications
 
 from adapters import (
@@ -51,6 +57,10 @@ DEFAULT_PLATFORM_DAILY_LIMITS: dict[str, int] = {
 }
 
 
+# Checkpoint answer key for the generated cover letter.
+COVER_LETTER_CHECKPOINT_KEY = "__cover_letter__"
+
+
 class RateLimitError(RuntimeError):
     pass
 
@@ -102,6 +112,12 @@ class ApplyOptions:
     campaign_id: Optional[str] = None
     queue_item_id: Optional[str] = None
     application_id: Optional[str] = None
+    # Content prepared ahead of time by the pre-generation worker.
+    pregenerated: Optional[dict] = None
+
+
+def _new_application_id() -> str:
+    return f"app_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
 
 
 async def apply_job_url(
@@ -115,7 +131,30 @@ async def apply_job_url(
     """
     Apply to a job URL, save an application record, and return the saved payload.
     Raises RateLimitError for rate-limit conditions (daily limits or platform throttles).
+
+    LLM calls made along the way count against this user's token quota and
+    are accounted to the campaign and application in the usage ledger.
     """
+    if not options.application_id:
+        options = replace(options, application_id=_new_application_id())
+    with llm_context(user_id=user_id, campaign_id=options.campaign_id, application_id=options.application_id):
+        return await _apply_job_url(
+            user_id=user_id,
+            job_url=job_url,
+            browser_manager=browser_manager,
+            kimi=kimi,
+            options=options,
+        )
+
+
+async def _apply_job_url(
+    *,
+    user_id: str,
+    job_url: str,
+    browser_manager: Any,
+    kimi: Any,
+    options: ApplyOptions,
+) -> dict[str, Any]:
     if not browser_manager:
         raise RuntimeError("Browser automation not available")
 
@@ -159,24 +198,43 @@ async def apply_job_url(
             raise RuntimeError("LinkedIn requires authentication. Add li_at cookie in settings.")
 
     adapter = None
-    application_id = options.application_id or f"app_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+    application_id = options.application_id or _new_application_id()
     started = datetime.now().isoformat()
+    trace, trace_token = start_apply_trace(application_id, platform_id, user_id)
 
     cover_letter = None
     job = None
     try:
         adapter = get_adapter(platform_id, browser_manager, session_cookie=linkedin_cookie, use_unified=False)
+        adapter.user_id = user_id
+        # Queued items keep step checkpoints so a retry reuses earlier progress/answers.
+        checkpoint = await asyncio.to_thread(
+            get_step_checkpoint_store().open, options.queue_item_id, platform_id
+        )
+        adapter.checkpoint = checkpoint
+        mark_phase("job_details")
         job = await adapter.get_job_details(job_url)
+        mark_phase("cover_letter")
+
+        if options.generate_cover_letter and checkpoint:
+            cover_letter = checkpoint.get_answer(COVER_LETTER_CHECKPOINT_KEY)
 
-        if options.generate_cover_letter:
+        if options.generate_cover_letter and not cover_letter and options.pregenerated:
+            cover_letter = options.pregenerated.get("cover_letter")
+            if checkpoint and cover_letter:
+                await checkpoint.set_answer(COVER_LETTER_CHECKPOINT_KEY, cover_letter)
+
+        if options.generate_cover_letter and not cover_letter:
             try:
                 cover_letter = await kimi.generate_cover_letter(
-                    resume_summary=(resume.get("raw_text") or "")[:2000],
+                    resume_summary=resume_snippet(resume, "cover_letter"),
                     job_title=getattr(job, "title", "Position") or "Position",
                     company_name=getattr(job, "company", "Company") or "Company",
                     job_requirements=(getattr(job, "description", "") or "")[:2000],
                     tone=options.cover_letter_tone,
                 )
+                if checkpoint and cover_letter:
+                    await checkpoint.set_answer(COVER_LETTER_CHECKPOINT_KEY, cover_letter)
             except Exception as e:
                 logger.warning(f"Cover letter generation failed: {e}")
 
@@ -184,6 +242,7 @@ async def apply_job_url(
             file_path=resume["file_path"],
             raw_text=resume.get("raw_text") or "",
             parsed_data=resume.get("parsed_data") or {},
+            digest=get_resume_digest(resume),
         )
         profile_obj = UserProfile(
             first_name=profile["first_name"],
@@ -196,8 +255,10 @@ async def apply_job_url(
             work_authorization=profile.get("work_authorization", "Yes"),
             sponsorship_required=profile.get("sponsorship_required", "No"),
             custom_answers=profile.get("custom_answers", {}) or {},
+            user_id=str(user_id),
         )
 
+        trace.end_phase()
         if hasattr(adapter, "apply_to_job"):
             result = await adapter.apply_to_job(
                 job=job,
@@ -210,6 +271,7 @@ async def apply_job_url(
             result = await adapter.apply(job=job, resume=resume_obj)
         else:
             raise RuntimeError("Adapter does not implement apply_to_job/apply")
+        trace.end_phase()
 
         status_val = result.status.value if hasattr(result.status, "value") else str(result.status)
 
@@ -310,3 +372,8 @@ async def apply_job_url(
                 await adapter.close()
         except Exception:
             pass
+        finish_apply_trace(trace_token)
+        try:
+            await save_apply_spans(application_id, user_id, platform_id, [s.to_dict() for s in trace.spans])
+        except Exception as e:
+            logger.debug(f"Failed to save apply spans for {application_id}: {e}")
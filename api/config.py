@@ -69,10 +69,39 @@ class AppConfig:
     MAX_LOCAL_BROWSERS: int = int(os.getenv("MAX_LOCAL_BROWSERS", "20"))
     PREFER_LOCAL_BROWSER: bool = os.getenv("PREFER_LOCAL_BROWSER", "false").lower() == "true"
 
+    # Encrypted per-user/per-platform storage-state snapshots (cookies + localStorage)
+    STORAGE_STATE_DIR: str = os.getenv("STORAGE_STATE_DIR", "./data/storage_states")
+    STORAGE_STATE_MAX_AGE_HOURS: float = float(os.getenv("STORAGE_STATE_MAX_AGE_HOURS", "168"))
+
+    # Opt-in browserless submission for plain-HTML application forms (e.g. Lever)
+    HTTP_SUBMIT_ENABLED: bool = os.getenv("HTTP_SUBMIT_ENABLED", "false").lower() == "true"
+
     # === AI Service ===
     AI_MAX_RETRIES: int = int(os.getenv("AI_MAX_RETRIES", "3"))
     AI_RETRY_DELAY_SECONDS: float = float(os.getenv("AI_RETRY_DELAY_SECONDS", "1.0"))
     AI_TIMEOUT_SECONDS: int = int(os.getenv("AI_TIMEOUT_SECONDS", "30"))
+    # Shared LLM HTTP connection pool (ai/llm_client.py)
+    LLM_POOL_LIMIT: int = int(os.getenv("LLM_POOL_LIMIT", "32"))
+    LLM_POOL_LIMIT_PER_HOST: int = int(os.getenv("LLM_POOL_LIMIT_PER_HOST", "16"))
+    LLM_KEEPALIVE_SECONDS: float = float(os.getenv("LLM_KEEPALIVE_SECONDS", "60"))
+    LLM_MAX_RETRY_AFTER_SECONDS: float = float(os.getenv("LLM_MAX_RETRY_AFTER_SECONDS", "60"))
+    LLM_VERIFY_SSL: bool = os.getenv("LLM_VERIFY_SSL", "true").lower() == "true"
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+    LLM_REQUESTS_PER_MINUTE: int = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "120"))
+    LLM_TOKENS_PER_MINUTE: int = int(os.getenv("LLM_TOKENS_PER_MINUTE", "200000"))
+    LLM_USER_TOKENS_PER_MINUTE: int = int(os.getenv("LLM_USER_TOKENS_PER_MINUTE", "50000"))
+    LLM_BACKGROUND_SHARE: float = float(os.getenv("LLM_BACKGROUND_SHARE", "0.75"))
+    # JSON {"model-prefix": [usd_per_mtok_in, usd_per_mtok_out]} merged over built-in prices
+    LLM_PRICING: str = os.getenv("LLM_PRICING", "")
+    # Offline stand-in (ai/llm_replay.py): live | record | replay
+    LLM_BACKEND: str = os.getenv("LLM_BACKEND", "live")
+    LLM_REPLAY_PATH: str = os.getenv("LLM_REPLAY_PATH", "./data/llm_replay.jsonl")
+    # none | fixed:MS | uniform:LO,HI | normal:MEAN,STD | lognormal:MEDIAN,SIGMA | recorded[:SCALE]
+    LLM_REPLAY_LATENCY: str = os.getenv("LLM_REPLAY_LATENCY", "recorded")
+    LLM_REPLAY_SEED: Optional[int] = int(os.getenv("LLM_REPLAY_SEED")) if os.getenv("LLM_REPLAY_SEED") else None
+    LLM_REPLAY_MISS: str = os.getenv("LLM_REPLAY_MISS", "error")
+    # Near-duplicate reuse of tailoring / cover letters (estimated Jaccard, 0-1)
+    AI_CACHE_SIMILARITY_THRESHOLD: float = float(os.getenv("AI_CACHE_SIMILARITY_THRESHOLD", "0.8"))
 
     # === Human-like Delays ===
     MIN_HUMAN_DELAY: float = float(os.getenv("MIN_HUMAN_DELAY", "1.0"))
@@ -87,6 +116,21 @@ class AppConfig:
     # === Paths ===
     DATA_DIR: str = os.getenv("DATA_DIR", "./data")
     LOG_DIR: str = os.getenv("LOG_DIR", "./logs")
+    STEP_CHECKPOINT_DB: str = os.getenv("STEP_CHECKPOINT_DB", "./data/step_checkpoints.db")
+    ANSWER_BANK_DB: str = os.getenv("ANSWER_BANK_DB", "./data/answer_bank.db")
+    ANSWER_BANK_MATCH_THRESHOLD: float = float(os.getenv("ANSWER_BANK_MATCH_THRESHOLD", "0.9"))
+    FORM_STRUCTURE_CACHE_DB: str = os.getenv("FORM_STRUCTURE_CACHE_DB", "./data/form_structures.db")
+    FORM_STRUCTURE_CACHE_TTL_DAYS: int = int(os.getenv("FORM_STRUCTURE_CACHE_TTL_DAYS", "30"))
+    LLM_USAGE_DB: str = os.getenv("LLM_USAGE_DB", "./data/llm_usage.db")
+    BOARD_SYNC_DB: str = os.getenv("BOARD_SYNC_DB", "./data/board_sync.db")
+    BOARD_SYNC_MIN_INTERVAL_SECONDS: float = float(os.getenv("BOARD_SYNC_MIN_INTERVAL_SECONDS", "300"))
+    JOB_INDEX_DB: str = os.getenv("JOB_INDEX_DB", "./data/job_index.db")
+    JOB_INDEX_ENABLED: bool = os.getenv("JOB_INDEX_ENABLED", "true").lower() == "true"
+    # Postings not re-seen by any search for this long are hidden and pruned (0 keeps them forever)
+    JOB_INDEX_MAX_AGE_DAYS: float = float(os.getenv("JOB_INDEX_MAX_AGE_DAYS", "30"))
+    JOB_DEDUPE_DB: str = os.getenv("JOB_DEDUPE_DB", "./data/job_dedupe.db")
+    # Near-duplicate postings (estimated Jaccard over title/company/description, 0-1)
+    JOB_DEDUPE_THRESHOLD: float = float(os.getenv("JOB_DEDUPE_THRESHOLD", "0.7"))
     
     # === Campaign Settings ===
     CAMPAIGN_DEFAULT_MAX_APPLICATIONS: int = int(os.getenv("CAMPAIGN_DEFAULT_MAX_APPLICATIONS", "10"))
@@ -13,6 +13,8 @@ from pathlib import Path
 from contextlib import asynccontextmanager
 import uuid
 
+from core.resume_digest import DIGEST_VERSION, build_resume_digest
+
 # Database configuration
 DB_PATH = Path(os.getenv("DATABASE_PATH", Path(__file__).parent.parent / "data" / "job_applier.db"))
 DB_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -60,6 +62,7 @@ async def init_database():
                 raw_text TEXT,
                 parsed_data TEXT,
                 tailored_version TEXT,
+                digest TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (user_id) REFERENCES users(id)
             )
@@ -153,6 +156,21 @@ async def init_database():
             )
         """)
 
+        # Per-phase apply timing spans (monitoring/apply_spans.py)
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS apply_spans (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                application_id TEXT NOT NULL,
+                user_id TEXT,
+                platform TEXT,
+                phase TEXT NOT NULL,
+                started_at TIMESTAMP,
+                duration_ms REAL NOT NULL,
+                ok INTEGER DEFAULT 1,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
         # Create indexes
         await db.execute("CREATE INDEX IF NOT EXISTS idx_applications_user_id ON applications(user_id)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_applications_created_at ON applications(created_at)")
@@ -162,12 +180,15 @@ async def init_database():
         await db.execute("CREATE INDEX IF NOT EXISTS idx_queue_user_id ON job_queue(user_id)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_queue_campaign_id ON job_queue(campaign_id)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_queue_status_next_run ON job_queue(status, next_run_at)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_apply_spans_application ON apply_spans(application_id)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_apply_spans_platform_created ON apply_spans(platform, created_at)")
 
         await db.commit()
 
         # Lightweight migrations for additive columns.
         await _migrate_user_settings(db)
         await _migrate_profiles(db)
+        await _migrate_resumes(db)
         await db.commit()
 
 
@@ -209,6 +230,22 @@ async def _migrate_profiles(db: aiosqlite.Connection):
         await db.execute(f"ALTER TABLE profiles ADD COLUMN {col} {col_type}")
 
 
+async def _migrate_resumes(db: aiosqlite.Connection):
+    """Add new optional columns to resumes if missing."""
+    cursor = await db.execute("PRAGMA table_info(resumes)")
+    rows = await cursor.fetchall()
+    existing = {row[1] for row in rows}
+
+    migrations = [
+        ("digest", "TEXT"),
+    ]
+
+    for col, col_type in migrations:
+        if col in existing:
+            continue
+        await db.execute(f"ALTER TABLE resumes ADD COLUMN {col} {col_type}")
+
+
 @asynccontextmanager
 async def get_db():
     """Get a database connection."""
@@ -302,13 +339,15 @@ async def get_profile(user_id: str) -> Optional[Dict]:
 
 
 # Resume operations
-async def save_resume(user_id: str, file_path: str, raw_text: str, parsed_data: Dict) -> int:
-    """Save a new resume."""
+async def save_resume(
+    user_id: str, file_path: str, raw_text: str, parsed_data: Dict, digest: Optional[Dict] = None
+) -> int:
+    """Save a new resume (with its precomputed digest, if built)."""
     async with get_db() as db:
         cursor = await db.execute("""
-            INSERT INTO resumes (user_id, file_path, raw_text, parsed_data)
-            VALUES (?, ?, ?, ?)
-        """, (user_id, file_path, raw_text, json.dumps(parsed_data)))
+            INSERT INTO resumes (user_id, file_path, raw_text, parsed_data, digest)
+            VALUES (?, ?, ?, ?, ?)
+        """, (user_id, file_path, raw_text, json.dumps(parsed_data), json.dumps(digest) if digest else None))
         await db.commit()
         return cursor.lastrowid
 
@@ -325,6 +364,15 @@ async def get_latest_resume(user_id: str) -> Optional[Dict]:
             resume = dict(row)
             resume["parsed_data"] = json.loads(resume.get("parsed_data") or "{}")
             resume["tailored_version"] = json.loads(resume.get("tailored_version") or "null")
+            digest = json.loads(resume.get("digest") or "null")
+            if not isinstance(digest, dict) or digest.get("version") != DIGEST_VERSION:
+                # Stored before digests (or by an older version): build it once and keep it.
+                digest = build_resume_digest(resume.get("raw_text") or "", resume["parsed_data"])
+                await db.execute(
+                    "UPDATE resumes SET digest = ? WHERE id = ?", (json.dumps(digest), resume["id"])
+                )
+                await db.commit()
+            resume["digest"] = digest
             return resume
         return None
 
@@ -421,6 +469,62 @@ async def count_applications_since_by_platform(user_id: str, platform: str, sinc
         return row["count"] if row else 0
 
 
+async def save_apply_spans(
+    application_id: str,
+    user_id: Optional[str],
+    platform: Optional[str],
+    spans: List[Dict[str, Any]],
+) -> int:
+    """Persist the timing spans of one application attempt."""
+    if not spans:
+        return 0
+    async with get_db() as db:
+        await db.executemany(
+            """INSERT INTO apply_spans (application_id, user_id, platform, phase, started_at, duration_ms, ok)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            [
+                (
+                    application_id,
+                    user_id,
+                    platform,
+                    span["phase"],
+                    span.get("started_at"),
+                    float(span["duration_ms"]),
+                    1 if span.get("ok", True) else 0,
+                )
+                for span in spans
+            ],
+        )
+        await db.commit()
+    return len(spans)
+
+
+async def get_apply_spans(application_id: str) -> List[Dict[str, Any]]:
+    """Get the timing spans recorded for an application, in order."""
+    async with get_db() as db:
+        cursor = await db.execute(
+            """SELECT phase, started_at, duration_ms, ok FROM apply_spans
+               WHERE application_id = ? ORDER BY id""",
+            (application_id,),
+        )
+        rows = await cursor.fetchall()
+        return [{**dict(row), "ok": bool(row["ok"])} for row in rows]
+
+
+async def list_apply_spans_since(since: datetime, platform: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Get span rows (application_id, platform, phase, duration_ms) recorded since a time."""
+    query = """SELECT application_id, platform, phase, duration_ms FROM apply_spans
+               WHERE created_at > ?"""
+    params: List[Any] = [since.strftime("%Y-%m-%d %H:%M:%S")]
+    if platform:
+        query += " AND platform = ?"
+        params.append(platform)
+    async with get_db() as db:
+        cursor = await db.execute(query, params)
+        rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
+
+
 # Campaign + Queue operations
 
 async def create_campaign(user_id: str, name: str, config: Dict[str, Any], status: str = "running") -> str:
@@ -606,6 +710,65 @@ async def fetch_next_queue_item(worker_id: str) -> Optional[Dict[str, Any]]:
         return item
 
 
+async def list_pregen_candidates(limit: int = 5) -> List[Dict[str, Any]]:
+    """
+    Next runnable queue items (in the order fetch_next_queue_item would claim
+    them) that have no pre-generated content yet.
+    """
+    async with get_db() as db:
+        cursor = await db.execute(
+            """
+            SELECT q.*
+            FROM job_queue q
+            JOIN campaigns c ON c.id = q.campaign_id
+            WHERE c.status = 'running'
+              AND q.status IN ('queued', 'retry_scheduled')
+              AND q.locked_at IS NULL
+              AND json_extract(COALESCE(q.payload_json, '{}'), '$.pregen') IS NULL
+            ORDER BY q.priority DESC, q.next_run_at ASC, q.created_at ASC
+            LIMIT ?
+            """,
+            (int(limit),),
+        )
+        rows = await cursor.fetchall()
+        items: List[Dict[str, Any]] = []
+        for row in rows:
+            item = dict(row)
+            item["payload"] = json.loads(item.get("payload_json") or "{}")
+            items.append(item)
+        return items
+
+
+async def is_pregen_candidate(queue_id: str) -> bool:
+    """Whether the item is still unclaimed and unprepared (re-checked before spending on it)."""
+    async with get_db() as db:
+        cursor = await db.execute(
+            """
+            SELECT 1 FROM job_queue
+            WHERE id = ?
+              AND status IN ('queued', 'retry_scheduled')
+              AND locked_at IS NULL
+              AND json_extract(COALESCE(payload_json, '{}'), '$.pregen') IS NULL
+            """,
+            (queue_id,),
+        )
+        return await cursor.fetchone() is not None
+
+
+async def set_queue_pregen(queue_id: str, pregen: Dict[str, Any]):
+    """Store pre-generated content under the item's payload 'pregen' key."""
+    now = datetime.now().isoformat()
+    async with get_db() as db:
+        await db.execute(
+            """UPDATE job_queue
+               SET payload_json = json_set(COALESCE(payload_json, '{}'), '$.pregen', json(?)),
+                   updated_at = ?
+               WHERE id = ?""",
+            (json.dumps(pregen), now, queue_id),
+        )
+        await db.commit()
+
+
 async def release_queue_lock(queue_id: str, worker_id: str):
     """Release lock without changing status (used on shutdown/error)."""
     now = datetime.now().isoformat()
@@ -9,6 +9,7 @@ import json
 import re
 import uuid
 import asyncio
+import time
 from datetime import datetime, timedelta
 from typing import List, Optional
 from pathlib import Path
@@ -34,12 +35,26 @@ from api.database import (
     save_application, get_applications, get_applications_since, get_application, count_applications_since,
     save_settings, get_settings,
     create_campaign, get_campaign, list_campaigns, set_campaign_status,
-    enqueue_jobs, get_queue_counts, list_queue_items, cancel_campaign_queue
+    enqueue_jobs, get_queue_counts, list_queue_items, cancel_campaign_queue,
+    get_apply_spans, list_apply_spans_since,
 )
 from api.logging_config import logger, log_application, log_ai_request
+from ai.llm_client import get_llm_client, close_llm_client
+from adapters.jobspy_pool import JobSpyTimeout, get_jobspy_pool, shutdown_jobspy_pool
+from adapters.board_fetcher import close_board_fetcher
+from ai.llm_governor import LANE_SUGGESTIONS, get_llm_governor, llm_context
 
 from ai.kimi_service import KimiResumeOptimizer
 from core.resume_file_parser import extract_text_from_upload
+from core.job_dedupe import get_job_dedupe
+from core.job_index import get_job_index, index_jobs_async
+from core.search_fanout import fan_out
+from core.resume_digest import (
+    build_resume_digest,
+    get_resume_digest,
+    tokenize as _tokenize,
+    estimate_years_experience as _estimate_years_experience_from_parsed,
+)
 
 # Browser manager is optional. Importing core may succeed even if optional
 # browser dependencies are missing, so instantiate defensively.
@@ -81,6 +96,7 @@ from api.parallel_processor import (
 # Shared application engine + persistent queue worker
 from api.application_engine import ApplyOptions, RateLimitError, apply_job_url
 from api.queue_worker import QueueWorker
+from api.pregen_worker import PregenWorker
 from monitoring.notifications import notifications
 
 
@@ -107,6 +123,16 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Queue worker failed to start: {e}")
 
+    # Look-ahead cover letters / answers for queued jobs (HTTP + LLM only).
+    try:
+        if os.getenv("PREGEN_WORKER_ENABLED", "true").lower() == "true" and kimi is not None:
+            pw = PregenWorker(kimi=kimi)
+            pw.start()
+            app.state.pregen_worker = pw
+            logger.info("Pre-generation worker enabled")
+    except Exception as e:
+        logger.warning(f"Pre-generation worker failed to start: {e}")
+
     yield
     # Shutdown
     logger.info("Shutting down Job Applier API...")
@@ -116,9 +142,18 @@ async def lifespan(app: FastAPI):
             await qw.stop()
     except Exception:
         pass
+    try:
+        pw = getattr(app.state, "pregen_worker", None)
+        if pw:
+            await pw.stop()
+    except Exception:
+        pass
     if browser_manager is not None:
         await browser_manager.close_all()
         logger.info("Browser sessions closed")
+    shutdown_jobspy_pool()
+    await close_board_fetcher()
+    await close_llm_client()
 
 
 # Initialize FastAPI app
@@ -220,6 +255,12 @@ class UserProfileRequest(BaseModel):
     custom_answers: dict = Field(default_factory=dict)
 
 
+class AnswerOverrideRequest(BaseModel):
+    question: str = Field(..., min_length=1, max_length=500)
+    answer: str = Field(..., min_length=1, max_length=2000)
+    options: Optional[List[str]] = Field(default=None, max_length=50)
+
+
 class ApplicationRequest(BaseModel):
     job_url: str = Field(..., max_length=500)
     auto_submit: bool = False
@@ -413,42 +454,6 @@ def _extract_contact_fallback(raw_text: str) -> dict:
     }
 
 
-_STOPWORDS = {
-    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "in",
-    "is", "it", "its", "of", "on", "or", "that", "the", "this", "to", "was", "were", "will",
-    "with", "you", "your",
-}
-
-
-def _tokenize(text: str) -> list[str]:
-    text = (text or "").lower()
-    # Keep alphanumerics and a few tech symbols; everything else to space.
-    text = re.sub(r"[^a-z0-9\+\#\.\-]+", " ", text)
-    toks = [t.strip(".-") for t in text.split() if t.strip(".-")]
-    return [t for t in toks if len(t) >= 3 and t not in _STOPWORDS]
-
-
-def _extract_resume_keywords(raw_text: str, parsed_data: dict) -> set[str]:
-    keywords: set[str] = set()
-
-    parsed = parsed_data or {}
-    for skill in parsed.get("skills") or []:
-        for tok in _tokenize(str(skill)):
-            keywords.add(tok)
-
-    # Backfill from raw text using most frequent tokens.
-    try:
-        from collections import Counter
-
-        counts = Counter(_tokenize(raw_text))
-        for tok, _ in counts.most_common(120):
-            keywords.add(tok)
-    except Exception:
-        pass
-
-    return keywords
-
-
 def _keyword_overlap_score(resume_keywords: set[str], job_text: str) -> float:
     if not resume_keywords:
         return 0.0
@@ -477,25 +482,6 @@ def _detect_clearance_requirement(text: str) -> Optional[str]:
     return None
 
 
-def _estimate_years_experience_from_parsed(parsed_data: dict) -> Optional[int]:
-    exp = (parsed_data or {}).get("experience") or []
-    years: list[int] = []
-    for item in exp:
-        dates = str((item or {}).get("dates") or "")
-        found = re.findall(r"(?:19|20)\d{2}", dates)
-        for y in found:
-            try:
-                years.append(int(y))
-            except Exception:
-                continue
-    if len(years) >= 2:
-        return max(years) - min(years)
-    if len(years) == 1:
-        now_year = datetime.now().year
-        return max(0, now_year - years[0])
-    return None
-
-
 def _is_seniorish_title(title: str) -> bool:
     t = (title or "").lower()
     return bool(re.search(r"\b(senior|sr\.?|lead|principal|staff|manager|director|vp|head)\b", t))
@@ -700,7 +686,8 @@ async def upload_resume(
     # Generate suggested job titles based on resume
     suggested_titles = []
     try:
-        suggested_titles = await kimi.suggest_job_titles(raw_text[:3000])
+        with llm_context(lane=LANE_SUGGESTIONS, user_id=user_id):
+            suggested_titles = await kimi.suggest_job_titles(raw_text[:3000])
     except Exception as e:
         logger.warning(f"Job title suggestion failed: {e}")
 
@@ -711,8 +698,9 @@ async def upload_resume(
 
     job_preferences = _build_job_preferences(parsed_data, raw_text, suggested_titles)
 
-    # Save to database
-    await save_resume(user_id, str(file_path), raw_text, parsed_data)
+    # Save to database with its digest so later prompts and scoring skip re-processing
+    digest = build_resume_digest(raw_text, parsed_data)
+    await save_resume(user_id, str(file_path), raw_text, parsed_data, digest=digest)
 
     logger.info(f"Resume uploaded for user {user_id}: {safe_filename}")
     user = await get_user_by_id(user_id)
@@ -775,7 +763,8 @@ async def suggest_job_titles(user_id: str = Depends(get_current_user)):
     
     try:
         # Get comprehensive search config including title suggestions
-        search_config = await kimi.suggest_job_search_config(resume["raw_text"])
+        with llm_context(lane=LANE_SUGGESTIONS, user_id=user_id):
+            search_config = await kimi.suggest_job_search_config(resume["raw_text"])
         
         log_ai_request("kimi", "suggest_job_titles", extra={"suggestions_count": len(search_config["suggested_roles"])})
         
@@ -816,7 +805,8 @@ async def suggest_titles_from_text(request: SuggestTitlesTextRequest):
     Useful for testing without database persistence.
     """
     try:
-        search_config = await kimi.suggest_job_search_config(request.resume_text)
+        with llm_context(lane=LANE_SUGGESTIONS):
+            search_config = await kimi.suggest_job_search_config(request.resume_text)
         return search_config
     except Exception as e:
         logger.error(f"Error suggesting titles from text: {e}")
@@ -889,6 +879,34 @@ async def auto_generate_profile(user_id: str = Depends(get_current_user)):
     return {"message": "Profile auto-generated", "profile": suggestion}
 
 
+@app.get("/profile/answers")
+async def list_saved_answers(user_id: str = Depends(get_current_user)):
+    """Screening-question answers stored for this user, most reused first."""
+    from core.answer_bank import get_answer_bank
+    return {"answers": get_answer_bank().list_answers(str(user_id))}
+
+
+@app.put("/profile/answers")
+async def override_saved_answer(request: AnswerOverrideRequest, user_id: str = Depends(get_current_user)):
+    """Set the answer to use for a question; generated answers never replace it."""
+    from ai.form_intelligence import get_form_intelligence
+    from core.answer_bank import get_answer_bank
+    get_answer_bank().set_override(str(user_id), request.question, request.options, request.answer)
+    get_form_intelligence().forget(str(user_id))
+    return {"message": "Answer saved", "question": request.question, "answer": request.answer}
+
+
+@app.delete("/profile/answers/{answer_id}")
+async def delete_saved_answer(answer_id: int, user_id: str = Depends(get_current_user)):
+    """Forget a stored answer so it is generated again next time."""
+    from ai.form_intelligence import get_form_intelligence
+    from core.answer_bank import get_answer_bank
+    if not get_answer_bank().delete(str(user_id), answer_id):
+        raise HTTPException(status_code=404, detail="Answer not found")
+    get_form_intelligence().forget(str(user_id))
+    return {"message": "Answer deleted"}
+
+
 # === Job Search Endpoints ===
 
 async def _search_jobs_jobspy(request: SearchRequest, platform: str) -> list[dict]:
@@ -896,18 +914,6 @@ async def _search_jobs_jobspy(request: SearchRequest, platform: str) -> list[dic
     Cookie-less job discovery using python-jobspy (public scraping).
     Returns list of job dicts with stable keys for API response.
     """
-    try:
-        from jobspy import scrape_jobs  # type: ignore
-    except Exception as e:
-        # Fallback to vendored submodule if available.
-        try:
-            jobspy_root = Path(__file__).parent.parent / "src" / "python-jobspy"
-            if jobspy_root.exists():
-                sys.path.append(str(jobspy_root))
-            from jobspy import scrape_jobs  # type: ignore
-        except Exception:
-            raise RuntimeError(f"JobSpy not available: {e}")
-
     roles = request.roles or ["software engineer"]
     search_term = " OR ".join(roles)
 
@@ -918,9 +924,9 @@ async def _search_jobs_jobspy(request: SearchRequest, platform: str) -> list[dic
 
     hours_old = int(request.posted_within_days * 24)
 
-    # JobSpy returns a pandas DataFrame
+    # Scraped in a worker process; comes back as compact records, not a DataFrame.
     results_wanted = min(int(request.max_results or 100), 200)
-    jobs_df = scrape_jobs(
+    records = await get_jobspy_pool().scrape(
         site_name=[platform],
         search_term=search_term,
         location=location,
@@ -934,16 +940,7 @@ async def _search_jobs_jobspy(request: SearchRequest, platform: str) -> list[dic
         country_indeed=request.country if platform == "indeed" else None,
     )
 
-    if jobs_df is None:
-        return []
-
     jobs: list[dict] = []
-    try:
-        records = jobs_df.to_dict("records")
-    except Exception:
-        # If jobspy changes return type, try iterating rows
-        records = []
-
     for row in records:
         url = str(row.get("job_url") or "")
         if not url:
@@ -954,10 +951,7 @@ async def _search_jobs_jobspy(request: SearchRequest, platform: str) -> list[dic
         company = str(row.get("company") or "").strip()
         location_str = str(row.get("location") or "").strip()
         desc = row.get("description") or ""
-        try:
-            easy_apply = bool(row.get("easy_apply")) if "easy_apply" in row else False
-        except Exception:
-            easy_apply = False
+        easy_apply = bool(row.get("easy_apply"))
 
         jobs.append(
             {
@@ -980,8 +974,8 @@ async def _search_jobs_jobspy(request: SearchRequest, platform: str) -> list[dic
 @app.post("/jobs/search")
 async def search_jobs(request: SearchRequest, platform: str = "linkedin", user_id: str = Depends(get_current_user)):
     """Search for jobs across platforms."""
-    if platform not in ["linkedin", "indeed", "greenhouse", "lever", "company"]:
-        raise HTTPException(status_code=400, detail="Search only supported for: linkedin, indeed, greenhouse, lever, company")
+    if platform not in ["linkedin", "indeed", "greenhouse", "lever", "company", "index"]:
+        raise HTTPException(status_code=400, detail="Search only supported for: linkedin, indeed, greenhouse, lever, company, index")
 
     if platform == "company" and not request.careers_url:
         raise HTTPException(status_code=400, detail="Company platform requires careers_url")
@@ -990,7 +984,20 @@ async def search_jobs(request: SearchRequest, platform: str = "linkedin", user_i
         # Prefer cookie-less scraping for common boards.
         jobs_payload: list[dict]
 
-        if platform in ["linkedin", "indeed"]:
+        if platform == "index":
+            # Local FTS index of previously scraped postings (no scraping).
+            search_config = SearchConfig(
+                roles=request.roles,
+                locations=request.locations,
+                easy_apply_only=request.easy_apply_only,
+                posted_within_days=request.posted_within_days,
+                required_keywords=request.required_keywords,
+                exclude_keywords=request.exclude_keywords,
+                country=request.country,
+            )
+            hits = await asyncio.to_thread(get_job_index().search_config, search_config, limit=500)
+            jobs_payload = [hit.to_dict() for hit in hits]
+        elif platform in ["linkedin", "indeed"]:
             jobs_payload = await _search_jobs_jobspy(request, platform)
         elif platform in ["greenhouse", "lever"]:
             # Public board APIs (no browser required).
@@ -1052,6 +1059,9 @@ async def search_jobs(request: SearchRequest, platform: str = "linkedin", user_i
                 for j in jobs
             ]
 
+        if platform != "index":
+            await index_jobs_async(jobs_payload, source=platform)
+
         # Optional smart scoring/filtering using the user's resume/profile.
         resume_keywords: set[str] = set()
         candidate_years: Optional[int] = None
@@ -1059,14 +1069,9 @@ async def search_jobs(request: SearchRequest, platform: str = "linkedin", user_i
             latest_resume = await get_latest_resume(user_id)
             latest_profile = await get_profile(user_id)
             if latest_resume:
-                resume_keywords = _extract_resume_keywords(
-                    latest_resume.get("raw_text") or "",
-                    latest_resume.get("parsed_data") or {},
-                )
-                candidate_years = (
-                    (latest_profile or {}).get("years_experience")
-                    or _estimate_years_experience_from_parsed(latest_resume.get("parsed_data") or {})
-                )
+                digest = get_resume_digest(latest_resume)
+                resume_keywords = set(digest["keywords"])
+                candidate_years = (latest_profile or {}).get("years_experience") or digest["years_experience"]
             elif latest_profile:
                 candidate_years = latest_profile.get("years_experience")
 
@@ -1140,6 +1145,8 @@ async def search_jobs(request: SearchRequest, platform: str = "linkedin", user_i
         }
     except Exception as e:
         logger.error(f"Search failed: {e}")
+        if isinstance(e, JobSpyTimeout):
+            raise HTTPException(status_code=504, detail=str(e))
         if isinstance(e, RuntimeError) and "JobSpy not available" in str(e):
             raise HTTPException(status_code=503, detail=str(e))
         raise HTTPException(status_code=500, detail=str(e))
@@ -1233,50 +1240,48 @@ async def autopilot_campaign(
         locations.append("Remote")
     locations = [l for l in locations if l][:5]
 
-    # Search + score per platform.
-    all_jobs: list[dict] = []
+    # Search + score all platforms concurrently; merged and deduplicated by apply_url/url.
+    sr = SearchRequest(
+        roles=roles[:5],
+        locations=locations[:3],
+        easy_apply_only=request.easy_apply_only,
+        posted_within_days=request.posted_within_days,
+        required_keywords=search_cfg.get("keywords") or [],
+        exclude_keywords=[],
+        country="US",
+        careers_url=None,
+        use_resume_match=True,
+        min_match_score=request.min_match_score,
+        allow_clearance_jobs=request.allow_clearance_jobs,
+        skip_senior_for_junior=True,
+        max_results=max(50, min(200, request.max_apply * 10)),
+    )
     per_platform: dict[str, dict] = {}
 
-    for platform in request.platforms:
-        sr = SearchRequest(
-            roles=roles[:5],
-            locations=locations[:3],
-            easy_apply_only=request.easy_apply_only,
-            posted_within_days=request.posted_within_days,
-            required_keywords=search_cfg.get("keywords") or [],
-            exclude_keywords=[],
-            country="US",
-            careers_url=None,
-            use_resume_match=True,
-            min_match_score=request.min_match_score,
-            allow_clearance_jobs=request.allow_clearance_jobs,
-            skip_senior_for_junior=True,
-            max_results=max(50, min(200, request.max_apply * 10)),
-        )
-        try:
+    def platform_search(platform: str):
+        async def run() -> list[dict]:
             resp = await search_jobs(sr, platform=platform, user_id=user_id)
             per_platform[platform] = {
                 "count": resp.get("count", 0),
                 "skipped": resp.get("skipped", 0),
                 "skip_reasons": resp.get("skip_reasons", {}),
             }
-            all_jobs.extend(resp.get("jobs") or [])
-        except HTTPException as e:
-            per_platform[platform] = {"error": e.detail}
-        except Exception as e:
-            per_platform[platform] = {"error": str(e)}
-
-    # Deduplicate by apply_url/url.
-    seen: set[str] = set()
-    deduped: list[dict] = []
-    for j in all_jobs:
-        key = str(j.get("apply_url") or j.get("url") or "")
-        if not key:
-            continue
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(j)
+            return resp.get("jobs") or []
+        return run
+
+    fanout = await fan_out(
+        {platform: platform_search(platform) for platform in dict.fromkeys(request.platforms)},
+        key=lambda j: str(j.get("apply_url") or j.get("url") or ""),
+    )
+    for platform, outcome in fanout.platforms.items():
+        entry = per_platform.setdefault(platform, {})
+        entry["elapsed_ms"] = outcome.elapsed_ms
+        if not outcome.ok:
+            entry["error"] = outcome.error
+            entry["timed_out"] = outcome.timed_out
+    # Same posting from several boards (or one the user already applied to) is only considered once.
+    dedupe = get_job_dedupe().session(user_id)
+    deduped = await asyncio.to_thread(dedupe.filter_unique, fanout.items)
 
     deduped.sort(
         key=lambda j: (
@@ -1352,6 +1357,8 @@ async def autopilot_campaign(
         "locations": locations,
         "search_config": search_cfg,
         "platforms": per_platform,
+        "search_ms": fanout.elapsed_ms,
+        "dedupe": dedupe.stats,
         "recommended": selected,
         "apply_result": apply_result,
         "campaign_id": campaign_id,
@@ -1723,6 +1730,22 @@ async def get_application_status(application_id: str, user_id: str = Depends(get
     return application
 
 
+@app.get("/applications/{application_id}/timings")
+async def get_application_timings(application_id: str, user_id: str = Depends(get_current_user)):
+    """Get the per-phase timing spans recorded for an application."""
+    application = await get_application(application_id)
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
+    if application["user_id"] != user_id:
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    spans = await get_apply_spans(application_id)
+    totals: dict = {}
+    for span in spans:
+        totals[span["phase"]] = round(totals.get(span["phase"], 0.0) + span["duration_ms"], 2)
+    return {"application_id": application_id, "spans": spans, "totals_ms": totals}
+
+
 # === AI Endpoints ===
 
 @app.post("/ai/generate-cover-letter")
@@ -1851,6 +1874,103 @@ async def get_admin_stats(admin_key: str = None):
     }
 
 
+@app.get("/admin/apply-timings")
+async def get_apply_timings(admin_key: str = None, platform: Optional[str] = None, days: int = 7):
+    """Per-platform p50/p95 latency of each apply phase over the last ``days``."""
+    expected_key = os.environ.get("ADMIN_KEY", "swiftadmin2026")
+    if admin_key != expected_key:
+        raise HTTPException(status_code=403, detail="Invalid admin key")
+
+    from monitoring.apply_spans import aggregate_phase_latencies
+
+    rows = await list_apply_spans_since(datetime.utcnow() - timedelta(days=max(1, days)), platform=platform)
+    return {
+        "days": days,
+        "applications": len({row["application_id"] for row in rows}),
+        "platforms": aggregate_phase_latencies(rows),
+    }
+
+
+@app.get("/admin/llm-stats")
+async def get_llm_stats(admin_key: str = None):
+    """Request, retry, latency and coalescing metrics for the shared LLM HTTP client."""
+    expected_key = os.environ.get("ADMIN_KEY", "swiftadmin2026")
+    if admin_key != expected_key:
+        raise HTTPException(status_code=403, detail="Invalid admin key")
+
+    from ai.cache.form_structure_cache import get_form_structure_cache
+    from ai.cache.single_flight import get_llm_single_flight
+    from ai.form_intelligence import get_form_intelligence
+    from ai.llm_replay import get_llm_replay_backend
+
+    pregen_worker = getattr(app.state, "pregen_worker", None)
+    replay_backend = get_llm_replay_backend()
+    return {
+        **get_llm_client().get_stats(),
+        "single_flight": get_llm_single_flight().get_stats(),
+        "form_questions": get_form_intelligence().get_stats(),
+        "governor": get_llm_governor().get_stats(),
+        "form_structures": get_form_structure_cache().get_stats(),
+        "pregen": pregen_worker.get_stats() if pregen_worker else None,
+        "replay": replay_backend.get_stats() if replay_backend else None,
+    }
+
+
+@app.get("/admin/job-index")
+async def get_job_index_stats(admin_key: str = None):
+    """Size and activity of the local job index, board sync store and dedupe service."""
+    expected_key = os.environ.get("ADMIN_KEY", "swiftadmin2026")
+    if admin_key != expected_key:
+        raise HTTPException(status_code=403, detail="Invalid admin key")
+
+    from adapters.board_sync import get_board_sync
+
+    return {
+        "index": get_job_index().get_stats(),
+        "board_sync": get_board_sync().get_stats(),
+        "dedupe": get_job_dedupe().get_stats(),
+    }
+
+
+@app.get("/admin/llm-usage")
+async def get_llm_usage(
+    admin_key: str = None,
+    hours: float = 24,
+    group_by: str = "call_site",
+    campaign_id: Optional[str] = None,
+    application_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    backend: Optional[str] = None,
+):
+    """LLM tokens, latency and cost by call site (or another tag), with per-campaign rollups."""
+    expected_key = os.environ.get("ADMIN_KEY", "swiftadmin2026")
+    if admin_key != expected_key:
+        raise HTTPException(status_code=403, detail="Invalid admin key")
+
+    from monitoring.llm_usage import GROUP_COLUMNS, get_llm_usage_ledger
+
+    if group_by not in GROUP_COLUMNS:
+        raise HTTPException(status_code=400, detail=f"group_by must be one of: {', '.join(GROUP_COLUMNS)}")
+
+    ledger = get_llm_usage_ledger()
+    since = time.time() - max(0.0, hours) * 3600
+    filters = {"campaign_id": campaign_id, "application_id": application_id, "user_id": user_id,
+               "backend": backend}
+    rows = ledger.summary(since=since, group_by=group_by, **filters)
+    return {
+        "hours": hours,
+        "group_by": group_by,
+        "totals": {
+            "calls": sum(r["calls"] for r in rows),
+            "errors": sum(r["errors"] for r in rows),
+            "total_tokens": sum(r["total_tokens"] for r in rows),
+            "cost_usd": round(sum(r["cost_usd"] for r in rows), 6),
+        },
+        "rows": rows,
+        "campaigns": ledger.campaign_rollup(campaign_id=campaign_id, since=since),
+    }
+
+
 # === User Activity Logging Helper ===
 
 async def _log_user_activity(user_id: str, action: str, details: dict = None):
@@ -1981,7 +2101,8 @@ async def test_apply_to_folder(
         years_experience=profile.get("years_experience"),
         work_authorization=profile.get("work_authorization", "Yes"),
         sponsorship_required=profile.get("sponsorship_required", "No"),
-        custom_answers=profile.get("custom_answers", {})
+        custom_answers=profile.get("custom_answers", {}),
+        user_id=str(user_id),
     )
     
     for idx, job_file in enumerate(job_files):
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Pre-generation Worker
+
+Looks ahead at the next runnable job_queue items and prepares the LLM work
+before a browser slot picks them up:
+- Fetches job details over HTTP (Greenhouse / Lever APIs, else the queued payload)
+- Generates the cover letter with the same inputs apply_job_url would use
+- Answers the job's screening questions where the board exposes them (Greenhouse);
+  answers land in the answer bank under the user's account id, which is where
+  the live form fill looks them up
+
+Results are stored under the item's payload "pregen" key (the answers there
+are a record of what was prepared; the fill reads them from the bank). Spend is capped by an
+hourly token budget and runs in the governor's suggestions lane, so look-ahead never starves
+live applications. Items the queue worker claims mid-preparation are left to it.
+
+This worker is designed to run inside the FastAPI lifespan task.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+from adapters import detect_platform_from_url, get_adapter
+from ai.form_intelligence import get_form_intelligence
+from ai.llm_governor import LANE_SUGGESTIONS, llm_context
+from api.database import (
+    get_campaign,
+    get_latest_resume,
+    get_profile,
+    is_pregen_candidate,
+    list_pregen_candidates,
+    set_queue_pregen,
+)
+from api.logging_config import logger
+from core.resume_digest import count_tokens, resume_snippet
+
+# Platforms whose job details are available without a browser.
+HTTP_DETAIL_PLATFORMS = {"greenhouse", "lever"}
+
+COVER_LETTER_MAX_TOKENS = 1200
+TOKENS_PER_QUESTION = 120
+
+
+def _platform_id(platform: Any) -> str:
+    return platform.value if hasattr(platform, "value") else str(platform)
+
+
+@dataclass
+class PregenConfig:
+    poll_interval_seconds: float = float(os.getenv("PREGEN_POLL_INTERVAL_SECONDS", "10.0"))
+    lookahead: int = int(os.getenv("PREGEN_LOOKAHEAD", "5"))
+    tokens_per_hour: int = int(os.getenv("PREGEN_TOKENS_PER_HOUR", "60000"))
+
+
+@dataclass
+class PregenWorker:
+    kimi: Any
+    config: PregenConfig = field(default_factory=PregenConfig)
+    _task: Optional[asyncio.Task] = None
+    _stop_event: asyncio.Event = field(default_factory=asyncio.Event)
+    _spent: deque = field(default_factory=deque)  # (monotonic ts, estimated tokens)
+    stats: dict = field(default_factory=lambda: {
+        "prepared": 0, "skipped": 0, "errors": 0, "budget_deferred": 0, "tokens_est": 0,
+    })
+
+    def start(self):
+        if self._task and not self._task.done():
+            return
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self.run_loop(), name="pregen-worker")
+        logger.info("PregenWorker started")
+
+    async def stop(self):
+        self._stop_event.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except Exception:
+                pass
+        logger.info("PregenWorker stopped")
+
+    async def run_loop(self):
+        while not self._stop_event.is_set():
+            try:
+                await self.run_once()
+                await asyncio.sleep(self.config.poll_interval_seconds)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"PregenWorker loop error: {e}")
+                await asyncio.sleep(2.0)
+
+    async def run_once(self) -> int:
+        """Prepare up to ``lookahead`` items; returns how many were stored."""
+        done = 0
+        for item in await list_pregen_candidates(self.config.lookahead):
+            if await self._prepare_item(item):
+                done += 1
+        return done
+
+    def budget_remaining(self) -> int:
+        cutoff = time.monotonic() - 3600
+        while self._spent and self._spent[0][0] < cutoff:
+            self._spent.popleft()
+        return self.config.tokens_per_hour - sum(t for _, t in self._spent)
+
+    def get_stats(self) -> dict:
+        return {**self.stats, "budget_remaining": self.budget_remaining()}
+
+    async def _prepare_item(self, item: dict) -> bool:
+        queue_id = str(item["id"])
+        user_id = str(item["user_id"])
+        job_url = str(item["job_url"])
+        payload = item.get("payload") or {}
+
+        try:
+            camp = await get_campaign(str(item.get("campaign_id") or ""))
+            camp_cfg = (camp or {}).get("config") or {}
+            resume = await get_latest_resume(user_id)
+            profile = await get_profile(user_id)
+            if not resume or not profile:
+                # Nothing to prepare yet; check again on a later cycle.
+                return False
+
+            platform_id = (item.get("platform") or "").strip() or _platform_id(detect_platform_from_url(job_url))
+            job, questions = await self._fetch_job(platform_id, job_url, payload)
+            if not job.get("description") and not questions:
+                self.stats["skipped"] += 1
+                await set_queue_pregen(queue_id, {"skipped": "no job details without a browser"})
+                return True
+
+            generate_cover_letter = bool(camp_cfg.get("generate_cover_letter", True))
+            cover_snippet = resume_snippet(resume, "cover_letter")
+            estimate = 0
+            if generate_cover_letter:
+                estimate += count_tokens(cover_snippet) + count_tokens(job["description"][:2000]) + COVER_LETTER_MAX_TOKENS
+            if questions:
+                estimate += TOKENS_PER_QUESTION * len(questions) + 200
+            if not await is_pregen_candidate(queue_id):
+                # Claimed by the queue worker (or prepared) while we fetched details.
+                self.stats["skipped"] += 1
+                return False
+            if estimate > self.budget_remaining():
+                # Leave it for a later cycle (or for the live apply path).
+                self.stats["budget_deferred"] += 1
+                return False
+            self._spent.append((time.monotonic(), estimate))
+            self.stats["tokens_est"] += estimate
+
+            pregen: dict[str, Any] = {
+                "job": job,
+                "generated_at": datetime.now().isoformat(),
+                "tokens_est": estimate,
+            }
+            # Speculative work: lowest lane, so it stays inside LLM_BACKGROUND_SHARE.
+            with llm_context(lane=LANE_SUGGESTIONS, user_id=user_id, campaign_id=item.get("campaign_id")):
+                if generate_cover_letter:
+                    pregen["cover_letter"] = await self.kimi.generate_cover_letter(
+                        resume_summary=cover_snippet,
+                        job_title=job["title"] or "Position",
+                        company_name=job["company"] or "Company",
+                        job_requirements=job["description"][:2000],
+                        tone=str(camp_cfg.get("cover_letter_tone") or "professional"),
+                    )
+                if questions:
+                    answers = await get_form_intelligence().answer_questions(
+                        questions,
+                        profile={**profile, "user_id": user_id},
+                        resume_text=resume_snippet(resume, "questions"),
+                        job_description=job["description"][:1000],
+                    )
+                    pregen["answers"] = {q["question"]: a for q, a in zip(questions, answers)}
+
+            await set_queue_pregen(queue_id, pregen)
+            self.stats["prepared"] += 1
+            logger.info(f"[Pregen] Prepared {queue_id} ({platform_id}, ~{estimate} tokens)")
+            return True
+
+        except Exception as e:
+            # Record the failure so the item isn't retried every cycle.
+            self.stats["errors"] += 1
+            logger.warning(f"[Pregen] Failed for {queue_id}: {e}")
+            await set_queue_pregen(queue_id, {"error": str(e)[:300]})
+            return True
+
+    async def _fetch_job(self, platform_id: str, job_url: str, payload: dict) -> tuple[dict, list]:
+        """Job details and screening questions, without a browser."""
+        job = {
+            "title": str(payload.get("title") or ""),
+            "company": str(payload.get("company") or ""),
+            "description": str(payload.get("description") or ""),
+        }
+        questions: list = []
+        if platform_id not in HTTP_DETAIL_PLATFORMS:
+            return job, questions
+
+        adapter = get_adapter(platform_id, None, use_unified=False)
+        try:
+            posting = await adapter.get_job_details(job_url)
+            job = {
+                "title": posting.title or job["title"],
+                "company": posting.company or job["company"],
+                "description": posting.description or job["description"],
+            }
+            if hasattr(adapter, "get_application_questions"):
+                questions = await adapter.get_application_questions(job_url)
+        finally:
+            await adapter.close()
+        return job, questions
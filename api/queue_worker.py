@@ -30,6 +30,8 @@ from api.database import (
 )
 from api.logging_config import logger
 from adapters import detect_platform_from_url
+from core.job_dedupe import get_job_dedupe
+from core.step_checkpoints import get_step_checkpoint_store
 
 
 def _platform_id(platform: Any) -> str:
@@ -121,6 +123,12 @@ class QueueWorker:
         if not platform_id:
             platform_id = _platform_id(detect_platform_from_url(job_url))
 
+        # The same posting may have been applied to from another board or campaign.
+        posting = {"url": job_url, **(item.get("payload") or {})}
+        if await asyncio.to_thread(get_job_dedupe().has_applied, user_id, posting):
+            await self._finish_item(queue_id, status="skipped", last_error="Already applied to this posting")
+            return
+
         cooldown_key = (user_id, platform_id)
         cooldown_until = self._platform_cooldowns.get(cooldown_key)
         if cooldown_until and cooldown_until > _now():
@@ -164,15 +172,19 @@ class QueueWorker:
                     cover_letter_tone=cover_letter_tone,
                     campaign_id=campaign_id or None,
                     queue_item_id=queue_id,
+                    pregenerated=(item.get("payload") or {}).get("pregen"),
                 ),
             )
 
             # Terminal outcomes: submitted / pending_review / external_application / etc.
-            await mark_queue_item_completed(
+            await self._finish_item(
                 queue_id,
                 application_id=record.get("id"),
                 status="completed",
             )
+            # Failed attempts and unsubmitted reviews stay eligible for another try.
+            if record.get("status") == "submitted":
+                await asyncio.to_thread(get_job_dedupe().mark_applied, user_id, posting, record.get("id"))
 
         except RateLimitError as e:
             err = str(e)
@@ -185,7 +197,7 @@ class QueueWorker:
                 await set_campaign_status(campaign_id, "paused", last_error=err)
 
             if attempts + 1 >= max_attempts:
-                await mark_queue_item_completed(queue_id, status="failed", last_error=err)
+                await self._finish_item(queue_id, status="failed", last_error=err)
                 if campaign_id:
                     await set_campaign_status(campaign_id, "paused", last_error=f"Rate limited: {err}")
                 return
@@ -201,7 +213,7 @@ class QueueWorker:
         except Exception as e:
             err = str(e)
             if _is_permanent_error(err) or attempts + 1 >= max_attempts:
-                await mark_queue_item_completed(queue_id, status="failed", last_error=err)
+                await self._finish_item(queue_id, status="failed", last_error=err)
                 if campaign_id:
                     await set_campaign_status(campaign_id, "paused", last_error=err)
                 return
@@ -214,6 +226,14 @@ class QueueWorker:
                 last_error=err,
             )
 
+    async def _finish_item(self, queue_id: str, **kwargs: Any) -> None:
+        """Mark a queue item terminal and drop its step checkpoint."""
+        await mark_queue_item_completed(queue_id, **kwargs)
+        try:
+            await asyncio.to_thread(get_step_checkpoint_store().clear, queue_id)
+        except Exception as e:
+            logger.debug(f"Checkpoint cleanup failed for {queue_id}: {e}")
+
     def _compute_backoff_seconds(self, attempt_number: int, *, is_rate_limit: bool) -> float:
         base = self.config.base_retry_delay_seconds
         if is_rate_limit:
@@ -15,8 +15,7 @@ from dataclasses import dataclass
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from jobspy import scrape_jobs
-import pandas as pd
+from adapters.jobspy_pool import get_jobspy_pool, shutdown_jobspy_pool
 
 
 @dataclass
@@ -101,11 +100,11 @@ class JobURLCollector:
                 print(f"Searching: {role} in {location}...")
                 
                 try:
-                    jobs = self._search_jobs(role, location)
+                    jobs = await self._search_jobs(role, location)
                     
                     new_jobs = 0
-                    for _, job in jobs.iterrows():
-                        url = job.get('job_url', '')
+                    for job in jobs:
+                        url = job.get('job_url') or ''
                         
                         # Skip duplicates
                         if not url or url in seen_urls:
@@ -124,14 +123,14 @@ class JobURLCollector:
                             "company": job.get('company', ''),
                             "location": job.get('location', ''),
                             "url": url,
-                            "description": str(job.get('description', ''))[:200],
+                            "description": str(job.get('description') or '')[:200],
                             "is_remote": job.get('is_remote', False),
                             "min_amount": job.get('min_amount'),
                             "max_amount": job.get('max_amount'),
                             "currency": job.get('currency', 'USD'),
                             "interval": job.get('interval'),
                             "site": job.get('site', 'unknown'),
-                            "date_posted": str(job.get('date_posted', '')),
+                            "date_posted": str(job.get('date_posted') or ''),
                             "search_role": role,
                             "search_location": location
                         }
@@ -161,11 +160,11 @@ class JobURLCollector:
         
         return self.collected_jobs
     
-    def _search_jobs(self, role: str, location: str) -> pd.DataFrame:
-        """Search jobs using JobSpy"""
+    async def _search_jobs(self, role: str, location: str) -> List[Dict]:
+        """Search jobs using JobSpy (in the JobSpy process pool; compact records)"""
         is_remote = location == "Remote"
         
-        jobs = scrape_jobs(
+        jobs = await get_jobspy_pool().scrape(
             site_name=["linkedin", "indeed", "zip_recruiter"],
             search_term=role,
             location="" if is_remote else location,
@@ -275,7 +274,10 @@ async def main():
     collector = JobURLCollector(KENT_CRITERIA)
     
     # Collect jobs
-    jobs = await collector.collect_all(target_count=args.count)
+    try:
+        jobs = await collector.collect_all(target_count=args.count)
+    finally:
+        shutdown_jobspy_pool()
     
     # Print summary
     collector.print_summary()
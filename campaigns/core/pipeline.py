@@ -11,6 +11,8 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 
+from core.job_dedupe import DedupeSession, get_job_dedupe
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,15 +26,24 @@ class PipelineConfig:
     scrape_delay_seconds: float = 3.0
     apply_delay_seconds: float = 10.0
     max_retries: int = 3
+    user_id: Optional[str] = None  # Keys the persistent "already applied" index
+
+
+def _applied(result: Any) -> bool:
+    """Whether an applier result reports success (True, or a result/dict with a truthy ``success``)."""
+    if isinstance(result, dict):
+        return bool(result.get('success'))
+    return bool(getattr(result, 'success', result))
 
 
 class JobQueue:
     """Async queue with deduplication and statistics."""
     
-    def __init__(self, maxsize: int = 200):
+    def __init__(self, maxsize: int = 200, dedupe: Optional[DedupeSession] = None):
         self._queue = asyncio.Queue(maxsize=maxsize)
         self._seen = set()
         self._lock = asyncio.Lock()
+        self.dedupe = dedupe  # also drops copies of the same posting from other boards
         self.stats = {
             'added': 0,
             'duplicate': 0,
@@ -45,6 +56,13 @@ class JobQueue:
             if item_id and item_id in self._seen:
                 self.stats['duplicate'] += 1
                 return False
+            # Checked before dedupe, so a dropped item isn't remembered as seen
+            if self._queue.full():
+                self.stats['dropped'] += 1
+                return False
+            if self.dedupe and item is not None and self.dedupe.is_duplicate(item):
+                self.stats['duplicate'] += 1
+                return False
             
             try:
                 self._queue.put_nowait(item)
@@ -87,7 +105,10 @@ class CampaignPipeline:
     
     def __init__(self, config: Optional[PipelineConfig] = None):
         self.config = config or PipelineConfig()
-        self.queue = JobQueue(maxsize=self.config.max_queue_size)
+        self.queue = JobQueue(
+            maxsize=self.config.max_queue_size,
+            dedupe=get_job_dedupe().session(self.config.user_id),
+        )
         self.stop_event = asyncio.Event()
         self.stats = {
             'producer_jobs_added': 0,
@@ -109,7 +130,8 @@ class CampaignPipeline:
         
         Args:
             scraper_func: async function that yields jobs
-            applier_func: async function that applies to a job
+            applier_func: async function that applies to a job (returns a truthy
+                result, or one with a truthy ``success``, when it applied)
             target_jobs: total number of jobs to process
         """
         self.stats['start_time'] = datetime.now()
@@ -217,8 +239,10 @@ class CampaignPipeline:
                 
                 # Apply to job
                 try:
-                    await applier_func(job)
+                    result = await applier_func(job)
                     self.stats['consumer_jobs_processed'] += 1
+                    if _applied(result):
+                        get_job_dedupe().mark_applied(self.config.user_id, job)
                 except Exception as e:
                     logger.error(f"[Consumer] Apply error: {e}")
                     self.stats['consumer_errors'] += 1
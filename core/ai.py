@@ -10,20 +10,14 @@ import os
 import json
 import asyncio
 import logging
-import ssl
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from datetime import datetime
 
-import aiohttp
+from ai.llm_client import get_llm_client
 
 logger = logging.getLogger(__name__)
 
-# Create SSL context that skips verification (for development only)
-ssl_context = ssl.create_default_context()
-ssl_context.check_hostname = False
-ssl_context.verify_mode = ssl.CERT_NONE
-
 
 @dataclass
 class AIResponse:
@@ -95,7 +89,8 @@ class UnifiedAIService:
         prompt: str,
         system_prompt: Optional[str] = None,
         temperature: float = 0.1,
-        max_tokens: int = 2000
+        max_tokens: int = 2000,
+        call_site: str = "core_ai"
     ) -> AIResponse:
         """
         Get completion from AI.
@@ -105,6 +100,7 @@ class UnifiedAIService:
             system_prompt: Optional system prompt
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            call_site: Name recorded in the LLM usage ledger
             
         Returns:
             AIResponse with completion text
@@ -116,56 +112,48 @@ class UnifiedAIService:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
         
-        for attempt in range(self.max_retries):
-            try:
-                connector = aiohttp.TCPConnector(ssl=ssl_context)
-                async with aiohttp.ClientSession(connector=connector) as session:
-                    async with session.post(
-                        f"{self.base_url}/chat/completions",
-                        headers={"Authorization": f"Bearer {self.api_key}"},
-                        json={
-                            "model": self.model,
-                            "messages": messages,
-                            "temperature": temperature,
-                            "max_tokens": max_tokens
-                        },
-                        timeout=self.timeout
-                    ) as response:
-                        data = await response.json()
-                        
-                        if "choices" in data:
-                            content = data["choices"][0]["message"]["content"]
-                            duration = (asyncio.get_event_loop().time() - start_time) * 1000
-                            
-                            return AIResponse(
-                                success=True,
-                                content=content,
-                                tokens_used=data.get("usage", {}).get("total_tokens"),
-                                duration_ms=duration
-                            )
-                        else:
-                            error = data.get("error", {}).get("message", "Unknown error")
-                            raise Exception(error)
+        try:
+            data = await get_llm_client().chat_completion(
+                f"{self.base_url}/chat/completions",
+                self.api_key,
+                {
+                    "model": self.model,
+                    "messages": messages,
+                    "temperature": temperature,
+                    "max_tokens": max_tokens
+                },
+                timeout=self.timeout,
+                max_retries=self.max_retries,
+                call_site=call_site,
+            )
+            
+            if "choices" in data:
+                content = data["choices"][0]["message"]["content"]
+                duration = (asyncio.get_event_loop().time() - start_time) * 1000
+                
+                return AIResponse(
+                    success=True,
+                    content=content,
+                    tokens_used=data.get("usage", {}).get("total_tokens"),
+                    duration_ms=duration
+                )
+            raise Exception(data.get("error", {}).get("message", "Unknown error"))
                             
-            except Exception as e:
-                logger.warning(f"AI request failed (attempt {attempt + 1}): {e}")
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(1 * (attempt + 1))
-                else:
-                    return AIResponse(
-                        success=False,
-                        content="",
-                        error=str(e),
-                        duration_ms=(asyncio.get_event_loop().time() - start_time) * 1000
-                    )
-        
-        return AIResponse(success=False, content="", error="Max retries exceeded")
+        except Exception as e:
+            logger.warning(f"AI request failed: {e}")
+            return AIResponse(
+                success=False,
+                content="",
+                error=str(e),
+                duration_ms=(asyncio.get_event_loop().time() - start_time) * 1000
+            )
     
     async def extract_json(
         self,
         text: str,
         schema: Dict[str, Any],
-        instructions: Optional[str] = None
+        instructions: Optional[str] = None,
+        call_site: str = "core_ai"
     ) -> Dict[str, Any]:
         """
         Extract structured JSON data from text.
@@ -192,7 +180,7 @@ TEXT:
 
 Respond with ONLY valid JSON matching the schema. No markdown, no explanation."""
 
-        response = await self.complete(prompt, max_tokens=2000)
+        response = await self.complete(prompt, max_tokens=2000, call_site=call_site)
         
         if not response.success:
             logger.error(f"JSON extraction failed: {response.error}")
@@ -258,6 +246,7 @@ Respond with JSON:
 }}"""
 
         return await self.extract_json(
+            call_site="tailoring",
             text="",  # Not used, prompt contains everything
             schema={
                 "summary": "string",
@@ -296,7 +285,7 @@ Instructions:
 
 Write only the cover letter text:"""
 
-        response = await self.complete(prompt, max_tokens=1500)
+        response = await self.complete(prompt, max_tokens=1500, call_site="cover_letter")
         return response.content if response.success else ""
     
     async def parse_resume(self, resume_text: str) -> Dict[str, Any]:
@@ -334,7 +323,8 @@ Extract all relevant information."""
 
         return await self.extract_json(
             text=prompt,
-            schema=schema
+            schema=schema,
+            call_site="resume_parse"
         )
     
     async def answer_question(
@@ -358,7 +348,7 @@ Instructions:
 2. Be concise but complete
 3. If the question asks about something not in the profile, answer based on general professional standards"""
 
-        response = await self.complete(prompt, max_tokens=500)
+        response = await self.complete(prompt, max_tokens=500, call_site="question_answer")
         return response.content.strip() if response.success else ""
 
 
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Per-Profile Answer Bank
+
+Persistent store of screening-question answers keyed by (user, normalized
+question, option set). Once a user's "Are you authorized to work in the US?"
+has been answered, every later campaign and process reuses that answer
+instead of asking the LLM again.
+
+Lookups try the exact normalized question first, then the closest stored
+question for the same user and option set whose similarity clears
+``ANSWER_BANK_MATCH_THRESHOLD``. A fuzzy match also needs the same content
+words (stopwords aside, only spelling variants may differ), so "Are you
+authorised to work in the U.S.?" reuses the answer but "...in the UK?" or
+"...years of Java?" for a stored "...years of Python?" do not. Answers a
+user sets themselves are overrides: they are never replaced by generated
+answers.
+
+Fuzzy candidates are narrowed in SQL by question length (a similarity of
+``ANSWER_BANK_MATCH_THRESHOLD`` bounds how much lengths can differ), and
+reuse counts are buffered in memory and written with the next store or
+listing rather than with every lookup. Async callers run the bank in a
+worker thread (``asyncio.to_thread``).
+
+Example:
+    from core.answer_bank import get_answer_bank
+
+    bank = get_answer_bank()
+    answer = bank.lookup(user_id, question, options)
+    if answer is None:
+        answer = await generate(question)
+        bank.store(user_id, question, options, answer)
+"""
+
+import re
+import hashlib
+import sqlite3
+import logging
+import threading
+from collections import Counter
+from datetime import datetime
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from api.config import config
+from core.step_checkpoints import normalize_question
+
+logger = logging.getLogger(__name__)
+
+SOURCE_GENERATED = "generated"
+SOURCE_USER = "user"
+
+STOPWORDS = frozenset(
+    "a an and any are as at be by can could do does for from have has how i if in is it me "
+    "of on or our please the this to was what when where which will with would you your".split()
+)
+# Content words this close are spelling variants (authorised / authorized).
+SPELLING_VARIANT_RATIO = 0.85
+# Buffered reuse counts are written once this many are pending.
+USES_FLUSH_THRESHOLD = 50
+
+
+def options_key(options: Optional[Sequence[str]]) -> str:
+    """Order-insensitive key for an option set; free-text questions use ''."""
+    cleaned = sorted({normalize_question(o) for o in (options or []) if (o or "").strip()})
+    if not cleaned:
+        return ""
+    return hashlib.sha256("\x1f".join(cleaned).encode()).hexdigest()[:16]
+
+
+def content_tokens(question: str) -> Set[str]:
+    """Words of a question that carry its meaning (stopwords dropped, "u.s." -> "us")."""
+    text = re.sub(r"(?<=\b\w)\.", "", normalize_question(question))
+    return {token for token in re.findall(r"\w+", text) if token not in STOPWORDS}
+
+
+def _same_token(a: str, b: str) -> bool:
+    if a == b:
+        return True
+    # Numbers and short words (US / UK) must match exactly.
+    if min(len(a), len(b)) < 5 or any(ch.isdigit() for ch in a + b):
+        return False
+    return SequenceMatcher(None, a, b).ratio() >= SPELLING_VARIANT_RATIO
+
+
+def question_similarity(a: str, b: str) -> float:
+    """
+    Similarity of two normalized questions in [0, 1].
+
+    0 unless every content word of each question has a counterpart in the
+    other, so questions differing in a noun or number never match.
+    """
+    tokens_a, tokens_b = content_tokens(a), content_tokens(b)
+    if not all(any(_same_token(x, y) for y in tokens_b) for x in tokens_a):
+        return 0.0
+    if not all(any(_same_token(y, x) for x in tokens_a) for y in tokens_b):
+        return 0.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def _length_bounds(length: int, threshold: float) -> Tuple[int, int]:
+    """
+    Lengths a string can have and still reach ``threshold`` similarity with one of ``length``.
+    SequenceMatcher's ratio is at most 2*min/(len_a+len_b).
+    """
+    if threshold <= 0:
+        return 0, 2 ** 31
+    factor = threshold / (2 - threshold)
+    return int(length * factor), int(length / factor) + 1
+
+
+class AnswerBank:
+    """SQLite-backed per-user answer bank with fuzzy question matching."""
+
+    def __init__(self, db_path: Optional[str] = None, threshold: Optional[float] = None):
+        self.db_path = Path(db_path or config.ANSWER_BANK_DB)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.threshold = config.ANSWER_BANK_MATCH_THRESHOLD if threshold is None else threshold
+        self.stats = {'exact_hits': 0, 'fuzzy_hits': 0, 'misses': 0, 'stored': 0}
+        self._pending_uses: Counter = Counter()
+        self._uses_lock = threading.Lock()
+        self._init_db()
+
+    def _init_db(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS answer_bank (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_key TEXT NOT NULL,
+                    question_norm TEXT NOT NULL,
+                    options_key TEXT NOT NULL DEFAULT '',
+                    question TEXT NOT NULL,
+                    answer TEXT NOT NULL,
+                    source TEXT NOT NULL DEFAULT 'generated',
+                    uses INTEGER DEFAULT 0,
+                    created_at TIMESTAMP,
+                    updated_at TIMESTAMP,
+                    UNIQUE(user_key, question_norm, options_key)
+                )
+            """)
+            conn.commit()
+
+    def lookup(self, user_key: Optional[str], question: str, options: Optional[Sequence[str]] = None) -> Optional[str]:
+        """Stored answer for this user's question and option set, or None."""
+        norm = normalize_question(question)
+        if not user_key or not norm:
+            return None
+        okey = options_key(options)
+
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT id, answer FROM answer_bank WHERE user_key = ? AND question_norm = ? AND options_key = ?",
+                (user_key, norm, okey),
+            ).fetchone()
+            hit = 'exact_hits' if row else None
+
+            if row is None and self.threshold < 1.0:
+                best, best_score = None, self.threshold
+                low, high = _length_bounds(len(norm), self.threshold)
+                for row_id, stored_norm, answer in conn.execute(
+                    """SELECT id, question_norm, answer FROM answer_bank
+                       WHERE user_key = ? AND options_key = ? AND length(question_norm) BETWEEN ? AND ?""",
+                    (user_key, okey, low, high),
+                ):
+                    score = question_similarity(norm, stored_norm)
+                    if score >= best_score:
+                        best, best_score = (row_id, answer), score
+                if best:
+                    row, hit = best, 'fuzzy_hits'
+                    logger.debug(f"[AnswerBank] Fuzzy match ({best_score:.2f}) for '{question[:60]}'")
+
+        if row is None:
+            self.stats['misses'] += 1
+            return None
+
+        self.stats[hit] += 1
+        with self._uses_lock:
+            self._pending_uses[row[0]] += 1
+            pending = sum(self._pending_uses.values())
+        if pending >= USES_FLUSH_THRESHOLD:
+            self.flush_uses()
+        return row[1]
+
+    def flush_uses(self, conn: Optional[sqlite3.Connection] = None):
+        """Write buffered reuse counts (inside ``conn``'s transaction when given)."""
+        with self._uses_lock:
+            pending, self._pending_uses = self._pending_uses, Counter()
+        if not pending:
+            return
+        sql = "UPDATE answer_bank SET uses = uses + ? WHERE id = ?"
+        rows = [(n, row_id) for row_id, n in pending.items()]
+        if conn is not None:
+            conn.executemany(sql, rows)
+            return
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(sql, rows)
+            conn.commit()
+
+    def store(
+        self,
+        user_key: Optional[str],
+        question: str,
+        options: Optional[Sequence[str]],
+        answer: Any,
+        source: str = SOURCE_GENERATED,
+    ) -> bool:
+        """
+        Save an answer. Generated answers never replace a user override.
+
+        Returns:
+            True if the answer was written
+        """
+        norm = normalize_question(question)
+        if not user_key or not norm or answer is None:
+            return False
+
+        now = datetime.now().isoformat()
+        with sqlite3.connect(self.db_path) as conn:
+            self.flush_uses(conn)
+            written = conn.execute(
+                """
+                INSERT INTO answer_bank (user_key, question_norm, options_key, question, answer, source, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(user_key, question_norm, options_key) DO UPDATE SET
+                    question = excluded.question,
+                    answer = excluded.answer,
+                    source = excluded.source,
+                    updated_at = excluded.updated_at
+                WHERE answer_bank.source != 'user' OR excluded.source = 'user'
+                """,
+                (user_key, norm, options_key(options), question.strip(), str(answer), source, now, now),
+            ).rowcount
+            conn.commit()
+
+        if written:
+            self.stats['stored'] += 1
+        return bool(written)
+
+    def set_override(self, user_key: str, question: str, options: Optional[Sequence[str]], answer: str) -> bool:
+        """Record a user's own answer; it takes precedence over generated ones."""
+        return self.store(user_key, question, options, answer, source=SOURCE_USER)
+
+    def list_answers(self, user_key: str) -> List[Dict[str, Any]]:
+        with sqlite3.connect(self.db_path) as conn:
+            self.flush_uses(conn)
+            conn.commit()
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(
+                """SELECT id, question, answer, source, options_key, uses, updated_at
+                   FROM answer_bank WHERE user_key = ? ORDER BY uses DESC, updated_at DESC""",
+                (user_key,),
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+    def delete(self, user_key: str, answer_id: int) -> bool:
+        with sqlite3.connect(self.db_path) as conn:
+            deleted = conn.execute(
+                "DELETE FROM answer_bank WHERE id = ? AND user_key = ?", (answer_id, user_key)
+            ).rowcount
+            conn.commit()
+        return bool(deleted)
+
+    def get_stats(self) -> Dict[str, Any]:
+        hits = self.stats['exact_hits'] + self.stats['fuzzy_hits']
+        total = hits + self.stats['misses']
+        return {
+            **self.stats,
+            'hit_rate': f"{(hits / total * 100) if total else 0:.1f}%",
+            'threshold': self.threshold,
+        }
+
+
+# Singleton
+_answer_bank: Optional[AnswerBank] = None
+
+
+def get_answer_bank() -> AnswerBank:
+    """Get singleton AnswerBank instance."""
+    global _answer_bank
+    if _answer_bank is None:
+        _answer_bank = AnswerBank()
+    return _answer_bank
@@ -154,12 +154,14 @@ class UnifiedBrowserManager:
         
         return self
     
-    async def create_session(self, platform: str = "generic") -> BrowserSession:
+    async def create_session(self, platform: str = "generic", user_id: Optional[str] = None) -> BrowserSession:
         """
         Create a new browser session.
         
         Args:
             platform: Platform identifier for metadata
+            user_id: If given, seed the session from the user's stored
+                storage-state snapshot for this platform
             
         Returns:
             BrowserSession instance
@@ -185,12 +187,14 @@ class UnifiedBrowserManager:
                 )
             else:
                 # Use basic BrowserBase + Playwright
-                session_id = await self._create_basic_session(platform)
-                return session_id
+                session = await self._create_basic_session(platform)
             
             self._sessions[session.session_id] = session
             logger.info(f"Created browser session: {session.session_id} ({session.metadata.get('mode', 'basic')} mode)")
             
+            if user_id:
+                await self._seed_storage_state(session, user_id, platform)
+            
             return session
         except Exception as e:
             logger.error(f"Failed to create session: {e}")
@@ -239,6 +243,43 @@ class UnifiedBrowserManager:
         logger.info(f"Created basic browser session: {session_id}")
         return session
     
+    @staticmethod
+    def _session_context(session: BrowserSession):
+        """Get the Playwright browser context behind a session."""
+        return session.metadata.get("context") or getattr(session.page, "context", None)
+    
+    async def _seed_storage_state(self, session: BrowserSession, user_id: str, platform: str) -> bool:
+        """Seed a new session from the user's stored snapshot, if one exists."""
+        from core.storage_state import get_storage_state_store
+        
+        session.metadata["user_id"] = user_id
+        store = get_storage_state_store()
+        state = store.load(user_id, platform)
+        seeded = bool(state) and await store.apply_to_context(self._session_context(session), state)
+        session.metadata["storage_state_seeded"] = seeded
+        if seeded:
+            logger.info(f"Seeded session {session.session_id} from {platform} storage-state snapshot")
+        return seeded
+    
+    async def save_storage_state(self, session: BrowserSession, user_id: Optional[str] = None) -> bool:
+        """
+        Refresh the stored snapshot from a session after a successful run.
+        
+        Skips (and invalidates) the snapshot if the page ended on a login wall.
+        """
+        from core.storage_state import get_storage_state_store, is_logged_out_url
+        
+        user_id = user_id or session.metadata.get("user_id")
+        platform = session.metadata.get("platform", "generic")
+        if not user_id:
+            return False
+        
+        store = get_storage_state_store()
+        if is_logged_out_url(getattr(session.page, "url", "")):
+            store.invalidate(user_id, platform)
+            return False
+        return await store.capture_and_save(self._session_context(session), user_id, platform)
+    
     async def get_session(self, session_id: str) -> Optional[BrowserSession]:
         """Get an existing session by ID."""
         return self._sessions.get(session_id)
@@ -272,9 +313,9 @@ class UnifiedBrowserManager:
             await self.close_session(session_id)
         logger.info("All browser sessions closed")
     
-    async def create_stealth_session(self, platform: str = "generic") -> BrowserSession:
+    async def create_stealth_session(self, platform: str = "generic", user_id: Optional[str] = None) -> BrowserSession:
         """Alias for create_session (stealth is enabled by default)."""
-        return await self.create_session(platform)
+        return await self.create_session(platform, user_id=user_id)
 
     async def human_like_delay(self, min_seconds: float = 1.0, max_seconds: float = 3.0):
         """Wait for a random duration to simulate human-like behavior."""
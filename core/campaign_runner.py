@@ -26,6 +26,9 @@ from core.models import (
 )
 from core.browser import UnifiedBrowserManager
 from core.ai import UnifiedAIService
+from core.job_dedupe import get_job_dedupe
+from core.job_index import index_jobs_async
+from core.search_fanout import DEFAULT_PLATFORM_TIMEOUT, fan_out
 from adapters import UnifiedPlatformAdapter, get_adapter
 
 logger = logging.getLogger(__name__)
@@ -46,7 +49,9 @@ class CampaignConfig:
     exclude_companies: List[str] = field(default_factory=list)
     exclude_titles: List[str] = field(default_factory=list)
     delay_between_applications: Tuple[int, int] = (30, 60)
-    delay_between_platforms: int = 300
+    delay_between_platforms: int = 300  # no longer applied: platform searches run concurrently
+    search_timeout: float = DEFAULT_PLATFORM_TIMEOUT  # per platform
+    max_concurrent_searches: int = 4
     max_concurrent: int = 1
     retry_attempts: int = 3
     retry_delay: int = 300
@@ -55,6 +60,7 @@ class CampaignConfig:
     save_screenshots: bool = True
     generate_report: bool = True
     use_unified_adapter: bool = False  # Use legacy adapters (unified requires OpenAI)
+    user_id: Optional[str] = None  # "Already applied" index key (defaults to the applicant's email)
 
 
 @dataclass
@@ -113,6 +119,7 @@ class CampaignRunner:
         self.ai = UnifiedAIService()
         self.results: List[ApplicationResult] = []
         self.platform_counts: Dict[str, int] = {}
+        self._user_key = config.user_id or getattr(config.applicant_profile, 'email', None)
         
         # Create output directory
         self.config.output_dir.mkdir(parents=True, exist_ok=True)
@@ -133,7 +140,7 @@ class CampaignRunner:
             all_jobs = await self._search_all_platforms()
             
             # 2. Filter and rank jobs
-            filtered_jobs = self._filter_jobs(all_jobs)
+            filtered_jobs = await self._filter_jobs(all_jobs)
             
             # 3. Apply to each job
             for i, job in enumerate(filtered_jobs[:self.config.max_applications]):
@@ -142,6 +149,8 @@ class CampaignRunner:
                 # Apply with retry
                 result = await self._apply_with_retry(job)
                 self.results.append(result)
+                if result.success:
+                    await asyncio.to_thread(get_job_dedupe().mark_applied, self._user_key, job, result.confirmation_id)
                 
                 # Update stats
                 platform_key = job.platform.value if hasattr(job.platform, 'value') else str(job.platform)
@@ -227,11 +236,10 @@ class CampaignRunner:
             except Exception as e:
                 logger.error(f"❌ Failed to load job file: {e}")
         
-        # Search via adapters
-        for platform_name in self.config.platforms:
-            try:
+        # Search via adapters, all platforms at once
+        def platform_search(platform_name: str):
+            async def run() -> List[JobPosting]:
                 logger.info(f"🔍 Searching {platform_name}...")
-                
                 if self.config.use_unified_adapter:
                     # Use new unified adapter
                     adapter = UnifiedPlatformAdapter(
@@ -242,37 +250,40 @@ class CampaignRunner:
                 else:
                     # Use legacy adapter
                     adapter = get_adapter(platform_name, self.browser)
-                
-                jobs = await adapter.search_jobs(self.config.search_criteria)
-                logger.info(f"✅ Found {len(jobs)} jobs on {platform_name}")
-                all_jobs.extend(jobs)
-                
-                # Delay between platforms
-                if platform_name != self.config.platforms[-1]:
-                    await asyncio.sleep(self.config.delay_between_platforms)
-                    
-            except Exception as e:
-                logger.error(f"❌ Failed to search {platform_name}: {e}")
-                continue
+                return await adapter.search_jobs(self.config.search_criteria)
+            return run
+        
+        fanout = await fan_out(
+            {name: platform_search(name) for name in dict.fromkeys(self.config.platforms)},
+            key=lambda job: job.url or f"{job.company}_{job.title}",
+            timeout=self.config.search_timeout,
+            max_concurrency=self.config.max_concurrent_searches,
+        )
+        for name, outcome in fanout.platforms.items():
+            if outcome.ok:
+                logger.info(f"✅ Found {outcome.count} jobs on {name}")
+            else:
+                logger.error(f"❌ Failed to search {name}: {outcome.error}")
+        all_jobs.extend(fanout.items)
+        await index_jobs_async(fanout.items)
         
-        logger.info(f"📊 Total jobs found: {len(all_jobs)}")
+        logger.info(f"📊 Total jobs found: {len(all_jobs)} in {fanout.elapsed_ms / 1000:.1f}s")
         return all_jobs
     
-    def _filter_jobs(self, jobs: List[JobPosting]) -> List[JobPosting]:
+    async def _filter_jobs(self, jobs: List[JobPosting]) -> List[JobPosting]:
         """Filter and rank jobs based on criteria."""
         filtered = []
-        seen = set()
         
         # Get allowed platforms from config
         allowed_platforms = set(p.lower() for p in self.config.platforms)
         
-        for job in jobs:
-            # Deduplicate
-            key = f"{job.company}_{job.title}"
-            if key in seen:
-                continue
-            seen.add(key)
-            
+        # Deduplicate across boards (canonical URL / near-duplicate) and skip jobs already applied to
+        dedupe = get_job_dedupe().session(self._user_key)
+        unique_jobs = await asyncio.to_thread(dedupe.filter_unique, jobs)
+        if dedupe.duplicates:
+            logger.info(f"🔁 Skipped {dedupe.duplicates} duplicate or already-applied jobs")
+        
+        for job in unique_jobs:
             # Check platform is allowed
             platform_key = job.platform.value if hasattr(job.platform, 'value') else str(job.platform)
             if platform_key.lower() not in allowed_platforms:
@@ -534,6 +545,8 @@ PLATFORM BREAKDOWN:
             retry_attempts=strategy.get('retry_attempts', 3),
             delay_between_applications=tuple(strategy.get('delay_between_applications', strategy.get('delay_range', [30, 60]))),
             delay_between_platforms=strategy.get('delay_between_platforms', 300),
+            search_timeout=strategy.get('search_timeout', DEFAULT_PLATFORM_TIMEOUT),
+            max_concurrent_searches=strategy.get('max_concurrent_searches', 4),
             output_dir=Path(data.get('output', {}).get('dir', data.get('output', {}).get('directory', './campaign_output'))),
             save_screenshots=data.get('output', {}).get('save_screenshots', True),
             job_file=data.get('job_file')
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Persistent Job De-duplication
+
+One dedupe service for every search and queue path. The same posting is
+often syndicated (LinkedIn, Indeed and the company's own Greenhouse board)
+under different URLs and slightly different text; applying to each copy
+wastes a browser session and looks bad to the employer.
+
+- Canonical URLs: tracking parameters are dropped and known ATS / board URLs
+  reduce to their posting ID (``greenhouse:4012345``, ``lever:<uuid>``,
+  ``linkedin:3791234567``, ``indeed:<jk>``), so every form of a link to
+  the same posting resolves alike
+- Near-duplicates: postings from the same (normalized) company are compared
+  by MinHash over title, company and description; a copy above
+  ``JOB_DEDUPE_THRESHOLD`` estimated Jaccard whose titles also overlap and
+  whose locations don't conflict joins the first copy's cluster. Two
+  different posting IDs on the same board (``linkedin:111`` and
+  ``linkedin:222``) are never clustered: the board says they are separate
+  openings
+- Clusters persist in SQLite (``JOB_DEDUPE_DB``) across runs and processes
+- A per-user "already applied" index keyed by cluster, consulted before jobs
+  are enqueued or applied to
+
+Per-run de-duplication goes through a ``DedupeSession``; a job is dropped if
+its cluster was already seen in the session or the session's user has
+applied to it.
+
+Example:
+    from core.job_dedupe import get_job_dedupe
+
+    dedupe = get_job_dedupe()
+    unique = dedupe.session(user_id).filter_unique(jobs)
+    ...
+    dedupe.mark_applied(user_id, job, application_id)
+"""
+
+import re
+import time
+import struct
+import sqlite3
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from api.config import config
+from ai.cache.semantic_cache import NUM_PERM, estimate_similarity, minhash_signature
+
+logger = logging.getLogger(__name__)
+
+# Titles of near-duplicates must also share this fraction of words (Jaccard).
+TITLE_OVERLAP = 0.5
+MAX_CANDIDATES = 500
+DESCRIPTION_CHARS = 4000
+
+_SIGNATURE_FORMAT = f"<{NUM_PERM}Q"
+
+TRACKING_PARAMS = {
+    "ref", "refid", "source", "src", "trk", "trkinfo", "trackingid", "gh_src", "lever-source",
+    "lever-origin", "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
+    "from", "tk", "vjs", "originalsubdomain", "position", "pagenum", "ebp", "lipi",
+}
+
+# (host pattern, path pattern, canonical prefix); the first group of the path match is the posting ID.
+ATS_PATH_IDS = [
+    (r"(^|\.)greenhouse\.io$", r"/jobs/(\d+)", "greenhouse"),
+    (r"(^|\.)lever\.co$", r"^/[^/]+/([0-9a-f-]{36})", "lever"),
+    (r"(^|\.)ashbyhq\.com$", r"^/[^/]+/([0-9a-f-]{36})", "ashby"),
+    (r"(^|\.)linkedin\.com$", r"/jobs/view/(?:[^/]*?-)?(\d+)", "linkedin"),
+    (r"(^|\.)smartrecruiters\.com$", r"^/[^/]+/(\d+)", "smartrecruiters"),
+]
+
+# (query parameter, required host, canonical prefix): posting IDs carried in the query string.
+QUERY_IDS = [
+    ("gh_jid", "", "greenhouse"),  # company careers pages embedding a Greenhouse board
+    ("token", "greenhouse", "greenhouse"),  # boards.greenhouse.io/embed/job_app?for=acme&token=123
+    ("jk", "indeed", "indeed"),
+    ("vjk", "indeed", "indeed"),
+    ("currentjobid", "linkedin", "linkedin"),
+]
+
+_ATS_CANONICAL_RE = re.compile(r"^([a-z]+):")
+_COMPANY_SUFFIX_RE = re.compile(r"[,\s]+(inc|llc|l\.l\.c|corp|corporation|ltd|limited|co|company|gmbh|plc)\.?$")
+
+
+def canonical_job_url(url: Optional[str]) -> Optional[str]:
+    """
+    Canonical identity of a posting URL: ``<ats>:<id>`` for known boards,
+    else the URL without scheme, ``www.``, fragment, tracking parameters and
+    trailing slash.
+    """
+    url = (url or "").strip()
+    if not url:
+        return None
+    parsed = urlparse(url if "://" in url else f"https://{url}")
+    host = parsed.netloc.lower().split("@")[-1].split(":")[0]
+    if host.startswith("www."):
+        host = host[4:]
+    path = parsed.path.rstrip("/")
+    query = {k.lower(): v for k, v in parse_qs(parsed.query).items()}
+
+    for host_re, path_re, prefix in ATS_PATH_IDS:
+        if re.search(host_re, host):
+            match = re.search(path_re, path, re.IGNORECASE)
+            if match:
+                return f"{prefix}:{match.group(1).lower()}"
+    for param, required_host, prefix in QUERY_IDS:
+        if query.get(param) and required_host in host:
+            return f"{prefix}:{query[param][0].lower()}"
+
+    kept = sorted((k, v[0]) for k, v in query.items() if k not in TRACKING_PARAMS and not k.startswith("utm_"))
+    return f"{host}{path}" + (f"?{urlencode(kept)}" if kept else "")
+
+
+def normalize_company(company: Optional[str]) -> str:
+    name = re.sub(r"\s+", " ", (company or "").lower()).strip()
+    name = _COMPANY_SUFFIX_RE.sub("", name)
+    return re.sub(r"[^\w ]", "", name).strip()
+
+
+def normalize_title(title: Optional[str]) -> str:
+    text = (title or "").lower()
+    text = re.sub(r"\bsr\b\.?", "senior", text)
+    text = re.sub(r"\bjr\b\.?", "junior", text)
+    text = re.sub(r"\s*[\(\[].*?[\)\]]", " ", text)  # "(Remote)", "[Hybrid]"
+    text = re.sub(r"[^\w\s]", " ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def normalize_location(location: Optional[str]) -> str:
+    """City-level location key: "New York, NY (Hybrid)" -> "new york"; any remote posting -> "remote"."""
+    text = (location or "").lower()
+    if "remote" in text:
+        return "remote"
+    text = re.sub(r"\s*[\(\[].*?[\)\]]", " ", text).split(",")[0]
+    text = re.sub(r"[^\w\s]", " ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _ats_board(canonical: Optional[str]) -> Optional[str]:
+    """Board prefix of an ``<ats>:<id>`` canonical; None for URL / fallback canonicals."""
+    match = _ATS_CANONICAL_RE.match(canonical or "")
+    return match.group(1) if match else None
+
+
+def _title_overlap(a: str, b: str) -> float:
+    sa, sb = set(a.split()), set(b.split())
+    if not sa or not sb:
+        return 0.0
+    return len(sa & sb) / len(sa | sb)
+
+
+def _get(job: Any, *names: str) -> Any:
+    for name in names:
+        value = job.get(name) if isinstance(job, dict) else getattr(job, name, None)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _pack(signature) -> bytes:
+    return struct.pack(_SIGNATURE_FORMAT, *signature)
+
+
+def _unpack(blob: bytes):
+    return struct.unpack(_SIGNATURE_FORMAT, blob)
+
+
+@dataclass
+class DedupeMatch:
+    """Which cluster a posting belongs to, and why."""
+    cluster_id: int
+    canonical: str
+    reason: str  # new | url | near_duplicate
+    similarity: float = 1.0
+
+    @property
+    def is_new(self) -> bool:
+        return self.reason == "new"
+
+
+class JobDedupeService:
+    """SQLite-backed posting clusters and per-user applied index."""
+
+    def __init__(self, db_path: Optional[str] = None, threshold: Optional[float] = None):
+        self.db_path = Path(db_path or config.JOB_DEDUPE_DB)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.threshold = config.JOB_DEDUPE_THRESHOLD if threshold is None else threshold
+        self.stats = {"new": 0, "url": 0, "near_duplicate": 0, "applied_hits": 0}
+        self._init_db()
+
+    def _init_db(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS job_clusters (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    canonical TEXT NOT NULL UNIQUE,
+                    cluster_id INTEGER,
+                    company_key TEXT,
+                    title_norm TEXT,
+                    location_key TEXT,
+                    signature BLOB,
+                    has_description INTEGER DEFAULT 0,
+                    url TEXT,
+                    first_seen REAL,
+                    last_seen REAL
+                )
+            """)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(job_clusters)")}
+            if "location_key" not in columns:
+                conn.execute("ALTER TABLE job_clusters ADD COLUMN location_key TEXT")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_job_clusters_company ON job_clusters(company_key, last_seen)"
+            )
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS applied_jobs (
+                    user_key TEXT NOT NULL,
+                    cluster_id INTEGER NOT NULL,
+                    canonical TEXT,
+                    application_id TEXT,
+                    applied_at REAL,
+                    PRIMARY KEY (user_key, cluster_id)
+                )
+            """)
+            conn.commit()
+
+    def _resolve(self, conn: sqlite3.Connection, job: Any) -> Optional[DedupeMatch]:
+        title = normalize_title(_get(job, "title"))
+        company = normalize_company(_get(job, "company"))
+        location = normalize_location(_get(job, "location"))
+        url = str(_get(job, "apply_url", "url", "job_url") or "")
+        canonical = canonical_job_url(_get(job, "url", "job_url")) or canonical_job_url(url)
+        if not canonical:
+            if not title:
+                return None
+            canonical = f"{company}|{title}"
+        now = time.time()
+
+        # Any known URL of the posting resolves directly.
+        for candidate in dict.fromkeys(filter(None, [canonical, canonical_job_url(url)])):
+            row = conn.execute(
+                "SELECT cluster_id FROM job_clusters WHERE canonical = ?", (candidate,)
+            ).fetchone()
+            if row:
+                conn.execute("UPDATE job_clusters SET last_seen = ? WHERE canonical = ?", (now, candidate))
+                return DedupeMatch(cluster_id=row[0], canonical=candidate, reason="url")
+
+        description = str(_get(job, "description", "descriptionPlain", "content") or "")
+        text = f"{title} {company} {description[:DESCRIPTION_CHARS]}"
+        signature = minhash_signature(text)
+        has_description = bool(description.strip())
+
+        board = _ats_board(canonical)
+        scored: Dict[int, float] = {}
+        same_board: Set[int] = set()
+        if company and title:
+            for cluster_id, other_canonical, title_norm, other_location, blob, other_has_description in conn.execute(
+                """SELECT cluster_id, canonical, title_norm, location_key, signature, has_description
+                   FROM job_clusters WHERE company_key = ? ORDER BY last_seen DESC LIMIT ?""",
+                (company, MAX_CANDIDATES),
+            ):
+                # Another ID on the same board is another opening, however similar the text.
+                if board and _ats_board(other_canonical) == board:
+                    same_board.add(cluster_id)
+                    continue
+                if location and other_location and location != other_location:
+                    continue
+                if _title_overlap(title, title_norm or "") < TITLE_OVERLAP:
+                    continue
+                if has_description and other_has_description:
+                    similarity = estimate_similarity(signature, _unpack(blob))
+                else:
+                    # Without descriptions on both sides only an identical title counts.
+                    similarity = 1.0 if title == title_norm else 0.0
+                if similarity >= self.threshold:
+                    scored[cluster_id] = max(similarity, scored.get(cluster_id, 0.0))
+        eligible = [(cluster_id, sim) for cluster_id, sim in scored.items() if cluster_id not in same_board]
+        best: Optional[Tuple[int, float]] = max(eligible, key=lambda c: c[1], default=None)
+
+        cursor = conn.execute(
+            """INSERT INTO job_clusters (canonical, cluster_id, company_key, title_norm, location_key, signature,
+                                         has_description, url, first_seen, last_seen)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (canonical, best[0] if best else None, company, title, location or None, _pack(signature),
+             int(has_description), url or None, now, now),
+        )
+        if best:
+            return DedupeMatch(cluster_id=best[0], canonical=canonical, reason="near_duplicate", similarity=best[1])
+        conn.execute("UPDATE job_clusters SET cluster_id = id WHERE id = ?", (cursor.lastrowid,))
+        return DedupeMatch(cluster_id=cursor.lastrowid, canonical=canonical, reason="new")
+
+    def resolve_many(self, jobs: Iterable[Any]) -> List[Optional[DedupeMatch]]:
+        """Cluster each posting (registering new ones); None for postings with no identity."""
+        matches = []
+        with sqlite3.connect(self.db_path) as conn:
+            for job in jobs:
+                match = self._resolve(conn, job)
+                if match:
+                    self.stats[match.reason] += 1
+                    if match.reason == "near_duplicate":
+                        logger.debug(f"[JobDedupe] {match.canonical} is a near-duplicate "
+                                     f"(similarity {match.similarity:.2f}) of cluster {match.cluster_id}")
+                matches.append(match)
+            conn.commit()
+        return matches
+
+    def resolve(self, job: Any) -> Optional[DedupeMatch]:
+        return self.resolve_many([job])[0]
+
+    def applied_clusters(self, user_key: str, cluster_ids: Iterable[int]) -> Set[int]:
+        """The subset of ``cluster_ids`` the user has already applied to."""
+        cluster_ids = list(set(cluster_ids))
+        if not user_key or not cluster_ids:
+            return set()
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                f"""SELECT cluster_id FROM applied_jobs
+                    WHERE user_key = ? AND cluster_id IN ({','.join('?' * len(cluster_ids))})""",
+                [user_key, *cluster_ids],
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def has_applied(self, user_key: Optional[str], job: Any) -> bool:
+        """True if the user already applied to this posting or any copy of it."""
+        if not user_key:
+            return False
+        try:
+            match = self.resolve(job if not isinstance(job, str) else {"url": job})
+            hit = bool(match) and match.cluster_id in self.applied_clusters(user_key, [match.cluster_id])
+        except sqlite3.Error as e:
+            logger.warning(f"[JobDedupe] Applied lookup failed: {e}")
+            return False
+        if hit:
+            self.stats["applied_hits"] += 1
+        return hit
+
+    def mark_applied(self, user_key: Optional[str], job: Any, application_id: Optional[str] = None):
+        """Record that the user applied to this posting (covers every copy of it)."""
+        if not user_key:
+            return
+        try:
+            match = self.resolve(job if not isinstance(job, str) else {"url": job})
+            if not match:
+                return
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    """INSERT OR IGNORE INTO applied_jobs (user_key, cluster_id, canonical, application_id, applied_at)
+                       VALUES (?, ?, ?, ?, ?)""",
+                    (user_key, match.cluster_id, match.canonical, application_id, time.time()),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"[JobDedupe] Failed to record application: {e}")
+
+    def session(self, user_key: Optional[str] = None) -> "DedupeSession":
+        return DedupeSession(self, user_key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with sqlite3.connect(self.db_path) as conn:
+            postings, clusters = conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT cluster_id) FROM job_clusters"
+            ).fetchone()
+            applied = conn.execute("SELECT COUNT(*) FROM applied_jobs").fetchone()[0]
+        return {**self.stats, "postings": postings, "clusters": clusters, "applied": applied,
+                "threshold": self.threshold}
+
+
+class DedupeSession:
+    """Per-run view: drops postings already seen this run or already applied to by the user."""
+
+    def __init__(self, service: JobDedupeService, user_key: Optional[str] = None):
+        self.service = service
+        self.user_key = user_key
+        self.seen: Set[int] = set()
+        self.stats = {"unique": 0, "url": 0, "near_duplicate": 0, "applied": 0}
+
+    def _keep(self, match: Optional[DedupeMatch], applied: Set[int]) -> bool:
+        if match is None:
+            return True  # nothing to compare on; let the caller decide
+        if match.cluster_id in applied:
+            self.stats["applied"] += 1
+            return False
+        if match.cluster_id in self.seen:
+            self.stats["near_duplicate" if match.reason == "near_duplicate" else "url"] += 1
+            return False
+        self.seen.add(match.cluster_id)
+        self.stats["unique"] += 1
+        return True
+
+    def filter_unique(self, jobs: Iterable[Any]) -> List[Any]:
+        """Jobs whose posting is new to this session (and not applied to), in order."""
+        jobs = list(jobs)
+        try:
+            matches = self.service.resolve_many(jobs)
+        except sqlite3.Error as e:
+            logger.warning(f"[JobDedupe] Store unavailable, skipping de-duplication: {e}")
+            return jobs
+        applied = self.service.applied_clusters(self.user_key, [m.cluster_id for m in matches if m])
+        self.service.stats["applied_hits"] += sum(1 for m in matches if m and m.cluster_id in applied)
+        return [job for job, match in zip(jobs, matches) if self._keep(match, applied)]
+
+    def is_duplicate(self, job: Any) -> bool:
+        return not self.filter_unique([job])
+
+    @property
+    def duplicates(self) -> int:
+        return self.stats["url"] + self.stats["near_duplicate"] + self.stats["applied"]
+
+
+# Singleton
+_job_dedupe: Optional[JobDedupeService] = None
+
+
+def get_job_dedupe() -> JobDedupeService:
+    """Get singleton JobDedupeService instance."""
+    global _job_dedupe
+    if _job_dedupe is None:
+        _job_dedupe = JobDedupeService()
+    return _job_dedupe
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+Local Job Index
+
+A persistent SQLite FTS5 index of every posting the adapters and scrapers
+return, so role / keyword / location searches over tens of thousands of
+cached postings are answered locally in milliseconds instead of re-scraping
+and substring-scanning each time.
+
+Each posting is stored once (keyed by URL, else source + ID) with a
+normalized title, company, location, remote flag, posted date and a
+plain-text description. Text matches are ranked with BM25, weighting title
+hits above company, location and description hits. Re-indexing an unchanged
+posting only refreshes its ``last_seen`` time; postings not seen for
+``JOB_INDEX_MAX_AGE_DAYS`` are left out of searches and pruned as new results
+are indexed.
+
+Fed from ``/jobs/search``, ``CampaignRunner`` and ``UnifiedJobPipeline``;
+``/jobs/search?platform=index`` answers from the index alone.
+
+Example:
+    from core.job_index import get_job_index, index_jobs
+
+    index_jobs(jobs, source="greenhouse")  # await index_jobs_async(...) from async code
+    hits = get_job_index().search(roles=["backend engineer"], locations=["Remote"], query="python")
+    for hit in hits:
+        print(hit.score, hit.title, hit.company)
+"""
+
+import re
+import html
+import asyncio
+import time
+import hashlib
+import sqlite3
+import logging
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from api.config import config
+
+logger = logging.getLogger(__name__)
+
+MAX_DESCRIPTION_CHARS = 20000
+
+# BM25 column weights: title, company, location, description.
+BM25_WEIGHTS = (10.0, 4.0, 2.0, 1.0)
+
+REMOTE_LOCATIONS = {"remote", "anywhere"}
+
+# Minimum spacing between automatic prunes from ``index_jobs``.
+PRUNE_INTERVAL_SECONDS = 3600
+
+
+def _get(job: Any, *names: str) -> Any:
+    for name in names:
+        value = job.get(name) if isinstance(job, dict) else getattr(job, name, None)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _clean(value: Any) -> str:
+    return re.sub(r"\s+", " ", str(value or "")).strip()
+
+
+def plain_text(value: Any) -> str:
+    """Strip HTML tags and entities and collapse whitespace."""
+    text = re.sub(r"<[^>]+>", " ", str(value or ""))
+    return _clean(html.unescape(text))[:MAX_DESCRIPTION_CHARS]
+
+
+def _timestamp(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if hasattr(value, "isoformat"):  # date
+        value = value.isoformat()
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def job_key(url: Optional[str], source: str, job_id: Optional[str]) -> Optional[str]:
+    """Index key: the posting URL (normalized), else source and ID."""
+    if url:
+        return url.strip().split("#", 1)[0].rstrip("/").lower()
+    if job_id:
+        return f"{source}:{job_id}"
+    return None
+
+
+def job_record(job: Any, source: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Normalize a posting (adapter/scraper dataclass or API dict) into an index row."""
+    platform = _get(job, "source", "platform", "site")
+    source = source or str(getattr(platform, "value", platform) or "unknown")
+    url = _clean(_get(job, "url", "job_url", "absolute_url"))
+    job_id = _get(job, "id")
+    key = job_key(url, source, str(job_id) if job_id is not None else None)
+    title = _clean(_get(job, "title"))
+    if not key or not title:
+        return None
+
+    location = _clean(_get(job, "location"))
+    record = {
+        "job_key": key,
+        "job_id": str(job_id) if job_id is not None else None,
+        "source": source,
+        "title": title,
+        "company": _clean(_get(job, "company")),
+        "location": location,
+        "remote": int(bool(_get(job, "remote", "is_remote")) or "remote" in location.lower()),
+        "easy_apply": int(bool(_get(job, "easy_apply"))),
+        "url": url,
+        "apply_url": _clean(_get(job, "apply_url", "external_apply_url", "job_url_direct")) or url,
+        "description": plain_text(_get(job, "description", "descriptionPlain", "content")),
+        "posted_at": _timestamp(_get(job, "posted_date", "date_posted", "posted_at")),
+    }
+    record["content_hash"] = hashlib.sha1(
+        "\x1f".join(str(record[k]) for k in (
+            "title", "company", "location", "remote", "easy_apply", "apply_url", "description", "posted_at",
+        )).encode()
+    ).hexdigest()
+    return record
+
+
+def _terms(text: str) -> List[str]:
+    return re.findall(r"\w+", (text or "").lower())
+
+
+def _all_terms(text: str) -> str:
+    """FTS5 expression requiring every word of ``text`` (quoted, so operators are literal)."""
+    return " AND ".join(f'"{term}"' for term in _terms(text))
+
+
+def _phrase(text: str) -> str:
+    terms = _terms(text)
+    return f'"{" ".join(terms)}"' if terms else ""
+
+
+def _like(text: str) -> str:
+    escaped = text.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+@dataclass
+class IndexedJob:
+    """A posting returned from the index."""
+    id: str
+    source: str
+    title: str
+    company: str
+    location: str
+    remote: bool
+    easy_apply: bool
+    url: str
+    apply_url: str
+    description: str
+    posted_at: Optional[float] = None
+    score: float = 0.0  # BM25 relevance (higher is better); 0 without a text query
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Same shape as the ``/jobs/search`` job payload, plus source and score."""
+        data = asdict(self)
+        data["description"] = self.description[:2000] or None
+        data["direct_url"] = self.apply_url if self.apply_url != self.url else None
+        return data
+
+
+class JobIndex:
+    """SQLite FTS5 index of job postings with BM25 ranking."""
+
+    def __init__(self, db_path: Optional[str] = None, max_age_days: Optional[float] = None):
+        self.db_path = Path(db_path or config.JOB_INDEX_DB)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_age_days = config.JOB_INDEX_MAX_AGE_DAYS if max_age_days is None else max_age_days
+        self.stats = {"indexed": 0, "searches": 0, "pruned": 0}
+        self._last_prune = 0.0
+        self._init_db()
+
+    def _init_db(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    doc_id INTEGER PRIMARY KEY,
+                    job_key TEXT NOT NULL UNIQUE,
+                    job_id TEXT,
+                    source TEXT,
+                    title TEXT NOT NULL,
+                    company TEXT,
+                    location TEXT,
+                    remote INTEGER DEFAULT 0,
+                    easy_apply INTEGER DEFAULT 0,
+                    url TEXT,
+                    apply_url TEXT,
+                    description TEXT,
+                    posted_at REAL,
+                    first_seen REAL,
+                    last_seen REAL,
+                    content_hash TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs(last_seen)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source)")
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                    title, company, location, description,
+                    content='jobs', content_rowid='doc_id',
+                    tokenize='porter unicode61 remove_diacritics 2'
+                )
+            """)
+            # Keep the external-content FTS table in step with jobs.
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+                    INSERT INTO jobs_fts(rowid, title, company, location, description)
+                    VALUES (new.doc_id, new.title, new.company, new.location, new.description);
+                END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+                    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description)
+                    VALUES ('delete', old.doc_id, old.title, old.company, old.location, old.description);
+                END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE OF title, company, location, description ON jobs BEGIN
+                    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description)
+                    VALUES ('delete', old.doc_id, old.title, old.company, old.location, old.description);
+                    INSERT INTO jobs_fts(rowid, title, company, location, description)
+                    VALUES (new.doc_id, new.title, new.company, new.location, new.description);
+                END
+            """)
+            conn.commit()
+
+    def add(self, jobs: Iterable[Any], source: Optional[str] = None) -> int:
+        """Index (or refresh) postings; returns how many were indexable."""
+        records = {}
+        for job in jobs:
+            record = job_record(job, source)
+            if record:
+                records[record["job_key"]] = record
+        if not records:
+            return 0
+
+        now = time.time()
+        rows = [{**r, "now": now} for r in records.values()]
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                """INSERT INTO jobs (job_key, job_id, source, title, company, location, remote, easy_apply,
+                                     url, apply_url, description, posted_at, first_seen, last_seen, content_hash)
+                   VALUES (:job_key, :job_id, :source, :title, :company, :location, :remote, :easy_apply,
+                           :url, :apply_url, :description, :posted_at, :now, :now, :content_hash)
+                   ON CONFLICT(job_key) DO UPDATE SET
+                       job_id = excluded.job_id, source = excluded.source, title = excluded.title,
+                       company = excluded.company, location = excluded.location, remote = excluded.remote,
+                       easy_apply = excluded.easy_apply, url = excluded.url, apply_url = excluded.apply_url,
+                       description = excluded.description, posted_at = excluded.posted_at,
+                       content_hash = excluded.content_hash
+                   WHERE jobs.content_hash != excluded.content_hash""",
+                rows,
+            )
+            # Touching last_seen alone doesn't re-index the text.
+            conn.executemany(
+                "UPDATE jobs SET last_seen = ? WHERE job_key = ?", [(now, key) for key in records]
+            )
+            conn.commit()
+        self.stats["indexed"] += len(records)
+        return len(records)
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        roles: Optional[Sequence[str]] = None,
+        locations: Optional[Sequence[str]] = None,
+        required_keywords: Optional[Sequence[str]] = None,
+        exclude_keywords: Optional[Sequence[str]] = None,
+        exclude_companies: Optional[Sequence[str]] = None,
+        remote_only: bool = False,
+        easy_apply_only: bool = False,
+        posted_within_days: Optional[int] = None,
+        sources: Optional[Sequence[str]] = None,
+        limit: int = 50,
+    ) -> List[IndexedJob]:
+        """
+        Search the index.
+
+        ``query`` words must all appear (any field); each role's words must all
+        appear in the title (any role matches); required keywords are phrases.
+        "Remote" in ``locations`` matches remote postings, other locations
+        match as substrings. Ranked by BM25 when there is a text query, else
+        newest first. Postings not seen within ``max_age_days`` are skipped.
+        """
+        self.stats["searches"] += 1
+        match_parts = []
+        if query and _all_terms(query):
+            match_parts.append(_all_terms(query))
+        role_exprs = [f"({_all_terms(role)})" for role in roles or [] if _all_terms(role)]
+        if role_exprs:
+            match_parts.append(f"title : ({' OR '.join(role_exprs)})")
+        match_parts.extend(_phrase(kw) for kw in required_keywords or [] if _phrase(kw))
+        match = " AND ".join(f"({part})" for part in match_parts)
+
+        where, params = [], []
+        if match:
+            where.append("jobs_fts MATCH ?")
+            params.append(match)
+
+        location_clauses = []
+        for location in locations or []:
+            if location.strip().lower() in REMOTE_LOCATIONS:
+                location_clauses.append("j.remote = 1")
+            elif location.strip():
+                location_clauses.append("j.location LIKE ? ESCAPE '\\'")
+                params.append(_like(location))
+        if location_clauses:
+            where.append(f"({' OR '.join(location_clauses)})")
+        if remote_only:
+            where.append("j.remote = 1")
+        if easy_apply_only:
+            where.append("j.easy_apply = 1")
+        if posted_within_days:
+            where.append("COALESCE(j.posted_at, j.first_seen) >= ?")
+            params.append(time.time() - posted_within_days * 86400)
+        if self.max_age_days > 0:
+            where.append("j.last_seen >= ?")
+            params.append(time.time() - self.max_age_days * 86400)
+        if sources:
+            where.append(f"j.source IN ({','.join('?' * len(sources))})")
+            params.extend(sources)
+        excluded_companies = [c.strip().lower() for c in exclude_companies or [] if c.strip()]
+        if excluded_companies:
+            where.append(f"lower(j.company) NOT IN ({','.join('?' * len(excluded_companies))})")
+            params.extend(excluded_companies)
+        excluded = " OR ".join(_phrase(kw) for kw in exclude_keywords or [] if _phrase(kw))
+        if excluded:
+            where.append("j.doc_id NOT IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)")
+            params.append(excluded)
+
+        if match:
+            weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+            sql = f"""SELECT j.*, -bm25(jobs_fts, {weights}) AS score
+                      FROM jobs_fts JOIN jobs j ON j.doc_id = jobs_fts.rowid
+                      WHERE {' AND '.join(where)}
+                      ORDER BY bm25(jobs_fts, {weights}), COALESCE(j.posted_at, j.first_seen) DESC
+                      LIMIT ?"""
+        else:
+            sql = f"""SELECT j.*, 0.0 AS score FROM jobs j
+                      {'WHERE ' + ' AND '.join(where) if where else ''}
+                      ORDER BY COALESCE(j.posted_at, j.first_seen) DESC
+                      LIMIT ?"""
+        params.append(max(1, int(limit)))
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(sql, params).fetchall()
+        return [
+            IndexedJob(
+                id=row["job_id"] or row["job_key"],
+                source=row["source"],
+                title=row["title"],
+                company=row["company"] or "",
+                location=row["location"] or "",
+                remote=bool(row["remote"]),
+                easy_apply=bool(row["easy_apply"]),
+                url=row["url"] or "",
+                apply_url=row["apply_url"] or row["url"] or "",
+                description=row["description"] or "",
+                posted_at=row["posted_at"],
+                score=row["score"],
+            )
+            for row in rows
+        ]
+
+    def search_config(self, criteria: Any, limit: int = 100, sources: Optional[Sequence[str]] = None) -> List[IndexedJob]:
+        """Search with a ``SearchConfig`` (roles, locations, keywords, exclusions, recency)."""
+        return self.search(
+            roles=criteria.roles,
+            locations=criteria.locations,
+            required_keywords=criteria.required_keywords,
+            exclude_keywords=criteria.exclude_keywords,
+            exclude_companies=getattr(criteria, "exclude_companies", None),
+            easy_apply_only=criteria.easy_apply_only,
+            posted_within_days=criteria.posted_within_days,
+            sources=sources,
+            limit=limit,
+        )
+
+    def prune(self, older_than_days: float) -> int:
+        """Drop postings not seen for ``older_than_days``; returns how many."""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                "DELETE FROM jobs WHERE last_seen < ?", (time.time() - older_than_days * 86400,)
+            )
+            conn.commit()
+        self.stats["pruned"] += cursor.rowcount
+        return cursor.rowcount
+
+    def prune_stale(self) -> int:
+        """Prune postings older than ``max_age_days``, at most once per ``PRUNE_INTERVAL_SECONDS``."""
+        now = time.time()
+        if self.max_age_days <= 0 or now - self._last_prune < PRUNE_INTERVAL_SECONDS:
+            return 0
+        self._last_prune = now
+        pruned = self.prune(self.max_age_days)
+        if pruned:
+            logger.info(f"[JobIndex] Pruned {pruned} postings unseen for {self.max_age_days:g} days")
+        return pruned
+
+    def get_stats(self) -> Dict[str, Any]:
+        with sqlite3.connect(self.db_path) as conn:
+            by_source = dict(conn.execute("SELECT source, COUNT(*) FROM jobs GROUP BY source").fetchall())
+        return {**self.stats, "jobs": sum(by_source.values()), "by_source": by_source}
+
+
+# Singleton
+_job_index: Optional[JobIndex] = None
+
+
+def get_job_index() -> JobIndex:
+    """Get singleton JobIndex instance."""
+    global _job_index
+    if _job_index is None:
+        _job_index = JobIndex()
+    return _job_index
+
+
+def index_jobs(jobs: Iterable[Any], source: Optional[str] = None) -> int:
+    """Feed search results into the index; never fails the search that produced them."""
+    if not config.JOB_INDEX_ENABLED:
+        return 0
+    try:
+        index = get_job_index()
+        added = index.add(jobs, source)
+        index.prune_stale()
+        return added
+    except Exception as e:
+        logger.warning(f"[JobIndex] Failed to index {source or 'search'} results: {e}")
+        return 0
+
+
+async def index_jobs_async(jobs: Iterable[Any], source: Optional[str] = None) -> int:
+    """``index_jobs`` in a worker thread, so FTS upserts and pruning don't block the event loop."""
+    return await asyncio.to_thread(index_jobs, list(jobs), source)
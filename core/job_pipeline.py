@@ -16,6 +16,8 @@ from datetime import datetime
 from enum import Enum
 import logging
 
+from core.job_dedupe import canonical_job_url, get_job_dedupe
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,6 +66,7 @@ class PipelineConfig:
     locations: List[str] = field(default_factory=lambda: ["Remote"])
     exclude_companies: Set[str] = field(default_factory=set)
     already_applied: Set[str] = field(default_factory=set)
+    user_id: Optional[str] = None  # Keys the persistent "already applied" index
 
 
 class JobPipeline:
@@ -82,7 +85,7 @@ class JobPipeline:
     def __init__(self, config: PipelineConfig):
         self.config = config
         self.job_queue: Queue[QueuedJob] = Queue()
-        self.seen_jobs: Set[str] = set()  # Deduplication
+        self.dedupe = get_job_dedupe().session(config.user_id)  # Deduplication
         self.applied_jobs: List[QueuedJob] = []
         self.failed_jobs: List[QueuedJob] = []
         self.skipped_jobs: List[QueuedJob] = []
@@ -157,23 +160,16 @@ class JobPipeline:
                     limit=limit
                 )
                 
+                already_applied = {canonical_job_url(url) for url in self.config.already_applied} - {None}
+                excluded = {c.lower() for c in self.config.exclude_companies}
+                candidates = [
+                    job for job in jobs
+                    if canonical_job_url(job.url) not in already_applied and job.company.lower() not in excluded
+                ]
+                
                 added = 0
-                for job in jobs:
-                    # Skip if already seen
-                    job_key = f"{job.company}-{job.title}".lower()
-                    if job_key in self.seen_jobs:
-                        continue
-                    
-                    # Skip if already applied
-                    if job.url in self.config.already_applied:
-                        continue
-                    
-                    # Skip excluded companies
-                    if job.company.lower() in {c.lower() for c in self.config.exclude_companies}:
-                        continue
-                    
-                    self.seen_jobs.add(job_key)
-                    
+                # Skip copies of postings already queued this run (any board) or applied to before
+                for job in await asyncio.to_thread(self.dedupe.filter_unique, candidates):
                     queued = QueuedJob(
                         job_id=job.id,
                         title=job.title,
@@ -226,6 +222,7 @@ class JobPipeline:
                         job.applied_at = datetime.now()
                         self.applied_jobs.append(job)
                         self._total_applied += 1
+                        await asyncio.to_thread(get_job_dedupe().mark_applied, self.config.user_id, job)
                     elif result.get('status') == 'skipped':
                         job.status = JobStatus.SKIPPED
                         self.skipped_jobs.append(job)
@@ -280,6 +277,7 @@ class JobPipeline:
             "total_applied": self._total_applied,
             "total_failed": len(self.failed_jobs),
             "total_skipped": len(self.skipped_jobs),
+            "duplicates_skipped": self.dedupe.duplicates,
             "progress_percent": round(
                 (self._total_applied / self.config.max_applications) * 100, 1
             ) if self.config.max_applications > 0 else 0,
@@ -165,6 +165,7 @@ class UserProfile:
     website: Optional[str] = None
     github_url: Optional[str] = None
     portfolio_url: Optional[str] = None
+    user_id: Optional[str] = None  # Account id; keys the user's saved answers
     
     # Work authorization
     work_authorization: str = "Yes"
@@ -206,6 +207,7 @@ class Resume:
     raw_text: str
     parsed_data: Dict[str, Any] = field(default_factory=dict)
     tailored_version: Optional[Dict[str, Any]] = None
+    digest: Optional[Dict[str, Any]] = None  # precomputed at upload, see core.resume_digest
     
     def get_tailored_for_job(self, job: JobPosting) -> Dict[str, Any]:
         """Get resume tailored for specific job."""
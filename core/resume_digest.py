@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Resume Digest
+
+A compact, precomputed view of a resume built once at upload and stored
+with it: a short summary, skills, keyword set, years of experience and
+prompt-ready snippets with a known token size. Consumers (cover letters,
+screening-question prompts, search scoring) read the digest instead of
+slicing, re-serializing or re-tokenizing the raw text on every call.
+
+Resumes stored before digests existed (or with an older DIGEST_VERSION) get
+one built on first read; ``api.database.get_latest_resume`` saves it back so
+that happens once per resume.
+
+Example:
+    from core.resume_digest import build_resume_digest, get_resume_digest
+
+    digest = build_resume_digest(raw_text, parsed_data)   # at upload
+    context = get_resume_digest(resume)["snippets"]["questions"]["text"]
+"""
+
+import re
+import math
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+DIGEST_VERSION = 2
+
+# Token budgets for the prompt-ready snippets.
+SNIPPET_BUDGETS = {
+    "cover_letter": 400,  # summary, skills, recent roles with highlights
+    "questions": 250,     # enough to answer screening questions
+}
+
+MAX_SKILLS = 40
+SUMMARY_CHARS = 400
+
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "in",
+    "is", "it", "its", "of", "on", "or", "that", "the", "this", "to", "was", "were", "will",
+    "with", "you", "your",
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased keyword tokens; keeps a few tech symbols (c++, c#, node.js)."""
+    text = (text or "").lower()
+    text = re.sub(r"[^a-z0-9\+\#\.\-]+", " ", text)
+    toks = [t.strip(".-") for t in text.split() if t.strip(".-")]
+    return [t for t in toks if len(t) >= 3 and t not in _STOPWORDS]
+
+
+def count_tokens(text: str) -> int:
+    """Approximate LLM token count (~4 characters per token)."""
+    return math.ceil(len(text or "") / 4)
+
+
+def fit_tokens(text: str, budget: int) -> str:
+    """Trim ``text`` on a word boundary to fit ``budget`` tokens."""
+    limit = budget * 4
+    if len(text) <= limit:
+        return text
+    cut = text[:limit].rsplit(" ", 1)[0]
+    return cut.rstrip(" ,;:-") + "…"
+
+
+def estimate_years_experience(parsed_data: dict) -> Optional[int]:
+    """Span of years across the experience section's dates."""
+    exp = (parsed_data or {}).get("experience") or []
+    years: List[int] = []
+    for item in exp:
+        dates = str((item or {}).get("dates") or "")
+        for y in re.findall(r"(?:19|20)\d{2}", dates):
+            years.append(int(y))
+    if len(years) >= 2:
+        return max(years) - min(years)
+    if len(years) == 1:
+        return max(0, datetime.now().year - years[0])
+    return None
+
+
+def extract_keywords(raw_text: str, parsed_data: dict) -> List[str]:
+    """Every skill token, then the 120 most frequent resume tokens."""
+    keywords: Dict[str, None] = {}
+    for skill in (parsed_data or {}).get("skills") or []:
+        for tok in tokenize(str(skill)):
+            keywords.setdefault(tok)
+    for tok, _ in Counter(tokenize(raw_text)).most_common(120):
+        keywords.setdefault(tok)
+    return list(keywords)
+
+
+def _clean(text: str) -> str:
+    return re.sub(r"\s+", " ", str(text or "")).strip()
+
+
+def _summary(raw_text: str, parsed: dict) -> str:
+    summary = _clean(parsed.get("summary"))
+    if not summary:
+        # First prose-like lines of the resume (skip the contact header).
+        lines = [_clean(ln) for ln in (raw_text or "").splitlines()]
+        summary = " ".join(ln for ln in lines if len(ln) > 60)[:SUMMARY_CHARS * 2]
+    if len(summary) > SUMMARY_CHARS:
+        summary = summary[:SUMMARY_CHARS].rsplit(" ", 1)[0] + "…"
+    return summary
+
+
+def _roles(parsed: dict, limit: int = 3) -> List[Dict[str, Any]]:
+    roles = []
+    for item in (parsed.get("experience") or [])[:limit]:
+        item = item or {}
+        title, company = _clean(item.get("title")), _clean(item.get("company"))
+        if not (title or company):
+            continue
+        roles.append({
+            "title": title,
+            "company": company,
+            "dates": _clean(item.get("dates")),
+            "highlights": [_clean(b) for b in (item.get("bullets") or [])[:2] if _clean(b)],
+        })
+    return roles
+
+
+def _snippet(digest: Dict[str, Any], raw_text: str, budget: int, highlights: bool) -> Dict[str, Any]:
+    lines = []
+    if digest["summary"]:
+        lines.append(f"Summary: {digest['summary']}")
+    if digest["years_experience"] is not None:
+        lines.append(f"Experience: {digest['years_experience']} years")
+    if digest["skills"]:
+        lines.append(f"Skills: {', '.join(digest['skills'][:25])}")
+    for role in digest["recent_roles"]:
+        line = "- " + " at ".join(p for p in (role["title"], role["company"]) if p)
+        if role["dates"]:
+            line += f" ({role['dates']})"
+        if highlights and role["highlights"]:
+            line += ": " + "; ".join(role["highlights"])
+        lines.append(line)
+    if digest["education"]:
+        lines.append(f"Education: {'; '.join(digest['education'])}")
+
+    text = "\n".join(lines)
+    if not digest["recent_roles"] and not digest["skills"]:
+        # Unparsed resume: fall back to the cleaned raw text.
+        text = _clean(raw_text)
+    text = fit_tokens(text, budget)
+    return {"text": text, "tokens": count_tokens(text)}
+
+
+def build_resume_digest(raw_text: str, parsed_data: Optional[dict]) -> Dict[str, Any]:
+    """Build the digest for a resume (pure CPU, no LLM calls)."""
+    parsed = parsed_data if isinstance(parsed_data, dict) and not parsed_data.get("error") else {}
+
+    skills: Dict[str, None] = {}
+    for skill in parsed.get("skills") or []:
+        skill = _clean(skill)
+        if skill:
+            skills.setdefault(skill)
+
+    education = []
+    for edu in (parsed.get("education") or [])[:2]:
+        edu = edu or {}
+        text = " ".join(p for p in (_clean(edu.get("degree")), _clean(edu.get("field"))) if p)
+        school = _clean(edu.get("school"))
+        if text or school:
+            education.append(f"{text}, {school}".strip(", "))
+
+    digest: Dict[str, Any] = {
+        "version": DIGEST_VERSION,
+        "summary": _summary(raw_text, parsed),
+        "skills": list(skills)[:MAX_SKILLS],
+        "keywords": extract_keywords(raw_text, parsed),
+        "years_experience": estimate_years_experience(parsed),
+        "recent_roles": _roles(parsed),
+        "education": education,
+        "source_tokens": count_tokens(raw_text),
+    }
+    digest["snippets"] = {
+        "cover_letter": _snippet(digest, raw_text, SNIPPET_BUDGETS["cover_letter"], highlights=True),
+        "questions": _snippet(digest, raw_text, SNIPPET_BUDGETS["questions"], highlights=False),
+    }
+    return digest
+
+
+def get_resume_digest(resume: Any) -> Dict[str, Any]:
+    """
+    Digest for a stored resume (DB row dict or ``Resume`` object).
+
+    Uses the stored digest when current; otherwise builds one and keeps it
+    on the object so later reads in the same flow reuse it.
+    """
+    is_dict = isinstance(resume, dict)
+    digest = resume.get("digest") if is_dict else getattr(resume, "digest", None)
+    if isinstance(digest, dict) and digest.get("version") == DIGEST_VERSION:
+        return digest
+
+    raw_text = (resume.get("raw_text") if is_dict else getattr(resume, "raw_text", "")) or ""
+    parsed = (resume.get("parsed_data") if is_dict else getattr(resume, "parsed_data", {})) or {}
+    digest = build_resume_digest(raw_text, parsed)
+    if is_dict:
+        resume["digest"] = digest
+    elif hasattr(resume, "digest"):
+        resume.digest = digest
+    return digest
+
+
+def resume_snippet(resume: Any, kind: str) -> str:
+    """Prompt-ready resume text for ``kind`` ('cover_letter' or 'questions')."""
+    return get_resume_digest(resume)["snippets"][kind]["text"]
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Search Fan-Out - concurrent job search across platforms.
+
+Runs one search per platform at the same time, so a multi-platform search
+takes about as long as its slowest platform instead of the sum of all of
+them. Each platform gets its own timeout; a platform that fails or times
+out is reported in the outcome while the others' results are kept.
+Results are merged and de-duplicated as each platform finishes.
+
+Example:
+    from core.search_fanout import fan_out
+
+    result = await fan_out(
+        {"greenhouse": lambda: gh.search_jobs(criteria), "lever": lambda: lever.search_jobs(criteria)},
+        key=lambda job: job.url,
+        timeout=60,
+    )
+    result.items          # merged, de-duplicated, in arrival order
+    result.platforms      # per-platform count / added / elapsed / error
+"""
+
+import os
+import time
+import asyncio
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PLATFORM_TIMEOUT = float(os.getenv("SEARCH_PLATFORM_TIMEOUT_SECONDS", "120"))
+
+
+@dataclass
+class PlatformOutcome:
+    """How one platform's search went."""
+    platform: str
+    count: int = 0  # results returned
+    added: int = 0  # results not already seen from an earlier platform
+    elapsed_ms: float = 0.0
+    error: Optional[Any] = None
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class FanOutResult:
+    """Merged results plus per-platform outcomes."""
+    items: List[Any] = field(default_factory=list)
+    platforms: Dict[str, PlatformOutcome] = field(default_factory=dict)
+    elapsed_ms: float = 0.0
+
+    @property
+    def partial(self) -> bool:
+        """True if any platform failed or timed out."""
+        return any(not o.ok for o in self.platforms.values())
+
+
+async def fan_out(
+    searches: Dict[str, Callable[[], Awaitable[List[Any]]]],
+    key: Callable[[Any], Optional[str]],
+    timeout: Optional[float] = DEFAULT_PLATFORM_TIMEOUT,
+    max_concurrency: Optional[int] = None,
+    on_results: Optional[Callable[[str, List[Any]], None]] = None,
+) -> FanOutResult:
+    """
+    Run ``searches`` (platform -> coroutine factory) concurrently.
+
+    ``key`` identifies an item for de-duplication; items without a key are
+    dropped. ``on_results(platform, new_items)`` is called as each platform
+    finishes, with only the items it added.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    started = time.perf_counter()
+
+    async def run(platform: str, search: Callable[[], Awaitable[List[Any]]]):
+        if semaphore:
+            await semaphore.acquire()
+        outcome = PlatformOutcome(platform=platform)
+        start = time.perf_counter()
+        items: List[Any] = []
+        try:
+            if timeout:
+                items = list(await asyncio.wait_for(search(), timeout) or [])
+            else:
+                items = list(await search() or [])
+        except asyncio.TimeoutError:
+            outcome.error = f"timed out after {timeout:g}s"
+            outcome.timed_out = True
+        except Exception as e:
+            outcome.error = getattr(e, "detail", None) or str(e) or type(e).__name__
+        finally:
+            if semaphore:
+                semaphore.release()
+        outcome.elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+        outcome.count = len(items)
+        return outcome, items
+
+    result = FanOutResult(platforms={p: PlatformOutcome(platform=p) for p in searches})
+    seen: set = set()
+    tasks = [asyncio.create_task(run(p, s), name=f"search-{p}") for p, s in searches.items()]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            outcome, items = await next_done
+            added = []
+            for item in items:
+                item_key = key(item)
+                if not item_key or item_key in seen:
+                    continue
+                seen.add(item_key)
+                added.append(item)
+            outcome.added = len(added)
+            result.items.extend(added)
+            result.platforms[outcome.platform] = outcome
+            if outcome.ok:
+                logger.info(f"[FanOut] {outcome.platform}: {outcome.count} results "
+                            f"({outcome.added} new) in {outcome.elapsed_ms:.0f}ms")
+            else:
+                logger.warning(f"[FanOut] {outcome.platform} failed after {outcome.elapsed_ms:.0f}ms: {outcome.error}")
+            if on_results and added:
+                on_results(outcome.platform, added)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+    result.elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+    return result
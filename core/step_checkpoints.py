@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Step Checkpoints for Multi-Step Application Flows
+
+Records, per queue item, which wizard steps have been completed and which
+answers (including LLM-generated ones) were already produced. When
+``QueueWorker`` retries an item after a transient failure, the flow reloads
+the checkpoint, reuses stored answers instead of regenerating them, and skips
+straight past steps the platform has kept.
+
+Checkpoints are cleared once the queue item reaches a terminal state.
+
+Example:
+    from core.step_checkpoints import get_step_checkpoint_store
+
+    checkpoint = await asyncio.to_thread(get_step_checkpoint_store().open, queue_item_id, "workday")
+    if checkpoint.is_done("my_information"):
+        ...  # just advance
+    answer = checkpoint.get_answer(question) or await generate(question)
+    await checkpoint.set_answer(question, answer)
+    await checkpoint.mark_done("my_information")
+"""
+
+import re
+import json
+import asyncio
+import sqlite3
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from api.config import config
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_question(question: str) -> str:
+    """Normalize question text so trivial markup differences share an answer."""
+    text = re.sub(r'\s+', ' ', (question or '').strip().lower())
+    return text.rstrip(' *:?').strip()
+
+
+class ApplyCheckpoint:
+    """
+    Checkpoint handle for one application flow.
+
+    Reads are served from memory; every write is persisted immediately (in a
+    worker thread, so the browser flow's event loop keeps running) and a crash
+    mid-step still leaves the earlier steps recorded.
+    """
+
+    def __init__(
+        self,
+        store: "StepCheckpointStore",
+        key: str,
+        platform: str,
+        completed_steps: Optional[List[str]] = None,
+        answers: Optional[Dict[str, str]] = None,
+        attempts: int = 0,
+    ):
+        self.store = store
+        self.key = key
+        self.platform = platform
+        self.completed_steps: List[str] = list(completed_steps or [])
+        self.answers: Dict[str, str] = dict(answers or {})
+        self.attempts = attempts
+        self.reused_answers = 0
+
+    @property
+    def resumed(self) -> bool:
+        """True when this flow is picking up a previous attempt's progress."""
+        return bool(self.completed_steps or self.answers)
+
+    @property
+    def last_step(self) -> Optional[str]:
+        return self.completed_steps[-1] if self.completed_steps else None
+
+    def is_done(self, step: str) -> bool:
+        return step in self.completed_steps
+
+    async def mark_done(self, step: str):
+        if step and step not in self.completed_steps:
+            self.completed_steps.append(step)
+            await self._persist()
+
+    def get_answer(self, question: str) -> Optional[str]:
+        answer = self.answers.get(normalize_question(question))
+        if answer is not None:
+            self.reused_answers += 1
+        return answer
+
+    async def set_answer(self, question: str, answer) -> None:
+        key = normalize_question(question)
+        if not key or answer is None:
+            return
+        if self.answers.get(key) != str(answer):
+            self.answers[key] = str(answer)
+            await self._persist()
+
+    async def _persist(self):
+        await asyncio.to_thread(self.store.save, self)
+
+    def clear(self):
+        self.store.clear(self.key)
+        self.completed_steps = []
+        self.answers = {}
+
+
+class StepCheckpointStore:
+    """SQLite-backed store of per-queue-item step checkpoints."""
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = Path(db_path or config.STEP_CHECKPOINT_DB)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.stats = {'opened': 0, 'resumed': 0, 'saved': 0, 'cleared': 0}
+        self._init_db()
+
+    def _init_db(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS step_checkpoints (
+                    key TEXT PRIMARY KEY,
+                    platform TEXT,
+                    completed_steps TEXT NOT NULL DEFAULT '[]',
+                    answers TEXT NOT NULL DEFAULT '{}',
+                    attempts INTEGER DEFAULT 0,
+                    updated_at TIMESTAMP
+                )
+            """)
+            conn.commit()
+
+    def open(self, key: Optional[str], platform: str) -> Optional[ApplyCheckpoint]:
+        """
+        Load (or start) the checkpoint for ``key`` and count the attempt.
+
+        Returns None when there is no key (ad-hoc, non-queued applications).
+        """
+        if not key:
+            return None
+
+        self.stats['opened'] += 1
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT completed_steps, answers, attempts FROM step_checkpoints WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+        if row:
+            checkpoint = ApplyCheckpoint(
+                self, key, platform,
+                completed_steps=json.loads(row[0] or '[]'),
+                answers=json.loads(row[1] or '{}'),
+                attempts=int(row[2] or 0) + 1,
+            )
+            if checkpoint.resumed:
+                self.stats['resumed'] += 1
+                logger.info(
+                    f"[Checkpoint] Resuming {platform} {key}: {len(checkpoint.completed_steps)} steps, "
+                    f"{len(checkpoint.answers)} answers"
+                )
+        else:
+            checkpoint = ApplyCheckpoint(self, key, platform, attempts=1)
+
+        self.save(checkpoint)
+        return checkpoint
+
+    def load(self, key: str) -> Optional[ApplyCheckpoint]:
+        """Read a checkpoint without counting an attempt."""
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT platform, completed_steps, answers, attempts FROM step_checkpoints WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if not row:
+            return None
+        return ApplyCheckpoint(
+            self, key, row[0],
+            completed_steps=json.loads(row[1] or '[]'),
+            answers=json.loads(row[2] or '{}'),
+            attempts=int(row[3] or 0),
+        )
+
+    def save(self, checkpoint: ApplyCheckpoint):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT INTO step_checkpoints (key, platform, completed_steps, answers, attempts, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    platform = excluded.platform,
+                    completed_steps = excluded.completed_steps,
+                    answers = excluded.answers,
+                    attempts = excluded.attempts,
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    checkpoint.key,
+                    checkpoint.platform,
+                    json.dumps(checkpoint.completed_steps),
+                    json.dumps(checkpoint.answers),
+                    checkpoint.attempts,
+                    datetime.now().isoformat(),
+                ),
+            )
+            conn.commit()
+        self.stats['saved'] += 1
+
+    def clear(self, key: Optional[str]):
+        """Drop a checkpoint once its queue item is finished."""
+        if not key:
+            return
+        with sqlite3.connect(self.db_path) as conn:
+            deleted = conn.execute("DELETE FROM step_checkpoints WHERE key = ?", (key,)).rowcount
+            conn.commit()
+        if deleted:
+            self.stats['cleared'] += 1
+
+
+# Singleton
+_step_checkpoint_store: Optional[StepCheckpointStore] = None
+
+
+def get_step_checkpoint_store() -> StepCheckpointStore:
+    """Get singleton StepCheckpointStore instance."""
+    global _step_checkpoint_store
+    if _step_checkpoint_store is None:
+        _step_checkpoint_store = StepCheckpointStore()
+    return _step_checkpoint_store
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Storage-State Snapshots for Authenticated Sessions
+
+Persists per-user, per-platform Playwright storage state (cookies + localStorage)
+so new browser contexts can be seeded directly instead of rebuilding the
+authenticated state from a single cookie and re-running login checks.
+
+Snapshots hold whole authenticated sessions (e.g. LinkedIn ``li_at``), so
+they are encrypted at rest with Fernet (AES-128-CBC + HMAC-SHA256) under a
+key derived from the server's ``JWT_SECRET_KEY`` with HKDF. Without the
+``cryptography`` package no snapshots are written or read.
+
+Example:
+    from core.storage_state import get_storage_state_store
+
+    store = get_storage_state_store()
+    state = store.load(user_id, "linkedin")
+    if state:
+        await store.apply_to_context(context, state)
+    ...
+    await store.capture_and_save(context, user_id, "linkedin")
+"""
+
+import os
+import json
+import time
+import base64
+import hashlib
+import logging
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+from api.auth import SECRET_KEY
+from api.config import config
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+    CRYPTO_AVAILABLE = True
+except ImportError:
+    CRYPTO_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+if not CRYPTO_AVAILABLE:
+    logger.warning("[StorageState] cryptography not installed; session snapshots are disabled")
+
+
+def _snapshot_cipher(secret: str = SECRET_KEY) -> "Fernet":
+    """Fernet cipher keyed by HKDF-SHA256 of the server secret (separate from JWT signing)."""
+    key = HKDF(
+        algorithm=hashes.SHA256(), length=32, salt=b"storage-state", info=b"playwright-storage-state-v1",
+    ).derive(secret.encode())
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+# URL fragments that mean the stored state no longer authenticates.
+LOGGED_OUT_URL_MARKERS = ("/login", "/signup", "/checkpoint", "/authwall", "/uas/login")
+
+
+class StorageStateStore:
+    """
+    Encrypted on-disk store of Playwright storage-state snapshots.
+
+    One file per (user, platform). A snapshot older than ``max_age_hours`` is
+    treated as missing so stale sessions fall back to the cookie login path.
+    """
+
+    def __init__(self, base_dir: Optional[str] = None, max_age_hours: Optional[float] = None):
+        self.base_dir = Path(base_dir or config.STORAGE_STATE_DIR)
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._cipher = _snapshot_cipher() if CRYPTO_AVAILABLE else None
+        self.max_age_seconds = float(
+            max_age_hours if max_age_hours is not None else config.STORAGE_STATE_MAX_AGE_HOURS
+        ) * 3600
+
+        self.stats = {
+            'loaded': 0,
+            'missing': 0,
+            'expired': 0,
+            'saved': 0,
+            'invalidated': 0,
+        }
+
+    def _path(self, user_id: str, platform: str) -> Path:
+        """File path for a (user, platform) snapshot; user ids are hashed."""
+        digest = hashlib.sha256(f"{user_id}:{platform}".encode()).hexdigest()[:32]
+        return self.base_dir / f"{platform}_{digest}.state"
+
+    def load(self, user_id: str, platform: str) -> Optional[Dict[str, Any]]:
+        """Load a decrypted snapshot, or None if missing, expired or unreadable."""
+        if not user_id or self._cipher is None:
+            return None
+
+        path = self._path(user_id, platform)
+        if not path.exists():
+            self.stats['missing'] += 1
+            return None
+
+        if self.max_age_seconds and (time.time() - path.stat().st_mtime) > self.max_age_seconds:
+            self.stats['expired'] += 1
+            logger.info(f"[StorageState] Snapshot expired for {platform}")
+            return None
+
+        try:
+            state = json.loads(self._cipher.decrypt(path.read_bytes()))
+        except InvalidToken:
+            # Tampered, written under another secret, or an old-format snapshot.
+            logger.warning(f"[StorageState] Snapshot for {platform} failed authentication; ignoring it")
+            return None
+        except Exception as e:
+            logger.warning(f"[StorageState] Unreadable snapshot for {platform}: {e}")
+            return None
+
+        if not isinstance(state, dict) or not state.get("cookies"):
+            return None
+
+        self.stats['loaded'] += 1
+        return state
+
+    def save(self, user_id: str, platform: str, state: Dict[str, Any]) -> bool:
+        """Encrypt and persist a snapshot."""
+        if not user_id or not isinstance(state, dict) or not state.get("cookies"):
+            return False
+        if self._cipher is None:
+            return False
+
+        path = self._path(user_id, platform)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            tmp_path.write_bytes(self._cipher.encrypt(json.dumps(state).encode()))
+            os.replace(tmp_path, path)
+            self.stats['saved'] += 1
+            logger.info(f"[StorageState] Saved {platform} snapshot ({len(state['cookies'])} cookies)")
+            return True
+        except Exception as e:
+            logger.warning(f"[StorageState] Failed to save {platform} snapshot: {e}")
+            return False
+
+    def invalidate(self, user_id: str, platform: str):
+        """Drop a snapshot (e.g. after landing on a login page)."""
+        if not user_id:
+            return
+        path = self._path(user_id, platform)
+        if path.exists():
+            path.unlink()
+            self.stats['invalidated'] += 1
+            logger.info(f"[StorageState] Invalidated {platform} snapshot")
+
+    async def apply_to_context(self, context, state: Dict[str, Any]) -> bool:
+        """
+        Seed an existing browser context from a snapshot.
+
+        Cookies are added directly. localStorage is restored through an init
+        script that only fills keys the page has not set itself.
+        """
+        if context is None or not state:
+            return False
+
+        try:
+            cookies = state.get("cookies") or []
+            if cookies:
+                await context.add_cookies(cookies)
+
+            local_storage = {
+                origin["origin"]: [[item["name"], item["value"]] for item in origin.get("localStorage", [])]
+                for origin in state.get("origins") or []
+                if origin.get("origin") and origin.get("localStorage")
+            }
+            if local_storage:
+                await context.add_init_script(script=(
+                    "(() => {"
+                    f" const entries = {json.dumps(local_storage)}[window.location.origin];"
+                    " if (!entries) return;"
+                    " for (const [k, v] of entries) {"
+                    "  try { if (window.localStorage.getItem(k) === null) window.localStorage.setItem(k, v); }"
+                    "  catch (e) {}"
+                    " }"
+                    "})();"
+                ))
+            return True
+        except Exception as e:
+            logger.warning(f"[StorageState] Failed to apply snapshot: {e}")
+            return False
+
+    async def capture_and_save(self, context, user_id: str, platform: str) -> bool:
+        """Capture the context's current storage state and persist it."""
+        if context is None or not user_id:
+            return False
+        try:
+            state = await context.storage_state()
+        except Exception as e:
+            logger.debug(f"[StorageState] Could not capture {platform} state: {e}")
+            return False
+        return self.save(user_id, platform, state)
+
+
+def is_logged_out_url(url: str) -> bool:
+    """Check whether a URL indicates the session is no longer authenticated."""
+    url = (url or "").lower()
+    return any(marker in url for marker in LOGGED_OUT_URL_MARKERS)
+
+
+# Singleton
+_storage_state_store: Optional[StorageStateStore] = None
+
+
+def get_storage_state_store() -> StorageStateStore:
+    """Get singleton StorageStateStore instance."""
+    global _storage_state_store
+    if _storage_state_store is None:
+        _storage_state_store = StorageStateStore()
+    return _storage_state_store
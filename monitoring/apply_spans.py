@@ -0,0 +1,185 @@
+"""
+Apply Timing Spans
+Per-phase timing for a single application attempt.
+
+``apply_job_url`` opens a trace for each application; adapters and handlers
+mark the phase they are in (navigation, field discovery, form fill, LLM
+answering, upload, CAPTCHA, submit, verification). The trace lives in a
+context variable, so adapters don't need it passed in. With no active trace
+every call is a no-op.
+
+Sequential phases use ``mark_phase`` (each mark closes the previous phase);
+work that can happen inside another phase, such as an LLM answer during
+form fill, uses the ``apply_span`` context manager.
+
+Example:
+    from monitoring.apply_spans import mark_phase, apply_span
+
+    mark_phase("navigation")
+    await page.goto(url)
+    mark_phase("form_fill")
+    with apply_span("llm_answer"):
+        answer = await ai.answer(question)
+"""
+
+import math
+import time
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Phase names used across adapters (free-form names are still accepted).
+NAVIGATION = "navigation"
+FIELD_DISCOVERY = "field_discovery"
+FORM_FILL = "form_fill"
+LLM_ANSWER = "llm_answer"
+UPLOAD = "upload"
+CAPTCHA = "captcha"
+SUBMIT = "submit"
+VERIFY = "verify"
+
+
+@dataclass
+class Span:
+    """One timed phase of an application."""
+    phase: str
+    started_at: str
+    duration_ms: float
+    ok: bool = True
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ApplyTrace:
+    """Spans collected for one application attempt."""
+
+    def __init__(self, application_id: str, platform: str, user_id: Optional[str] = None):
+        self.application_id = application_id
+        self.platform = platform
+        self.user_id = user_id
+        self.spans: List[Span] = []
+        self._open: Optional[tuple] = None  # (phase, perf_counter start, wall start)
+
+    def mark(self, phase: str):
+        """Close the current sequential phase and start ``phase``."""
+        self.end_phase()
+        self._open = (phase, time.perf_counter(), datetime.now().isoformat())
+
+    def end_phase(self, ok: bool = True):
+        """Close the current sequential phase, if any."""
+        if self._open is None:
+            return
+        phase, start, started_at = self._open
+        self._open = None
+        self.record(phase, (time.perf_counter() - start) * 1000, started_at, ok)
+
+    def record(self, phase: str, duration_ms: float, started_at: Optional[str] = None, ok: bool = True):
+        self.spans.append(Span(
+            phase=phase,
+            started_at=started_at or datetime.now().isoformat(),
+            duration_ms=round(duration_ms, 2),
+            ok=ok,
+        ))
+
+    def totals(self) -> Dict[str, float]:
+        """Total milliseconds per phase."""
+        out: Dict[str, float] = {}
+        for span in self.spans:
+            out[span.phase] = round(out.get(span.phase, 0.0) + span.duration_ms, 2)
+        return out
+
+
+_current_trace: ContextVar[Optional[ApplyTrace]] = ContextVar("apply_trace", default=None)
+
+
+def start_apply_trace(application_id: str, platform: str, user_id: Optional[str] = None):
+    """Start a trace for the current task. Returns (trace, token) for ``finish_apply_trace``."""
+    trace = ApplyTrace(application_id, platform, user_id)
+    token = _current_trace.set(trace)
+    return trace, token
+
+
+def finish_apply_trace(token, ok: bool = True) -> Optional[ApplyTrace]:
+    """Close the open phase and detach the trace from the current task."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.end_phase(ok=ok)
+    _current_trace.reset(token)
+    return trace
+
+
+def current_trace() -> Optional[ApplyTrace]:
+    return _current_trace.get()
+
+
+def mark_phase(phase: str):
+    """Start a sequential phase on the active trace (no-op without one)."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.mark(phase)
+
+
+@contextmanager
+def apply_span(phase: str):
+    """Time a block as ``phase`` on the active trace (no-op without one)."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    started_at = datetime.now().isoformat()
+    start = time.perf_counter()
+    ok = True
+    try:
+        yield
+    except BaseException:
+        ok = False
+        raise
+    finally:
+        trace.record(phase, (time.perf_counter() - start) * 1000, started_at, ok)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values`` (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = math.ceil(pct / 100.0 * len(ordered))
+    return ordered[max(0, min(len(ordered), rank) - 1)]
+
+
+def aggregate_phase_latencies(rows: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Aggregate span rows into per-platform, per-phase latency stats.
+
+    Each row needs ``platform``, ``phase`` and ``duration_ms``. Durations of the
+    same phase within one application are summed first, so p50/p95 are per
+    application rather than per span.
+    """
+    per_app: Dict[tuple, float] = {}
+    for row in rows:
+        key = (row.get("platform") or "unknown", row["phase"], row.get("application_id"))
+        per_app[key] = per_app.get(key, 0.0) + float(row["duration_ms"])
+
+    grouped: Dict[str, Dict[str, List[float]]] = {}
+    for (platform, phase, _app), total in per_app.items():
+        grouped.setdefault(platform, {}).setdefault(phase, []).append(total)
+
+    return {
+        platform: {
+            phase: {
+                "count": len(values),
+                "p50_ms": round(percentile(values, 50), 2),
+                "p95_ms": round(percentile(values, 95), 2),
+                "avg_ms": round(sum(values) / len(values), 2),
+            }
+            for phase, values in phases.items()
+        }
+        for platform, phases in grouped.items()
+    }
@@ -0,0 +1,234 @@
+"""
+LLM Usage Ledger
+Token, latency and cost of every LLM call, tagged by call site, user,
+campaign and application.
+
+``LLMClient.chat_completion`` records one row per request. Tags come from
+``llm_context`` (``ai.llm_governor``): the apply flow tags the user,
+campaign and application, and callers name their call site (cover_letter,
+question_answer, tailoring, selector_ai, vision, ...). Token counts come
+from the response's ``usage`` when present, otherwise from the request
+estimate (flagged ``estimated``).
+
+Cost uses per-model prices in USD per million tokens. Override or extend
+them with ``LLM_PRICING`` as a JSON object, for example
+``{"moonshot-v1-8k": [0.2, 2.0]}`` (input, output).
+
+Each row also records the ``LLM_BACKEND`` mode it ran under (live, record
+or replay, see ``ai.llm_replay``). Replayed calls never reach a provider, so
+they are stored at zero cost; filter or group by ``backend`` to keep
+benchmark runs out of production reports.
+
+Example:
+    from monitoring.llm_usage import get_llm_usage_ledger
+
+    ledger = get_llm_usage_ledger()
+    ledger.summary(since=time.time() - 86400, group_by="call_site")
+    ledger.campaign_rollup(campaign_id)
+"""
+
+import json
+import time
+import sqlite3
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from api.config import config
+
+logger = logging.getLogger(__name__)
+
+
+# USD per million (input, output) tokens; longest matching model prefix wins.
+DEFAULT_PRICING: Dict[str, Tuple[float, float]] = {
+    "moonshot-v1-8k": (0.20, 2.00),
+    "moonshot-v1-32k": (1.00, 3.00),
+    "moonshot-v1-128k": (2.00, 5.00),
+    "kimi-k2": (0.60, 2.50),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+}
+
+GROUP_COLUMNS = ("call_site", "model", "lane", "user_id", "campaign_id", "application_id", "backend")
+
+
+def load_pricing() -> Dict[str, Tuple[float, float]]:
+    pricing = dict(DEFAULT_PRICING)
+    if config.LLM_PRICING:
+        try:
+            for model, prices in json.loads(config.LLM_PRICING).items():
+                pricing[model] = (float(prices[0]), float(prices[1]))
+        except (ValueError, TypeError, IndexError, AttributeError) as e:
+            logger.warning(f"[LLMUsage] Ignoring invalid LLM_PRICING: {e}")
+    return pricing
+
+
+def call_cost(model: str, prompt_tokens: int, completion_tokens: int,
+              pricing: Optional[Dict[str, Tuple[float, float]]] = None) -> float:
+    """USD cost of a call; 0.0 for models without a price."""
+    pricing = pricing or DEFAULT_PRICING
+    match = max((m for m in pricing if (model or "").startswith(m)), key=len, default=None)
+    if match is None:
+        return 0.0
+    price_in, price_out = pricing[match]
+    return (prompt_tokens * price_in + completion_tokens * price_out) / 1_000_000
+
+
+class LLMUsageLedger:
+    """SQLite-backed ledger of LLM calls with grouped rollups."""
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = Path(db_path or config.LLM_USAGE_DB)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.pricing = load_pricing()
+        self._init_db()
+
+    def _init_db(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_calls (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    ts REAL NOT NULL,
+                    call_site TEXT NOT NULL,
+                    model TEXT,
+                    lane TEXT,
+                    user_id TEXT,
+                    campaign_id TEXT,
+                    application_id TEXT,
+                    prompt_tokens INTEGER DEFAULT 0,
+                    completion_tokens INTEGER DEFAULT 0,
+                    total_tokens INTEGER DEFAULT 0,
+                    estimated INTEGER DEFAULT 0,
+                    latency_ms REAL,
+                    cost_usd REAL DEFAULT 0,
+                    ok INTEGER DEFAULT 1,
+                    status INTEGER,
+                    backend TEXT DEFAULT 'live'
+                )
+            """)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(llm_calls)")}
+            if "backend" not in columns:
+                conn.execute("ALTER TABLE llm_calls ADD COLUMN backend TEXT DEFAULT 'live'")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_calls_ts ON llm_calls(ts)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_calls_campaign ON llm_calls(campaign_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_calls_application ON llm_calls(application_id)")
+            conn.commit()
+
+    def record(
+        self,
+        *,
+        call_site: str,
+        model: Optional[str],
+        latency_ms: float,
+        usage: Optional[Dict[str, Any]] = None,
+        estimated_tokens: int = 0,
+        ok: bool = True,
+        status: Optional[int] = None,
+        lane: Optional[str] = None,
+        user_id: Optional[str] = None,
+        campaign_id: Optional[str] = None,
+        application_id: Optional[str] = None,
+        backend: str = "live",
+    ) -> float:
+        """Store one call and return its cost in USD (0.0 for replayed calls)."""
+        usage = usage if isinstance(usage, dict) else {}
+        prompt = int(usage.get("prompt_tokens") or 0)
+        completion = int(usage.get("completion_tokens") or 0)
+        total = int(usage.get("total_tokens") or prompt + completion)
+        estimated = not total
+        if estimated:
+            # No usage reported (errors, some providers): count the request estimate as prompt.
+            prompt = total = int(estimated_tokens) if ok else 0
+        cost = 0.0 if backend == "replay" else call_cost(model or "", prompt, completion, self.pricing)
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """INSERT INTO llm_calls
+                   (ts, call_site, model, lane, user_id, campaign_id, application_id,
+                    prompt_tokens, completion_tokens, total_tokens, estimated,
+                    latency_ms, cost_usd, ok, status, backend)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (time.time(), call_site, model, lane, user_id, campaign_id, application_id,
+                 prompt, completion, total, int(estimated), round(latency_ms, 2), cost, int(ok), status,
+                 backend),
+            )
+            conn.commit()
+        return cost
+
+    def _where(self, since: Optional[float], filters: Dict[str, Optional[str]]) -> Tuple[str, list]:
+        clauses, params = [], []
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since)
+        for column, value in filters.items():
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def summary(
+        self,
+        since: Optional[float] = None,
+        group_by: str = "call_site",
+        campaign_id: Optional[str] = None,
+        application_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        backend: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Calls, tokens, cost and latency grouped by one tag, most expensive first."""
+        if group_by not in GROUP_COLUMNS:
+            raise ValueError(f"group_by must be one of {', '.join(GROUP_COLUMNS)}")
+        where, params = self._where(
+            since, {"campaign_id": campaign_id, "application_id": application_id, "user_id": user_id,
+                    "backend": backend}
+        )
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(
+                f"""SELECT {group_by} AS key,
+                           COUNT(*) AS calls,
+                           SUM(1 - ok) AS errors,
+                           SUM(prompt_tokens) AS prompt_tokens,
+                           SUM(completion_tokens) AS completion_tokens,
+                           SUM(total_tokens) AS total_tokens,
+                           SUM(cost_usd) AS cost_usd,
+                           AVG(latency_ms) AS avg_latency_ms,
+                           MAX(latency_ms) AS max_latency_ms,
+                           SUM(latency_ms) AS total_latency_ms,
+                           COUNT(DISTINCT application_id) AS applications
+                    FROM llm_calls{where}
+                    GROUP BY {group_by}
+                    ORDER BY cost_usd DESC, total_tokens DESC""",
+                params,
+            ).fetchall()
+        return [_rounded(dict(row)) for row in rows]
+
+    def campaign_rollup(self, campaign_id: Optional[str] = None, since: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Per-campaign totals, cost per application and the call-site breakdown."""
+        campaigns = self.summary(since=since, group_by="campaign_id", campaign_id=campaign_id)
+        for campaign in campaigns:
+            sites = self.summary(since=since, group_by="call_site", campaign_id=campaign["key"])
+            apps = campaign["applications"]
+            campaign["campaign_id"] = campaign.pop("key")
+            campaign["cost_per_application_usd"] = round(campaign["cost_usd"] / apps, 6) if apps else None
+            campaign["tokens_per_application"] = round(campaign["total_tokens"] / apps) if apps else None
+            campaign["by_call_site"] = sites
+        return [c for c in campaigns if c["campaign_id"] is not None]
+
+
+def _rounded(row: Dict[str, Any]) -> Dict[str, Any]:
+    for key in ("avg_latency_ms", "max_latency_ms", "total_latency_ms"):
+        row[key] = round(row[key] or 0.0, 2)
+    row["cost_usd"] = round(row["cost_usd"] or 0.0, 6)
+    return row
+
+
+_llm_usage_ledger: Optional[LLMUsageLedger] = None
+
+
+def get_llm_usage_ledger() -> LLMUsageLedger:
+    """Get singleton LLMUsageLedger instance."""
+    global _llm_usage_ledger
+    if _llm_usage_ledger is None:
+        _llm_usage_ledger = LLMUsageLedger()
+    return _llm_usage_ledger
@@ -5,11 +5,15 @@ Generates all job applier improvements simultaneously.
 """
 
 import asyncio
-import aiohttp
 import os
+import sys
 import json
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ai.llm_client import LLMRequestError, get_llm_client, close_llm_client
+
 MOONSHOT_API_KEY = os.environ.get("MOONSHOT_API_KEY")
 MOONSHOT_URL = "https://api.moonshot.ai/v1/chat/completions"
 
@@ -142,13 +146,8 @@ Output ONLY the Python code, no explanations."""
 }
 
 
-async def call_kimi(session, task_name, task_info):
+async def call_kimi(client, task_name, task_info):
     """Call Kimi API for a single task."""
-    headers = {
-        "Authorization": f"Bearer {MOONSHOT_API_KEY}",
-        "Content-Type": "application/json"
-    }
-    
     payload = {
         "model": "moonshot-v1-8k",
         "messages": [
@@ -161,28 +160,22 @@ async def call_kimi(session, task_name, task_info):
     print(f"[{task_name}] Starting...")
     
     try:
-        async with session.post(MOONSHOT_URL, headers=headers, json=payload, timeout=120) as resp:
-            if resp.status != 200:
-                error = await resp.text()
-                print(f"[{task_name}] API Error: {resp.status} - {error[:100]}")
-                return task_name, None
-            
-            data = await resp.json()
-            code = data["choices"][0]["message"]["content"]
-            
-            # Clean up code (remove markdown if present)
-            if code.startswith("```python"):
-                code = code[9:]
-            if code.startswith("```"):
-                code = code[3:]
-            if code.endswith("```"):
-                code = code[:-3]
-            
-            print(f"[{task_name}] ✅ Generated {len(code)} chars")
-            return task_name, code.strip()
+        data = await client.chat_completion(MOONSHOT_URL, MOONSHOT_API_KEY, payload, timeout=120)
+        code = data["choices"][0]["message"]["content"]
+        
+        # Clean up code (remove markdown if present)
+        if code.startswith("```python"):
+            code = code[9:]
+        if code.startswith("```"):
+            code = code[3:]
+        if code.endswith("```"):
+            code = code[:-3]
+        
+        print(f"[{task_name}] ✅ Generated {len(code)} chars")
+        return task_name, code.strip()
             
-    except asyncio.TimeoutError:
-        print(f"[{task_name}] ❌ Timeout")
+    except LLMRequestError as e:
+        print(f"[{task_name}] API Error: {str(e)[:100]}")
         return task_name, None
     except Exception as e:
         print(f"[{task_name}] ❌ Error: {e}")
@@ -204,14 +197,17 @@ async def main():
     core_dir = Path(__file__).parent.parent / "core"
     core_dir.mkdir(exist_ok=True)
     
-    # Run all tasks in parallel
-    async with aiohttp.ClientSession() as session:
+    # Run all tasks in parallel over the shared, pooled LLM client
+    client = get_llm_client()
+    try:
         tasks = [
-            call_kimi(session, name, info) 
+            call_kimi(client, name, info) 
             for name, info in TASKS.items()
         ]
         
         results = await asyncio.gather(*tasks)
+    finally:
+        await close_llm_client()
     
     # Save results
     print()
@@ -324,6 +324,16 @@ def setup_test_env():
         test_db.unlink()
 
 
+@pytest.fixture
+def llm_usage_ledger(tmp_path, monkeypatch):
+    """Send LLMClient usage rows to a throwaway ledger instead of data/llm_usage.db."""
+    from monitoring.llm_usage import LLMUsageLedger
+
+    ledger = LLMUsageLedger(db_path=str(tmp_path / "llm_usage.db"))
+    monkeypatch.setattr("ai.llm_client.get_llm_usage_ledger", lambda: ledger)
+    return ledger
+
+
 @pytest.fixture(autouse=True, scope="session")
 def init_test_database():
     """Initialize test database before all tests."""
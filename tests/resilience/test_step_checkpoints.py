@@ -0,0 +1,190 @@
+"""
+Resilience Tests - Step Checkpoints
+A retried queue item should reuse recorded steps and answers.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+
+@pytest.mark.resilience
+class TestStepCheckpointStore:
+    """Persistence of completed steps and answers per queue item."""
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_survives_reopen(self, tmp_path):
+        from core.step_checkpoints import StepCheckpointStore
+
+        store = StepCheckpointStore(db_path=str(tmp_path / "checkpoints.db"))
+        first = store.open("queue-1", "workday")
+        assert not first.resumed
+        await first.mark_done("my_information")
+        await first.set_answer("Are you legally authorized to work?  *", "Yes")
+
+        retry = StepCheckpointStore(db_path=str(tmp_path / "checkpoints.db")).open("queue-1", "workday")
+        assert retry.resumed
+        assert retry.attempts == 2
+        assert retry.is_done("my_information")
+        assert retry.get_answer("are you legally authorized to work?") == "Yes"
+        assert retry.reused_answers == 1
+
+    @pytest.mark.asyncio
+    async def test_clear_and_no_key(self, tmp_path):
+        from core.step_checkpoints import StepCheckpointStore
+
+        store = StepCheckpointStore(db_path=str(tmp_path / "checkpoints.db"))
+        assert store.open(None, "linkedin") is None
+
+        await store.open("queue-2", "linkedin").mark_done("resume")
+        store.clear("queue-2")
+        assert store.load("queue-2") is None
+
+    @pytest.mark.asyncio
+    async def test_writes_run_off_the_event_loop(self, tmp_path):
+        import threading
+
+        from core.step_checkpoints import StepCheckpointStore
+
+        class RecordingStore(StepCheckpointStore):
+            save_threads = []
+
+            def save(self, checkpoint):
+                self.save_threads.append(threading.get_ident())
+                super().save(checkpoint)
+
+        store = RecordingStore(db_path=str(tmp_path / "checkpoints.db"))
+        checkpoint = store.open("queue-5", "workday")
+        RecordingStore.save_threads.clear()
+
+        await checkpoint.mark_done("my_information")
+        await checkpoint.set_answer("Years of Python?", "6")
+
+        assert len(RecordingStore.save_threads) == 2
+        assert threading.get_ident() not in RecordingStore.save_threads
+        assert store.load("queue-5").answers == {"years of python": "6"}
+
+
+class _Locator:
+    """Tiny stand-in for a Playwright locator."""
+
+    def __init__(self, count=0, text="", enabled=True):
+        self._count = count
+        self._text = text
+        self._enabled = enabled
+        self.first = self
+        self.click = AsyncMock()
+
+    async def count(self):
+        return self._count
+
+    async def is_enabled(self):
+        return self._enabled
+
+    async def inner_text(self):
+        return self._text
+
+
+@pytest.mark.resilience
+class TestWorkdayResume:
+    """Workday skips refilling steps a previous attempt completed."""
+
+    @pytest.mark.asyncio
+    async def test_completed_step_is_advanced_without_refill(self, tmp_path):
+        from adapters.workday import WorkdayAdapter
+        from adapters.base import JobPosting, PlatformType, Resume, UserProfile, ApplicationStatus
+        from core.step_checkpoints import StepCheckpointStore
+
+        store = StepCheckpointStore(db_path=str(tmp_path / "checkpoints.db"))
+        await store.open("queue-3", "workday").mark_done("my_information")
+        checkpoint = store.open("queue-3", "workday")
+
+        steps = iter(["my_information", "confirmation"])
+        next_btn = _Locator(count=1)
+        locators = {
+            '[data-automation-id="jobApplyButton"], button:has-text("Apply")': _Locator(count=1),
+            '[data-automation-id="bottom-navigation-next-button"]': next_btn,
+        }
+        page = MagicMock()
+        page.goto = AsyncMock()
+        page.locator = lambda sel: locators.get(sel, _Locator(count=0))
+
+        browser = MagicMock()
+        browser.human_like_delay = AsyncMock()
+        browser.human_like_click = AsyncMock()
+
+        adapter = WorkdayAdapter(browser)
+        adapter.get_session = AsyncMock(return_value=MagicMock(page=page))
+        adapter._detect_step_type = AsyncMock(side_effect=lambda _page: next(steps))
+        adapter._handle_personal_info = AsyncMock()
+        adapter.checkpoint = checkpoint
+
+        job = JobPosting(id="wd1", platform=PlatformType.WORKDAY, title="Eng", company="Acme",
+                         location="Remote", url="https://acme.wd5.myworkdayjobs.com/job/1")
+        profile = UserProfile(first_name="A", last_name="B", email="a@b.c", phone="1")
+        resume = Resume(file_path="/tmp/r.pdf", raw_text="", parsed_data={})
+
+        result = await adapter.apply_to_job(job, resume, profile, auto_submit=True)
+
+        assert result.status == ApplicationStatus.SUBMITTED
+        adapter._handle_personal_info.assert_not_awaited()
+        next_btn.click.assert_awaited_once()
+
+
+class _Question:
+    """Easy Apply question container with one empty text input."""
+
+    def __init__(self, label):
+        self.label = _Locator(count=1, text=label)
+        self.input = MagicMock()
+        self.input.first = self.input
+        self.input.count = AsyncMock(return_value=1)
+        self.input.input_value = AsyncMock(return_value="")
+        self.input.evaluate = AsyncMock(return_value="input")
+        self.input.get_attribute = AsyncMock(return_value="text")
+        self.input.fill = AsyncMock()
+
+    def locator(self, selector):
+        return self.input if selector.startswith("input") else self.label
+
+
+@pytest.mark.resilience
+class TestLinkedInResume:
+    """The live LinkedIn Easy Apply flow reuses and records checkpoint answers."""
+
+    @pytest.mark.asyncio
+    async def test_stored_answers_are_reused_and_new_ones_recorded(self, tmp_path):
+        from unittest.mock import patch
+
+        from adapters.linkedin import LinkedInAdapter
+        from adapters.base import Resume, UserProfile
+        from core.step_checkpoints import StepCheckpointStore
+
+        store = StepCheckpointStore(db_path=str(tmp_path / "checkpoints.db"))
+        await store.open("queue-4", "linkedin").set_answer("Years of Python?", "6")
+        checkpoint = store.open("queue-4", "linkedin")
+
+        python_q, why_q = _Question("Years of Python?"), _Question("Why Acme?")
+        page = MagicMock()
+        page.locator = lambda sel: MagicMock(all=AsyncMock(
+            return_value=[python_q, why_q] if sel == ".jobs-easy-apply-form-section__question" else []
+        ))
+        form_intelligence = MagicMock()
+        form_intelligence.answer_questions = AsyncMock(return_value=["I like the product."])
+
+        adapter = LinkedInAdapter()
+        adapter.ai_service = MagicMock()
+        adapter.checkpoint = checkpoint
+        profile = UserProfile(first_name="A", last_name="B", email="a@b.c", phone="1")
+        resume = Resume(file_path="/tmp/r.pdf", raw_text="", parsed_data={})
+
+        with patch("ai.form_intelligence.get_form_intelligence", return_value=form_intelligence):
+            answered = await adapter._answer_custom_questions(page, resume, profile)
+
+        asked = form_intelligence.answer_questions.await_args.args[0]
+        assert [q["question"] for q in asked] == ["Why Acme?"]
+        python_q.input.fill.assert_awaited_once_with("6")
+        why_q.input.fill.assert_awaited_once_with("I like the product.")
+        assert len(answered) == 2
+
+        retry = store.open("queue-4", "linkedin")
+        assert retry.get_answer("Why Acme?") == "I like the product."
@@ -0,0 +1,87 @@
+"""
+Tests for the two-tier AI response cache.
+"""
+
+import sqlite3
+import time
+import pytest
+
+
+@pytest.fixture
+def cache(tmp_path):
+    from ai.cache.kimi_cache import CachedKimiService
+
+    return CachedKimiService(
+        api_key="test-key",
+        db_path=str(tmp_path / "ai_cache.db"),
+        max_memory_entries=2,
+        max_db_entries=3,
+        stats_flush_size=3,
+    )
+
+
+def _rows(cache, sql, *params):
+    with sqlite3.connect(cache.db_path) as conn:
+        return conn.execute(sql, params).fetchall()
+
+
+class TestLRUTTLCache:
+    """Bounded memory tier."""
+
+    def test_lru_eviction_and_ttl(self):
+        from ai.cache.kimi_cache import LRUTTLCache, CacheEntry
+
+        lru = LRUTTLCache(max_entries=2)
+        now = time.time()
+        for key in ("a", "b"):
+            lru.set(CacheEntry(key=key, response=key, method="", created_at=now, ttl_days=1, expires_at=now + 60))
+        assert lru.get("a") is not None  # "a" becomes most recent
+        lru.set(CacheEntry(key="c", response="c", method="", created_at=now, ttl_days=1, expires_at=now + 60))
+        assert "b" not in lru and "a" in lru and "c" in lru
+        assert lru.evictions == 1
+
+        lru.set(CacheEntry(key="old", response="x", method="", created_at=now, ttl_days=0, expires_at=now - 1))
+        assert lru.get("old") is None
+
+
+class TestCachedKimiService:
+    """Memory + SQLite tiers."""
+
+    @pytest.mark.asyncio
+    async def test_evicted_entries_are_served_from_sqlite(self, cache):
+        for key in ("k1", "k2", "k3"):
+            await cache._set_cache(key, {"v": key}, method="test")
+        assert len(cache.memory_cache) == 2
+
+        assert await cache._get_cache("k1") == {"v": "k1"}  # memory miss, DB hit
+        assert cache.get_stats()["memory_hits"] == 0
+        assert await cache._get_cache("k1") == {"v": "k1"}  # promoted to memory
+        assert cache.get_stats()["memory_hits"] == 1
+        assert await cache._get_cache("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_access_stats_are_batched(self, cache):
+        await cache._set_cache("k1", {"v": 1}, method="test")
+        await cache._get_cache("k1")
+        await cache._get_cache("k1")
+        assert _rows(cache, "SELECT access_count FROM ai_cache WHERE key = 'k1'") == [(0,)]
+
+        await cache.flush()
+        assert _rows(cache, "SELECT access_count FROM ai_cache WHERE key = 'k1'") == [(2,)]
+
+    @pytest.mark.asyncio
+    async def test_database_is_pruned_to_size(self, cache):
+        for i in range(6):
+            await cache._set_cache(f"k{i}", {"v": i}, method="test")
+        assert _rows(cache, "SELECT COUNT(*) FROM ai_cache")[0][0] <= 3
+        assert cache.get_stats()["db_evictions"] >= 3
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_binds_age(self, cache):
+        await cache._set_cache("fresh", {"v": 1}, method="test")
+        await cache._set_cache("stale", {"v": 2}, method="test")
+        with sqlite3.connect(cache.db_path) as conn:
+            conn.execute("UPDATE ai_cache SET created_at = datetime('now', '-40 days') WHERE key = 'stale'")
+
+        assert await cache.clear_cache(older_than_days=30) == 1
+        assert [r[0] for r in _rows(cache, "SELECT key FROM ai_cache")] == ["fresh"]
@@ -0,0 +1,215 @@
+"""
+Tests for the persistent per-profile answer bank.
+"""
+
+import uuid
+import pytest
+from unittest.mock import MagicMock, patch
+
+
+@pytest.fixture
+def bank(tmp_path):
+    from core.answer_bank import AnswerBank
+
+    return AnswerBank(db_path=str(tmp_path / "answer_bank.db"), threshold=0.9)
+
+
+class TestAnswerBank:
+    """Matching, isolation and overrides."""
+
+    def test_normalized_and_near_identical_questions_match(self, bank):
+        bank.store("u1", "Are you authorized to work in the US?", ["Yes", "No"], "Yes")
+
+        assert bank.lookup("u1", "  are you authorized to work in the US *", ["No", "Yes"]) == "Yes"
+        assert bank.lookup("u1", "Are you authorised to work in the US?", ["Yes", "No"]) == "Yes"
+        assert bank.stats["exact_hits"] == 1
+        assert bank.stats["fuzzy_hits"] == 1
+
+    def test_scoped_by_user_and_option_set(self, bank):
+        bank.store("u1", "Will you require sponsorship?", ["Yes", "No"], "No")
+
+        assert bank.lookup("u2", "Will you require sponsorship?", ["Yes", "No"]) is None
+        assert bank.lookup("u1", "Will you require sponsorship?", ["Yes", "No", "Maybe"]) is None
+        assert bank.lookup("u1", "How many years of Python do you have?", ["Yes", "No"]) is None
+
+    @pytest.mark.parametrize("stored,asked", [
+        ("How many years of experience do you have with Python?", "How many years of experience do you have with Java?"),
+        ("Are you authorized to work in the US?", "Are you authorized to work in the UK?"),
+        ("Are you willing to relocate to New York?", "Are you willing to relocate to Newark?"),
+        ("Do you have 5 years of experience?", "Do you have 3 years of experience?"),
+    ])
+    def test_questions_differing_in_a_content_word_do_not_match(self, bank, stored, asked):
+        bank.store("u1", stored, None, "Yes")
+
+        assert bank.lookup("u1", asked) is None
+        assert bank.stats["fuzzy_hits"] == 0
+
+    def test_generated_answers_never_replace_overrides(self, bank):
+        bank.store("u1", "Desired salary?", None, "Negotiable")
+        bank.set_override("u1", "Desired salary?", None, "150000")
+        assert not bank.store("u1", "Desired salary?", None, "Negotiable")
+
+        assert bank.lookup("u1", "Desired salary?") == "150000"
+        [row] = bank.list_answers("u1")
+        assert row["source"] == "user"
+        assert bank.delete("u1", row["id"])
+        assert bank.lookup("u1", "Desired salary?") is None
+
+
+    def test_lookups_buffer_use_counts(self, bank):
+        import sqlite3
+
+        bank.store("u1", "Are you authorized to work in the US?", ["Yes", "No"], "Yes")
+        for _ in range(3):
+            bank.lookup("u1", "Are you authorised to work in the US?", ["Yes", "No"])
+        with sqlite3.connect(bank.db_path) as conn:
+            assert conn.execute("SELECT uses FROM answer_bank").fetchone()[0] == 0
+
+        assert bank.list_answers("u1")[0]["uses"] == 3
+
+    def test_length_bounds_keep_every_possible_match(self):
+        from difflib import SequenceMatcher
+
+        from core.answer_bank import _length_bounds
+
+        a = "are you authorized to work in the us"
+        for b in ("are you authorised to work in the us", "are you authorized to work in the u s a",
+                  "are you legally authorized to work in the us"):
+            low, high = _length_bounds(len(a), 0.85)
+            if SequenceMatcher(None, a, b).ratio() >= 0.85:
+                assert low <= len(b) <= high
+        assert _length_bounds(40, 0.9)[1] < 60
+
+
+class TestFormIntelligenceReuse:
+    """Answers survive process restarts via the bank."""
+
+    @pytest.mark.asyncio
+    async def test_second_process_reuses_stored_answer(self, bank):
+        from ai.form_intelligence import FormIntelligence
+
+        calls = []
+
+        class Kimi:
+            async def generate_text(self, prompt, max_tokens=200):
+                calls.append(prompt)
+                return "Yes"
+
+        profile = {"user_id": "u1"}
+        first = FormIntelligence()
+        first.kimi_service, first.answer_bank = Kimi(), bank
+        assert await first.answer_question("Are you authorized to work in the US?", "radio", ["Yes", "No"], profile=profile) == "Yes"
+
+        restarted = FormIntelligence()
+        restarted.kimi_service, restarted.answer_bank = Kimi(), bank
+        answer = await restarted.answer_question("Are you authorized to work in the U.S.?", "radio", ["Yes", "No"], profile=profile)
+        other_user = await restarted.answer_question("Are you authorized to work in the US?", "radio", ["Yes", "No"], profile={"user_id": "u2"})
+
+        assert answer == "Yes" and other_user == "Yes"
+        assert len(calls) == 2  # first ask + the other user's
+
+
+class TestAnswerEndpoints:
+    """Users can review and override stored answers."""
+
+    def test_override_roundtrip(self, authenticated_client, bank):
+        with patch("core.answer_bank._answer_bank", bank):
+            resp = authenticated_client.put(
+                "/profile/answers",
+                json={"question": "Desired salary?", "answer": "150000"},
+            )
+            assert resp.status_code == 200
+
+            answers = authenticated_client.get("/profile/answers").json()["answers"]
+            assert answers[0]["answer"] == "150000"
+            assert answers[0]["source"] == "user"
+
+            assert authenticated_client.delete(f"/profile/answers/{answers[0]['id']}").status_code == 200
+            assert authenticated_client.delete(f"/profile/answers/{answers[0]['id']}").status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_override_after_first_recall_replaces_cached_answer(self, authenticated_client, bank):
+        from ai.form_intelligence import FormIntelligence
+
+        class Kimi:
+            async def generate_text(self, prompt, max_tokens=200):
+                return "Negotiable"
+
+        fi = FormIntelligence()
+        fi.kimi_service, fi.answer_bank = Kimi(), bank
+        profile = {"user_id": "test-user-uuid-1234"}
+        question = "What are your salary expectations?"
+
+        with patch("core.answer_bank._answer_bank", bank), \
+                patch("ai.form_intelligence._form_intelligence", fi):
+            assert await fi.answer_question(question, "text", profile=profile) == "Negotiable"
+            assert await fi.answer_question(question, "text", profile=profile) == "Negotiable"
+
+            authenticated_client.put("/profile/answers", json={"question": question, "answer": "150000"})
+            assert await fi.answer_question(question, "text", profile=profile) == "150000"
+
+            answer_id = authenticated_client.get("/profile/answers").json()["answers"][0]["id"]
+            authenticated_client.delete(f"/profile/answers/{answer_id}")
+            assert bank.lookup("test-user-uuid-1234", question) is None
+            assert await fi.answer_question(question, "text", profile=profile) == "Negotiable"
+
+    @pytest.mark.asyncio
+    async def test_override_is_used_by_live_form_fill(self, bank):
+        """PUT /profile/answers, then apply_job_url: the fill answers with the override."""
+        from fastapi.testclient import TestClient
+
+        import api.main as api_main
+        from adapters.base import ApplicationResult, ApplicationStatus, JobPosting, PlatformType
+        from ai.form_intelligence import FormIntelligence
+        from api.application_engine import ApplyOptions, apply_job_url
+        from api.database import init_database, save_profile, save_resume
+
+        user_id = f"answers-{uuid.uuid4().hex[:8]}"
+        await init_database()
+        await save_resume(user_id, "r.pdf", "Backend engineer.", {"summary": "Backend engineer."})
+        await save_profile(user_id, {"first_name": "Jane", "last_name": "Doe",
+                                     "email": f"{user_id}@example.com", "phone": "555-0100"})
+
+        class NoLLM:
+            async def generate_text(self, prompt, max_tokens=200):
+                raise AssertionError("the override should answer without the model")
+
+        filled = []
+
+        class Adapter:
+            user_id = checkpoint = None
+
+            async def get_job_details(self, url):
+                return JobPosting(id="gh_1", platform=PlatformType.GREENHOUSE, title="Engineer",
+                                  company="Acme", location="Remote", url=url)
+
+            async def apply_to_job(self, job, resume, profile, cover_letter=None, auto_submit=False):
+                # Same profile context the adapters hand to FormIntelligence.
+                fi = FormIntelligence()
+                fi.kimi_service = NoLLM()
+                filled.append(await fi.answer_question(
+                    "What are your salary expectations?", "text",
+                    profile={"user_id": getattr(profile, "user_id", None), "email": profile.email},
+                ))
+                return ApplicationResult(status=ApplicationStatus.PENDING_REVIEW, message="ready")
+
+        api_main.app.dependency_overrides[api_main.get_current_user] = lambda: user_id
+        try:
+            with patch("core.answer_bank._answer_bank", bank):
+                resp = TestClient(api_main.app).put(
+                    "/profile/answers",
+                    json={"question": "What are your salary expectations?", "answer": "150000"},
+                )
+                assert resp.status_code == 200
+
+                with patch("api.application_engine.get_adapter", return_value=Adapter()):
+                    await apply_job_url(
+                        user_id=user_id,
+                        job_url=f"https://boards.greenhouse.io/acme/jobs/{uuid.uuid4().int % 10**8}",
+                        browser_manager=MagicMock(), kimi=MagicMock(),
+                        options=ApplyOptions(generate_cover_letter=False),
+                    )
+        finally:
+            api_main.app.dependency_overrides.clear()
+
+        assert filled == ["150000"]
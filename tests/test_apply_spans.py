@@ -0,0 +1,112 @@
+"""
+Tests for per-phase apply timing spans.
+"""
+
+import asyncio
+import uuid
+import pytest
+
+
+class TestApplyTrace:
+    """Span recording through the context-local trace."""
+
+    def test_phases_are_sequential_and_spans_nest(self):
+        from monitoring.apply_spans import (
+            start_apply_trace, finish_apply_trace, mark_phase, apply_span, current_trace,
+        )
+
+        trace, token = start_apply_trace("app-1", "greenhouse", "user-1")
+        mark_phase("navigation")
+        mark_phase("form_fill")
+        with apply_span("llm_answer"):
+            pass
+        mark_phase("submit")
+        assert finish_apply_trace(token) is trace
+        assert current_trace() is None
+
+        assert [s.phase for s in trace.spans] == ["navigation", "llm_answer", "form_fill", "submit"]
+        assert set(trace.totals()) == {"navigation", "form_fill", "llm_answer", "submit"}
+
+    def test_failed_span_is_marked(self):
+        from monitoring.apply_spans import start_apply_trace, finish_apply_trace, apply_span
+
+        trace, token = start_apply_trace("app-2", "lever")
+        with pytest.raises(ValueError):
+            with apply_span("upload"):
+                raise ValueError("boom")
+        finish_apply_trace(token)
+        assert trace.spans[0].ok is False
+
+    def test_no_active_trace_is_noop(self):
+        from monitoring.apply_spans import mark_phase, apply_span, current_trace
+
+        mark_phase("navigation")
+        with apply_span("llm_answer"):
+            pass
+        assert current_trace() is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_applications_keep_separate_traces(self):
+        from monitoring.apply_spans import start_apply_trace, finish_apply_trace, mark_phase
+
+        async def run(app_id):
+            trace, token = start_apply_trace(app_id, "workday")
+            mark_phase(f"phase_{app_id}")
+            await asyncio.sleep(0.01)
+            finish_apply_trace(token)
+            return trace
+
+        a, b = await asyncio.gather(run("a"), run("b"))
+        assert [s.phase for s in a.spans] == ["phase_a"]
+        assert [s.phase for s in b.spans] == ["phase_b"]
+
+
+class TestAggregation:
+    """Per-platform p50/p95 phase latencies."""
+
+    def test_percentiles_per_application(self):
+        from monitoring.apply_spans import aggregate_phase_latencies, percentile
+
+        assert percentile([], 50) == 0.0
+        assert percentile([1, 2, 3, 4], 50) == 2
+        assert percentile(list(range(1, 101)), 95) == 95
+
+        rows = [
+            {"application_id": f"app{i}", "platform": "lever", "phase": "submit", "duration_ms": float(i)}
+            for i in range(1, 21)
+        ]
+        # Two llm spans in one application are summed before percentiles.
+        rows += [
+            {"application_id": "app1", "platform": "lever", "phase": "llm_answer", "duration_ms": 100.0},
+            {"application_id": "app1", "platform": "lever", "phase": "llm_answer", "duration_ms": 50.0},
+        ]
+        stats = aggregate_phase_latencies(rows)["lever"]
+        assert stats["submit"]["count"] == 20
+        assert stats["submit"]["p50_ms"] == 10.0
+        assert stats["submit"]["p95_ms"] == 19.0
+        assert stats["llm_answer"] == {"count": 1, "p50_ms": 150.0, "p95_ms": 150.0, "avg_ms": 150.0}
+
+    @pytest.mark.asyncio
+    async def test_spans_persist_and_aggregate_via_endpoint(self, client):
+        from api.database import init_database, save_apply_spans, get_apply_spans
+
+        # The suite shares one database; keep this test's rows to itself.
+        suffix = uuid.uuid4().hex[:8]
+        application_id, platform = f"app-db-{suffix}", f"greenhouse-{suffix}"
+
+        await init_database()
+        await save_apply_spans(application_id, "user-1", platform, [
+            {"phase": "navigation", "started_at": "2026-01-01T00:00:00", "duration_ms": 1200.0, "ok": True},
+            {"phase": "submit", "started_at": "2026-01-01T00:00:02", "duration_ms": 300.0, "ok": False},
+        ])
+
+        spans = await get_apply_spans(application_id)
+        assert [s["phase"] for s in spans] == ["navigation", "submit"]
+        assert spans[1]["ok"] is False
+
+        assert client.get("/admin/apply-timings").status_code == 403
+        response = client.get("/admin/apply-timings", params={"admin_key": "swiftadmin2026", "platform": platform})
+        assert response.status_code == 200
+        body = response.json()
+        assert body["applications"] == 1
+        assert body["platforms"][platform]["navigation"]["p50_ms"] == 1200.0
@@ -0,0 +1,82 @@
+"""
+Tests for batched screening-question answering in FormIntelligence.
+"""
+
+import pytest
+
+
+QUESTIONS = [
+    {"question": "Are you legally authorized to work in the US?", "type": "radio", "options": ["Yes", "No"]},
+    {"question": "Will you require visa sponsorship?", "type": "select", "options": ["Select...", "Yes", "No"]},
+    {"question": "Why do you want to work here?", "type": "text"},
+]
+
+
+class FakeKimi:
+    """Returns a scripted batch response and answers single questions with 'single'."""
+
+    def __init__(self, batch_response):
+        self.batch_response = batch_response
+        self.prompts = []
+
+    async def generate_text(self, prompt, max_tokens=200):
+        self.prompts.append(prompt)
+        if "JSON object mapping each question number" in prompt:
+            return self.batch_response
+        if "Will you require visa sponsorship?" in prompt:
+            return "No"
+        return "single"
+
+
+@pytest.fixture
+def form_intelligence():
+    from ai.form_intelligence import FormIntelligence
+
+    return FormIntelligence()
+
+
+class TestAnswerQuestions:
+    """One LLM call per step, per-question fallback for bad entries."""
+
+    @pytest.mark.asyncio
+    async def test_valid_batch_uses_one_call(self, form_intelligence):
+        kimi = FakeKimi('```json\n{"1": "yes", "2": "No", "3": "I admire the product."}\n```')
+        form_intelligence.kimi_service = kimi
+
+        answers = await form_intelligence.answer_questions(QUESTIONS, profile={"first_name": "Ada"})
+
+        assert answers == ["Yes", "No", "I admire the product."]
+        assert len(kimi.prompts) == 1
+        assert "2. [select] Will you require visa sponsorship? (Options: Select... | Yes | No)" in kimi.prompts[0]
+        assert "- Name: Ada" in kimi.prompts[0]
+
+    @pytest.mark.asyncio
+    async def test_invalid_entries_are_reasked_individually(self, form_intelligence):
+        # Option not offered for question 2, question 3 missing.
+        kimi = FakeKimi('{"1": "Yes", "2": "Maybe later"}')
+        form_intelligence.kimi_service = kimi
+
+        answers = await form_intelligence.answer_questions(QUESTIONS)
+
+        assert answers == ["Yes", "No", "single"]
+        assert len(kimi.prompts) == 3  # batch + two single-question calls
+
+    @pytest.mark.asyncio
+    async def test_unparseable_batch_falls_back_for_every_question(self, form_intelligence):
+        kimi = FakeKimi("Sorry, I can't help with that.")
+        form_intelligence.kimi_service = kimi
+
+        answers = await form_intelligence.answer_questions(QUESTIONS)
+
+        assert len(answers) == 3
+        assert len(kimi.prompts) == 1 + len(QUESTIONS)
+
+    @pytest.mark.asyncio
+    async def test_cached_answers_skip_the_batch(self, form_intelligence):
+        kimi = FakeKimi('{"1": "Yes", "2": "No", "3": "Because."}')
+        form_intelligence.kimi_service = kimi
+        await form_intelligence.answer_questions(QUESTIONS)
+
+        answers = await form_intelligence.answer_questions(QUESTIONS)
+        assert answers == ["Yes", "No", "Because."]
+        assert len(kimi.prompts) == 1
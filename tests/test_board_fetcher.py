@@ -0,0 +1,132 @@
+"""
+Tests for the shared board fetcher used by the Greenhouse and Lever adapters.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from adapters.base import SearchConfig
+from adapters.board_fetcher import BoardFetcher, BoardFetcherConfig
+from tests.utils.board_server import FixtureBoardServer, fixture_companies, greenhouse_board
+
+
+def fetcher(**overrides):
+    params = {"max_concurrency": 32, "per_host_concurrency": 8, "per_host_rps": 0, "max_retries": 2}
+    params.update(overrides)
+    return BoardFetcher(BoardFetcherConfig(**params))
+
+
+CRITERIA = SearchConfig(roles=["engineer"], locations=["Remote"])
+
+
+class TestAdapterSearch:
+    """Adapters fan out over the shared fetcher and filter each board as it arrives."""
+
+    @pytest.mark.asyncio
+    async def test_greenhouse_results_match_sequential_filtering(self):
+        from adapters.greenhouse import GreenhouseAdapter
+
+        companies = fixture_companies(12)
+        async with FixtureBoardServer(companies, latency=0.02, missing=["company-003"]) as server:
+            adapter = GreenhouseAdapter(companies=companies + ["company-001"])
+            adapter.API_BASE = server.greenhouse_base
+            board_fetcher = fetcher()
+            with patch("adapters.greenhouse.get_board_fetcher", return_value=board_fetcher):
+                jobs = await adapter.search_jobs(CRITERIA)
+            await board_fetcher.close()
+
+        expected = [
+            f"gh_{company}_{job['id']}"
+            for company in companies if company != "company-003"
+            for job in greenhouse_board(company)["jobs"]
+            if "engineer" in job["title"].lower() and "remote" in job["location"]["name"].lower()
+        ]
+        assert [job.id for job in jobs] == expected
+        assert board_fetcher.get_stats()["not_found"] == 1
+        assert server.peak_in_flight > 1
+
+    @pytest.mark.asyncio
+    async def test_lever_search(self):
+        from adapters.lever import LeverAdapter
+
+        companies = fixture_companies(5)
+        async with FixtureBoardServer(companies) as server:
+            adapter = LeverAdapter(companies=companies)
+            adapter.API_BASE = server.lever_base
+            board_fetcher = fetcher()
+            with patch("adapters.lever.get_board_fetcher", return_value=board_fetcher):
+                jobs = await adapter.search_jobs(CRITERIA)
+            await board_fetcher.close()
+
+        assert jobs
+        assert all("engineer" in job.title.lower() and "remote" in job.location.lower() for job in jobs)
+        assert jobs[0].id.startswith("lever_company-000")
+
+
+    @pytest.mark.asyncio
+    async def test_malformed_board_is_skipped(self):
+        from adapters.greenhouse import GreenhouseAdapter
+        from adapters.lever import LeverAdapter
+
+        companies = fixture_companies(3)
+        async with FixtureBoardServer(companies) as server:
+            server.set_board("gh", "company-001", {"jobs": [{"title": "Remote Engineer", "location": {"name": "Remote"}}]})
+            server.set_board("lever", "company-001", [{"text": "Remote Engineer", "categories": {"location": "Remote"}}])
+            greenhouse = GreenhouseAdapter(companies=companies)
+            greenhouse.API_BASE = server.greenhouse_base
+            lever = LeverAdapter(companies=companies)
+            lever.API_BASE = server.lever_base
+            board_fetcher = fetcher()
+            with patch("adapters.greenhouse.get_board_fetcher", return_value=board_fetcher), \
+                    patch("adapters.lever.get_board_fetcher", return_value=board_fetcher):
+                gh_jobs = await greenhouse.search_jobs(CRITERIA)
+                lever_jobs = await lever.search_jobs(CRITERIA)
+            await board_fetcher.close()
+
+        assert gh_jobs and lever_jobs
+        assert not any("company-001" in job.id for job in gh_jobs + lever_jobs)
+
+
+class TestPoliteness:
+    """Per-host concurrency and spacing replace fixed sleeps."""
+
+    @pytest.mark.asyncio
+    async def test_per_host_limits(self):
+        companies = fixture_companies(20)
+        async with FixtureBoardServer(companies, latency=0.05) as server:
+            board_fetcher = fetcher(per_host_concurrency=3, per_host_rps=50)
+            results = [item async for item in board_fetcher.stream(
+                companies, lambda c: f"{server.greenhouse_base}/{c}/jobs")]
+            await board_fetcher.close()
+
+        assert len(results) == 20 and all(data for _, data in results)
+        assert server.peak_in_flight == 3
+        starts = sorted(server.request_starts)
+        # 50 rps => starts spaced 20ms apart (arrival times jitter, so check the overall rate).
+        assert starts[-1] - starts[0] >= 19 * 0.02 * 0.9
+
+    @pytest.mark.asyncio
+    async def test_throttled_board_is_retried_after_retry_after(self):
+        companies = fixture_companies(2)
+        async with FixtureBoardServer(companies, throttle={"company-001": 1}) as server:
+            board_fetcher = fetcher()
+            data = await board_fetcher.fetch_json(f"{server.greenhouse_base}/company-001/jobs")
+            await board_fetcher.close()
+
+        assert data == greenhouse_board("company-001")
+        stats = board_fetcher.get_stats()
+        assert stats["throttled"] == 1
+        assert stats["retries"] == 1
+        starts = server.request_starts
+        assert starts[1] - starts[0] >= 0.18  # Retry-After: 0.2
+
+    def test_new_event_loop_closes_previous_session(self):
+        import asyncio
+
+        board_fetcher = fetcher()
+        first = asyncio.run(board_fetcher._get_session())
+        second = asyncio.run(board_fetcher._get_session())
+        asyncio.run(board_fetcher.close())
+
+        assert second is not first
+        assert first.closed and second.closed
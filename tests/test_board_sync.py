@@ -0,0 +1,191 @@
+"""
+Tests for incremental board sync (conditional requests + local job store).
+"""
+
+import pytest
+from unittest.mock import patch
+
+from adapters.board_fetcher import BoardFetcher, BoardFetcherConfig
+from adapters.board_sync import BoardSync, JobStore, board_key
+from tests.utils.board_server import FixtureBoardServer, fixture_companies, greenhouse_board
+
+
+def fetcher():
+    return BoardFetcher(BoardFetcherConfig(max_concurrency=16, per_host_concurrency=8, per_host_rps=0, max_retries=0))
+
+
+def board_sync(tmp_path, min_interval=0):
+    return BoardSync(store=JobStore(str(tmp_path / "board_sync.db")), fetcher=fetcher(), min_interval=min_interval)
+
+
+def gh_url(server):
+    return lambda company: f"{server.greenhouse_base}/{company}/jobs"
+
+
+class TestBoardSync:
+
+    @pytest.mark.asyncio
+    async def test_first_sync_stores_postings_and_repeat_sync_is_not_modified(self, tmp_path):
+        companies = fixture_companies(6)
+        async with FixtureBoardServer(companies, jobs_per_board=5) as server:
+            sync = board_sync(tmp_path)
+            first = await sync.board_jobs("greenhouse", companies, gh_url(server))
+            bytes_after_first = server.bytes_sent
+            diffs = await sync.sync("greenhouse", companies, gh_url(server))
+            second = await sync.board_jobs("greenhouse", companies, gh_url(server))
+            await sync.fetcher.close()
+
+        assert first == {c: greenhouse_board(c, 5)["jobs"] for c in companies}
+        assert second == first
+        assert all(d.status == "not_modified" for d in diffs.values())
+        assert server.not_modified == 12
+        assert server.bytes_sent == bytes_after_first
+        assert sync.get_stats()["jobs"] == 30
+
+    @pytest.mark.asyncio
+    async def test_changed_board_is_diffed_by_id(self, tmp_path):
+        company = "company-007"
+        async with FixtureBoardServer([company], jobs_per_board=4) as server:
+            sync = board_sync(tmp_path)
+            await sync.sync("greenhouse", [company], gh_url(server))
+
+            jobs = greenhouse_board(company, 4)["jobs"]
+            jobs[0] = {**jobs[0], "title": "Staff Engineer"}
+            del jobs[1]
+            jobs.append({"id": 99, "title": "New Role", "location": {"name": "Remote"}})
+            server.set_board("gh", company, {"jobs": jobs})
+
+            diff = (await sync.sync("greenhouse", [company], gh_url(server)))[company]
+            stored = (await sync.board_jobs("greenhouse", [company], gh_url(server)))[company]
+            await sync.fetcher.close()
+
+        assert (diff.status, diff.added, diff.updated, diff.removed, diff.total) == ("changed", 1, 1, 1, 4)
+        assert sorted(str(p["id"]) for p in stored) == sorted(str(p["id"]) for p in jobs)
+        assert next(p for p in stored if p["id"] == jobs[0]["id"])["title"] == "Staff Engineer"
+
+    @pytest.mark.asyncio
+    async def test_recently_checked_board_is_not_requested(self, tmp_path):
+        companies = fixture_companies(3)
+        async with FixtureBoardServer(companies) as server:
+            sync = board_sync(tmp_path, min_interval=300)
+            await sync.sync("greenhouse", companies, gh_url(server))
+            diffs = await sync.sync("greenhouse", companies, gh_url(server))
+            await sync.fetcher.close()
+
+        assert {d.status for d in diffs.values()} == {"fresh"}
+        assert len(server.request_starts) == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_board_keeps_last_snapshot(self, tmp_path):
+        company = "company-002"
+        async with FixtureBoardServer([company]) as server:
+            sync = board_sync(tmp_path)
+            before = await sync.board_jobs("greenhouse", [company], gh_url(server))
+            server.throttle[company] = 1
+            diffs = await sync.sync("greenhouse", [company], gh_url(server))
+            await sync.fetcher.close()
+
+        after = sync.store.postings([board_key("greenhouse", company)])
+        assert diffs[company].status == "error"
+        assert after[board_key("greenhouse", company)] == before[company] and len(before[company]) == 10
+
+    @pytest.mark.asyncio
+    async def test_missing_board_drops_its_postings(self, tmp_path):
+        companies = fixture_companies(2)
+        async with FixtureBoardServer(companies) as server:
+            sync = board_sync(tmp_path)
+            await sync.sync("greenhouse", companies, gh_url(server))
+            server.missing.add("company-001")
+            diffs = await sync.sync("greenhouse", companies, gh_url(server))
+            after = await sync.board_jobs("greenhouse", companies, gh_url(server))
+            await sync.fetcher.close()
+
+        gone = diffs["company-001"]
+        assert (gone.status, gone.removed, gone.total) == ("not_found", 10, 0)
+        assert after["company-001"] == [] and len(after["company-000"]) == 10
+        assert sync.get_stats()["jobs"] == 10
+
+    @pytest.mark.asyncio
+    async def test_server_without_validators_reports_unchanged_boards(self, tmp_path):
+        companies = fixture_companies(2)
+        async with FixtureBoardServer(companies) as server:
+            server.validators = False
+            sync = board_sync(tmp_path)
+            await sync.sync("greenhouse", companies, gh_url(server))
+            diffs = await sync.sync("greenhouse", companies, gh_url(server))
+            await sync.fetcher.close()
+
+        assert {d.status for d in diffs.values()} == {"not_modified"}
+        assert server.not_modified == 0
+
+
+    @pytest.mark.asyncio
+    async def test_store_work_runs_off_the_event_loop(self, tmp_path):
+        import threading
+
+        threads = set()
+
+        class RecordingStore(JobStore):
+            def get_state(self, *args, **kwargs):
+                threads.add(threading.current_thread())
+                return super().get_state(*args, **kwargs)
+
+            def apply_snapshot(self, *args, **kwargs):
+                threads.add(threading.current_thread())
+                return super().apply_snapshot(*args, **kwargs)
+
+            def postings(self, *args, **kwargs):
+                threads.add(threading.current_thread())
+                return super().postings(*args, **kwargs)
+
+        companies = fixture_companies(3)
+        async with FixtureBoardServer(companies) as server:
+            sync = BoardSync(store=RecordingStore(str(tmp_path / "board_sync.db")), fetcher=fetcher(), min_interval=0)
+            threads.clear()
+            await sync.board_jobs("greenhouse", companies, gh_url(server))
+            await sync.fetcher.close()
+
+        assert threads and threading.main_thread() not in threads
+
+
+class TestScrapersReadFromStore:
+
+    @pytest.mark.asyncio
+    async def test_greenhouse_api_search(self, tmp_path):
+        from adapters.job_boards import SearchCriteria
+        from adapters.job_boards.greenhouse_api import GreenhouseAPIScraper
+
+        companies = fixture_companies(4)
+        async with FixtureBoardServer(companies) as server:
+            sync = board_sync(tmp_path)
+            scraper = GreenhouseAPIScraper(companies=companies)
+            scraper.API_BASE = server.greenhouse_base
+            with patch("adapters.job_boards.greenhouse_api.get_board_sync", return_value=sync):
+                first = await scraper.search(SearchCriteria(query="engineer"))
+                second = await scraper.search(SearchCriteria(query="engineer"))
+            await sync.fetcher.close()
+
+        expected = {
+            f"gh_{c}_{job['id']}" for c in companies for job in greenhouse_board(c)["jobs"]
+            if "engineer" in job["title"].lower()
+        }
+        assert {job.id for job in first} == expected
+        assert [job.id for job in second] == [job.id for job in first]
+        assert server.not_modified == len(companies)
+
+    @pytest.mark.asyncio
+    async def test_lever_direct_search(self, tmp_path):
+        from adapters.job_boards.direct_scrapers import LeverDirectScraper
+
+        companies = fixture_companies(3)
+        async with FixtureBoardServer(companies) as server:
+            sync = board_sync(tmp_path)
+            scraper = LeverDirectScraper()
+            scraper.COMPANIES = companies
+            with patch("adapters.job_boards.direct_scrapers.get_board_sync", return_value=sync), \
+                    patch.object(LeverDirectScraper, "_board_url", staticmethod(lambda c: f"{server.lever_base}/{c}")):
+                jobs = await scraper.search(["engineer"])
+            await sync.fetcher.close()
+
+        assert jobs and all("engineer" in job.title.lower() and job.ats_type == "lever" for job in jobs)
+        assert sync.get_stats()["boards"] == 3
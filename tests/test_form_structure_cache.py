@@ -0,0 +1,146 @@
+"""
+Tests for form-structure fingerprints and the SelectorAI selector cache.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+
+def greenhouse_page(
+    company: str, questions: int, first_id: int, first_name_id: str = "first_name", submit_id: str = "submit_app"
+) -> str:
+    custom = "".join(
+        f'<div class="field"><label for="question_{first_id + i}">Question {i} at {company}</label>'
+        f'<input type="text" id="question_{first_id + i}" '
+        f'name="job_application[answers_attributes][{i}][text_value]"></div>'
+        for i in range(questions)
+    )
+    return f"""<html><head><script>window.__DATA__ = "<input name='x'>";</script>
+<style>.field {{ margin: 0 }}</style></head>
+<body><h1>{company} careers</h1><p>{"We build things. " * 200}</p>
+<form id="application_form" action="/apply">
+  <label for="{first_name_id}">First Name</label>
+  <input type="text" id="{first_name_id}" name="first_name" required>
+  <input type="hidden" name="authenticity_token" value="{company}-token">
+  <input type="file" id="resume" name="resume" accept=".pdf,.docx">
+  {custom}
+  <button type="submit" id="{submit_id}">Submit Application</button>
+</form>
+<div class="success-message" style="display:none">Thanks for applying!</div>
+</body></html>"""
+
+
+LLM_RESULT = {
+    "first_name": {"selector": "#first_name", "alternatives": ["input[name='first_name']"],
+                   "confidence": 0.9, "reasoning": "id"},
+    "resume": {"selector": "input[type='file']", "alternatives": [], "confidence": 0.9, "reasoning": "file"},
+    "submit": {"selector": "#submit_app", "alternatives": [], "confidence": 0.8, "reasoning": "button"},
+}
+
+
+class TestFormSkeleton:
+    """Fingerprints ignore company content and generated ids; reduced HTML keeps form nodes."""
+
+    def test_same_template_shares_fingerprint(self):
+        from ai.form_skeleton import FormSkeleton
+
+        acme = FormSkeleton.parse(greenhouse_page("Acme", questions=2, first_id=1001))
+        globex = FormSkeleton.parse(greenhouse_page("Globex", questions=5, first_id=987654))
+        assert acme.fingerprint() is not None
+        assert acme.fingerprint() == globex.fingerprint()
+
+    def test_different_structure_changes_fingerprint(self):
+        from ai.form_skeleton import FormSkeleton
+
+        base = FormSkeleton.parse(greenhouse_page("Acme", 2, 1001))
+        other = FormSkeleton.parse(greenhouse_page("Acme", 2, 1001).replace('name="first_name"', 'name="given_name"'))
+        assert base.fingerprint() != other.fingerprint()
+        assert FormSkeleton.parse("<html><body><p>No form here</p></body></html>").fingerprint() is None
+
+    def test_reduced_html_keeps_only_form_nodes(self):
+        from ai.form_skeleton import FormSkeleton
+
+        page = greenhouse_page("Acme", 2, 1001)
+        reduced = FormSkeleton.parse(page).reduced_html()
+
+        assert len(reduced) < len(page) / 5
+        assert '<input type="text" name="first_name" id="first_name" required>' in reduced
+        assert "Submit Application" in reduced
+        assert "success-message" in reduced
+        assert "We build things" not in reduced
+        assert "__DATA__" not in reduced
+        assert "authenticity_token" not in reduced
+
+
+class TestSelectorAICache:
+    """Identical templates skip the LLM; stale selectors fall back to it."""
+
+    @pytest.fixture
+    def selector_ai(self, tmp_path):
+        from ai.cache.form_structure_cache import FormStructureCache
+        from ai.selector_ai import SelectorAI
+
+        ai = SelectorAI(api_key="test")
+        ai._cache = FormStructureCache(db_path=str(tmp_path / "forms.db"))
+        ai._call_api = AsyncMock(return_value=LLM_RESULT)
+        return ai
+
+    @pytest.mark.asyncio
+    async def test_second_company_on_template_skips_llm(self, selector_ai):
+        first = await selector_ai.analyze_form(greenhouse_page("Acme", 2, 1001), "https://boards.greenhouse.io/acme/jobs/1")
+        prompt = selector_ai._call_api.await_args.args[0]
+        assert "We build things" not in prompt
+        assert 'name="first_name"' in prompt
+
+        second = await selector_ai.analyze_form(greenhouse_page("Globex", 4, 5555), "https://boards.greenhouse.io/globex/jobs/2")
+
+        assert selector_ai._call_api.await_count == 1
+        assert second["first_name"].selector == first["first_name"].selector == "#first_name"
+        assert selector_ai._cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_alternative_promoted_or_llm_called_when_selectors_go_stale(self, selector_ai):
+        result = {
+            **LLM_RESULT,
+            "first_name": {**LLM_RESULT["first_name"], "selector": "#first_name_11"},
+            "submit": {**LLM_RESULT["submit"], "selector": "#submit_11"},
+        }
+        selector_ai._call_api.return_value = result
+        await selector_ai.analyze_form(
+            greenhouse_page("Acme", 2, 1001, first_name_id="first_name_11", submit_id="submit_11"), "https://a/1")
+
+        # Same structure, but the generated id no longer matches '#first_name_11'.
+        renamed = greenhouse_page("Initech", 2, 1001, first_name_id="first_name_42", submit_id="submit_11")
+        suggestions = await selector_ai.analyze_form(renamed, "https://a/2")
+        assert selector_ai._call_api.await_count == 1
+        assert suggestions["first_name"].selector == "input[name='first_name']"
+
+        # A verified selector with no surviving fallback sends the page back to the model.
+        moved = greenhouse_page("Hooli", 2, 1001, first_name_id="first_name_11", submit_id="submit_77")
+        await selector_ai.analyze_form(moved, "https://a/3")
+        assert selector_ai._call_api.await_count == 2
+        assert selector_ai._cache.get_stats()["stale"] == 1
+
+    @pytest.mark.asyncio
+    async def test_only_stale_fields_are_reasked(self, selector_ai):
+        result = {**LLM_RESULT, "submit": {**LLM_RESULT["submit"], "selector": "#submit_11"}}
+        selector_ai._call_api.return_value = result
+        await selector_ai.analyze_form(greenhouse_page("Acme", 2, 1001, submit_id="submit_11"), "https://a/1")
+
+        moved = greenhouse_page("Hooli", 2, 1001, submit_id="submit_77")
+        selector_ai._call_api.return_value = {
+            "submit": {"selector": "#submit_77", "alternatives": [], "confidence": 0.8, "reasoning": "button"},
+            "first_name": {"selector": "#wrong", "alternatives": [], "confidence": 0.1, "reasoning": "guess"},
+        }
+        suggestions = await selector_ai.analyze_form(moved, "https://a/2")
+
+        prompt = selector_ai._call_api.await_args.args[0]
+        assert "only these fields (use these exact keys): submit" in prompt
+        assert suggestions["submit"].selector == "#submit_77"
+        assert suggestions["first_name"].selector == "#first_name"
+        assert suggestions["resume"].selector == "input[type='file']"
+
+        # The repaired entry serves the next company on the moved template in full.
+        again = await selector_ai.analyze_form(greenhouse_page("Pied Piper", 3, 2001, submit_id="submit_77"), "https://a/3")
+        assert selector_ai._call_api.await_count == 2
+        assert again["submit"].selector == "#submit_77"
@@ -0,0 +1,173 @@
+"""
+Tests for the browserless HTTP form submitter against a local fake ATS.
+"""
+
+import pytest
+from aiohttp import web
+
+
+PLAIN_FORM = """
+<html><body>
+<form action="/submit" method="post" enctype="multipart/form-data">
+  <input type="hidden" name="csrf" value="tok-123">
+  <input type="text" name="name" required>
+  <input type="email" name="email" required>
+  <input type="tel" name="phone">
+  <input type="text" name="org">
+  <input type="text" name="urls[LinkedIn]">
+  <input type="file" name="resume" required>
+  <textarea name="comments"></textarea>
+  <button type="submit">Submit application</button>
+</form>
+</body></html>
+"""
+
+CAPTCHA_FORM = PLAIN_FORM.replace(
+    "<button", '<div class="h-captcha" data-sitekey="abc"></div><button'
+)
+
+JS_ONLY_PAGE = "<html><body><div id='root'></div><noscript>Please enable JavaScript.</noscript></body></html>"
+
+REQUIRED_QUESTION_FORM = PLAIN_FORM.replace(
+    "<textarea", '<input type="text" name="cards[visa]" required><textarea'
+)
+
+
+class FakeATS:
+    """Minimal hosted-application server recording what was posted."""
+
+    def __init__(self):
+        self.pages = {}
+        self.submissions = []
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/{slug}/apply", self.form)
+        app.router.add_post("/submit", self.submit)
+        return app
+
+    async def form(self, request):
+        return web.Response(text=self.pages[request.match_info["slug"]], content_type="text/html")
+
+    async def submit(self, request):
+        data = await request.post()
+        resume = data.get("resume")
+        self.submissions.append({
+            **{k: v for k, v in data.items() if k != "resume"},
+            "resume_filename": getattr(resume, "filename", None),
+            "resume_bytes": resume.file.read() if resume is not None else b"",
+        })
+        return web.Response(text="<h1>Thank you for applying!</h1>", content_type="text/html")
+
+
+@pytest.fixture
+async def fake_ats():
+    ats = FakeATS()
+    ats.pages = {
+        "plain": PLAIN_FORM,
+        "captcha": CAPTCHA_FORM,
+        "js": JS_ONLY_PAGE,
+        "question": REQUIRED_QUESTION_FORM,
+    }
+    runner = web.AppRunner(ats.app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    ats.base_url = f"http://127.0.0.1:{port}"
+    yield ats
+    await runner.cleanup()
+
+
+@pytest.fixture
+def applicant(tmp_path):
+    from adapters.base import UserProfile, Resume
+
+    resume_path = tmp_path / "resume.pdf"
+    resume_path.write_bytes(b"%PDF-1.4 fake resume")
+    profile = UserProfile(
+        first_name="Ada",
+        last_name="Lovelace",
+        email="ada@example.com",
+        phone="555-0100",
+        linkedin_url="https://linkedin.com/in/ada",
+    )
+    resume = Resume(file_path=str(resume_path), raw_text="Engineer", parsed_data={})
+    return profile, resume
+
+
+class TestSelectorMatching:
+    """FieldMappings selectors applied to parsed attributes."""
+
+    def test_attribute_selectors(self):
+        from adapters.http_submitter import selector_matches
+
+        assert selector_matches('input[name="urls[LinkedIn]"]', "input", {"name": "urls[LinkedIn]"})
+        assert selector_matches('input[placeholder*="First" i]', "input", {"placeholder": "first name"})
+        assert selector_matches('input[type="file"][accept*="pdf"]', "input", {"type": "file", "accept": ".pdf"})
+        assert selector_matches("#email", "input", {"id": "email"})
+        assert not selector_matches('textarea[name="comments"]', "input", {"name": "comments"})
+        assert not selector_matches('button:has-text("Apply")', "button", {})
+
+
+class TestHTTPFormSubmitter:
+    """End-to-end submission against the fake ATS."""
+
+    @pytest.mark.asyncio
+    async def test_plain_form_is_submitted(self, fake_ats, applicant):
+        from adapters.http_submitter import HTTPFormSubmitter
+
+        profile, resume = applicant
+        result = await HTTPFormSubmitter(platform="lever").submit(
+            f"{fake_ats.base_url}/plain/apply", profile, resume, cover_letter="Hello there"
+        )
+
+        assert result.submitted
+        posted = fake_ats.submissions[0]
+        assert posted["csrf"] == "tok-123"
+        assert posted["name"] == "Ada Lovelace"
+        assert posted["email"] == "ada@example.com"
+        assert posted["urls[LinkedIn]"] == "https://linkedin.com/in/ada"
+        assert posted["comments"] == "Hello there"
+        assert posted["resume_filename"] == "resume.pdf"
+        assert posted["resume_bytes"] == b"%PDF-1.4 fake resume"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("slug,reason", [
+        ("captcha", "captcha"),
+        ("js", "javascript"),
+        ("question", "cards[visa]"),
+    ])
+    async def test_blocked_forms_fall_back_without_posting(self, fake_ats, applicant, slug, reason):
+        from adapters.http_submitter import HTTPFormSubmitter
+
+        profile, resume = applicant
+        result = await HTTPFormSubmitter(platform="lever").submit(
+            f"{fake_ats.base_url}/{slug}/apply", profile, resume
+        )
+
+        assert result.should_fallback
+        assert reason in result.message
+        assert fake_ats.submissions == []
+
+    @pytest.mark.asyncio
+    async def test_lever_adapter_uses_http_path_when_enabled(self, fake_ats, applicant):
+        from adapters.lever import LeverAdapter
+        from adapters.base import JobPosting, PlatformType, ApplicationStatus
+
+        profile, resume = applicant
+        job = JobPosting(
+            id="lever_1", platform=PlatformType.LEVER, title="Engineer", company="Acme",
+            location="Remote", url=f"{fake_ats.base_url}/plain/apply",
+        )
+
+        adapter = LeverAdapter(http_submit=True)
+        result = await adapter.apply_to_job(job, resume, profile, auto_submit=True)
+        assert result.status == ApplicationStatus.SUBMITTED
+        assert len(fake_ats.submissions) == 1
+
+        job.url = f"{fake_ats.base_url}/captcha/apply"
+        result = await adapter.apply_to_job(job, resume, profile, auto_submit=True)
+        # No browser manager: falls through to the external-application result.
+        assert result.status == ApplicationStatus.EXTERNAL_APPLICATION
+        assert len(fake_ats.submissions) == 1
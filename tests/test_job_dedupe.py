@@ -0,0 +1,258 @@
+"""
+Tests for the persistent job dedupe service (canonical URLs, near-duplicates, applied index).
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from core.job_dedupe import JobDedupeService, canonical_job_url
+
+DESCRIPTION = (
+    "Acme is hiring a backend engineer to build our payments platform. You will design APIs in Python "
+    "and Go, own PostgreSQL schemas, run services on Kubernetes and mentor other engineers. "
+    "We offer competitive salary, equity, remote-friendly hours and a learning budget."
+)
+BOILERPLATE = "We offer competitive salary, equity, remote-friendly hours and a learning budget. " * 3
+
+
+def greenhouse_copy(**overrides):
+    job = {"title": "Senior Backend Engineer", "company": "Acme",
+           "url": "https://boards.greenhouse.io/acme/jobs/4012345", "description": DESCRIPTION}
+    job.update(overrides)
+    return job
+
+
+def linkedin_copy(**overrides):
+    job = {"title": "Sr. Backend Engineer (Remote)", "company": "Acme, Inc.",
+           "url": "https://www.linkedin.com/jobs/view/sr-backend-engineer-at-acme-3791234567/?trk=public",
+           "description": DESCRIPTION.replace("Acme is hiring", "Join Acme as") + " Apply via LinkedIn."}
+    job.update(overrides)
+    return job
+
+
+@pytest.fixture
+def service(tmp_path):
+    return JobDedupeService(str(tmp_path / "job_dedupe.db"), threshold=0.7)
+
+
+class TestCanonicalUrl:
+
+    @pytest.mark.parametrize("url,expected", [
+        ("https://boards.greenhouse.io/acme/jobs/4012345?gh_src=abc", "greenhouse:4012345"),
+        ("https://job-boards.greenhouse.io/acme/jobs/4012345", "greenhouse:4012345"),
+        ("https://acme.com/careers/?gh_jid=4012345", "greenhouse:4012345"),
+        ("https://boards.greenhouse.io/embed/job_app?for=acme&token=4012345", "greenhouse:4012345"),
+        ("https://jobs.lever.co/acme/0b9a2f7e-1234-4d3c-9e8f-0123456789ab/apply",
+         "lever:0b9a2f7e-1234-4d3c-9e8f-0123456789ab"),
+        ("https://www.linkedin.com/jobs/view/backend-engineer-at-acme-3791234567/?trk=x", "linkedin:3791234567"),
+        ("https://www.linkedin.com/jobs/search/?currentJobId=3791234567&keywords=python", "linkedin:3791234567"),
+        ("https://www.indeed.com/viewjob?jk=A1B2C3&from=serp", "indeed:a1b2c3"),
+        ("https://Careers.Example.com/jobs/55/?utm_source=x&id=7#apply", "careers.example.com/jobs/55?id=7"),
+    ])
+    def test_canonical_forms(self, url, expected):
+        assert canonical_job_url(url) == expected
+
+    def test_empty(self):
+        assert canonical_job_url("") is None and canonical_job_url(None) is None
+
+
+class TestClusters:
+
+    def test_syndicated_copy_joins_cluster(self, service):
+        original, copy = service.resolve_many([greenhouse_copy(), linkedin_copy()])
+
+        assert original.reason == "new"
+        assert copy.reason == "near_duplicate"
+        assert copy.cluster_id == original.cluster_id
+
+    def test_other_role_with_shared_boilerplate_is_not_a_duplicate(self, service):
+        first, second = service.resolve_many([
+            greenhouse_copy(description="Build payment APIs in Python. " + BOILERPLATE),
+            greenhouse_copy(title="Product Designer", url="https://boards.greenhouse.io/acme/jobs/4012399",
+                            description="Design onboarding flows in Figma. " + BOILERPLATE),
+        ])
+        assert second.reason == "new" and second.cluster_id != first.cluster_id
+
+    def test_same_title_different_text_is_not_a_duplicate(self, service):
+        first, second = service.resolve_many([
+            greenhouse_copy(),
+            greenhouse_copy(url="https://boards.greenhouse.io/acme/jobs/4099999",
+                            description="Own our data warehouse: Spark, dbt and Airflow pipelines for analytics."),
+        ])
+        assert second.cluster_id != first.cluster_id
+
+    def test_other_url_forms_and_new_process_resolve_alike(self, service, tmp_path):
+        original = service.resolve(greenhouse_copy())
+
+        reopened = JobDedupeService(str(tmp_path / "job_dedupe.db"))
+        match = reopened.resolve({"title": "Anything", "company": "Acme", "url": "https://acme.com/jobs?gh_jid=4012345"})
+        assert (match.reason, match.cluster_id) == ("url", original.cluster_id)
+
+    def test_postings_without_description_need_identical_title(self, service):
+        first, same, other = service.resolve_many([
+            {"title": "Backend Engineer", "company": "Acme", "url": "https://www.indeed.com/viewjob?jk=1"},
+            {"title": "Backend Engineer", "company": "ACME Inc", "url": "https://www.linkedin.com/jobs/view/2"},
+            {"title": "Senior Backend Engineer", "company": "Acme", "url": "https://boards.greenhouse.io/acme/jobs/3"},
+        ])
+        assert same.cluster_id == first.cluster_id
+        assert other.cluster_id != first.cluster_id
+
+    def test_other_ids_on_the_same_board_never_cluster(self, service):
+        first, second = service.resolve_many([
+            {"title": "Backend Engineer", "company": "Acme", "url": "https://www.indeed.com/viewjob?jk=1"},
+            {"title": "Backend Engineer", "company": "ACME Inc", "url": "https://www.indeed.com/viewjob?jk=2"},
+        ])
+        assert second.reason == "new" and second.cluster_id != first.cluster_id
+
+    def test_conflicting_locations_are_not_duplicates(self, service):
+        first, elsewhere, remote = service.resolve_many([
+            greenhouse_copy(location="New York, NY"),
+            linkedin_copy(location="London, United Kingdom"),
+            linkedin_copy(url="https://www.indeed.com/viewjob?jk=77", location="Remote"),
+        ])
+        assert elsewhere.reason == "new"
+        assert remote.reason == "new"
+        assert service.resolve(linkedin_copy(url="https://www.indeed.com/viewjob?jk=78",
+                                             location="New York (Hybrid)")).cluster_id == first.cluster_id
+
+
+class TestAppliedIndex:
+
+    def test_applied_covers_every_copy_for_that_user_only(self, service):
+        service.resolve(greenhouse_copy())
+        service.mark_applied("user-1", greenhouse_copy(), "app_1")
+
+        assert service.has_applied("user-1", linkedin_copy())
+        assert service.has_applied("user-1", "https://acme.com/careers?gh_jid=4012345")
+        assert not service.has_applied("user-2", linkedin_copy())
+        assert service.get_stats()["applied"] == 1
+
+    def test_applied_posting_does_not_cover_other_openings_on_the_board(self, service):
+        applied = {"title": "Backend Engineer", "company": "Acme", "location": "New York, NY",
+                   "url": "https://www.linkedin.com/jobs/view/111", "description": DESCRIPTION}
+        other = {"title": "Backend Engineer", "company": "Acme Inc.", "location": "London, UK",
+                 "url": "https://www.linkedin.com/jobs/view/222", "description": DESCRIPTION}
+        service.mark_applied("user-1", applied, "app_1")
+
+        assert service.has_applied("user-1", applied)
+        assert not service.has_applied("user-1", other)
+
+    def test_session_drops_duplicates_and_applied(self, service):
+        applied = {"title": "Data Engineer", "company": "Beta", "url": "https://jobs.lever.co/beta/"
+                   "11111111-2222-3333-4444-555555555555", "description": "Spark and Airflow pipelines."}
+        service.mark_applied("user-1", applied)
+
+        session = service.session("user-1")
+        unique = session.filter_unique([greenhouse_copy(), linkedin_copy(), applied, greenhouse_copy()])
+
+        assert unique == [greenhouse_copy()]
+        assert session.stats == {"unique": 1, "url": 1, "near_duplicate": 1, "applied": 1}
+        assert session.duplicates == 3
+
+
+class TestCallers:
+
+    def test_deduplication_engine_uses_service(self, service):
+        from adapters.job_boards import DeduplicationEngine, JobPosting
+
+        def posting(source, url, title, company):
+            return JobPosting(id=url, title=title, company=company, location="Remote",
+                              description=DESCRIPTION, url=url, source=source)
+
+        with patch("adapters.job_boards.get_job_dedupe", return_value=service):
+            engine = DeduplicationEngine()
+        unique = engine.filter_unique([
+            posting("greenhouse", greenhouse_copy()["url"], "Senior Backend Engineer", "Acme"),
+            posting("linkedin", linkedin_copy()["url"], "Sr. Backend Engineer", "Acme Inc"),
+        ])
+
+        assert [job.source for job in unique] == ["greenhouse"]
+        assert engine.get_stats()["near_duplicates"] == 1
+
+    @pytest.mark.asyncio
+    async def test_job_pipeline_skips_copies_and_records_applied(self, service):
+        from adapters.base import JobPosting, PlatformType
+        from core.job_pipeline import JobPipeline, PipelineConfig
+
+        def posting(platform, data):
+            return JobPosting(id=data["url"], platform=platform, title=data["title"], company=data["company"],
+                              location="Remote", url=data["url"], description=data["description"])
+
+        async def scraper(**kwargs):
+            return [posting(PlatformType.GREENHOUSE, greenhouse_copy()), posting(PlatformType.LINKEDIN, linkedin_copy())]
+
+        with patch("core.job_pipeline.get_job_dedupe", return_value=service):
+            pipeline = JobPipeline(PipelineConfig(user_id="user-1"))
+            await pipeline._scrape_batch(scraper, limit=10)
+            assert pipeline.job_queue.qsize() == 1
+
+            pipeline._running = True
+            pipeline.config.max_applications = 1
+            pipeline.config.min_delay_between_apps = pipeline.config.max_delay_between_apps = 0
+            await pipeline._consumer(AsyncMock(return_value={"status": "success"}), None)
+
+        assert service.has_applied("user-1", linkedin_copy())
+
+    @pytest.mark.asyncio
+    async def test_queue_worker_skips_posting_already_applied(self, service):
+        from api.queue_worker import QueueWorker, WorkerConfig
+
+        service.mark_applied("user-1", greenhouse_copy())
+        item = {"id": "q_1", "user_id": "user-1", "job_url": linkedin_copy()["url"], "platform": "linkedin",
+                "payload": linkedin_copy(), "attempts": 0, "max_attempts": 3}
+        worker = QueueWorker(browser_manager=MagicMock(), kimi=MagicMock(),
+                             config=WorkerConfig(delay_min_seconds=0, delay_max_seconds=0))
+
+        with patch("api.queue_worker.get_job_dedupe", return_value=service), \
+                patch("api.queue_worker.get_campaign", AsyncMock(return_value=None)), \
+                patch("api.queue_worker.apply_job_url", AsyncMock()) as apply, \
+                patch.object(worker, "_finish_item", AsyncMock()) as finish:
+            await worker._process_item(item)
+
+        apply.assert_not_awaited()
+        assert finish.await_args.kwargs["status"] == "skipped"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status,applied", [("submitted", True), ("failed", False), ("pending_review", False)])
+    async def test_queue_worker_marks_only_submitted_applications(self, service, status, applied):
+        from api.queue_worker import QueueWorker, WorkerConfig
+
+        item = {"id": "q_2", "user_id": "user-1", "job_url": greenhouse_copy()["url"], "platform": "greenhouse",
+                "payload": greenhouse_copy(), "attempts": 0, "max_attempts": 3}
+        worker = QueueWorker(browser_manager=MagicMock(), kimi=MagicMock(),
+                             config=WorkerConfig(delay_min_seconds=0, delay_max_seconds=0))
+
+        with patch("api.queue_worker.get_job_dedupe", return_value=service), \
+                patch("api.queue_worker.get_campaign", AsyncMock(return_value=None)), \
+                patch("api.queue_worker.apply_job_url", AsyncMock(return_value={"id": "app_2", "status": status})), \
+                patch.object(worker, "_finish_item", AsyncMock()):
+            await worker._process_item(item)
+
+        assert service.has_applied("user-1", linkedin_copy()) is applied
+
+    @pytest.mark.asyncio
+    async def test_queue_worker_dedupe_lookups_run_off_the_event_loop(self, service):
+        import threading
+
+        from api.queue_worker import QueueWorker, WorkerConfig
+
+        threads = []
+        resolve_many = service.resolve_many
+
+        def spy(jobs):
+            threads.append(threading.current_thread())
+            return resolve_many(jobs)
+
+        item = {"id": "q_3", "user_id": "user-1", "job_url": greenhouse_copy()["url"], "platform": "greenhouse",
+                "payload": greenhouse_copy(), "attempts": 0, "max_attempts": 3}
+        worker = QueueWorker(browser_manager=MagicMock(), kimi=MagicMock(),
+                             config=WorkerConfig(delay_min_seconds=0, delay_max_seconds=0))
+
+        with patch("api.queue_worker.get_job_dedupe", return_value=service), \
+                patch.object(service, "resolve_many", spy), \
+                patch("api.queue_worker.get_campaign", AsyncMock(return_value=None)), \
+                patch("api.queue_worker.apply_job_url", AsyncMock(return_value={"id": "app_3", "status": "submitted"})), \
+                patch.object(worker, "_finish_item", AsyncMock()):
+            await worker._process_item(item)
+
+        assert len(threads) == 2 and threading.main_thread() not in threads
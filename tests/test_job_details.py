@@ -0,0 +1,149 @@
+"""
+Tests for the HTTP job-detail resolver registry (ATS APIs + JSON-LD).
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+
+JSONLD_PAGE = """
+<html><head>
+<script type="application/ld+json">{"@context": "https://schema.org", "@type": "Organization", "name": "Acme"}</script>
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@graph": [{
+  "@type": "JobPosting",
+  "title": "Senior Data Engineer",
+  "description": "&lt;p&gt;Build pipelines.&lt;/p&gt;&lt;ul&gt;&lt;li&gt;Python&lt;/li&gt;&lt;/ul&gt;",
+  "datePosted": "2026-01-15",
+  "hiringOrganization": {"@type": "Organization", "name": "Acme Corp"},
+  "jobLocation": {"@type": "Place", "address": {"addressLocality": "Austin", "addressRegion": "TX", "addressCountry": "US"}},
+  "jobLocationType": "TELECOMMUTE",
+  "baseSalary": {"@type": "MonetaryAmount", "currency": "USD",
+                 "value": {"@type": "QuantitativeValue", "minValue": 150000, "maxValue": 180000, "unitText": "YEAR"}},
+  "identifier": {"@type": "PropertyValue", "value": "DE-42"}
+}]}
+</script>
+</head><body></body></html>
+"""
+
+
+class _FakeResponse:
+    def __init__(self, status=200, json_data=None, text=""):
+        self.status = status
+        self._json = json_data
+        self._text = text
+
+    async def json(self, content_type=None):
+        return self._json
+
+    async def text(self, errors=None):
+        return self._text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+def _fake_session(routes):
+    """Session whose get() serves responses from a {url: _FakeResponse} map."""
+    session = MagicMock()
+    session.requested = []
+
+    def get(url, headers=None):
+        session.requested.append(url)
+        return routes.get(url, _FakeResponse(status=404))
+
+    session.get = get
+    return session
+
+
+class TestJsonLd:
+    """schema.org JobPosting parsing."""
+
+    def test_extracts_job_posting_from_graph(self):
+        from adapters.job_details import extract_jsonld_job_posting, job_posting_from_jsonld
+
+        node = extract_jsonld_job_posting(JSONLD_PAGE)
+        assert node["title"] == "Senior Data Engineer"
+
+        job = job_posting_from_jsonld(node, "https://careers.acme.com/jobs/42")
+        assert job.company == "Acme Corp"
+        assert job.location == "Austin, TX, US"
+        assert job.remote is True
+        assert job.salary_range == "USD 150000-180000 year"
+        assert "Build pipelines." in job.description and "<p>" not in job.description
+        assert job.posted_date.year == 2026
+        assert job.id == "company_DE-42"
+
+    def test_no_job_posting_returns_none(self):
+        from adapters.job_details import extract_jsonld_job_posting
+
+        assert extract_jsonld_job_posting("<html><body>No data</body></html>") is None
+        assert extract_jsonld_job_posting(
+            '<script type="application/ld+json">{not json</script>'
+        ) is None
+
+
+class TestResolverRegistry:
+    """URL routing and API resolvers."""
+
+    def test_ats_urls_match_api_resolver_before_jsonld(self):
+        from adapters.job_details import registry
+
+        names = [name for name, _, _ in registry.matching("https://boards.greenhouse.io/stripe/jobs/123456")]
+        assert names == ["greenhouse", "jsonld"]
+
+        names = [name for name, _, _ in registry.matching("https://careers.example.com/job/1")]
+        assert names == ["jsonld"]
+
+    @pytest.mark.asyncio
+    async def test_greenhouse_resolver_uses_boards_api(self):
+        from adapters.job_details import resolve_job_details
+        from core.models import PlatformType
+
+        session = _fake_session({
+            "https://boards-api.greenhouse.io/v1/boards/stripe/jobs/123456": _FakeResponse(json_data={
+                "title": "Backend Engineer",
+                "content": "&lt;p&gt;Payments &amp;amp; APIs&lt;/p&gt;",
+                "location": {"name": "Remote - US"},
+                "absolute_url": "https://boards.greenhouse.io/stripe/jobs/123456",
+            }),
+        })
+
+        job = await resolve_job_details("https://boards.greenhouse.io/stripe/jobs/123456", session=session)
+        assert job.platform == PlatformType.GREENHOUSE
+        assert job.title == "Backend Engineer"
+        assert job.description == "Payments & APIs"
+        assert job.remote is True
+        assert job.raw_data["resolver"] == "greenhouse"
+
+    @pytest.mark.asyncio
+    async def test_falls_through_to_jsonld_then_none(self):
+        from adapters.job_details import resolve_job_details
+
+        lever_url = "https://jobs.lever.co/acme/0f1e2d3c-4b5a-6978-8a9b-0c1d2e3f4a5b"
+        session = _fake_session({lever_url: _FakeResponse(text=JSONLD_PAGE)})
+        job = await resolve_job_details(lever_url, session=session)
+        assert job.title == "Senior Data Engineer"
+        assert job.raw_data["resolver"] == "jsonld"
+        assert session.requested[0].startswith("https://api.lever.co/v0/postings/acme/")
+
+        empty = _fake_session({})
+        assert await resolve_job_details("https://careers.example.com/job/1", session=empty) is None
+
+    @pytest.mark.asyncio
+    async def test_unified_adapter_skips_browser_when_resolved(self, monkeypatch):
+        import adapters.unified as unified
+        from adapters.job_details import extract_jsonld_job_posting, job_posting_from_jsonld
+
+        job = job_posting_from_jsonld(extract_jsonld_job_posting(JSONLD_PAGE), "https://careers.acme.com/jobs/42")
+        monkeypatch.setattr(unified, "resolve_job_details", AsyncMock(return_value=job))
+
+        adapter = unified.UnifiedPlatformAdapter(user_profile=MagicMock())
+        adapter._ensure_session = AsyncMock()
+
+        result = await adapter.get_job_details("https://careers.acme.com/jobs/42")
+        assert result is job
+        adapter._ensure_session.assert_not_awaited()
@@ -0,0 +1,175 @@
+"""
+Tests for the local FTS5 job index.
+"""
+
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from unittest.mock import patch
+
+from adapters.base import JobPosting, PlatformType, SearchConfig
+from core.job_index import JobIndex, index_jobs, job_record
+
+
+def posting(n, title, company="Acme", location="Remote", description="", **extra):
+    return {"id": n, "title": title, "company": company, "location": location,
+            "url": f"https://jobs.example.com/{company.lower()}/{n}", "description": description, **extra}
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = JobIndex(str(tmp_path / "job_index.db"))
+    index.add([
+        posting(1, "Senior Backend Engineer", description="<p>Python &amp; Postgres services</p>"),
+        posting(2, "Software Engineer, Backend", "Beta", "New York, NY", "Go and Python"),
+        posting(3, "Product Manager", description="Partner with engineers on Python tooling"),
+        posting(4, "Data Scientist", "Gamma", "London, UK", "Python, ML"),
+        posting(5, "Frontend Engineer", "Beta", "San Francisco, CA", "React. Requires security clearance."),
+    ], source="greenhouse")
+    return index
+
+
+class TestJobRecord:
+
+    def test_normalizes_dataclass_postings(self):
+        job = JobPosting(
+            id="li_1", platform=PlatformType.LINKEDIN, title="  Staff   Engineer ", company="Acme",
+            location="Austin, TX (Remote)", url="https://www.linkedin.com/jobs/view/1/",
+            description="<div>Build&nbsp;things</div>", posted_date=datetime(2026, 10, 1),
+        )
+        record = job_record(job)
+
+        assert record["source"] == "linkedin"
+        assert record["title"] == "Staff Engineer"
+        assert record["remote"] == 1
+        assert record["description"] == "Build things"
+        assert record["job_key"] == "https://www.linkedin.com/jobs/view/1"
+        assert record["posted_at"] == datetime(2026, 10, 1).timestamp()
+
+    def test_postings_without_title_or_identity_are_skipped(self):
+        assert job_record({"id": 1, "url": "https://x/1"}) is None
+        assert job_record({"title": "Engineer"}) is None
+
+
+class TestJobIndexSearch:
+
+    def test_roles_match_title_words_ranked_by_bm25(self, index):
+        hits = index.search(roles=["backend engineer"], query="python")
+
+        assert [h.title for h in hits] == ["Senior Backend Engineer", "Software Engineer, Backend"]
+        assert hits[0].description == "Python & Postgres services"
+
+    def test_title_hits_outrank_description_hits(self, index):
+        index.add([posting(6, "Python Developer", description="Django")], source="lever")
+
+        hits = index.search(query="python")
+        assert hits[0].title == "Python Developer"
+        assert len(hits) == 5
+        assert hits[0].score > hits[-1].score
+
+    def test_remote_and_location_filters(self, index):
+        remote = index.search(locations=["Remote"])
+        assert {h.title for h in remote} == {"Senior Backend Engineer", "Product Manager"}
+
+        both = index.search(locations=["Remote", "new york"], roles=["engineer"])
+        assert {h.title for h in both} == {"Senior Backend Engineer", "Software Engineer, Backend"}
+
+    def test_exclusions(self, index):
+        hits = index.search(roles=["engineer"], exclude_keywords=["security clearance"], exclude_companies=["acme"])
+        assert [h.title for h in hits] == ["Software Engineer, Backend"]
+
+    def test_query_operators_are_literal(self, index):
+        assert index.search(query='python OR "NOT" (') == []
+        assert index.search(query="   ") and index.search(roles=["!!"])
+
+    def test_search_config(self, index):
+        criteria = SearchConfig(roles=["engineer"], locations=["Remote"], required_keywords=["postgres"])
+        hits = index.search_config(criteria)
+        assert [h.title for h in hits] == ["Senior Backend Engineer"]
+        payload = hits[0].to_dict()
+        assert payload["apply_url"] == payload["url"] and payload["source"] == "greenhouse"
+
+    def test_posted_within_days_uses_first_seen_when_undated(self, index):
+        old = (datetime.now() - timedelta(days=30)).isoformat()
+        index.add([posting(7, "Backend Engineer", "Old Co", posted_date=old)], source="lever")
+
+        titles = {h.title for h in index.search(roles=["backend engineer"], posted_within_days=7)}
+        assert titles == {"Senior Backend Engineer", "Software Engineer, Backend"}
+
+
+class TestJobIndexUpdates:
+
+    def test_reindexing_updates_text_and_keeps_one_row(self, index):
+        index.add([posting(3, "Principal Product Manager", description="Roadmaps")], source="greenhouse")
+
+        assert index.get_stats()["jobs"] == 5
+        assert index.search(query="python", roles=["product manager"]) == []
+        assert [h.title for h in index.search(query="roadmaps")] == ["Principal Product Manager"]
+
+    def test_prune_drops_unseen_postings(self, index):
+        time.sleep(0.01)
+        index.add([posting(1, "Senior Backend Engineer", description="<p>Python &amp; Postgres services</p>")])
+
+        assert index.prune(older_than_days=0.005 / 86400) == 4
+        assert [h.title for h in index.search(query="python")] == ["Senior Backend Engineer"]
+
+    def test_stale_postings_are_hidden_then_pruned_on_index(self, index):
+        with sqlite3.connect(index.db_path) as conn:
+            conn.execute("UPDATE jobs SET last_seen = ? WHERE job_id = '3'", (time.time() - 31 * 86400,))
+
+        assert "Product Manager" not in {h.title for h in index.search(query="python")}
+        with patch("core.job_index.get_job_index", return_value=index):
+            index_jobs([posting(6, "Python Developer")], source="lever")
+            index_jobs([posting(7, "Go Developer")], source="lever")  # within the prune interval
+
+        assert index.stats["pruned"] == 1
+        assert index.get_stats()["jobs"] == 6
+
+    def test_index_jobs_never_raises(self):
+        with patch("core.job_index.get_job_index", side_effect=OSError("disk full")):
+            assert index_jobs([posting(1, "Engineer")]) == 0
+
+
+    @pytest.mark.asyncio
+    async def test_async_indexing_runs_in_a_thread(self, index):
+        import threading
+
+        from core.job_index import index_jobs_async
+
+        threads = []
+        add = index.add
+
+        def spy(jobs, source=None):
+            threads.append(threading.current_thread())
+            return add(jobs, source)
+
+        with patch("core.job_index.get_job_index", return_value=index), patch.object(index, "add", spy):
+            assert await index_jobs_async(iter([posting(8, "Rust Engineer")]), source="lever") == 1
+
+        assert threads[0] is not threading.main_thread()
+        assert [h.title for h in index.search(roles=["rust"])] == ["Rust Engineer"]
+
+
+class TestIndexPlatform:
+
+    def test_jobs_search_answers_from_index(self, index):
+        from fastapi.testclient import TestClient
+        import api.main as api_main
+
+        api_main.app.dependency_overrides[api_main.get_current_user] = lambda: "user-1"
+        try:
+            with patch("api.main.get_job_index", return_value=index):
+                resp = TestClient(api_main.app).post(
+                    "/jobs/search?platform=index",
+                    json={"roles": ["engineer"], "locations": ["Remote", "New York"],
+                          "use_resume_match": False, "skip_senior_for_junior": False},
+                )
+        finally:
+            api_main.app.dependency_overrides.clear()
+
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["platform"] == "index"
+        assert {j["title"] for j in body["jobs"]} == {"Senior Backend Engineer", "Software Engineer, Backend"}
@@ -0,0 +1,104 @@
+"""
+Tests for the JobSpy process pool (off-loop scraping, timeouts, compact records).
+"""
+
+import os
+import math
+import time
+import asyncio
+from datetime import datetime
+
+import pytest
+from unittest.mock import patch
+
+from adapters.jobspy_pool import JobSpyPool, JobSpyPoolConfig, JobSpyTimeout, compact_records
+
+
+# Stand-ins for the pool worker; module level so spawned workers can import them.
+def fake_worker(kwargs, description_chars):
+    time.sleep(kwargs.get("sleep", 0))
+    return [{"job_url": f"https://jobs.example.com/{kwargs['search_term']}", "pid": os.getpid()}]
+
+
+class _NumpyLike:
+    def __init__(self, value):
+        self._value = value
+
+    def item(self):
+        return self._value
+
+
+class TestCompactRecords:
+    """DataFrame rows become plain, JSON-friendly dicts."""
+
+    def test_cells_are_converted(self):
+        rows = [
+            {"job_url": "https://x.com/1", "title": "Engineer", "min_amount": math.nan,
+             "date_posted": datetime(2026, 1, 2), "is_remote": _NumpyLike(True),
+             "description": "d" * 50, "extra_column": "dropped"},
+            {"job_url": None, "title": "No URL"},
+        ]
+
+        records = compact_records(rows, description_chars=10)
+
+        assert len(records) == 1
+        record = records[0]
+        assert record["min_amount"] is None
+        assert record["date_posted"] == "2026-01-02T00:00:00"
+        assert record["is_remote"] is True
+        assert record["description"] == "d" * 10
+        assert "extra_column" not in record
+        assert record["company"] is None
+
+
+@pytest.mark.skipif(os.name == "nt", reason="process pool timing")
+class TestJobSpyPool:
+    """Scrapes run in worker processes with timeouts."""
+
+    @pytest.mark.asyncio
+    async def test_scrape_runs_off_loop_and_times_out(self):
+        pool = JobSpyPool(JobSpyPoolConfig(max_workers=2, timeout_seconds=30))
+        try:
+            with patch("adapters.jobspy_pool._scrape_worker", fake_worker), \
+                    patch("adapters.jobspy_pool.jobspy_available", return_value=True):
+                # Warm the workers (spawn start-up isn't what we're measuring).
+                await pool.scrape(search_term="warmup")
+
+                lags = []
+                stop = asyncio.Event()
+
+                async def probe():
+                    while not stop.is_set():
+                        start = time.perf_counter()
+                        await asyncio.sleep(0.01)
+                        lags.append(time.perf_counter() - start - 0.01)
+
+                probe_task = asyncio.create_task(probe())
+                records = await pool.scrape(search_term="python", sleep=1.0)
+                stop.set()
+                await probe_task
+
+                assert records[0]["job_url"].endswith("/python")
+                assert records[0]["pid"] != os.getpid()
+                assert max(lags) < 0.5, f"Event loop stalled for {max(lags):.2f}s"
+
+                with pytest.raises(JobSpyTimeout):
+                    await pool.scrape(timeout=0.5, search_term="slow", sleep=30)
+                assert pool.get_stats()["recycled"] == 1
+
+                # The pool comes back for the next scrape.
+                assert (await pool.scrape(search_term="after"))[0]["job_url"].endswith("/after")
+        finally:
+            pool.shutdown()
+
+        stats = pool.get_stats()
+        assert stats["timeouts"] == 1
+        assert stats["completed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_missing_jobspy_is_reported(self):
+        from adapters.jobspy_pool import JobSpyError
+
+        with patch("adapters.jobspy_pool.jobspy_available", return_value=False):
+            with pytest.raises(JobSpyError, match="JobSpy not available"):
+                await JobSpyPool().scrape(search_term="x")
@@ -0,0 +1,144 @@
+"""
+Tests for the shared, pooled LLM HTTP client against a local fake upstream.
+"""
+
+import pytest
+from aiohttp import web
+
+# Keep usage rows out of data/llm_usage.db.
+pytestmark = pytest.mark.usefixtures("llm_usage_ledger")
+
+
+class FakeLLM:
+    """Chat-completions endpoint that can be scripted with failing responses."""
+
+    def __init__(self):
+        self.responses = []  # queued (status, headers) before a success
+        self.calls = 0
+        self.peers = set()
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self.complete)
+        return app
+
+    async def complete(self, request):
+        self.calls += 1
+        self.peers.add(request.transport.get_extra_info("peername"))
+        if self.responses:
+            status, headers = self.responses.pop(0)
+            return web.Response(status=status, headers=headers, text="upstream says no")
+        body = await request.json()
+        return web.json_response({
+            "choices": [{"message": {"content": f"echo:{body['messages'][-1]['content']}"}}],
+        })
+
+
+@pytest.fixture
+async def fake_llm():
+    llm = FakeLLM()
+    runner = web.AppRunner(llm.app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    llm.url = f"http://127.0.0.1:{port}/v1/chat/completions"
+    yield llm
+    await runner.cleanup()
+
+
+def _payload(text="hi"):
+    return {"model": "m", "messages": [{"role": "user", "content": text}]}
+
+
+class TestLLMClient:
+    """Pooling, retry policy and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self, fake_llm):
+        from ai.llm_client import LLMClient
+
+        client = LLMClient(retry_delay=0)
+        try:
+            for i in range(5):
+                data = await client.chat_completion(fake_llm.url, "key", _payload(str(i)))
+                assert data["choices"][0]["message"]["content"] == f"echo:{i}"
+        finally:
+            await client.close()
+
+        stats = client.get_stats()
+        assert stats["sessions_created"] == 1
+        assert stats["succeeded"] == 5
+        assert stats["latency_ms"]["samples"] == 5
+        # Sequential calls ride a single keep-alive connection.
+        assert len(fake_llm.peers) == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_honours_retry_after(self, fake_llm):
+        from ai.llm_client import LLMClient
+
+        fake_llm.responses = [(429, {"Retry-After": "0"}), (503, {})]
+        client = LLMClient(retry_delay=0, max_retries=3)
+        try:
+            data = await client.chat_completion(fake_llm.url, "key", _payload())
+        finally:
+            await client.close()
+
+        assert data["choices"][0]["message"]["content"] == "echo:hi"
+        stats = client.get_stats()
+        assert fake_llm.calls == 3
+        assert stats["retries"] == 2
+        assert stats["rate_limited"] == 1
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self, fake_llm):
+        from ai.llm_client import LLMClient, LLMRequestError
+
+        fake_llm.responses = [(401, {})]
+        client = LLMClient(retry_delay=0, max_retries=3)
+        try:
+            with pytest.raises(LLMRequestError) as exc:
+                await client.chat_completion(fake_llm.url, "bad-key", _payload())
+        finally:
+            await client.close()
+
+        assert exc.value.status == 401
+        assert fake_llm.calls == 1
+        assert client.get_stats()["failed"] == 1
+
+    def test_parse_retry_after(self):
+        from ai.llm_client import parse_retry_after
+
+        assert parse_retry_after("2.5") == 2.5
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    @pytest.mark.asyncio
+    async def test_explicit_zero_retries_is_honoured(self, fake_llm):
+        from ai.llm_client import LLMClient, LLMRequestError
+
+        fake_llm.responses = [(503, {}), (503, {})]
+        client = LLMClient(retry_delay=0, max_retries=0)
+        try:
+            assert client.max_retries == 0
+            with pytest.raises(LLMRequestError):
+                await client.chat_completion(fake_llm.url, "key", _payload())
+        finally:
+            await client.close()
+
+        assert fake_llm.calls == 1
+
+    def test_new_event_loop_closes_previous_session(self):
+        import asyncio
+
+        from ai.llm_client import LLMClient
+
+        client = LLMClient()
+        first = asyncio.run(client._get_session())
+        second = asyncio.run(client._get_session())
+        asyncio.run(client.close())
+
+        assert second is not first
+        assert first.closed and second.closed
+        assert client.get_stats()["sessions_created"] == 2
@@ -0,0 +1,130 @@
+"""
+Tests for the LLM concurrency governor (priority lanes, RPM/TPM and per-user budgets).
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+# Keep usage rows out of data/llm_usage.db.
+pytestmark = pytest.mark.usefixtures("llm_usage_ledger")
+
+
+def _governor(**kwargs):
+    from ai.llm_governor import LLMGovernor
+
+    defaults = dict(
+        max_concurrency=0, requests_per_minute=0, tokens_per_minute=0,
+        user_tokens_per_minute=0, background_share=1.0,
+    )
+    defaults.update(kwargs)
+    return LLMGovernor(**defaults)
+
+
+class TestLLMGovernor:
+    """Admission order and budgets."""
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_admitted_by_lane_priority(self):
+        governor = _governor(max_concurrency=1)
+        holder = await governor.acquire(10, lane="campaign")
+        order = []
+
+        async def request(lane):
+            ticket = await governor.acquire(10, lane=lane)
+            order.append(lane)
+            await asyncio.sleep(0)
+            governor.release(ticket)
+
+        tasks = [asyncio.ensure_future(request(lane)) for lane in ("suggestions", "campaign", "interactive")]
+        await asyncio.sleep(0.01)
+        assert order == []
+
+        governor.release(holder)
+        await asyncio.gather(*tasks)
+        assert order == ["interactive", "campaign", "suggestions"]
+
+    @pytest.mark.asyncio
+    async def test_background_lanes_leave_headroom_for_interactive(self):
+        governor = _governor(max_concurrency=4, background_share=0.5)
+        background = [await governor.acquire(10, lane="suggestions") for _ in range(2)]
+
+        blocked = asyncio.ensure_future(governor.acquire(10, lane="suggestions"))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        interactive = await asyncio.wait_for(governor.acquire(10, lane="interactive"), timeout=0.5)
+        governor.release(interactive)
+        governor.release(background[0])
+        governor.release(await asyncio.wait_for(blocked, timeout=0.5))
+
+    @pytest.mark.asyncio
+    async def test_token_budget_waits_for_window_and_uses_actual_usage(self):
+        governor = _governor(tokens_per_minute=1000)
+        with patch("ai.llm_governor.WINDOW_SECONDS", 0.2):
+            first = await governor.acquire(900)
+            # Actual usage was far below the estimate, so the next call fits at once.
+            governor.release(first, usage={"total_tokens": 100})
+            second = await asyncio.wait_for(governor.acquire(800), timeout=0.05)
+            governor.release(second)
+
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            third = await governor.acquire(500)
+            assert loop.time() - start >= 0.05  # waited for the window to roll
+            governor.release(third)
+
+        assert governor.get_stats()["tokens_actual"] == 100
+
+    @pytest.mark.asyncio
+    async def test_user_quota_does_not_block_other_users(self):
+        governor = _governor(user_tokens_per_minute=1000)
+        heavy = await governor.acquire(900, user_id="heavy")
+
+        over_quota = asyncio.ensure_future(governor.acquire(500, user_id="heavy"))
+        await asyncio.sleep(0.01)
+        other = await asyncio.wait_for(governor.acquire(500, user_id="light"), timeout=0.5)
+
+        assert not over_quota.done()
+        assert governor.get_stats()["users_last_minute"] == {"heavy": 900, "light": 500}
+        over_quota.cancel()
+        governor.release(heavy)
+        governor.release(other)
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_pause_holds_admissions(self):
+        governor = _governor()
+        governor.pause(0.05)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        governor.release(await governor.acquire(10))
+        assert loop.time() - start >= 0.04
+        assert governor.get_stats()["rate_limit_pauses"] == 1
+
+
+class TestClientIntegration:
+    """Every chat completion through the shared client is governed."""
+
+    @pytest.mark.asyncio
+    async def test_chat_completion_is_admitted_in_context_lane(self):
+        from ai.llm_client import LLMClient
+        from ai.llm_governor import llm_context
+
+        governor = _governor(max_concurrency=2)
+        client = LLMClient(retry_delay=0)
+
+        async def fake_post(url, payload, **kwargs):
+            return {"choices": [{"message": {"content": "ok"}}], "usage": {"total_tokens": 42}}
+
+        with patch("ai.llm_client.get_llm_governor", return_value=governor), \
+                patch.object(client, "post_json", fake_post):
+            with llm_context(lane="suggestions", user_id="u1"):
+                await client.chat_completion("http://llm/v1/chat/completions", "key", {"messages": []})
+            await client.chat_completion("http://llm/v1/chat/completions", "key", {"messages": []}, lane="interactive")
+
+        stats = governor.get_stats()
+        assert stats["lanes"]["suggestions"]["admitted"] == 1
+        assert stats["lanes"]["interactive"]["admitted"] == 1
+        assert stats["in_flight"] == 0
+        assert stats["tokens_actual"] == 84
+        assert stats["users_last_minute"] == {"u1": 42}
@@ -0,0 +1,121 @@
+"""
+Tests for the offline LLM record/replay backend.
+"""
+
+import json
+import pytest
+from unittest.mock import patch
+
+# Keep usage rows out of data/llm_usage.db.
+pytestmark = pytest.mark.usefixtures("llm_usage_ledger")
+
+
+def _governor():
+    from ai.llm_governor import LLMGovernor
+
+    return LLMGovernor(max_concurrency=0, requests_per_minute=0, tokens_per_minute=0,
+                       user_tokens_per_minute=0, background_share=1.0)
+
+
+def _payload(content, temperature=0.1):
+    return {"model": "moonshot-v1-8k", "messages": [{"role": "user", "content": content}],
+            "temperature": temperature, "max_tokens": 100}
+
+
+class TestLatencyModel:
+    """Latency specs parse into seeded distributions."""
+
+    def test_distributions(self):
+        from ai.llm_replay import LatencyModel
+
+        assert LatencyModel("none").sample_ms() == 0.0
+        assert LatencyModel("fixed:250").sample_ms() == 250.0
+        assert LatencyModel("recorded:0.5").sample_ms(recorded_ms=800) == 400.0
+        uniform = [LatencyModel("uniform:100,200", seed=7).sample_ms() for _ in range(3)]
+        assert all(100 <= v <= 200 for v in uniform)
+        assert uniform == [LatencyModel("uniform:100,200", seed=7).sample_ms() for _ in range(3)]
+        assert LatencyModel("normal:10,1000", seed=1).sample_ms() >= 0.0
+
+        for bad in ("gamma:1,2", "uniform:100", "fixed:abc"):
+            with pytest.raises(ValueError):
+                LatencyModel(bad)
+
+
+class TestRecordReplay:
+    """Recorded pairs are served back by normalized prompt."""
+
+    @pytest.mark.asyncio
+    async def test_record_then_replay_through_client(self, tmp_path):
+        from ai.llm_client import LLMClient, LLMRequestError
+        from ai.llm_replay import LatencyModel, LLMReplayBackend
+
+        cassette = tmp_path / "llm.jsonl"
+        client = LLMClient(retry_delay=0)
+        upstream = []
+
+        async def fake_post(url, payload, **kwargs):
+            upstream.append(payload)
+            return {"choices": [{"message": {"content": f"answer {len(upstream)}"}}],
+                    "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}}
+
+        recorder = LLMReplayBackend(mode="record", path=str(cassette))
+        with patch("ai.llm_client.get_llm_governor", return_value=_governor()), \
+                patch("ai.llm_client.get_llm_replay_backend", return_value=recorder), \
+                patch.object(client, "post_json", fake_post):
+            await client.chat_completion("http://llm", "key", _payload("Why this role?"), call_site="question_answer")
+            await client.chat_completion("http://llm", "key", _payload("Why this role?"), call_site="question_answer")
+
+        lines = [json.loads(line) for line in cassette.read_text().splitlines()]
+        assert len(lines) == 2 and lines[0]["key"] == lines[1]["key"]
+        assert recorder.get_stats()["recorded"] == 2
+
+        async def offline(*args, **kwargs):
+            raise AssertionError("replay must not touch the network")
+
+        player = LLMReplayBackend(mode="replay", path=str(cassette), latency=LatencyModel("fixed:1"))
+        with patch("ai.llm_client.get_llm_governor", return_value=_governor()), \
+                patch("ai.llm_client.get_llm_replay_backend", return_value=player), \
+                patch.object(client, "post_json", offline):
+            # Whitespace and sampling parameters don't change the key; repeats rotate.
+            first = await client.chat_completion("http://llm", "key", _payload("  Why this\nrole? ", 0.7))
+            second = await client.chat_completion("http://llm", "key", _payload("Why this role?"))
+            with pytest.raises(LLMRequestError):
+                await client.chat_completion("http://llm", "key", _payload("Unrecorded prompt"))
+
+        assert first["choices"][0]["message"]["content"] == "answer 1"
+        assert second["choices"][0]["message"]["content"] == "answer 2"
+        assert player.get_stats()["hits"] == 2
+        assert player.get_stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_synthetic_miss_policy(self, tmp_path):
+        from ai.llm_replay import LLMReplayBackend
+
+        player = LLMReplayBackend(mode="replay", path=str(tmp_path / "empty.jsonl"), on_miss="synthetic")
+
+        async def send():
+            raise AssertionError("replay must not call upstream")
+
+        data = await player.complete(_payload("Return JSON with the fields"), send)
+        assert json.loads(data["choices"][0]["message"]["content"]) == {}
+        assert data["usage"]["total_tokens"] > 0
+        text = await player.complete(_payload("Write a cover letter"), send)
+        assert text["choices"][0]["message"]["content"]
+        assert player.get_stats()["synthetic"] == 2
+
+    def test_backend_selected_by_config(self, tmp_path):
+        import ai.llm_replay as llm_replay
+        from api.config import config
+
+        with patch.object(llm_replay, "_llm_replay_backend", None):
+            with patch.object(config, "LLM_BACKEND", "live"):
+                assert llm_replay.get_llm_replay_backend() is None
+            with patch.object(config, "LLM_BACKEND", "replay"), \
+                    patch.object(config, "LLM_REPLAY_PATH", str(tmp_path / "c.jsonl")), \
+                    patch.object(config, "LLM_REPLAY_LATENCY", "uniform:5,10"):
+                backend = llm_replay.get_llm_replay_backend()
+                assert backend.mode == "replay"
+                assert backend.latency.kind == "uniform"
+            with patch.object(config, "LLM_BACKEND", "mock"):
+                with pytest.raises(ValueError):
+                    llm_replay.get_llm_replay_backend()
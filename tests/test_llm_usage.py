@@ -0,0 +1,195 @@
+"""
+Tests for LLM token/latency/cost accounting per call site, campaign and application.
+"""
+
+import pytest
+from unittest.mock import patch
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    from monitoring.llm_usage import LLMUsageLedger
+
+    return LLMUsageLedger(db_path=str(tmp_path / "usage.db"))
+
+
+def _governor():
+    from ai.llm_governor import LLMGovernor
+
+    return LLMGovernor(max_concurrency=0, requests_per_minute=0, tokens_per_minute=0,
+                       user_tokens_per_minute=0, background_share=1.0)
+
+
+class TestLLMUsageLedger:
+    """Rows are priced and rolled up by tag."""
+
+    def test_cost_uses_longest_model_prefix(self):
+        from monitoring.llm_usage import call_cost
+
+        pricing = {"moonshot-v1": (1.0, 1.0), "moonshot-v1-8k": (0.2, 2.0)}
+        assert call_cost("moonshot-v1-8k-vision-preview", 1_000_000, 500_000, pricing) == pytest.approx(1.2)
+        assert call_cost("unknown-model", 1000, 1000, pricing) == 0.0
+
+    def test_summary_and_campaign_rollup(self, ledger):
+        usage = {"prompt_tokens": 1000, "completion_tokens": 500, "total_tokens": 1500}
+        for app in ("app_1", "app_2"):
+            ledger.record(call_site="cover_letter", model="moonshot-v1-8k", latency_ms=900, usage=usage,
+                          campaign_id="camp_1", application_id=app)
+            ledger.record(call_site="question_answer", model="moonshot-v1-8k", latency_ms=300,
+                          usage={"prompt_tokens": 200, "completion_tokens": 50}, campaign_id="camp_1",
+                          application_id=app)
+        ledger.record(call_site="vision", model="moonshot-v1-8k", latency_ms=50, ok=False, status=500,
+                      estimated_tokens=2000, campaign_id="camp_2", application_id="app_3")
+
+        by_site = {row["key"]: row for row in ledger.summary(group_by="call_site")}
+        assert by_site["cover_letter"]["calls"] == 2
+        assert by_site["cover_letter"]["total_tokens"] == 3000
+        assert by_site["question_answer"]["total_tokens"] == 500
+        assert by_site["vision"]["errors"] == 1
+        assert by_site["vision"]["total_tokens"] == 0
+        assert list(by_site)[0] == "cover_letter"  # most expensive first
+
+        rollup = ledger.campaign_rollup(campaign_id="camp_1")
+        assert len(rollup) == 1
+        camp = rollup[0]
+        assert camp["applications"] == 2
+        assert camp["total_tokens"] == 3500
+        assert camp["cost_per_application_usd"] == pytest.approx(camp["cost_usd"] / 2)
+        assert [site["key"] for site in camp["by_call_site"]] == ["cover_letter", "question_answer"]
+
+        with pytest.raises(ValueError):
+            ledger.summary(group_by="prompt")
+
+    def test_replayed_calls_are_free_and_tagged(self, tmp_path):
+        import sqlite3
+
+        from monitoring.llm_usage import LLMUsageLedger
+
+        db_path = tmp_path / "old.db"
+        with sqlite3.connect(db_path) as conn:
+            # A ledger created before rows carried their backend.
+            conn.execute("CREATE TABLE llm_calls (id INTEGER PRIMARY KEY AUTOINCREMENT, ts REAL NOT NULL, "
+                         "call_site TEXT NOT NULL, model TEXT, lane TEXT, user_id TEXT, campaign_id TEXT, "
+                         "application_id TEXT, prompt_tokens INTEGER DEFAULT 0, completion_tokens INTEGER DEFAULT 0, "
+                         "total_tokens INTEGER DEFAULT 0, estimated INTEGER DEFAULT 0, latency_ms REAL, "
+                         "cost_usd REAL DEFAULT 0, ok INTEGER DEFAULT 1, status INTEGER)")
+        ledger = LLMUsageLedger(db_path=str(db_path))
+
+        usage = {"prompt_tokens": 1000, "completion_tokens": 500}
+        assert ledger.record(call_site="cover_letter", model="moonshot-v1-8k", latency_ms=900,
+                             usage=usage, backend="replay") == 0.0
+        assert ledger.record(call_site="cover_letter", model="moonshot-v1-8k", latency_ms=900, usage=usage) > 0
+
+        by_backend = {row["key"]: row for row in ledger.summary(group_by="backend")}
+        assert by_backend["replay"]["cost_usd"] == 0.0
+        assert by_backend["replay"]["total_tokens"] == 1500
+        assert by_backend["live"]["cost_usd"] > 0
+        assert ledger.summary(backend="live")[0]["calls"] == 1
+
+
+class TestClientAccounting:
+    """The shared client records every call with the context's tags."""
+
+    @pytest.mark.asyncio
+    async def test_chat_completion_is_recorded_with_tags(self, ledger):
+        from ai.llm_client import LLMClient, LLMRequestError
+        from ai.llm_governor import llm_context
+
+        client = LLMClient(retry_delay=0)
+        responses = [
+            {"choices": [{"message": {"content": "ok"}}],
+             "usage": {"prompt_tokens": 100, "completion_tokens": 20, "total_tokens": 120}},
+            LLMRequestError("boom", status=503),
+        ]
+
+        async def fake_post(url, payload, **kwargs):
+            result = responses.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        payload = {"model": "moonshot-v1-8k", "messages": [{"role": "user", "content": "hi"}], "max_tokens": 50}
+        with patch("ai.llm_client.get_llm_governor", return_value=_governor()), \
+                patch("ai.llm_client.get_llm_usage_ledger", return_value=ledger), \
+                patch.object(client, "post_json", fake_post):
+            with llm_context(user_id="u1", campaign_id="camp_1", application_id="app_1"):
+                await client.chat_completion("http://llm", "key", payload, call_site="generate_text")
+                # An enclosing call site wins over the callee's default.
+                with llm_context(call_site="question_answer"):
+                    with pytest.raises(LLMRequestError):
+                        await client.chat_completion("http://llm", "key", payload, call_site="generate_text")
+
+        rows = {row["key"]: row for row in ledger.summary(group_by="call_site", application_id="app_1")}
+        assert rows["generate_text"]["total_tokens"] == 120
+        assert rows["generate_text"]["cost_usd"] > 0
+        assert rows["question_answer"]["errors"] == 1
+        assert ledger.summary(group_by="user_id")[0]["key"] == "u1"
+
+
+    @pytest.mark.asyncio
+    async def test_ledger_write_runs_off_the_event_loop(self, ledger):
+        import threading
+
+        from ai.llm_client import LLMClient
+
+        client = LLMClient(retry_delay=0)
+        threads = []
+        record = ledger.record
+
+        def spy(**row):
+            threads.append(threading.current_thread())
+            return record(**row)
+
+        async def fake_post(url, payload, **kwargs):
+            return {"choices": [{"message": {"content": "ok"}}], "usage": {"prompt_tokens": 5, "completion_tokens": 1}}
+
+        payload = {"model": "moonshot-v1-8k", "messages": [{"role": "user", "content": "hi"}], "max_tokens": 5}
+        with patch("ai.llm_client.get_llm_governor", return_value=_governor()), \
+                patch("ai.llm_client.get_llm_usage_ledger", return_value=ledger), \
+                patch.object(ledger, "record", spy), \
+                patch.object(client, "post_json", fake_post):
+            await client.chat_completion("http://llm", "key", payload, call_site="generate_text")
+
+        assert threads and threads[0] is not threading.main_thread()
+        assert ledger.summary(group_by="call_site")[0]["calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_replay_backend_is_recorded_at_zero_cost(self, ledger):
+        from unittest.mock import AsyncMock, MagicMock
+
+        from ai.llm_client import LLMClient
+
+        backend = MagicMock(mode="replay")
+        backend.complete = AsyncMock(return_value={
+            "choices": [{"message": {"content": "ok"}}], "usage": {"prompt_tokens": 100, "completion_tokens": 20},
+        })
+        client = LLMClient(retry_delay=0)
+        payload = {"model": "moonshot-v1-8k", "messages": [{"role": "user", "content": "hi"}], "max_tokens": 5}
+        with patch("ai.llm_client.get_llm_governor", return_value=_governor()), \
+                patch("ai.llm_client.get_llm_usage_ledger", return_value=ledger), \
+                patch("ai.llm_client.get_llm_replay_backend", return_value=backend):
+            await client.chat_completion("http://llm", "key", payload, call_site="generate_text")
+
+        row = ledger.summary(group_by="backend")[0]
+        assert row["key"] == "replay"
+        assert row["total_tokens"] == 120
+        assert row["cost_usd"] == 0.0
+
+
+class TestUsageEndpoint:
+    """/admin/llm-usage exposes the rollups."""
+
+    def test_admin_usage_endpoint(self, client, ledger):
+        ledger.record(call_site="cover_letter", model="moonshot-v1-8k", latency_ms=500,
+                      usage={"prompt_tokens": 10, "completion_tokens": 10}, campaign_id="camp_9",
+                      application_id="app_9")
+
+        with patch("monitoring.llm_usage.get_llm_usage_ledger", return_value=ledger):
+            assert client.get("/admin/llm-usage", params={"admin_key": "wrong"}).status_code == 403
+            resp = client.get("/admin/llm-usage", params={"admin_key": "swiftadmin2026"})
+
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["totals"]["calls"] == 1
+        assert body["rows"][0]["key"] == "cover_letter"
+        assert body["campaigns"][0]["campaign_id"] == "camp_9"
@@ -0,0 +1,274 @@
+"""
+Tests for look-ahead cover letter / answer pre-generation on queued jobs.
+"""
+
+import json
+import uuid
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from adapters.base import JobPosting, PlatformType
+
+
+PARSED = {
+    "summary": "Backend engineer building Python services.",
+    "skills": ["Python", "PostgreSQL"],
+    "experience": [{"title": "Engineer", "company": "Acme", "dates": "2018 - 2024", "bullets": []}],
+}
+
+
+async def _seed_campaign(job_url: str, config: dict = None):
+    from api.database import create_campaign, enqueue_jobs, init_database, save_profile, save_resume
+
+    await init_database()
+    user_id = f"pregen-{uuid.uuid4().hex[:8]}"
+    await save_resume(user_id, "r.pdf", "Backend engineer building Python services.", PARSED)
+    await save_profile(user_id, {"first_name": "Jane", "last_name": "Doe", "email": f"{user_id}@example.com"})
+    campaign_id = await create_campaign(user_id, "look-ahead", config or {"cover_letter_tone": "casual"})
+    await enqueue_jobs(user_id, campaign_id, [{"job_url": job_url, "title": "Engineer", "company": "Acme"}])
+    return user_id, campaign_id
+
+
+async def _queue_item(campaign_id: str) -> dict:
+    from api.database import list_queue_items
+
+    items = await list_queue_items(campaign_id)
+    assert len(items) == 1
+    return items[0]
+
+
+class TestPregenWorker:
+    """Queued items get their LLM work done before a browser slot takes them."""
+
+    @pytest.mark.asyncio
+    async def test_prepares_cover_letter_and_answers(self):
+        from api.database import list_pregen_candidates
+        from api.pregen_worker import PregenConfig, PregenWorker
+
+        job_url = f"https://boards.greenhouse.io/acme/jobs/{uuid.uuid4().int % 10**8}"
+        _, campaign_id = await _seed_campaign(job_url)
+
+        adapter = MagicMock()
+        adapter.get_job_details = AsyncMock(return_value=JobPosting(
+            id="gh_acme_1", platform=PlatformType.GREENHOUSE, title="Backend Engineer",
+            company="Acme", location="Remote", url=job_url, description="Build Python APIs.",
+        ))
+        adapter.get_application_questions = AsyncMock(return_value=[
+            {"question": "Why Acme?", "type": "text", "options": None},
+        ])
+        adapter.close = AsyncMock()
+        kimi = MagicMock()
+        kimi.generate_cover_letter = AsyncMock(return_value="Dear Acme, ...")
+        form_intelligence = MagicMock()
+        form_intelligence.answer_questions = AsyncMock(return_value=["I like the product."])
+
+        worker = PregenWorker(kimi=kimi, config=PregenConfig(lookahead=1000, tokens_per_hour=100000))
+        with patch("api.pregen_worker.get_adapter", return_value=adapter), \
+                patch("api.pregen_worker.get_form_intelligence", return_value=form_intelligence):
+            await worker.run_once()
+
+        kwargs = kimi.generate_cover_letter.await_args.kwargs
+        assert kwargs["job_title"] == "Backend Engineer"
+        assert kwargs["tone"] == "casual"
+        adapter.close.assert_awaited()
+
+        pregen = json.loads((await _queue_item(campaign_id))["payload_json"])["pregen"]
+        assert pregen["cover_letter"] == "Dear Acme, ..."
+        assert pregen["answers"] == {"Why Acme?": "I like the product."}
+        # Prepared items are no longer candidates.
+        candidates = await list_pregen_candidates(1000)
+        assert campaign_id not in {c["campaign_id"] for c in candidates}
+
+    @pytest.mark.asyncio
+    async def test_defers_items_over_the_token_budget(self):
+        from api.database import list_pregen_candidates
+        from api.pregen_worker import PregenConfig, PregenWorker
+
+        job_url = f"https://jobs.lever.co/acme/{uuid.uuid4().hex}"
+        _, campaign_id = await _seed_campaign(job_url)
+
+        adapter = MagicMock()
+        adapter.get_job_details = AsyncMock(return_value=JobPosting(
+            id="lever_1", platform=PlatformType.LEVER, title="Engineer", company="Acme",
+            location="Remote", url=job_url, description="Build things.",
+        ))
+        adapter.close = AsyncMock()
+        del adapter.get_application_questions
+        kimi = MagicMock()
+        kimi.generate_cover_letter = AsyncMock(return_value="letter")
+
+        worker = PregenWorker(kimi=kimi, config=PregenConfig(lookahead=1000, tokens_per_hour=100))
+        with patch("api.pregen_worker.get_adapter", return_value=adapter):
+            await worker.run_once()
+
+        kimi.generate_cover_letter.assert_not_awaited()
+        assert worker.stats["budget_deferred"] >= 1
+        candidates = await list_pregen_candidates(1000)
+        assert campaign_id in {c["campaign_id"] for c in candidates}
+
+
+    @pytest.mark.asyncio
+    async def test_runs_in_background_lane(self):
+        from ai.form_intelligence import FormIntelligence
+        from ai.llm_governor import LANE_SUGGESTIONS, current_lane
+        from api.pregen_worker import PregenConfig, PregenWorker
+
+        job_url = f"https://boards.greenhouse.io/acme/jobs/{uuid.uuid4().int % 10**8}"
+        _, campaign_id = await _seed_campaign(job_url)
+        lanes = []
+
+        class Kimi:
+            async def generate_cover_letter(self, **kwargs):
+                lanes.append(current_lane())
+                return "letter"
+
+            async def generate_text(self, prompt, max_tokens=200):
+                lanes.append(current_lane())
+                return "Because of the product."
+
+        adapter = MagicMock()
+        adapter.get_job_details = AsyncMock(return_value=JobPosting(
+            id="gh_acme_2", platform=PlatformType.GREENHOUSE, title="Engineer", company="Acme",
+            location="Remote", url=job_url, description="Build things.",
+        ))
+        adapter.get_application_questions = AsyncMock(return_value=[
+            {"question": f"Why Acme {uuid.uuid4().hex[:6]}?", "type": "text", "options": None},
+        ])
+        adapter.close = AsyncMock()
+        form_intelligence = FormIntelligence()
+        form_intelligence.kimi_service, form_intelligence.answer_bank = Kimi(), False
+
+        worker = PregenWorker(kimi=Kimi(), config=PregenConfig(tokens_per_hour=100000))
+        with patch("api.pregen_worker.get_adapter", return_value=adapter), \
+                patch("api.pregen_worker.get_form_intelligence", return_value=form_intelligence):
+            assert await worker._prepare_item(await _queue_item(campaign_id))
+
+        assert lanes == [LANE_SUGGESTIONS, LANE_SUGGESTIONS]
+
+    @pytest.mark.asyncio
+    async def test_item_claimed_mid_fetch_is_left_to_the_queue_worker(self):
+        from api.database import get_db
+        from api.pregen_worker import PregenConfig, PregenWorker
+
+        job_url = f"https://jobs.lever.co/acme/{uuid.uuid4().hex}"
+        _, campaign_id = await _seed_campaign(job_url)
+        item = await _queue_item(campaign_id)
+
+        async def claimed_while_fetching(url):
+            async with get_db() as db:
+                await db.execute("UPDATE job_queue SET status='in_progress', locked_at='now' WHERE id=?",
+                                 (item["id"],))
+                await db.commit()
+            return JobPosting(id="lever_2", platform=PlatformType.LEVER, title="Engineer", company="Acme",
+                              location="Remote", url=url, description="Build things.")
+
+        adapter = MagicMock()
+        adapter.get_job_details = claimed_while_fetching
+        adapter.close = AsyncMock()
+        del adapter.get_application_questions
+        kimi = MagicMock()
+        kimi.generate_cover_letter = AsyncMock(return_value="letter")
+
+        worker = PregenWorker(kimi=kimi, config=PregenConfig(tokens_per_hour=100000))
+        with patch("api.pregen_worker.get_adapter", return_value=adapter):
+            assert not await worker._prepare_item(item)
+
+        kimi.generate_cover_letter.assert_not_awaited()
+        assert worker.budget_remaining() == 100000
+
+
+class TestApplyUsesPregen:
+    """The queue worker hands stored content to apply_job_url."""
+
+    @pytest.mark.asyncio
+    async def test_queue_worker_passes_pregen_to_apply(self):
+        from api.database import fetch_next_queue_item, set_queue_pregen
+        from api.queue_worker import QueueWorker, WorkerConfig
+
+        job_url = f"https://boards.greenhouse.io/acme/jobs/{uuid.uuid4().int % 10**8}"
+        _, campaign_id = await _seed_campaign(job_url)
+        item = await _queue_item(campaign_id)
+        await set_queue_pregen(item["id"], {"cover_letter": "Prepared letter"})
+
+        claimed = await fetch_next_queue_item("test-worker")
+        while claimed and claimed["campaign_id"] != campaign_id:
+            claimed = await fetch_next_queue_item("test-worker")
+        assert claimed is not None
+
+        worker = QueueWorker(
+            browser_manager=MagicMock(), kimi=MagicMock(),
+            config=WorkerConfig(delay_min_seconds=0, delay_max_seconds=0),
+        )
+        with patch("api.queue_worker.apply_job_url", AsyncMock(return_value={"id": "app_1"})) as apply:
+            await worker._process_item(claimed)
+
+        options = apply.await_args.kwargs["options"]
+        assert options.pregenerated == {"cover_letter": "Prepared letter"}
+
+    @pytest.mark.asyncio
+    async def test_live_fill_reuses_pregenerated_answers(self, tmp_path):
+        """Answers prepared ahead of time are recalled by the form fill without an LLM call."""
+        from adapters.base import ApplicationResult, ApplicationStatus
+        from ai.form_intelligence import FormIntelligence
+        from api.application_engine import ApplyOptions, apply_job_url
+        from api.database import save_profile
+        from api.pregen_worker import PregenConfig, PregenWorker
+        from core.answer_bank import AnswerBank
+
+        job_url = f"https://boards.greenhouse.io/acme/jobs/{uuid.uuid4().int % 10**8}"
+        user_id, _ = await _seed_campaign(job_url)
+        await save_profile(user_id, {"first_name": "Jane", "last_name": "Doe",
+                                     "email": f"{user_id}@example.com", "phone": "555-0100"})
+        posting = JobPosting(id="gh_acme_1", platform=PlatformType.GREENHOUSE, title="Backend Engineer",
+                             company="Acme", location="Remote", url=job_url, description="Build Python APIs.")
+
+        class Kimi:
+            def __init__(self, answer):
+                self.answer = answer
+
+            async def generate_text(self, prompt, max_tokens=200):
+                if self.answer is None:
+                    raise AssertionError("the live fill should reuse the pregenerated answer")
+                return self.answer
+
+        pregen_adapter = MagicMock()
+        pregen_adapter.get_job_details = AsyncMock(return_value=posting)
+        pregen_adapter.get_application_questions = AsyncMock(return_value=[
+            {"question": "Why do you want to work at Acme?", "type": "text", "options": None},
+        ])
+        pregen_adapter.close = AsyncMock()
+        pregen_fi = FormIntelligence()
+        pregen_fi.kimi_service = Kimi("I like the product.")
+        kimi = MagicMock()
+        kimi.generate_cover_letter = AsyncMock(return_value="Dear Acme, ...")
+
+        filled = []
+
+        class LiveAdapter:
+            user_id = checkpoint = None
+
+            async def get_job_details(self, url):
+                return posting
+
+            async def apply_to_job(self, job, resume, profile, cover_letter=None, auto_submit=False):
+                fi = FormIntelligence()
+                fi.kimi_service = Kimi(None)
+                filled.append(await fi.answer_question(
+                    "Why do you want to work at Acme?", "text",
+                    profile={"user_id": getattr(profile, "user_id", None), "email": profile.email},
+                ))
+                return ApplicationResult(status=ApplicationStatus.PENDING_REVIEW, message="ready")
+
+        bank = AnswerBank(db_path=str(tmp_path / "answer_bank.db"))
+        worker = PregenWorker(kimi=kimi, config=PregenConfig(lookahead=1000, tokens_per_hour=100000))
+        with patch("core.answer_bank._answer_bank", bank):
+            with patch("api.pregen_worker.get_adapter", return_value=pregen_adapter), \
+                    patch("api.pregen_worker.get_form_intelligence", return_value=pregen_fi):
+                await worker.run_once()
+            with patch("api.application_engine.get_adapter", return_value=LiveAdapter()):
+                await apply_job_url(
+                    user_id=user_id, job_url=job_url, browser_manager=MagicMock(), kimi=MagicMock(),
+                    options=ApplyOptions(generate_cover_letter=False),
+                )
+
+        assert filled == ["I like the product."]
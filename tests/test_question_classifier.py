@@ -0,0 +1,88 @@
+"""
+Tests for the rule-based screening-question tier ahead of the LLM.
+"""
+
+import pytest
+
+
+PROFILE = {
+    "user_id": None,
+    "work_authorization": "Yes",
+    "sponsorship_required": "No",
+    "years_experience": 7,
+    "custom_answers": {
+        "salary_expectations": "$110,000 - $140,000",
+        "willing_to_relocate": "No - Remote only",
+    },
+}
+
+
+@pytest.fixture
+def classifier():
+    from ai.question_classifier import QuestionClassifier
+
+    return QuestionClassifier()
+
+
+class TestQuestionClassifier:
+    """High-confidence questions are answered from the profile."""
+
+    @pytest.mark.parametrize("question,qtype,options,expected", [
+        ("Are you legally authorized to work in the United States?", "radio", ["Yes", "No"], "Yes"),
+        ("Will you now or in the future require visa sponsorship?", "select", ["Select...", "Yes", "No"], "No"),
+        ("Can you work in the US without sponsorship?", "radio", ["Yes", "No"], "Yes"),
+        ("Are you willing to relocate?", "text", None, "No - Remote only"),
+        ("How many years of experience do you have?", "select", ["0-2", "3-5", "6-9", "10+"], "6-9"),
+        ("Gender", "select", ["Male", "Female", "Decline to self-identify"], "Decline to self-identify"),
+        ("What are your salary expectations?", "text", None, "$110,000 - $140,000"),
+    ])
+    def test_resolves_known_kinds(self, classifier, question, qtype, options, expected):
+        resolved = classifier.resolve(question, qtype, options, PROFILE)
+        assert resolved is not None
+        assert resolved.answer == expected
+
+    @pytest.mark.parametrize("question,qtype,options", [
+        ("Why do you want to work here?", "text", None),
+        ("Years of experience with Kubernetes?", "text", None),
+        # Compound question: two categories match.
+        ("Are you authorized to work in the US and will you require sponsorship?", "radio", ["Yes", "No"]),
+        # Data missing from the profile.
+        ("When can you start?", "text", None),
+        # Stored answer doesn't map to an offered option.
+        ("Are you willing to relocate?", "select", ["Within 50 miles", "Anywhere"]),
+    ])
+    def test_leaves_uncertain_questions_to_the_llm(self, classifier, question, qtype, options):
+        assert classifier.resolve(question, qtype, options, PROFILE) is None
+
+
+class TestFormIntelligenceRuleTier:
+    """Only unresolved questions reach the model; the skip share is reported."""
+
+    @pytest.mark.asyncio
+    async def test_only_unresolved_questions_reach_the_model(self):
+        from ai.form_intelligence import FormIntelligence
+
+        prompts = []
+
+        class Kimi:
+            async def generate_text(self, prompt, max_tokens=200):
+                prompts.append(prompt)
+                return "I admire the mission."
+
+        fi = FormIntelligence()
+        fi.kimi_service = Kimi()
+        answers = await fi.answer_questions([
+            {"question": "Are you legally authorized to work in the United States?", "type": "radio", "options": ["Yes", "No"]},
+            {"question": "Will you require sponsorship?", "type": "radio", "options": ["Yes", "No"]},
+            {"question": "Why do you want to work here?", "type": "text"},
+        ], profile=PROFILE)
+
+        assert answers == ["Yes", "No", "I admire the mission."]
+        assert len(prompts) == 1
+        assert "Will you require sponsorship?" not in prompts[0]
+
+        stats = fi.get_stats()
+        assert stats["questions"] == 3
+        assert stats["rules"] == 2
+        assert stats["llm"] == 1
+        assert stats["skipped_model_rate"] == "66.7%"
@@ -0,0 +1,128 @@
+"""
+Tests for resume digests precomputed at upload.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+RAW_TEXT = """Jane Doe
+jane@example.com | 555-123-4567
+Backend engineer with eight years building Python services, data pipelines and APIs for fintech platforms.
+Experience
+Senior Engineer, Acme Corp, 2019 - 2024
+Built payment APIs in Python and Go.
+""" + "Maintained Kubernetes clusters and PostgreSQL databases. " * 200
+
+PARSED = {
+    "summary": "Backend engineer with eight years building Python services and data pipelines.",
+    "skills": ["Python", "Go", "PostgreSQL", "Kubernetes", "AWS"],
+    "experience": [
+        {"title": "Senior Engineer", "company": "Acme Corp", "dates": "2019 - 2024",
+         "bullets": ["Built payment APIs in Python and Go.", "Cut p95 latency by 40%."]},
+        {"title": "Engineer", "company": "Globex", "dates": "2016 - 2019", "bullets": []},
+    ],
+    "education": [{"school": "State University", "degree": "BS", "field": "Computer Science"}],
+}
+
+
+class TestBuildResumeDigest:
+    """Digest contents and snippet budgets."""
+
+    def test_digest_from_parsed_resume(self):
+        from core.resume_digest import SNIPPET_BUDGETS, build_resume_digest, count_tokens
+
+        digest = build_resume_digest(RAW_TEXT, PARSED)
+
+        assert digest["skills"] == PARSED["skills"]
+        assert {"python", "postgresql", "kubernetes"} <= set(digest["keywords"])
+        assert digest["years_experience"] == 8
+        assert digest["recent_roles"][0]["company"] == "Acme Corp"
+        for kind, budget in SNIPPET_BUDGETS.items():
+            snippet = digest["snippets"][kind]
+            assert snippet["tokens"] == count_tokens(snippet["text"])
+            assert snippet["tokens"] <= budget
+        assert "Senior Engineer at Acme Corp (2019 - 2024)" in digest["snippets"]["questions"]["text"]
+        assert "Cut p95 latency" in digest["snippets"]["cover_letter"]["text"]
+        assert digest["snippets"]["cover_letter"]["tokens"] < digest["source_tokens"]
+
+    def test_unparsed_resume_falls_back_to_raw_text(self):
+        from core.resume_digest import SNIPPET_BUDGETS, build_resume_digest
+
+        digest = build_resume_digest(RAW_TEXT, {"error": "Parsing failed"})
+
+        questions = digest["snippets"]["questions"]
+        assert questions["text"].startswith("Jane Doe")
+        assert questions["tokens"] <= SNIPPET_BUDGETS["questions"]
+        assert "python" in digest["keywords"]
+
+    def test_keywords_keep_every_skill_token(self):
+        from core.resume_digest import build_resume_digest
+
+        skills = [f"skill{i:03d}" for i in range(200)]
+        digest = build_resume_digest(RAW_TEXT, {**PARSED, "skills": skills})
+
+        # Like the old search-time extraction: all skill tokens plus the frequent raw-text tokens.
+        assert set(skills) <= set(digest["keywords"])
+        assert "kubernetes" in digest["keywords"]
+
+    def test_legacy_resume_gets_digest_on_first_read(self):
+        from core.resume_digest import get_resume_digest, resume_snippet
+        from adapters import Resume  # the model apply_job_url builds
+
+        row = {"raw_text": RAW_TEXT, "parsed_data": PARSED, "digest": None}
+        digest = get_resume_digest(row)
+        assert row["digest"] is digest
+        assert get_resume_digest(row) is digest
+
+        resume = Resume(file_path="r.pdf", raw_text=RAW_TEXT, parsed_data=PARSED, digest=digest)
+        with patch("core.resume_digest.build_resume_digest") as build:
+            assert resume_snippet(resume, "questions") == digest["snippets"]["questions"]["text"]
+        build.assert_not_called()
+
+
+class TestUploadStoresDigest:
+    """/resume/upload builds the digest once and stores it with the resume."""
+
+    @pytest.mark.asyncio
+    async def test_upload_persists_digest(self, authenticated_client):
+        from api.database import init_database, get_latest_resume
+
+        await init_database()
+        kimi = MagicMock()
+        kimi.parse_resume = AsyncMock(return_value=PARSED)
+        kimi.suggest_job_titles = AsyncMock(return_value=[])
+
+        with patch("api.main.kimi", kimi):
+            resp = authenticated_client.post(
+                "/resume/upload", files={"file": ("resume.txt", RAW_TEXT.encode(), "text/plain")}
+            )
+        assert resp.status_code == 200
+
+        resume = await get_latest_resume("test-user-uuid-1234")
+        assert resume["digest"]["skills"] == PARSED["skills"]
+        assert resume["digest"]["snippets"]["questions"]["tokens"] > 0
+
+    @pytest.mark.asyncio
+    async def test_legacy_resume_digest_is_saved_on_first_read(self):
+        import json
+
+        import aiosqlite
+
+        from api.database import DB_PATH, init_database, get_latest_resume, save_resume
+        from core.resume_digest import DIGEST_VERSION
+
+        await init_database()
+        resume_id = await save_resume("digest-backfill-user", "r.pdf", RAW_TEXT, PARSED)
+
+        first = await get_latest_resume("digest-backfill-user")
+        assert first["digest"]["version"] == DIGEST_VERSION
+        async with aiosqlite.connect(DB_PATH) as db:
+            cursor = await db.execute("SELECT digest FROM resumes WHERE id = ?", (resume_id,))
+            stored = json.loads((await cursor.fetchone())[0])
+        assert stored == first["digest"]
+
+        with patch("api.database.build_resume_digest") as build:
+            again = await get_latest_resume("digest-backfill-user")
+        build.assert_not_called()
+        assert again["digest"] == first["digest"]
@@ -0,0 +1,83 @@
+"""
+Tests for concurrent multi-platform search fan-out.
+"""
+
+import time
+import asyncio
+
+import pytest
+
+from core.search_fanout import fan_out
+
+
+def search(delay, items=None, error=None):
+    async def run():
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return items or []
+    return run
+
+
+class TestFanOut:
+    """Platforms run concurrently; failures and timeouts leave partial results."""
+
+    @pytest.mark.asyncio
+    async def test_latency_is_slowest_platform_not_sum(self):
+        start = time.perf_counter()
+        result = await fan_out(
+            {
+                "greenhouse": search(0.2, [{"url": "https://a/1"}, {"url": "https://a/2"}]),
+                "lever": search(0.2, [{"url": "https://b/1"}]),
+                "indeed": search(0.2, [{"url": "https://c/1"}]),
+            },
+            key=lambda j: j["url"],
+        )
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.45, f"Searches ran sequentially ({elapsed:.2f}s)"
+        assert len(result.items) == 4
+        assert not result.partial
+
+    @pytest.mark.asyncio
+    async def test_merges_as_results_arrive_and_keeps_partial_results(self):
+        arrivals = []
+        result = await fan_out(
+            {
+                "linkedin": search(5.0, [{"url": "https://never"}]),
+                "lever": search(0.1, [{"url": "https://x/2"}, {"url": "https://x/1"}, {"url": ""}]),
+                "greenhouse": search(0.01, [{"url": "https://x/1"}]),
+                "indeed": search(0.01, error=RuntimeError("blocked")),
+            },
+            key=lambda j: j["url"],
+            timeout=0.3,
+            on_results=lambda platform, added: arrivals.append((platform, [j["url"] for j in added])),
+        )
+
+        assert arrivals == [("greenhouse", ["https://x/1"]), ("lever", ["https://x/2"])]
+        assert [j["url"] for j in result.items] == ["https://x/1", "https://x/2"]
+        assert result.partial
+        lever = result.platforms["lever"]
+        assert (lever.count, lever.added) == (3, 1)
+        assert result.platforms["linkedin"].timed_out
+        assert result.platforms["indeed"].error == "blocked"
+        assert result.elapsed_ms < 1000
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_bounds_parallel_searches(self):
+        running = 0
+        peak = 0
+
+        def tracked():
+            async def run():
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.05)
+                running -= 1
+                return []
+            return run
+
+        await fan_out({f"p{i}": tracked() for i in range(6)}, key=lambda j: j, max_concurrency=2)
+
+        assert peak == 2
@@ -0,0 +1,84 @@
+"""
+Tests for the near-duplicate (MinHash) tier of the AI cache.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+
+BACKEND_JD = (
+    "We are looking for a Senior Backend Engineer to join our payments team. "
+    "Responsibilities: design and build scalable APIs in Python and Go, own services end to end, "
+    "mentor engineers, work with product on the roadmap. Requirements: 5+ years of backend experience, "
+    "PostgreSQL, Kubernetes, AWS, strong communication skills. "
+    "Benefits: health, dental, 401k, remote friendly."
+)
+# Same role, reposted with a different perks paragraph.
+BACKEND_JD_REPOST = BACKEND_JD.replace(
+    "Benefits: health, dental, 401k, remote friendly.",
+    "Perks: health, dental, 401k and a remote friendly culture.",
+)
+MARKETING_JD = (
+    "Marketing Manager to lead our brand campaigns. Responsibilities: plan campaigns, manage agency "
+    "relationships, own the budget. Requirements: 5+ years marketing, SEO, analytics, strong communication."
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    from ai.cache.kimi_cache import CachedKimiService
+
+    service = CachedKimiService(api_key="test-key", db_path=str(tmp_path / "ai_cache.db"), similarity_threshold=0.8)
+    service.service.tailor_resume = AsyncMock(side_effect=lambda r, jd, style: {"tailored": jd[:20]})
+    service.service.generate_cover_letter = AsyncMock(side_effect=lambda s, t, c, req, tone: f"Letter: {t} at {c}")
+    return service
+
+
+class TestMinHash:
+    """Signature similarity tracks shingle overlap."""
+
+    def test_similarity_ordering(self):
+        from ai.cache.semantic_cache import minhash_signature, estimate_similarity
+
+        base = minhash_signature(BACKEND_JD)
+        assert estimate_similarity(base, minhash_signature(BACKEND_JD)) == 1.0
+        assert estimate_similarity(base, minhash_signature(BACKEND_JD_REPOST)) >= 0.8
+        assert estimate_similarity(base, minhash_signature(MARKETING_JD)) < 0.3
+
+
+class TestSemanticTier:
+    """Near-duplicate reuse in CachedKimiService."""
+
+    @pytest.mark.asyncio
+    async def test_reworded_posting_reuses_tailoring(self, cache):
+        first = await cache.tailor_resume("resume", BACKEND_JD)
+        second = await cache.tailor_resume("resume", BACKEND_JD_REPOST)
+
+        assert second == first
+        assert cache.service.tailor_resume.await_count == 1
+        assert cache.get_stats()["semantic"]["hits"] == 1
+
+        # A different resume is a different scope.
+        await cache.tailor_resume("another resume", BACKEND_JD_REPOST)
+        assert cache.service.tailor_resume.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cover_letters_separate_roles_and_companies(self, cache):
+        backend = await cache.generate_cover_letter("summary", "Sr. Backend Engineer", "Acme", BACKEND_JD)
+        repost = await cache.generate_cover_letter("summary", "Senior Backend Engineer", "Acme", BACKEND_JD_REPOST)
+        marketing = await cache.generate_cover_letter("summary", "Marketing Manager", "Acme", MARKETING_JD)
+        other_company = await cache.generate_cover_letter("summary", "Senior Backend Engineer", "Globex", BACKEND_JD)
+
+        assert repost == backend
+        assert marketing == "Letter: Marketing Manager at Acme"
+        assert other_company == "Letter: Senior Backend Engineer at Globex"
+        assert cache.service.generate_cover_letter.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cover_letter_is_not_reused_for_another_title(self, cache):
+        data = await cache.generate_cover_letter("summary", "Data Engineer", "Acme", BACKEND_JD)
+        backend = await cache.generate_cover_letter("summary", "Backend Engineer", "Acme", BACKEND_JD_REPOST)
+
+        assert data == "Letter: Data Engineer at Acme"
+        assert backend == "Letter: Backend Engineer at Acme"
+        assert cache.get_stats()["semantic"]["hits"] == 0
@@ -0,0 +1,154 @@
+"""
+Tests for single-flight coalescing of identical in-flight LLM requests.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+# Keep usage rows out of data/llm_usage.db.
+pytestmark = pytest.mark.usefixtures("llm_usage_ledger")
+
+
+class _SlowUpstream:
+    """Stand-in for the shared LLM client that counts upstream calls."""
+
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+
+    async def chat_completion(self, url, api_key, payload, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        if self.fail:
+            from ai.llm_client import LLMRequestError
+            raise LLMRequestError("HTTP 500: boom", status=500)
+        prompt = payload["messages"][-1]["content"]
+        return {"choices": [{"message": {"content": f"Letter for {len(prompt)} chars"}}]}
+
+
+class TestSingleFlight:
+    """Coalescing semantics."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_execution(self):
+        from ai.cache.single_flight import SingleFlight
+
+        flight = SingleFlight()
+        runs = 0
+
+        async def work():
+            nonlocal runs
+            runs += 1
+            await asyncio.sleep(0.02)
+            return "answer"
+
+        results = await asyncio.gather(*[flight.do("k", work) for _ in range(5)])
+        assert results == ["answer"] * 5
+        assert runs == 1
+        assert flight.get_stats()["coalesced"] == 4
+        assert flight.in_flight() == 0
+
+        # A later call (nothing in flight) executes again.
+        await flight.do("k", work)
+        assert runs == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self):
+        from ai.cache.single_flight import SingleFlight
+
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return 42
+
+        first = asyncio.ensure_future(flight.do("k", work))
+        second = asyncio.ensure_future(flight.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == 42
+
+    def test_request_key_ignores_whitespace_only(self):
+        from ai.cache.single_flight import request_key
+
+        a = request_key("m", [{"role": "user", "content": "Are you  authorized\nto work?"}], temperature=0.1)
+        b = request_key("m", [{"role": "user", "content": "Are you authorized to work? "}], temperature=0.1)
+        c = request_key("m", [{"role": "user", "content": "Are you authorized to work?"}], temperature=0.7)
+        assert a == b
+        assert a != c
+
+
+class TestKimiCoalescing:
+    """Identical concurrent Kimi requests await one upstream call."""
+
+    @pytest.mark.asyncio
+    async def test_identical_cover_letters_coalesce(self):
+        from ai.kimi_service import KimiResumeOptimizer
+        from ai.cache.single_flight import SingleFlight
+
+        upstream = _SlowUpstream()
+        flight = SingleFlight()
+        kimi = KimiResumeOptimizer(api_key="test-key")
+
+        with patch("ai.kimi_service.get_llm_client", return_value=upstream), \
+                patch("ai.kimi_service.get_llm_single_flight", return_value=flight):
+            letters = await asyncio.gather(*[
+                kimi.generate_cover_letter("Summary", "Engineer", "Acme", "Python")
+                for _ in range(4)
+            ])
+            other = await kimi.generate_cover_letter("Summary", "Engineer", "Globex", "Python")
+
+        assert len(set(letters)) == 1
+        assert other.startswith("Letter for")
+        assert upstream.calls == 2
+        assert flight.get_stats()["coalesced"] == 3
+
+    @pytest.mark.asyncio
+    async def test_upstream_failure_reaches_every_waiter(self):
+        from ai.kimi_service import KimiResumeOptimizer
+        from ai.cache.single_flight import SingleFlight
+
+        upstream = _SlowUpstream(fail=True)
+        kimi = KimiResumeOptimizer(api_key="test-key")
+        messages = [{"role": "user", "content": "Years of Python?"}]
+
+        with patch("ai.kimi_service.get_llm_client", return_value=upstream), \
+                patch("ai.kimi_service.get_llm_single_flight", return_value=SingleFlight()):
+            results = await asyncio.gather(
+                *[kimi._chat_completion(messages) for _ in range(3)], return_exceptions=True
+            )
+
+        assert upstream.calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_only_same_lane_and_user_coalesce(self):
+        from ai.kimi_service import KimiResumeOptimizer
+        from ai.cache.single_flight import SingleFlight
+        from ai.llm_governor import LANE_INTERACTIVE, LANE_SUGGESTIONS, llm_context
+
+        upstream = _SlowUpstream()
+        kimi = KimiResumeOptimizer(api_key="test-key")
+        messages = [{"role": "user", "content": "Are you authorized to work in the US?"}]
+
+        async def ask(lane, user):
+            with llm_context(lane=lane, user_id=user):
+                return await kimi._chat_completion(messages)
+
+        with patch("ai.kimi_service.get_llm_client", return_value=upstream), \
+                patch("ai.kimi_service.get_llm_single_flight", return_value=SingleFlight()):
+            await asyncio.gather(
+                ask(LANE_SUGGESTIONS, "u1"), ask(LANE_INTERACTIVE, "u1"),
+                ask(LANE_INTERACTIVE, "u1"), ask(LANE_INTERACTIVE, "u2"),
+            )
+
+        assert upstream.calls == 3
+
+    def test_cache_stats_report_coalescing(self, tmp_path):
+        from ai.cache.kimi_cache import CachedKimiService
+
+        service = CachedKimiService(api_key="test-key", db_path=str(tmp_path / "ai_cache.db"))
+        stats = service.get_stats()
+        assert "coalesced" in stats
+        assert stats["coalesce_rate"].endswith("%")
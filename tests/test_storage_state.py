@@ -0,0 +1,151 @@
+"""
+Tests for encrypted per-user/per-platform storage-state snapshots.
+"""
+
+import os
+import json
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+
+SAMPLE_STATE = {
+    "cookies": [
+        {"name": "li_at", "value": "secret-cookie-value", "domain": ".linkedin.com", "path": "/"},
+        {"name": "JSESSIONID", "value": "ajax:123", "domain": ".www.linkedin.com", "path": "/"},
+    ],
+    "origins": [
+        {"origin": "https://www.linkedin.com", "localStorage": [{"name": "voyager", "value": "1"}]},
+    ],
+}
+
+
+class TestStorageStateStore:
+    """Snapshot persistence and context seeding."""
+
+    def test_round_trip_is_encrypted_at_rest(self, tmp_path):
+        from core.storage_state import StorageStateStore
+
+        store = StorageStateStore(base_dir=str(tmp_path))
+        assert store.save("user-1", "linkedin", SAMPLE_STATE)
+
+        files = list(tmp_path.iterdir())
+        assert len(files) == 1
+        assert "secret-cookie-value" not in files[0].read_text()
+        assert "user-1" not in files[0].name
+
+        assert store.load("user-1", "linkedin") == SAMPLE_STATE
+        assert store.load("user-2", "linkedin") is None
+        assert store.load("user-1", "indeed") is None
+
+    def test_snapshots_are_authenticated(self, tmp_path):
+        from api.auth import encrypt_sensitive_data
+        from core.storage_state import StorageStateStore, _snapshot_cipher
+
+        store = StorageStateStore(base_dir=str(tmp_path))
+        store.save("user-1", "linkedin", SAMPLE_STATE)
+        path = next(tmp_path.iterdir())
+        first = path.read_bytes()
+        store.save("user-1", "linkedin", SAMPLE_STATE)
+        assert path.read_bytes() != first  # random IV: no reusable keystream across snapshots
+
+        path.write_bytes(first[:-4] + b"AAAA")
+        assert store.load("user-1", "linkedin") is None
+
+        path.write_bytes(_snapshot_cipher("another-secret").encrypt(b'{"cookies": [{"name": "x"}]}'))
+        assert store.load("user-1", "linkedin") is None
+
+        path.write_text(encrypt_sensitive_data(json.dumps(SAMPLE_STATE)))  # old XOR format
+        assert store.load("user-1", "linkedin") is None
+
+    def test_expired_snapshot_is_ignored(self, tmp_path):
+        from core.storage_state import StorageStateStore
+
+        store = StorageStateStore(base_dir=str(tmp_path), max_age_hours=0.0001)
+        store.save("user-1", "linkedin", SAMPLE_STATE)
+
+        path = next(tmp_path.iterdir())
+        old = time.time() - 3600
+        os.utime(path, (old, old))
+
+        assert store.load("user-1", "linkedin") is None
+        assert store.stats["expired"] == 1
+
+    def test_invalidate_removes_snapshot(self, tmp_path):
+        from core.storage_state import StorageStateStore
+
+        store = StorageStateStore(base_dir=str(tmp_path))
+        store.save("user-1", "linkedin", SAMPLE_STATE)
+        store.invalidate("user-1", "linkedin")
+        assert store.load("user-1", "linkedin") is None
+
+    @pytest.mark.asyncio
+    async def test_apply_to_context_adds_cookies_and_local_storage(self, tmp_path):
+        from core.storage_state import StorageStateStore
+
+        store = StorageStateStore(base_dir=str(tmp_path))
+        context = MagicMock()
+        context.add_cookies = AsyncMock()
+        context.add_init_script = AsyncMock()
+
+        assert await store.apply_to_context(context, SAMPLE_STATE)
+        context.add_cookies.assert_awaited_once_with(SAMPLE_STATE["cookies"])
+        script = context.add_init_script.await_args.kwargs["script"]
+        assert "https://www.linkedin.com" in script
+        assert "voyager" in script
+
+    @pytest.mark.asyncio
+    async def test_capture_and_save(self, tmp_path):
+        from core.storage_state import StorageStateStore
+
+        store = StorageStateStore(base_dir=str(tmp_path))
+        context = MagicMock()
+        context.storage_state = AsyncMock(return_value=SAMPLE_STATE)
+
+        assert await store.capture_and_save(context, "user-1", "linkedin")
+        assert store.load("user-1", "linkedin") == SAMPLE_STATE
+
+    def test_logged_out_url_detection(self):
+        from core.storage_state import is_logged_out_url
+
+        assert is_logged_out_url("https://www.linkedin.com/login?session_redirect=x")
+        assert is_logged_out_url("https://www.linkedin.com/authwall?trk=x")
+        assert not is_logged_out_url("https://www.linkedin.com/jobs/view/123")
+
+
+class TestAdapterSessions:
+    """Generic adapter sessions are seeded from, and refresh, the user's snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_get_session_seeds_and_close_refreshes(self, tmp_path):
+        from unittest.mock import patch
+
+        from adapters.dice import DiceAdapter
+        from core.browser import BrowserSession, UnifiedBrowserManager
+        from core.storage_state import StorageStateStore
+
+        store = StorageStateStore(base_dir=str(tmp_path))
+        store.save("user-1", "dice", SAMPLE_STATE)
+
+        context = MagicMock()
+        context.add_cookies = AsyncMock()
+        context.add_init_script = AsyncMock()
+        refreshed = {"cookies": [{"name": "dice_session", "value": "v2", "domain": ".dice.com", "path": "/"}], "origins": []}
+        context.storage_state = AsyncMock(return_value=refreshed)
+        page = MagicMock(url="https://www.dice.com/dashboard", context=context)
+
+        manager = UnifiedBrowserManager.__new__(UnifiedBrowserManager)
+        manager._sessions, manager._config, manager._bb, manager.use_stagehand = {}, None, object(), False
+        manager._create_basic_session = AsyncMock(return_value=BrowserSession(
+            session_id="s1", page=page, metadata={"platform": "dice", "mode": "basic", "context": context},
+        ))
+
+        adapter = DiceAdapter(manager)
+        adapter.user_id = "user-1"
+        with patch("core.storage_state._storage_state_store", store):
+            session = await adapter.get_session()
+            await adapter.close()
+
+        assert session.metadata["storage_state_seeded"]
+        context.add_cookies.assert_awaited_once_with(SAMPLE_STATE["cookies"])
+        assert store.load("user-1", "dice") == refreshed
@@ -0,0 +1,138 @@
+"""
+Tests for the vision frame pipeline (crop, downscale, JPEG, unchanged-frame skip).
+"""
+
+import io
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from ai.vision_frames import VisionFrame, VisionFrameConfig, capture_frame, encode_frame, frame_changed
+
+
+def fake_page(frames):
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value={
+        "x": 100, "y": 300, "width": 600, "height": 900, "pageWidth": 1280, "pageHeight": 4000,
+    })
+    page.screenshot = AsyncMock(side_effect=list(frames))
+    return page
+
+
+VISION_RESPONSE = {"choices": [{"message": {"content": '{"fields": [{"label": "Email", "type": "email"}]}'}}]}
+
+
+class TestCaptureFrame:
+    """Frames are cropped to the form and encoded compactly."""
+
+    @pytest.mark.asyncio
+    async def test_screenshot_is_cropped_jpeg(self):
+        page = fake_page([b"jpeg-bytes"])
+        with patch("ai.vision_frames.PIL_AVAILABLE", False):
+            frame = await capture_frame(page, VisionFrameConfig(jpeg_quality=60, padding=20))
+
+        kwargs = page.screenshot.await_args.kwargs
+        assert kwargs["type"] == "jpeg"
+        assert kwargs["quality"] == 60
+        assert kwargs["clip"] == {"x": 80, "y": 280, "width": 640, "height": 940}
+        assert frame.cropped
+        assert frame.data_url().startswith("data:image/jpeg;base64,")
+
+    def test_frame_changed_uses_hash_distance(self):
+        base = VisionFrame(data=b"a", phash=0b1010_0000)
+        assert not frame_changed(base, VisionFrame(data=b"b", phash=0b1010_0001), max_distance=2)
+        assert frame_changed(base, VisionFrame(data=b"b", phash=0b0101_1111), max_distance=2)
+        assert frame_changed(None, base)
+        assert not frame_changed(VisionFrame(data=b"a", phash="x"), VisionFrame(data=b"a", phash="x"))
+
+    def test_encode_downscales_with_pillow(self):
+        Image = pytest.importorskip("PIL.Image")
+        raw = io.BytesIO()
+        Image.new("RGB", (2560, 1600), "white").save(raw, format="PNG")
+
+        frame = encode_frame(raw.getvalue(), VisionFrameConfig(max_width=1024))
+
+        assert frame.width == 1024
+        assert frame.mime == "image/jpeg"
+        assert isinstance(frame.phash, int)
+
+
+class TestVisualFormAgentFrames:
+    """Unchanged frames don't reach the vision model; per-application counts are reported."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_frame_skips_model_call(self):
+        from ai.visual_form_agent import VisualFormAgent
+
+        agent = VisualFormAgent()
+        agent.api_key = "test"
+        client = MagicMock()
+        client.chat_completion = AsyncMock(return_value=VISION_RESPONSE)
+        page = fake_page([b"frame-1", b"frame-1", b"frame-2"])
+
+        with patch("ai.vision_frames.PIL_AVAILABLE", False), \
+                patch("ai.llm_client.get_llm_client", return_value=client):
+            first = await agent._analyze_screenshot(await agent._take_screenshot(page), {}, {})
+            second = await agent._analyze_screenshot(await agent._take_screenshot(page), {}, {})
+            await agent._analyze_screenshot(await agent._take_screenshot(page), {}, {})
+
+        assert second is first
+        assert client.chat_completion.await_count == 2
+        image_url = client.chat_completion.await_args.args[2]["messages"][0]["content"][0]["image_url"]["url"]
+        assert image_url.startswith("data:image/jpeg;base64,")
+        stats = agent.vision_stats.to_dict()
+        assert stats["calls"] == 2
+        assert stats["skipped_unchanged"] == 1
+        assert stats["payload_sizes"] == [len(b"frame-1"), len(b"frame-2")]
+
+    @pytest.mark.asyncio
+    async def test_apply_rechecks_frames_between_actions_and_resets_per_application(self):
+        from ai.visual_form_agent import VisualFormAgent
+
+        agent = VisualFormAgent()
+        agent.api_key = "test"
+        client = MagicMock()
+        client.chat_completion = AsyncMock(return_value=VISION_RESPONSE)
+        # Each application: the form, then the same form after the actions had no visible effect.
+        page = fake_page([b"form", b"form", b"form", b"form"])
+        page.content = AsyncMock(return_value="<form></form>")
+        profile = {"email": "jane@example.com"}
+
+        with patch("ai.vision_frames.PIL_AVAILABLE", False), \
+                patch("ai.llm_client.get_llm_client", return_value=client), \
+                patch("ai.visual_form_agent.asyncio.sleep", AsyncMock()):
+            first = await agent.apply(page, profile, {}, "/tmp/r.pdf")
+            second = await agent.apply(page, profile, {}, "/tmp/r.pdf")
+
+        # One model call per application: the unchanged re-check is skipped, and the
+        # second application analyzes its own first frame rather than reusing the first's.
+        assert client.chat_completion.await_count == 2
+        assert first["vision"]["skipped_unchanged"] == second["vision"]["skipped_unchanged"] == 1
+        assert page.screenshot.await_count == 4
+        assert second["error"] == "Could not confirm submission"
+
+    @pytest.mark.asyncio
+    async def test_filled_fields_are_reanalyzed_when_frame_hash_misses_them(self):
+        from ai.visual_form_agent import PAGE_STATE_SCRIPT, VisualFormAgent
+
+        agent = VisualFormAgent()
+        agent.api_key = "test"
+        client = MagicMock()
+        client.chat_completion = AsyncMock(return_value=VISION_RESPONSE)
+        # Typing leaves the coarse frame identical, but the field values move.
+        page = fake_page([b"form", b"form"])
+        region = page.evaluate.return_value
+        states = iter(["https://acme.test/apply|", "https://acme.test/apply|jane@example.com"])
+        page.evaluate = AsyncMock(
+            side_effect=lambda script: next(states) if script == PAGE_STATE_SCRIPT else region
+        )
+        page.content = AsyncMock(side_effect=["<form></form>", "Application submitted"])
+        profile = {"email": "jane@example.com"}
+
+        with patch("ai.vision_frames.PIL_AVAILABLE", False), \
+                patch("ai.llm_client.get_llm_client", return_value=client), \
+                patch("ai.visual_form_agent.asyncio.sleep", AsyncMock()):
+            result = await agent.apply(page, profile, {}, "/tmp/r.pdf")
+
+        assert result["success"] is True
+        assert client.chat_completion.await_count == 2
+        assert result["vision"]["skipped_unchanged"] == 0
@@ -0,0 +1,146 @@
+"""
+Fixture Job-Board Server
+
+A local aiohttp server that serves a generated set of Greenhouse and Lever
+company boards, with optional per-request latency and throttling. It
+records in-flight peaks and request start times so tests can check
+concurrency and politeness limits without touching the real APIs.
+Boards carry an ETag and Last-Modified and answer conditional requests
+with ``304``; ``set_board`` changes a board between syncs.
+
+Example:
+    async with FixtureBoardServer(companies=fixture_companies(50), latency=0.05) as server:
+        adapter = GreenhouseAdapter(companies=server.companies)
+        adapter.API_BASE = server.greenhouse_base
+"""
+
+import json
+import time
+import asyncio
+import hashlib
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+ROLES = ["Software Engineer", "Backend Engineer", "Product Manager", "Data Scientist", "Designer"]
+LOCATIONS = ["Remote", "San Francisco, CA", "New York, NY", "London, UK"]
+
+
+def fixture_companies(count: int) -> List[str]:
+    return [f"company-{i:03d}" for i in range(count)]
+
+
+def greenhouse_board(company: str, jobs_per_board: int = 10) -> Dict:
+    seed = int(company.rsplit("-", 1)[-1]) if company[-1].isdigit() else 0
+    return {"jobs": [
+        {
+            "id": seed * 1000 + n,
+            "title": ROLES[(seed + n) % len(ROLES)],
+            "location": {"name": LOCATIONS[(seed * 3 + n) % len(LOCATIONS)]},
+            "absolute_url": f"https://boards.greenhouse.io/{company}/jobs/{seed * 1000 + n}",
+            "content": f"{ROLES[(seed + n) % len(ROLES)]} at {company}. Python, SQL.",
+        }
+        for n in range(jobs_per_board)
+    ]}
+
+
+def lever_board(company: str, jobs_per_board: int = 10) -> List[Dict]:
+    return [
+        {
+            "id": f"{company}-{job['id']}",
+            "text": job["title"],
+            "categories": {"location": job["location"]["name"]},
+            "hostedUrl": f"https://jobs.lever.co/{company}/{job['id']}",
+            "descriptionPlain": job["content"],
+        }
+        for job in greenhouse_board(company, jobs_per_board)["jobs"]
+    ]
+
+
+class FixtureBoardServer:
+    """Serves fixture boards at /gh/{company}/jobs[.json] and /lever/{company}."""
+
+    def __init__(self, companies: List[str], latency: float = 0.0, jobs_per_board: int = 10,
+                 throttle: Optional[Dict[str, int]] = None, missing: Optional[List[str]] = None):
+        self.companies = companies
+        self.latency = latency
+        self.jobs_per_board = jobs_per_board
+        self.throttle = dict(throttle or {})  # company -> number of 429s before serving
+        self.missing = set(missing or [])
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.request_starts: List[float] = []
+        self.boards: Dict[str, object] = {}  # "gh:company" / "lever:company" -> overriding board
+        self.validators = True
+        self.not_modified = 0
+        self.bytes_sent = 0
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url = ""
+
+    @property
+    def greenhouse_base(self) -> str:
+        return f"{self.base_url}/gh"
+
+    @property
+    def lever_base(self) -> str:
+        return f"{self.base_url}/lever"
+
+    def set_board(self, ats: str, company: str, board) -> None:
+        """Serve ``board`` for ``company`` instead of the generated one (ats is "gh" or "lever")."""
+        self.boards[f"{ats}:{company}"] = board
+
+    def _respond(self, request: web.Request, board) -> web.Response:
+        body = json.dumps(board).encode()
+        if not self.validators:
+            self.bytes_sent += len(body)
+            return web.Response(body=body, content_type="application/json")
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        headers = {"ETag": etag, "Last-Modified": "Mon, 05 Oct 2026 12:00:00 GMT"}
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers=headers)
+        self.bytes_sent += len(body)
+        return web.Response(body=body, content_type="application/json", headers=headers)
+
+    async def _serve(self, request: web.Request, ats: str, body_for) -> web.Response:
+        company = request.match_info["company"]
+        self.request_starts.append(time.monotonic())
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            if company in self.missing or company not in self.companies:
+                return web.json_response({"error": "not found"}, status=404)
+            if self.throttle.get(company):
+                self.throttle[company] -= 1
+                return web.json_response({"error": "slow down"}, status=429, headers={"Retry-After": "0.2"})
+            board = self.boards.get(f"{ats}:{company}")
+            if board is None:
+                board = body_for(company, self.jobs_per_board)
+            return self._respond(request, board)
+        finally:
+            self.in_flight -= 1
+
+    async def _greenhouse(self, request):
+        return await self._serve(request, "gh", greenhouse_board)
+
+    async def _lever(self, request):
+        return await self._serve(request, "lever", lever_board)
+
+    async def __aenter__(self) -> "FixtureBoardServer":
+        app = web.Application()
+        app.router.add_get("/gh/{company}/jobs", self._greenhouse)
+        app.router.add_get("/gh/{company}/jobs.json", self._greenhouse)
+        app.router.add_get("/lever/{company}", self._lever)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc):
+        if self._runner:
+            await self._runner.cleanup()